@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.queue_logging import start_non_blocking_logging, stop_non_blocking_logging
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -161,7 +162,14 @@ def init_logging(conf_filename: str,
             for logger in config_dict["loggers"]:
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        non_blocking_config: Dict = config_dict.pop("non_blocking", None) or {}
+        # The records queued by the previous configuration are written before its handlers are closed
+        stop_non_blocking_logging()
         logging.config.dictConfig(config_dict)
+        if non_blocking_config.get("enabled", False):
+            start_non_blocking_logging(max_size=int(non_blocking_config.get("max_size", 10000)),
+                                       rate_limit_interval=float(non_blocking_config.get("rate_limit_interval", 10.0)),
+                                       rate_limit_burst=int(non_blocking_config.get("rate_limit_burst", 5)))
 
 
 def get_strategy_list() -> List[str]:
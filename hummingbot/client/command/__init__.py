@@ -8,6 +8,7 @@ from .gateway_command import GatewayCommand
 from .help_command import HelpCommand
 from .history_command import HistoryCommand
 from .import_command import ImportCommand
+from .metrics_command import MetricsCommand
 from .mqtt_command import MQTTCommand
 from .order_book_command import OrderBookCommand
 from .pmm_script_command import PMMScriptCommand
@@ -30,6 +31,7 @@ __all__ = [
     HelpCommand,
     HistoryCommand,
     ImportCommand,
+    MetricsCommand,
     OrderBookCommand,
     PMMScriptCommand,
     PreviousCommand,
@@ -60,6 +60,7 @@ client_configs_to_display = ["autofill_import",
                              "mqtt_commands",
                              "mqtt_events",
                              "mqtt_external_events",
+                             "mqtt_metrics",
                              "mqtt_autostart",
                              "instance_id",
                              "send_error_logs",
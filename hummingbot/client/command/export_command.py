@@ -63,6 +63,9 @@ class ExportCommand:
 
     async def export_trades(self,  # type: HummingbotApplication
                             ):
+        # Trades still queued by the markets recorder have to be in the database before reading
+        if self.markets_recorder is not None:
+            await self.markets_recorder.wait_for_pending_writes()
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(self.init_time * 1e3),
@@ -94,7 +97,6 @@ class ExportCommand:
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
                                  config_file_path: str = None) -> List[TradeFill]:
-
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
             filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
@@ -3,7 +3,7 @@ import threading
 import time
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -40,6 +40,31 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if self._tracks_performance_since(start_time):
+            if self.performance_tracker.num_trades == 0:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.tracked_history_report(precision))
+            return
+        if self.markets_recorder is not None and self.markets_recorder.pending_writes > 0:
+            # Trades still queued by the markets recorder have to be in the database before reading
+            safe_ensure_future(self._history_after_pending_writes(start_time, verbose, precision))
+            return
+        self._history_from_database(start_time, verbose, precision)
+
+    async def _history_after_pending_writes(self,  # type: HummingbotApplication
+                                            start_time: float,
+                                            verbose: bool,
+                                            precision: Optional[int]):
+        await self.markets_recorder.wait_for_pending_writes()
+        self._history_from_database(start_time, verbose, precision)
+
+    def _history_from_database(self,  # type: HummingbotApplication
+                               start_time: float,
+                               verbose: bool,
+                               precision: Optional[int]):
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -75,23 +100,54 @@ class HistoryCommand:
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
+            cur_balances = await self._get_current_balances_for_report(market)
             perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def tracked_history_report(self,  # type: HummingbotApplication
+                                     precision: Optional[int] = None,
+                                     display_report: bool = True) -> Decimal:
+        """
+        Same report as `history_report`, from the metrics kept up to date by the performance tracker instead of the
+        trades in the database
+        """
+        if display_report:
+            self.report_header(self.performance_tracker.start_time)
+        return_pcts = []
+        for (market, symbol), accumulator in list(self.performance_tracker.accumulators.items()):
+            cur_balances = await self._get_current_balances_for_report(market)
+            perf = await accumulator.performance_metrics(cur_balances)
+            if display_report:
+                self.report_performance_by_market(market, symbol, perf, precision)
+            return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def _get_current_balances_for_report(self,  # type: HummingbotApplication
+                                               market: str) -> Dict[str, Decimal]:
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
+    def _report_average_return(self,  # type: HummingbotApplication
+                               return_pcts: List[Decimal],
+                               display_report: bool) -> Decimal:
         avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
         if display_report and len(return_pcts) > 1:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _tracks_performance_since(self,  # type: HummingbotApplication
+                                  start_time: float) -> bool:
+        return self.performance_tracker is not None and self.performance_tracker.start_time == start_time
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -202,6 +258,8 @@ class HistoryCommand:
             return s_decimal_0
 
         start_time = self.init_time
+        if self._tracks_performance_since(start_time):
+            return await self.tracked_history_report(display_report=False)
 
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
@@ -0,0 +1,60 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List
+
+import pandas as pd
+
+from hummingbot.client.ui.interface_utils import format_df_for_printout
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
+
+class MetricsCommand:
+    def metrics(self,  # type: HummingbotApplication
+                reset: bool = False):
+        if threading.current_thread() != threading.main_thread():
+            self.ev_loop.call_soon_threadsafe(self.metrics, reset)
+            return
+        self.show_metrics(reset)
+
+    def show_metrics(self,  # type: HummingbotApplication
+                     reset: bool = False):
+        runtime_metrics = RuntimeMetrics.get_instance()
+        snapshot = runtime_metrics.snapshot()
+        lines = []
+        if len(snapshot["tick_duration_ms"]) == 0:
+            lines.append("\n  No clock tick recorded. The tick durations are measured while a strategy is running.")
+        else:
+            lines.extend(["\n  Clock tick duration (ms):",
+                          self._histograms_table(snapshot["tick_duration_ms"], "Iterator")])
+        lines.extend(["\n  Event loop (ms):",
+                      self._histograms_table({"Loop lag": snapshot["loop_lag_ms"],
+                                              "GC pauses": snapshot["gc_pause_ms"]}, "Source")])
+        if len(snapshot["rest_latency_ms"]) > 0:
+            lines.extend(["\n  REST latency (ms):",
+                          self._histograms_table(snapshot["rest_latency_ms"], "Endpoint")])
+        if len(snapshot["gauges"]) > 0:
+            gauges_df = pd.DataFrame(data=sorted(snapshot["gauges"].items()), columns=["Gauge", "Value"])
+            lines.extend(["\n  Gauges:",
+                          self._indented(format_df_for_printout(gauges_df, self.client_config_map.tables_format))])
+        if reset:
+            runtime_metrics.reset()
+            lines.append("\n  The recorded durations were cleared.")
+        self.notify("\n".join(lines))
+
+    def _histograms_table(self,  # type: HummingbotApplication
+                          histograms: Dict[str, Dict[str, float]],
+                          name_column: str) -> str:
+        columns = [name_column, "Count", "Mean", "p50", "p90", "p99", "Max"]
+        data: List[List] = [
+            [name, histogram["count"], histogram["mean"], histogram["p50"], histogram["p90"], histogram["p99"],
+             histogram["max"]]
+            for name, histogram in sorted(histograms.items())
+        ]
+        df = pd.DataFrame(data=data, columns=columns).round(2)
+        return self._indented(format_df_for_printout(df, self.client_config_map.tables_format))
+
+    @staticmethod
+    def _indented(table: str) -> str:
+        return "\n".join("    " + line for line in table.split("\n"))
@@ -17,6 +17,7 @@ from hummingbot.connector.connector_status import get_connector_status, warning_
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.exceptions import OracleRateUnavailable
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 from hummingbot.user.user_balances import UserBalances
@@ -32,8 +33,12 @@ class StartCommand(GatewayChainApiManager):
     _in_start_check: bool = False
 
     async def _run_clock(self):
-        with self.clock as clock:
-            await clock.run()
+        RuntimeMetrics.get_instance().start_loop_lag_sampling()
+        try:
+            with self.clock as clock:
+                await clock.run()
+        finally:
+            RuntimeMetrics.get_instance().stop_loop_lag_sampling()
 
     async def wait_till_ready(self,  # type: HummingbotApplication
                               func: Callable, *args, **kwargs):
@@ -57,6 +57,9 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
+        if self.performance_tracker is not None:
+            self.performance_tracker.stop()
+
         if self.kill_switch is not None:
             self.kill_switch.stop()
 
@@ -65,4 +68,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.performance_tracker = None
         self.market_trading_pairs_map.clear()
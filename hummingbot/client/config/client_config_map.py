@@ -31,6 +31,7 @@ from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.connector.exchange.gate_io.gate_io_utils import GateIOConfigMap
 from hummingbot.connector.exchange.kucoin.kucoin_utils import KuCoinConfigMap
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.trade_fill_exporter import TradeFillExporter
 from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOracle
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
@@ -138,6 +139,14 @@ class MQTTBridgeConfigMap(BaseClientModel):
             ),
         ),
     )
+    mqtt_metrics: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable Runtime metrics publishing to MQTT broker"
+            ),
+        ),
+    )
     mqtt_autostart: bool = Field(
         default=False,
         client_data=ClientFieldData(
@@ -635,6 +644,58 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class TradesExportConfigMap(BaseClientModel):
+    max_file_size_mb: Decimal = Field(
+        default=Decimal("0"),
+        ge=Decimal("0"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Size (in MB) at which the trades CSV files are rotated (Enter 0 to not rotate them by size)"
+            ),
+        ),
+    )
+    rotate_daily: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to rotate the trades CSV files when the UTC date changes? (Yes/No)",
+        ),
+    )
+    parquet_segment_size: int = Field(
+        default=0,
+        ge=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Number of trades per Parquet segment written next to the trades CSV files"
+                " (requires pyarrow or fastparquet; Enter 0 to only export to CSV)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "trades_export"
+
+    def build_trade_fill_exporter(self) -> TradeFillExporter:
+        return TradeFillExporter(
+            max_file_size=int(self.max_file_size_mb * 1024 * 1024) if self.max_file_size_mb > 0 else None,
+            rotate_daily=self.rotate_daily,
+            parquet_segment_size=self.parquet_segment_size if self.parquet_segment_size > 0 else None,
+        )
+
+    @validator("max_file_size_mb", pre=True)
+    def validate_decimal(cls, v: str, field: Field):
+        """Used for client-friendly error output."""
+        return super().validate_decimal(v, field)
+
+    @validator("rotate_daily", pre=True)
+    def validate_bool(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -967,6 +1028,11 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     commands_timeout: CommandsTimeoutConfigMap = Field(default=CommandsTimeoutConfigMap())
+    trades_export: TradesExportConfigMap = Field(
+        default=TradesExportConfigMap(),
+        description=("Trades CSV export options"
+                     "\nThe trades CSV files can be rotated by size and/or daily, and also written as Parquet segments"),
+    )
     tables_format: ClientConfigEnum(
         value="TabulateFormats",  # noqa: F821
         names={e: e for e in tabulate_formats},
@@ -1,16 +1,22 @@
 import binascii
+import hashlib
 import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from Crypto.Protocol.KDF import scrypt
 from eth_account import Account
 from eth_keyfile.keyfile import (
     DKLEN,
     SCRYPT_P,
     SCRYPT_R,
     Random,
-    _pbkdf2_hash,
-    _scrypt_hash,
     big_endian_to_int,
+    decode_hex,
+    decrypt_aes_ctr,
     encode_hex_no_prefix,
     encrypt_aes_ctr,
     get_default_work_factor_for_kdf,
@@ -41,8 +47,26 @@ class BaseSecretsManager(ABC):
     def decrypt_secret_value(self, attr: str, value: str) -> str:
         pass
 
+    def prepare_decryption(self, encrypted_values: List[str]):
+        """
+        Optionally does upfront the expensive work required to decrypt the values later
+        """
+        pass
+
 
 class ETHKeyFileSecretManger(BaseSecretsManager):
+    """
+    Encrypts the secrets in the Ethereum key file format.
+
+    The keys required to decrypt the values loaded at login are derived upfront by `prepare_decryption`, and each of
+    them is dropped once its value is decrypted, so only the keys of the values not decrypted yet are kept in memory.
+    """
+
+    def __init__(self, password: str):
+        super().__init__(password)
+        self._derived_keys: Dict[Tuple[str, str], bytes] = {}
+        self._derived_keys_lock = threading.Lock()
+
     def encrypt_secret_value(self, attr: str, value: str):
         if self._password is None:
             raise ValueError(f"Could not encrypt secret attribute {attr} because no password was provided.")
@@ -57,9 +81,38 @@ class ETHKeyFileSecretManger(BaseSecretsManager):
         if self._password is None:
             raise ValueError(f"Could not decrypt secret attribute {attr} because no password was provided.")
         value = binascii.unhexlify(value)
-        decrypted_value = Account.decrypt(value.decode(), self._password).decode()
+        keyfile_json = json.loads(value.decode())
+        if keyfile_json.get("version") != 3:
+            return Account.decrypt(value.decode(), self._password).decode()
+        with self._derived_keys_lock:
+            derived_key = self._derived_keys.pop(_derived_key_cache_key(keyfile_json["crypto"]), None)
+        if derived_key is None:
+            derived_key = _derive_key(keyfile_json["crypto"], self._password.encode())
+        decrypted_value = _decode_v3_keyfile_json(keyfile_json, derived_key).decode()
         return decrypted_value
 
+    def prepare_decryption(self, encrypted_values: List[str]):
+        """
+        Derives the keys required to decrypt the values in parallel, in a thread pool (the key derivation functions
+        release the GIL). The keys derived for other values before are discarded.
+        """
+        pending_cryptos: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for value in encrypted_values:
+            keyfile_json = _try_load_keyfile_json(value)
+            if keyfile_json is not None and keyfile_json.get("version") == 3:
+                pending_cryptos[_derived_key_cache_key(keyfile_json["crypto"])] = keyfile_json["crypto"]
+
+        derived_keys: Dict[Tuple[str, str], bytes] = {}
+        if len(pending_cryptos) > 0:
+            password_bytes = self._password.encode()
+            with ThreadPoolExecutor(max_workers=min(len(pending_cryptos), os.cpu_count() or 1)) as executor:
+                derived_keys.update(zip(pending_cryptos.keys(),
+                                        executor.map(_derive_key,
+                                                     pending_cryptos.values(),
+                                                     [password_bytes] * len(pending_cryptos))))
+        with self._derived_keys_lock:
+            self._derived_keys = derived_keys
+
 
 def store_password_verification(secrets_manager: BaseSecretsManager):
     encrypted_word = secrets_manager.encrypt_secret_value(PASSWORD_VERIFICATION_WORD, PASSWORD_VERIFICATION_WORD)
@@ -80,39 +133,20 @@ def validate_password(secrets_manager: BaseSecretsManager) -> bool:
     return valid
 
 
-def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None):
+def _kdf_crypto_params(salt: bytes, kdf: str = "pbkdf2", work_factor: Optional[int] = None) -> Dict[str, Any]:
     """
-    Encrypt message by a given password.
-    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    Returns the key derivation part of the key file crypto parameters used by `_create_v3_keyfile_json`
     """
-    salt = Random.get_random_bytes(16)
-
     if work_factor is None:
         work_factor = get_default_work_factor_for_kdf(kdf)
-
     if kdf == 'pbkdf2':
-        derived_key = _pbkdf2_hash(
-            password,
-            hash_name='sha256',
-            salt=salt,
-            iterations=work_factor,
-            dklen=DKLEN,
-        )
         kdfparams = {
             'c': work_factor,
             'dklen': DKLEN,
             'prf': 'hmac-sha256',
             'salt': encode_hex_no_prefix(salt),
         }
-    elif kdf == 'scrypt':
-        derived_key = _scrypt_hash(
-            password,
-            salt=salt,
-            buflen=DKLEN,
-            r=SCRYPT_R,
-            p=SCRYPT_P,
-            n=work_factor,
-        )
+    else:
         kdfparams = {
             'dklen': DKLEN,
             'n': work_factor,
@@ -120,8 +154,79 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             'p': SCRYPT_P,
             'salt': encode_hex_no_prefix(salt),
         }
-    else:
+    return {'kdf': kdf, 'kdfparams': kdfparams}
+
+
+def _derived_key_cache_key(crypto: Dict[str, Any]) -> Tuple[str, str]:
+    return crypto['kdf'], json.dumps(crypto['kdfparams'], sort_keys=True)
+
+
+def _derive_key(crypto: Dict[str, Any], password: bytes) -> bytes:
+    kdfparams = crypto['kdfparams']
+    salt = decode_hex(kdfparams['salt'])
+    if crypto['kdf'] == 'pbkdf2':
+        if kdfparams['prf'] != 'hmac-sha256':
+            raise ValueError("Unsupported pseudo-random function: {0}".format(kdfparams['prf']))
+        return hashlib.pbkdf2_hmac('sha256', password, salt, kdfparams['c'], kdfparams['dklen'])
+    elif crypto['kdf'] == 'scrypt':
+        # hashlib.scrypt (OpenSSL) requires n < 2 ** (16 * r), which the key file default parameters do not meet
+        return scrypt(password, salt, key_len=kdfparams['dklen'], N=kdfparams['n'], r=kdfparams['r'],
+                      p=kdfparams['p'])
+    raise TypeError("Unsupported key derivation function: {0}".format(crypto['kdf']))
+
+
+def _try_load_keyfile_json(value: Any) -> Optional[Dict[str, Any]]:
+    try:
+        keyfile_json = json.loads(binascii.unhexlify(value).decode())
+    except (TypeError, ValueError, binascii.Error):
+        return None
+    return keyfile_json if isinstance(keyfile_json, dict) and "crypto" in keyfile_json else None
+
+
+def encrypted_values_in(data: Any) -> Iterable[str]:
+    """
+    Returns the encrypted secret values found in the data loaded from a config file
+    """
+    if isinstance(data, dict):
+        for value in data.values():
+            yield from encrypted_values_in(value)
+    elif isinstance(data, str) and _try_load_keyfile_json(data) is not None:
+        yield data
+
+
+def _decode_v3_keyfile_json(keyfile_json: Dict[str, Any], derived_key: bytes) -> bytes:
+    """
+    Decrypt a message with the key derived from the password.
+    Most of this code is copied from eth_key_file.key_file, the key derivation is done by the caller.
+    """
+    crypto = keyfile_json['crypto']
+    ciphertext = decode_hex(crypto['ciphertext'])
+    mac = keccak(derived_key[16:32] + ciphertext)
+
+    expected_mac = decode_hex(crypto['mac'])
+
+    if mac != expected_mac:
+        raise ValueError("MAC mismatch")
+
+    encrypt_key = derived_key[:16]
+    iv = big_endian_to_int(decode_hex(crypto['cipherparams']['iv']))
+    return decrypt_aes_ctr(ciphertext, encrypt_key, iv)
+
+
+def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_factor=None, salt=None, derived_key=None):
+    """
+    Encrypt message by a given password.
+    Most of this code is copied from eth_key_file.key_file, removed address and is from json result.
+    The salt and the key derived from the password with it can be provided, to skip the key derivation.
+    """
+    if salt is None:
+        salt = Random.get_random_bytes(16)
+
+    if kdf not in ('pbkdf2', 'scrypt'):
         raise NotImplementedError("KDF not implemented: {0}".format(kdf))
+    kdf_crypto = _kdf_crypto_params(salt, kdf, work_factor)
+    if derived_key is None:
+        derived_key = _derive_key(kdf_crypto, password)
 
     iv = big_endian_to_int(Random.get_random_bytes(16))
     encrypt_key = derived_key[:16]
@@ -136,7 +241,7 @@ def _create_v3_keyfile_json(message_to_encrypt, password, kdf="pbkdf2", work_fac
             },
             'ciphertext': encode_hex_no_prefix(ciphertext),
             'kdf': kdf,
-            'kdfparams': kdfparams,
+            'kdfparams': kdf_crypto['kdfparams'],
             'mac': encode_hex_no_prefix(mac),
         },
         'version': 3,
@@ -2,7 +2,12 @@ import asyncio
 from pathlib import Path
 from typing import Dict, Optional
 
-from hummingbot.client.config.config_crypt import PASSWORD_VERIFICATION_PATH, BaseSecretsManager, validate_password
+from hummingbot.client.config.config_crypt import (
+    PASSWORD_VERIFICATION_PATH,
+    BaseSecretsManager,
+    encrypted_values_in,
+    validate_password,
+)
 from hummingbot.client.config.config_helpers import (
     ClientConfigAdapter,
     api_keys_from_connector_config_map,
@@ -10,6 +15,7 @@ from hummingbot.client.config.config_helpers import (
     get_connector_config_yml_path,
     list_connector_configs,
     load_connector_config_map_from_file,
+    read_yml_file,
     reset_connector_hb_config,
     save_to_yml,
     update_connector_hb_config,
@@ -19,6 +25,12 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
 class Security:
+    """
+    Holds the decrypted connector configs.
+
+    At login only the keys required to decrypt the connector config files are derived from the password (in parallel,
+    by the secrets manager). Each connector config is then decrypted and loaded the first time it is used.
+    """
     __instance = None
     secrets_manager: Optional[BaseSecretsManager] = None
     _secure_configs = {}
@@ -30,7 +42,7 @@ class Security:
 
     @classmethod
     def any_secure_configs(cls):
-        return len(cls._secure_configs) > 0
+        return len(cls._secure_configs) > 0 or len(list_connector_configs()) > 0
 
     @staticmethod
     def connector_config_file_exists(connector_name: str) -> bool:
@@ -51,8 +63,8 @@ class Security:
         cls._secure_configs.clear()
         cls._decryption_done.clear()
         encrypted_files = list_connector_configs()
-        for file in encrypted_files:
-            cls.decrypt_connector_config(file)
+        encrypted_values = [value for file in encrypted_files for value in encrypted_values_in(read_yml_file(file))]
+        cls.secrets_manager.prepare_decryption(encrypted_values)
         cls._decryption_done.set()
 
     @classmethod
@@ -73,7 +85,7 @@ class Security:
         file_path = get_connector_config_yml_path(connector_name)
         file_path.unlink(missing_ok=True)
         reset_connector_hb_config(connector_name)
-        cls._secure_configs.pop(connector_name)
+        cls._secure_configs.pop(connector_name, None)
 
     @classmethod
     def is_decryption_done(cls):
@@ -81,10 +93,16 @@ class Security:
 
     @classmethod
     def decrypted_value(cls, key: str) -> Optional[ClientConfigAdapter]:
+        if key not in cls._secure_configs and cls.secrets_manager is not None and cls.connector_config_file_exists(key):
+            cls.decrypt_connector_config(get_connector_config_yml_path(key))
         return cls._secure_configs.get(key, None)
 
     @classmethod
     def all_decrypted_values(cls) -> Dict[str, ClientConfigAdapter]:
+        if cls.secrets_manager is not None:
+            for file in list_connector_configs():
+                if connector_name_from_file(file) not in cls._secure_configs:
+                    cls.decrypt_connector_config(file)
         return cls._secure_configs.copy()
 
     @classmethod
@@ -20,6 +20,7 @@ from hummingbot.client.config.config_helpers import (
 from hummingbot.client.config.gateway_ssl_config_map import SSLConfigMap
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.strategy_config_data_types import BaseStrategyConfigMap
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, AllConnectorSettings, ConnectorType
 from hummingbot.client.tab import __all__ as tab_classes
 from hummingbot.client.tab.data_types import CommandTab
@@ -104,6 +105,7 @@ class HummingbotApplication(*commands):
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: Optional[PerformanceTracker] = None
         self._pmm_script_iterator = None
         self._binance_connector = None
         self._shared_client = None
@@ -321,8 +323,17 @@ class HummingbotApplication(*commands):
             list(self.markets.values()),
             self.strategy_file_name,
             self.strategy_name,
+            write_behind=True,
+            trade_fill_exporter=self.client_config_map.trades_export.build_trade_fill_exporter(),
         )
         self.markets_recorder.start()
+        self.performance_tracker = PerformanceTracker(
+            self.trade_fill_db,
+            list(self.markets.values()),
+            self.strategy_file_name,
+            self.init_time,
+        )
+        self.performance_tracker.start()
         if self._mqtt is not None:
             self._mqtt.start_market_events_fw()
 
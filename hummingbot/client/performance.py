@@ -194,6 +194,11 @@ class PerformanceMetrics:
                 self.s_vol_base += Decimal(str(trade.amount)) * Decimal("-1")
                 self.s_vol_quote += Decimal(str(trade.amount)) * Decimal(str(trade.price))
 
+        self._calculate_volume_totals()
+
+        return buys, sells
+
+    def _calculate_volume_totals(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -204,8 +209,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
             fee_percent = None
@@ -230,6 +233,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -284,15 +290,35 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_portfolio_metrics(trading_pair,
+                                                current_balances,
+                                                start_price=Decimal(str(trades[0].price)),
+                                                last_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self._calculate_return()
+
+    async def _calculate_portfolio_metrics(self,
+                                           trading_pair: str,
+                                           current_balances: Dict[str, Decimal],
+                                           start_price: Decimal,
+                                           last_price: Decimal):
+        """
+        Calculates the balances, prices and portfolio values, once the trade volumes are known
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
+
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -300,9 +326,228 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
 
+    def _calculate_return(self):
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class _PositionOrder:
+    """
+    The fills of a derivative order, aggregated the same way as in `PerformanceMetrics.aggregate_orders`
+    """
+
+    __slots__ = ("order_id", "price_sum", "fills", "amount")
+
+    def __init__(self, order_id: str, price_sum: Decimal = s_decimal_0, fills: int = 0, amount: Decimal = s_decimal_0):
+        self.order_id: str = order_id
+        self.price_sum: Decimal = price_sum
+        self.fills: int = fills
+        self.amount: Decimal = amount
+
+    @property
+    def price(self) -> Decimal:
+        return self.price_sum / self.fills
+
+
+class PerformanceMetricsAccumulator:
+    """
+    Keeps the trade volumes, fees and trade PnL of one market trading pair up to date as the trades are added, so that
+    the performance metrics can be produced without processing all the trades again.
+
+    The results are the same as `PerformanceMetrics.create` with all the trades added so far. For derivatives, the
+    open and close position orders are paired incrementally in the order they were first filled, as in
+    `PerformanceMetrics._calculate_trade_pnl`.
+    """
+
+    # (open position orders, close position orders, sign of the PnL of a pair)
+    _POSITION_PAIRS = (
+        ((TradeType.BUY.name, "OPEN"), (TradeType.SELL.name, "CLOSE"), Decimal("1")),  # long positions
+        ((TradeType.SELL.name, "OPEN"), (TradeType.BUY.name, "CLOSE"), Decimal("-1")),  # short positions
+    )
+
+    def __init__(self, trading_pair: str):
+        self.trading_pair: str = trading_pair
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.start_price: Optional[Decimal] = None
+        self.last_price: Optional[Decimal] = None
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        # Number of buy and sell trades without a position, the trades are not from derivatives if there are any
+        self.nil_position_buys: int = 0
+        self.nil_position_sells: int = 0
+        self.derivative_pnl: Decimal = s_decimal_0
+        self._position_queues: Dict[Tuple[str, str], List[_PositionOrder]] = {
+            queue_key: [] for pair in self._POSITION_PAIRS for queue_key in pair[:2]
+        }
+        self._position_orders: Dict[Tuple[str, str], Tuple[Tuple[str, str], int]] = {}
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def are_derivatives(self) -> bool:
+        return ((self.num_buys > 0 and self.nil_position_buys == 0)
+                or (self.num_sells > 0 and self.nil_position_sells == 0))
+
+    def add_trade(self,
+                  order_id: str,
+                  trade_type: str,
+                  price: Decimal,
+                  amount: Decimal,
+                  trade_fee: Dict[str, Any],
+                  position: str = PositionAction.NIL.value):
+        """
+        Adds a trade to the metrics
+        :param order_id: the client order id of the trade
+        :param trade_type: BUY or SELL
+        :param price: the trade price
+        :param amount: the trade amount
+        :param trade_fee: the trade fee, in the JSON format of the trade fills (`TradeFeeBase.to_json`)
+        :param position: the position action of the trade
+        """
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        price = Decimal(str(price))
+        amount = Decimal(str(amount))
+        trade_type = trade_type.upper()
+        is_nil_position = position is None or position == PositionAction.NIL.value
+
+        if trade_type == TradeType.BUY.name:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+            self.nil_position_buys += int(is_nil_position)
+        elif trade_type == TradeType.SELL.name:
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+            self.nil_position_sells += int(is_nil_position)
+        else:
+            return
+
+        if self.start_price is None:
+            self.start_price = price
+        self.last_price = price
+
+        if trade_fee.get("percent") is not None and Decimal(trade_fee["percent"]) > 0:
+            self.fees[quote] += price * amount * Decimal(str(trade_fee["percent"]))
+        for flat_fee in trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+        self._add_position_fill(order_id, trade_type, price, amount, position)
+
+    async def performance_metrics(self, current_balances: Dict[str, Decimal]) -> PerformanceMetrics:
+        """
+        Produces the performance metrics of the trades added so far
+        :param current_balances: current user account balance
+        """
+        _, quote = split_hb_trading_pair(self.trading_pair)
+        performance = PerformanceMetrics()
+        performance.num_buys = self.num_buys
+        performance.num_sells = self.num_sells
+        performance.num_trades = self.num_trades
+        performance.b_vol_base = self.b_vol_base
+        performance.s_vol_base = self.s_vol_base
+        performance.b_vol_quote = self.b_vol_quote
+        performance.s_vol_quote = self.s_vol_quote
+        performance._calculate_volume_totals()
+
+        await performance._calculate_portfolio_metrics(self.trading_pair,
+                                                       current_balances,
+                                                       start_price=self.start_price or s_decimal_0,
+                                                       last_price=self.last_price or s_decimal_0)
+        if self.are_derivatives:
+            performance.trade_pnl = Decimal(str(self.derivative_pnl))
+        else:
+            performance.trade_pnl = performance.cur_value - performance.hold_value
+
+        performance.fees.update(self.fees)
+        await performance._calculate_fee_in_quote(quote)
+
+        performance._calculate_return()
+        return performance
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "trading_pair": self.trading_pair,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "start_price": str(self.start_price) if self.start_price is not None else None,
+            "last_price": str(self.last_price) if self.last_price is not None else None,
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "nil_position_buys": self.nil_position_buys,
+            "nil_position_sells": self.nil_position_sells,
+            "derivative_pnl": str(self.derivative_pnl),
+            "position_orders": [
+                {
+                    "trade_type": trade_type,
+                    "position": position,
+                    "orders": [[order.order_id, str(order.price_sum), order.fills, str(order.amount)]
+                               for order in orders],
+                }
+                for (trade_type, position), orders in self._position_queues.items()
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceMetricsAccumulator":
+        accumulator = PerformanceMetricsAccumulator(data["trading_pair"])
+        accumulator.num_buys = data["num_buys"]
+        accumulator.num_sells = data["num_sells"]
+        accumulator.b_vol_base = Decimal(data["b_vol_base"])
+        accumulator.s_vol_base = Decimal(data["s_vol_base"])
+        accumulator.b_vol_quote = Decimal(data["b_vol_quote"])
+        accumulator.s_vol_quote = Decimal(data["s_vol_quote"])
+        accumulator.start_price = Decimal(data["start_price"]) if data["start_price"] is not None else None
+        accumulator.last_price = Decimal(data["last_price"]) if data["last_price"] is not None else None
+        accumulator.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        accumulator.nil_position_buys = data["nil_position_buys"]
+        accumulator.nil_position_sells = data["nil_position_sells"]
+        accumulator.derivative_pnl = Decimal(data["derivative_pnl"])
+        for queue_data in data["position_orders"]:
+            queue_key = (queue_data["trade_type"], queue_data["position"])
+            queue = accumulator._position_queues[queue_key]
+            for order_id, price_sum, fills, amount in queue_data["orders"]:
+                accumulator._position_orders[(queue_key[0], order_id)] = (queue_key, len(queue))
+                queue.append(_PositionOrder(order_id, Decimal(price_sum), fills, Decimal(amount)))
+        return accumulator
+
+    def _add_position_fill(self, order_id: str, trade_type: str, price: Decimal, amount: Decimal, position: str):
+        # Orders are aggregated by side, and keep the position of their first fill
+        queue_key, index = self._position_orders.get((trade_type, order_id), ((trade_type, position), None))
+        queue = self._position_queues.get(queue_key)
+        if queue is None:
+            # Orders without an open or close position are never paired
+            return
+        if index is None:
+            index = len(queue)
+            self._position_orders[(trade_type, order_id)] = (queue_key, index)
+            queue.append(_PositionOrder(order_id))
+
+        previous_pnl = self._position_pair_pnl(queue_key, index)
+        order = queue[index]
+        order.price_sum += price
+        order.fills += 1
+        order.amount += amount
+        self.derivative_pnl += self._position_pair_pnl(queue_key, index) - previous_pnl
+
+    def _position_pair_pnl(self, queue_key: Tuple[str, str], index: int) -> Decimal:
+        for open_key, close_key, sign in self._POSITION_PAIRS:
+            if queue_key in (open_key, close_key):
+                open_queue = self._position_queues[open_key]
+                close_queue = self._position_queues[close_key]
+                if index < len(open_queue) and index < len(close_queue) and close_queue[index].fills > 0:
+                    open_order = open_queue[index]
+                    close_order = close_queue[index]
+                    if open_order.fills > 0:
+                        return sign * (close_order.price - open_order.price) * close_order.amount
+        return s_decimal_0
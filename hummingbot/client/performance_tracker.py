@@ -0,0 +1,269 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, not_
+
+from hummingbot import data_path
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent, PositionAction
+from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.trade_fill import TradeFill
+
+pt_logger = None
+
+# (order id, exchange trade id)
+TradeFillKey = Tuple[str, str]
+
+
+class PerformanceTracker:
+    """
+    Keeps the performance metrics of the trades of a strategy config since `start_time` up to date, with one
+    PerformanceMetricsAccumulator per market trading pair fed by the connectors OrderFilled events.
+
+    The accumulated metrics are saved to a checkpoint file every CHECKPOINT_INTERVAL seconds and when the tracker is
+    stopped, with the last trade fill accumulated for each market trading pair. When the tracker is started again for
+    the same config file, the checkpoint of a market trading pair is used if the trades database still has exactly
+    the trade fills it accumulated since the start time, and only the trade fills recorded after its last one are read.
+    Otherwise the metrics of the market trading pair are calculated again from the trades database.
+    """
+    CHECKPOINT_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global pt_logger
+        if pt_logger is None:
+            pt_logger = logging.getLogger(__name__)
+        return pt_logger
+
+    def __init__(self,
+                 sql: SQLConnectionManager,
+                 markets: List[ConnectorBase],
+                 config_file_path: str,
+                 start_time: float,
+                 checkpoint_path: Optional[str] = None):
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._sql_manager: SQLConnectionManager = sql
+        self._markets: List[ConnectorBase] = markets
+        self._config_file_path: str = config_file_path
+        self._start_time: float = start_time
+        self._checkpoint_path: str = checkpoint_path or os.path.join(
+            data_path(), "performance_" + config_file_path[:-4] + ".json")
+        self._accumulators: Dict[Tuple[str, str], PerformanceMetricsAccumulator] = {}
+        # Timestamp of the last trade fill accumulated for each market trading pair, and the trade fills with that
+        # timestamp, to skip them when reading the trades recorded after a checkpoint
+        self._last_fill_timestamps: Dict[Tuple[str, str], int] = {}
+        self._last_fill_keys: Dict[Tuple[str, str], Set[TradeFillKey]] = {}
+        self._last_checkpoint_time: float = 0
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @property
+    def start_timestamp(self) -> int:
+        return int(self._start_time * 1e3)
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self._checkpoint_path
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceMetricsAccumulator]:
+        return self._accumulators
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    def start(self):
+        self.restore()
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self.save_checkpoint()
+
+    async def performance_metrics(self,
+                                  market: str,
+                                  trading_pair: str,
+                                  current_balances: Dict[str, Decimal]) -> Optional[PerformanceMetrics]:
+        accumulator = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            return None
+        return await accumulator.performance_metrics(current_balances)
+
+    def restore(self):
+        """
+        Loads the checkpoint of the market trading pairs that still match the trades database, then adds the trade
+        fills recorded in the database after it
+        """
+        self._accumulators = {}
+        self._last_fill_timestamps = {}
+        self._last_fill_keys = {}
+
+        with self._sql_manager.get_new_session() as session:
+            self._load_checkpoint(session)
+            query = session.query(TradeFill).filter(TradeFill.timestamp >= self.start_timestamp,
+                                                    TradeFill.config_file_path.like(f"%{self._config_file_path}%"))
+            for (market, trading_pair), last_fill_timestamp in self._last_fill_timestamps.items():
+                query = query.filter(not_(and_(TradeFill.market == market,
+                                               TradeFill.symbol == trading_pair,
+                                               TradeFill.timestamp < last_fill_timestamp)))
+            trade_fills: List[TradeFill] = query.order_by(TradeFill.timestamp).all()
+            for trade_fill in trade_fills:
+                key = (trade_fill.market, trade_fill.symbol)
+                if (trade_fill.timestamp == self._last_fill_timestamps.get(key)
+                        and (trade_fill.order_id, trade_fill.exchange_trade_id) in self._last_fill_keys[key]):
+                    continue
+                self._add_trade(market=trade_fill.market,
+                                trading_pair=trade_fill.symbol,
+                                timestamp=trade_fill.timestamp,
+                                order_id=trade_fill.order_id,
+                                exchange_trade_id=trade_fill.exchange_trade_id,
+                                trade_type=trade_fill.trade_type,
+                                price=Decimal(str(trade_fill.price)),
+                                amount=Decimal(str(trade_fill.amount)),
+                                trade_fee=trade_fill.trade_fee,
+                                position=trade_fill.position)
+        self._last_checkpoint_time = time.time()
+
+    def save_checkpoint(self):
+        checkpoint: Dict[str, Any] = {
+            "config_file_path": self._config_file_path,
+            "markets": [
+                {
+                    "market": market,
+                    "trading_pair": trading_pair,
+                    "last_fill_timestamp": self._last_fill_timestamps[(market, trading_pair)],
+                    "last_fill_keys": [list(key) for key in self._last_fill_keys[(market, trading_pair)]],
+                    "accumulator": accumulator.to_json(),
+                }
+                for (market, trading_pair), accumulator in self._accumulators.items()
+            ],
+        }
+        temp_path = self._checkpoint_path + ".tmp"
+        try:
+            with open(temp_path, "w") as checkpoint_file:
+                json.dump(checkpoint, checkpoint_file)
+            os.replace(temp_path, self._checkpoint_path)
+        except Exception:
+            self.logger().error(f"Error saving the performance checkpoint {self._checkpoint_path}.", exc_info=True)
+        self._last_checkpoint_time = time.time()
+
+    def _load_checkpoint(self, session):
+        if not os.path.exists(self._checkpoint_path):
+            return
+        try:
+            with open(self._checkpoint_path) as checkpoint_file:
+                checkpoint: Dict[str, Any] = json.load(checkpoint_file)
+            if checkpoint["config_file_path"] != self._config_file_path:
+                return
+            for market_data in checkpoint["markets"]:
+                key = (market_data["market"], market_data["trading_pair"])
+                accumulator = PerformanceMetricsAccumulator.from_json(market_data["accumulator"])
+                last_fill_timestamp: int = market_data["last_fill_timestamp"]
+                last_fill_keys: Set[TradeFillKey] = set(tuple(fill_key) for fill_key in market_data["last_fill_keys"])
+                if self._matches_trades_database(session, key, accumulator, last_fill_timestamp, last_fill_keys):
+                    self._accumulators[key] = accumulator
+                    self._last_fill_timestamps[key] = last_fill_timestamp
+                    self._last_fill_keys[key] = last_fill_keys
+        except Exception:
+            self._accumulators = {}
+            self._last_fill_timestamps = {}
+            self._last_fill_keys = {}
+            self.logger().warning(f"Could not load the performance checkpoint {self._checkpoint_path}. "
+                                  f"The performance will be calculated from the trades database.", exc_info=True)
+
+    def _matches_trades_database(self,
+                                 session,
+                                 key: Tuple[str, str],
+                                 accumulator: PerformanceMetricsAccumulator,
+                                 last_fill_timestamp: int,
+                                 last_fill_keys: Set[TradeFillKey]) -> bool:
+        """
+        Checks that the trade fills of the market trading pair in the database since the start time and up to the last
+        one in the checkpoint are the ones accumulated in it: the last trade fills are still there, and there are no
+        trade fills missing or added (e.g. from before the start time, or deleted from the database).
+        """
+        market, trading_pair = key
+        filters = (TradeFill.config_file_path.like(f"%{self._config_file_path}%"),
+                   TradeFill.market == market,
+                   TradeFill.symbol == trading_pair)
+        last_trade_fills: Set[TradeFillKey] = set(
+            session.query(TradeFill.order_id, TradeFill.exchange_trade_id)
+            .filter(*filters, TradeFill.timestamp == last_fill_timestamp)
+            .all())
+        if not last_fill_keys.issubset(last_trade_fills):
+            return False
+        num_previous_trade_fills: int = (session
+                                         .query(func.count(TradeFill.exchange_trade_id))
+                                         .filter(*filters,
+                                                 TradeFill.timestamp >= self.start_timestamp,
+                                                 TradeFill.timestamp < last_fill_timestamp)
+                                         .scalar())
+        return last_fill_timestamp >= self.start_timestamp and \
+            num_previous_trade_fills + len(last_fill_keys) == accumulator.num_trades
+
+    def _add_trade(self,
+                   market: str,
+                   trading_pair: str,
+                   timestamp: int,
+                   order_id: str,
+                   exchange_trade_id: str,
+                   trade_type: str,
+                   price: Decimal,
+                   amount: Decimal,
+                   trade_fee: Dict[str, Any],
+                   position: str):
+        accumulator = self._accumulators.get((market, trading_pair))
+        if accumulator is None:
+            accumulator = PerformanceMetricsAccumulator(trading_pair)
+            self._accumulators[(market, trading_pair)] = accumulator
+        accumulator.add_trade(order_id=order_id,
+                              trade_type=trade_type,
+                              price=price,
+                              amount=amount,
+                              trade_fee=trade_fee,
+                              position=position)
+
+        key = (market, trading_pair)
+        if timestamp > self._last_fill_timestamps.get(key, 0):
+            self._last_fill_timestamps[key] = timestamp
+            self._last_fill_keys[key] = set()
+        if timestamp == self._last_fill_timestamps[key]:
+            self._last_fill_keys[key].add((order_id, exchange_trade_id))
+
+    def _did_fill_order(self,
+                        event_tag: int,
+                        market: ConnectorBase,
+                        evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+
+        # Same values as the trade fill saved by the markets recorder
+        timestamp: int = int(evt.timestamp * 1e3) if evt.timestamp is not None else int(time.time() * 1e3)
+        self._add_trade(market=market.display_name,
+                        trading_pair=evt.trading_pair,
+                        timestamp=timestamp,
+                        order_id=evt.order_id,
+                        exchange_trade_id=evt.exchange_trade_id,
+                        trade_type=evt.trade_type.name,
+                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                        amount=Decimal(evt.amount),
+                        trade_fee=evt.trade_fee.to_json(),
+                        position=evt.position if evt.position else PositionAction.NIL.value)
+
+        if time.time() - self._last_checkpoint_time >= self.CHECKPOINT_INTERVAL:
+            self.save_checkpoint()
@@ -1,16 +1,17 @@
+import hashlib
 import importlib
 import json
 from decimal import Decimal
 from enum import Enum
-from os import DirEntry, scandir
-from os.path import exists, join, realpath
+from os import DirEntry, replace, scandir, stat, walk
+from os.path import dirname, exists, join, realpath, relpath
 from types import ModuleType
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
 if TYPE_CHECKING:
@@ -62,6 +63,8 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 ]
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES = ["test_support", "utilities", "gateway"]
+# Changing the content of the connector settings manifest requires a new version, to recreate the existing manifests
+CONNECTOR_SETTINGS_MANIFEST_VERSION = 1
 
 
 class ConnectorType(Enum):
@@ -353,6 +356,49 @@ class ConnectorSetting(NamedTuple):
         return self.type.name.lower()
 
 
+class LazyConnectorSetting(ConnectorSetting):
+    """
+    A ConnectorSetting created from the connector settings manifest. The config keys are loaded from the connector
+    utils module (importing it) the first time they are accessed.
+    """
+
+    @classmethod
+    def create(cls,
+               utils_module_path: str,
+               has_config_keys: bool,
+               config_keys_domain: Optional[str] = None,
+               **kwargs) -> "LazyConnectorSetting":
+        """
+        :param utils_module_path: the module path of the connector utils module
+        :param has_config_keys: False if the utils module defines no config keys for the connector
+        :param config_keys_domain: the domain name, for the settings of other domains of a connector
+        :param kwargs: the other ConnectorSetting fields
+        """
+        setting = cls(config_keys=None, **kwargs)
+        setting.__dict__.update(utils_module_path=utils_module_path,
+                                has_config_keys=has_config_keys,
+                                config_keys_domain=config_keys_domain)
+        return setting
+
+    def lazy_copy(self, **kwargs) -> "LazyConnectorSetting":
+        """
+        Creates a setting with other field values, that shares the config keys of this one
+        """
+        return LazyConnectorSetting.create(utils_module_path=self.__dict__["utils_module_path"],
+                                           has_config_keys=self.__dict__["has_config_keys"],
+                                           config_keys_domain=self.__dict__["config_keys_domain"],
+                                           **kwargs)
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        if not self.__dict__["has_config_keys"]:
+            return None
+        util_module = importlib.import_module(self.__dict__["utils_module_path"])
+        if self.__dict__["config_keys_domain"] is None:
+            return getattr(util_module, "KEYS", None)
+        return getattr(util_module, "OTHER_DOMAINS_KEYS")[self.__dict__["config_keys_domain"]]
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
 
@@ -360,68 +406,58 @@ class AllConnectorSettings:
     def create_connector_settings(cls):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        The settings are read from the connector settings manifest, without importing the connectors utils modules.
+        The manifest is created (importing all the utils modules) when it does not exist or when any connector
+        changed since it was created. The connectors that could not be imported are checked again on every call.
+        The config keys of each connector are only loaded when they are used.
         """
         cls.all_connector_settings = {}  # reset
-        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
 
-        type_dirs: List[DirEntry] = [
-            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
-            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-        ]
-        for type_dir in type_dirs:
-            if type_dir.name == 'gateway':
+        utils_modules: List[Tuple[str, str, str, str]] = cls._connector_utils_modules()
+        fingerprint: str = cls._connector_utils_fingerprint(utils_modules)
+        manifest: Optional[Dict[str, Any]] = cls._load_connector_settings_manifest(fingerprint)
+        if manifest is None:
+            manifest = cls._create_connector_settings_manifest(utils_modules, fingerprint)
+            cls._save_connector_settings_manifest(manifest)
+        elif cls._recheck_unavailable_connectors(manifest):
+            cls._save_connector_settings_manifest(manifest)
+
+        for entry in manifest["connectors"]:
+            if not entry["available"]:
                 continue
-            connector_dirs: List[DirEntry] = [
-                cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                    trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            cls.all_connector_settings[entry["name"]] = LazyConnectorSetting.create(
+                utils_module_path=entry["module"],
+                has_config_keys=entry["has_config_keys"],
+                name=entry["name"],
+                type=ConnectorType[entry["type"].capitalize()],
+                centralised=entry["centralised"],
+                example_pair=entry["example_pair"],
+                use_ethereum_wallet=entry["use_ethereum_wallet"],
+                trade_fee_schema=cls._trade_fee_schema_from_json(entry["trade_fee_schema"]),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+            )
+            # Adds other domains of connector
+            parent = cls.all_connector_settings[entry["name"]]
+            for domain_entry in entry["other_domains"]:
+                cls.all_connector_settings[domain_entry["name"]] = LazyConnectorSetting.create(
+                    utils_module_path=entry["module"],
+                    has_config_keys=domain_entry["has_config_keys"],
+                    config_keys_domain=domain_entry["name"],
+                    name=domain_entry["name"],
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=domain_entry["example_pair"],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
+                    trade_fee_schema=cls._trade_fee_schema_from_json(domain_entry["trade_fee_schema"]),
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=domain_entry["domain_parameter"],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
                 )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
 
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
@@ -451,19 +487,24 @@ class AllConnectorSettings:
         for e in paper_trade_exchanges:
             base_connector_settings: Optional[ConnectorSetting] = cls.all_connector_settings.get(e, None)
             if base_connector_settings:
-                paper_trade_settings = ConnectorSetting(
+                paper_trade_params = dict(
                     name=f"{e}_paper_trade",
                     type=base_connector_settings.type,
                     centralised=base_connector_settings.centralised,
                     example_pair=base_connector_settings.example_pair,
                     use_ethereum_wallet=base_connector_settings.use_ethereum_wallet,
                     trade_fee_schema=base_connector_settings.trade_fee_schema,
-                    config_keys=base_connector_settings.config_keys,
                     is_sub_domain=False,
                     parent_name=base_connector_settings.name,
                     domain_parameter=None,
                     use_eth_gas_lookup=base_connector_settings.use_eth_gas_lookup,
                 )
+                if isinstance(base_connector_settings, LazyConnectorSetting):
+                    # Shares the config keys of the exchange, without loading them yet
+                    paper_trade_settings = base_connector_settings.lazy_copy(**paper_trade_params)
+                else:
+                    paper_trade_settings = ConnectorSetting(config_keys=base_connector_settings.config_keys,
+                                                            **paper_trade_params)
                 cls.all_connector_settings.update({f"{e}_paper_trade": paper_trade_settings})
 
     @classmethod
@@ -540,6 +581,179 @@ class AllConnectorSettings:
     def get_example_assets(cls) -> Dict[str, str]:
         return {name: cs.example_pair.split("-")[0] for name, cs in cls.get_connector_settings().items()}
 
+    @classmethod
+    def connector_settings_manifest_path(cls) -> str:
+        return join(data_path(), "connector_settings_manifest.json")
+
+    @staticmethod
+    def _connector_utils_modules() -> List[Tuple[str, str, str, str]]:
+        """
+        Returns the type directory name, connector name, utils module path and utils file path of all the connectors
+        """
+        connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        utils_modules: List[Tuple[str, str, str, str]] = []
+        connector_names: Set[str] = set()
+
+        type_dirs: List[DirEntry] = [
+            cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
+            if f.is_dir() and f.name not in CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
+        ]
+        for type_dir in sorted(type_dirs, key=lambda d: d.name):
+            if type_dir.name == 'gateway':
+                continue
+            connector_dirs: List[DirEntry] = [
+                cast(DirEntry, f) for f in scandir(type_dir.path)
+                if f.is_dir() and exists(join(f.path, "__init__.py"))
+            ]
+            for connector_dir in sorted(connector_dirs, key=lambda d: d.name):
+                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
+                    continue
+                if connector_dir.name in connector_names:
+                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+                connector_names.add(connector_dir.name)
+                utils_modules.append((
+                    type_dir.name,
+                    connector_dir.name,
+                    f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils",
+                    join(connector_dir.path, f"{connector_dir.name}_utils.py"),
+                ))
+        return utils_modules
+
+    @staticmethod
+    def _connector_utils_fingerprint(utils_modules: List[Tuple[str, str, str, str]]) -> str:
+        """
+        Identifies the current version of the connectors, from the Hummingbot version and the modification times and
+        sizes of the source files of every connector package (the utils modules import the constants and other
+        modules of their package)
+        """
+        fingerprint = hashlib.sha256(str(CONNECTOR_SETTINGS_MANIFEST_VERSION).encode())
+        version_path = join(root_path(), "hummingbot", "VERSION")
+        if exists(version_path):
+            with open(version_path) as version_file:
+                fingerprint.update(f"{version_file.read().strip()};".encode())
+        for _, _, module_path, file_path in utils_modules:
+            fingerprint.update(f"{module_path};".encode())
+            package_path = dirname(file_path)
+            for dir_path, dir_names, file_names in walk(package_path):
+                dir_names[:] = sorted(dir_name for dir_name in dir_names if dir_name != "__pycache__")
+                for file_name in sorted(file_names):
+                    if not file_name.endswith((".py", ".pyx", ".pxd")):
+                        continue
+                    file_path = join(dir_path, file_name)
+                    file_stat = stat(file_path)
+                    fingerprint.update(f"{relpath(file_path, package_path)}:{file_stat.st_mtime_ns}:"
+                                       f"{file_stat.st_size};".encode())
+        return fingerprint.hexdigest()
+
+    @classmethod
+    def _load_connector_settings_manifest(cls, fingerprint: str) -> Optional[Dict[str, Any]]:
+        manifest_path = cls.connector_settings_manifest_path()
+        if not exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path) as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        return manifest if manifest.get("fingerprint") == fingerprint else None
+
+    @classmethod
+    def _save_connector_settings_manifest(cls, manifest: Dict[str, Any]):
+        manifest_path = cls.connector_settings_manifest_path()
+        temp_path = manifest_path + ".tmp"
+        try:
+            with open(temp_path, "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+            replace(temp_path, manifest_path)
+        except OSError:
+            # The settings are created from the utils modules again on the next start
+            pass
+
+    @classmethod
+    def _create_connector_settings_manifest(cls,
+                                            utils_modules: List[Tuple[str, str, str, str]],
+                                            fingerprint: str) -> Dict[str, Any]:
+        connectors: List[Dict[str, Any]] = [
+            cls._connector_settings_manifest_entry(type_dir_name, connector_name, util_module_path)
+            for type_dir_name, connector_name, util_module_path, _ in utils_modules
+        ]
+        return {"fingerprint": fingerprint, "connectors": connectors}
+
+    @classmethod
+    def _recheck_unavailable_connectors(cls, manifest: Dict[str, Any]) -> bool:
+        """
+        Tries to import again the utils modules of the connectors that could not be imported when the manifest was
+        created (e.g. because of a missing dependency installed since then), and updates their entries.
+        Returns True if any of them is available now.
+        """
+        updated = False
+        connectors: List[Dict[str, Any]] = manifest["connectors"]
+        for i, entry in enumerate(connectors):
+            if entry["available"]:
+                continue
+            new_entry = cls._connector_settings_manifest_entry(entry["type"], entry["name"], entry["module"])
+            if new_entry["available"]:
+                connectors[i] = new_entry
+                updated = True
+        return updated
+
+    @classmethod
+    def _connector_settings_manifest_entry(cls,
+                                           type_dir_name: str,
+                                           connector_name: str,
+                                           util_module_path: str) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"name": connector_name, "type": type_dir_name, "module": util_module_path}
+        try:
+            util_module = importlib.import_module(util_module_path)
+        except ModuleNotFoundError:
+            entry["available"] = False
+            return entry
+        trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+        trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(connector_name, trade_fee_settings)
+        entry.update(
+            available=True,
+            centralised=getattr(util_module, "CENTRALIZED", True),
+            example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+            use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+            trade_fee_schema=cls._trade_fee_schema_to_json(trade_fee_schema),
+            has_config_keys=getattr(util_module, "KEYS", None) is not None,
+            use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            other_domains=[],
+        )
+        for domain in getattr(util_module, "OTHER_DOMAINS", []):
+            trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+            trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+            entry["other_domains"].append({
+                "name": domain,
+                "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                "trade_fee_schema": cls._trade_fee_schema_to_json(trade_fee_schema),
+                "has_config_keys": getattr(util_module, "OTHER_DOMAINS_KEYS")[domain] is not None,
+                "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+            })
+        return entry
+
+    @staticmethod
+    def _trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": trade_fee_schema.percent_fee_token,
+            "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+            "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+        }
+
+    @staticmethod
+    def _trade_fee_schema_from_json(data: Dict[str, Any]) -> TradeFeeSchema:
+        return TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["maker_fixed_fees"]],
+            taker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["taker_fixed_fees"]],
+        )
+
     @staticmethod
     def _validate_trade_fee_schema(
         exchange_name: str, trade_fee_schema: Optional[Union[TradeFeeSchema, List[float]]]
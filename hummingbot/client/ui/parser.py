@@ -139,6 +139,12 @@ def load_parser(hummingbot: "HummingbotApplication", command_tabs) -> [ThrowingA
     ticker_parser.add_argument("--market", type=str, dest="market", help="The market (trading pair) of the order book")
     ticker_parser.set_defaults(func=hummingbot.ticker)
 
+    metrics_parser = subparsers.add_parser("metrics", help="Show the clock tick durations, event loop lag, REST "
+                                                           "latencies and task and queue gauges")
+    metrics_parser.add_argument("--reset", default=False, action="store_true", dest="reset",
+                                help="Clear the recorded durations after showing them")
+    metrics_parser.set_defaults(func=hummingbot.metrics)
+
     pmm_script_parser = subparsers.add_parser("pmm_script", help="Send command to running PMM script instance")
     pmm_script_parser.add_argument("cmd", nargs="?", default=None, help="Command")
     pmm_script_parser.add_argument("args", nargs="*", default=None, help="Arguments")
@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Deque, Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -12,8 +12,10 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.time_windowed_index import TimeWindowedIndex
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.event.order_filled_store import OrderFilledStore
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -21,6 +23,7 @@ from hummingbot.core.utils.estimate_fee import estimate_fee
 if TYPE_CHECKING:
     from hummingbot.client.config.client_config_map import ClientConfigMap
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
+    from hummingbot.connector.markets_recorder import MarketsRecorder
 
 
 cdef class ConnectorBase(NetworkIterator):
@@ -43,6 +46,12 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    # The trade fills and exchange order ids recorded in the last days are indexed to detect the new fills without
+    # querying the DB, the older ones are looked up in the MarketsRecorder
+    RECORDED_IDS_INDEX_WINDOW = 3 * 24 * 60 * 60.0
+    RECORDED_IDS_INDEX_MAX_SIZE = 100_000
+    # The exchange order ids not found in the DB are not looked up again during this time
+    UNRECORDED_EXCHANGE_ORDER_IDS_WINDOW = 60.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
@@ -62,8 +71,14 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
-        self._current_trade_fills = set()
-        self._exchange_order_ids = dict()
+        self._in_flight_orders_snapshot_balances = None  # (snapshot, estimated fee, balances locked in the snapshot)
+        self._current_trade_fills = TimeWindowedIndex(window=self.RECORDED_IDS_INDEX_WINDOW,
+                                                      max_size=self.RECORDED_IDS_INDEX_MAX_SIZE)
+        self._exchange_order_ids = TimeWindowedIndex(window=self.RECORDED_IDS_INDEX_WINDOW,
+                                                     max_size=self.RECORDED_IDS_INDEX_MAX_SIZE)
+        self._unrecorded_exchange_order_ids = TimeWindowedIndex(window=self.UNRECORDED_EXCHANGE_ORDER_IDS_WINDOW,
+                                                                max_size=self.RECORDED_IDS_INDEX_MAX_SIZE)
+        self._markets_recorder = None
         self._trade_fee_schema = None
         self._trade_volume_metric_collector = client_config_map.anonymized_metrics_mode.get_collector(
             connector=self,
@@ -116,23 +131,43 @@ cdef class ConnectorBase(NetworkIterator):
         :param in_flight_orders: a dictionary of in-flight orders
         :return A dictionary of tokens and their balance locked in the orders
         """
-        asset_balances = {}
         if in_flight_orders is None:
-            return asset_balances
+            return {}
+        if in_flight_orders is not self._in_flight_orders_snapshot:
+            return self._compute_in_flight_asset_balances(in_flight_orders)[0]
+        # The snapshot only changes when a new one is taken (it is replaced, holding copies of the orders), so its
+        # balances are reused until then, as long as the estimated fee they were calculated with did not change.
+        cached = self._in_flight_orders_snapshot_balances
+        if (cached is None
+                or cached[0] is not in_flight_orders
+                or (cached[1] is not None and cached[1] != self.estimate_fee_pct(True))):
+            asset_balances, fee = self._compute_in_flight_asset_balances(in_flight_orders)
+            cached = (in_flight_orders, fee, asset_balances)
+            self._in_flight_orders_snapshot_balances = cached
+        return dict(cached[2])
+
+    def _compute_in_flight_asset_balances(
+            self, in_flight_orders: Dict[str, InFlightOrderBase]) -> Tuple[Dict[str, Decimal], Optional[Decimal]]:
+        """
+        :return the asset balances locked in the orders, and the estimated fee used for BUY orders (None if there are
+        no BUY orders)
+        """
+        asset_balances = {}
+        fee = None
         for order in (o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)):
             outstanding_amount = order.amount - order.executed_amount_base
             if order.trade_type is TradeType.BUY:
-                outstanding_value = outstanding_amount * order.price
+                if fee is None:
+                    fee = self.estimate_fee_pct(True)
+                outstanding_value = outstanding_amount * order.price * (Decimal(1) + fee)
                 if order.quote_asset not in asset_balances:
                     asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= Decimal(1) + fee
                 asset_balances[order.quote_asset] += outstanding_value
             else:
                 if order.base_asset not in asset_balances:
                     asset_balances[order.base_asset] = s_decimal_0
                 asset_balances[order.base_asset] += outstanding_amount
-        return asset_balances
+        return asset_balances, fee
 
     def order_filled_balances(self, starting_timestamp = 0) -> Dict[str, Decimal]:
         """
@@ -142,24 +177,7 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
-        balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
-        return balances
+        return self.order_filled_store.balance_changes(starting_timestamp)
 
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
@@ -187,6 +205,20 @@ cdef class ConnectorBase(NetworkIterator):
     def event_logs(self) -> List[any]:
         return self._event_logger.event_log
 
+    @property
+    def order_filled_events(self) -> Deque[OrderFilledEvent]:
+        """
+        The most recent order filled events
+        """
+        return self._event_logger.order_filled_events
+
+    @property
+    def order_filled_store(self) -> OrderFilledStore:
+        """
+        The aggregated volumes and fees of all the order filled events, by trading pair and side
+        """
+        return self._event_logger.order_filled_store
+
     @property
     def ready(self) -> bool:
         """
@@ -505,6 +537,13 @@ cdef class ConnectorBase(NetworkIterator):
     def available_balances(self) -> Dict[str, Decimal]:
         return self._account_available_balances
 
+    def set_markets_recorder(self, markets_recorder: Optional["MarketsRecorder"]):
+        """
+        Sets the MarketsRecorder used to look up the trade fills and orders not in the recent ids indexes
+        """
+        self._markets_recorder = markets_recorder
+        self._unrecorded_exchange_order_ids.clear()
+
     def add_trade_fills_from_market_recorder(self, current_trade_fills: Set[TradeFillOrderDetails]):
         """
         Gets updates from new records in TradeFill table. This is used in method is_confirmed_new_order_filled_event
@@ -516,15 +555,39 @@ cdef class ConnectorBase(NetworkIterator):
         Gets updates from new orders in Order table. This is used in method connector _history_reconciliation
         """
         self._exchange_order_ids.update(current_exchange_order_ids)
+        for exchange_order_id in current_exchange_order_ids:
+            self._unrecorded_exchange_order_ids.remove(exchange_order_id)
 
     def is_confirmed_new_order_filled_event(self, exchange_trade_id: str, exchange_order_id: str, trading_pair: str):
         """
         Returns True if order to be filled is not already present in TradeFill entries.
         This is intended to avoid duplicated order fills in local DB.
+        The recent trade fills and orders are looked up in the indexes, the older ones in the MarketsRecorder (and added
+        back to the indexes when found).
         """
         # Assume (market, exchange_trade_id, trading_pair) are unique. Also order has to be recorded in Order table
-        return (not TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair) in self._current_trade_fills) and \
-               (exchange_order_id in set(self._exchange_order_ids.keys()))
+        if not self._is_exchange_order_id_recorded(exchange_order_id):
+            return False
+        trade_fill = TradeFillOrderDetails(self.display_name, exchange_trade_id, trading_pair)
+        if trade_fill in self._current_trade_fills:
+            return False
+        if (self._markets_recorder is not None
+                and self._markets_recorder.is_trade_fill_recorded(self, exchange_trade_id, trading_pair)):
+            self._current_trade_fills.add(trade_fill)
+            return False
+        return True
+
+    def _is_exchange_order_id_recorded(self, exchange_order_id: str) -> bool:
+        if exchange_order_id in self._exchange_order_ids:
+            return True
+        if self._markets_recorder is None or exchange_order_id in self._unrecorded_exchange_order_ids:
+            return False
+        order_id = self._markets_recorder.get_order_id_for_exchange_order_id(self, exchange_order_id)
+        if order_id is None:
+            self._unrecorded_exchange_order_ids.add(exchange_order_id)
+            return False
+        self._exchange_order_ids.add(exchange_order_id, order_id)
+        return True
 
     def trade_fee_schema(self):
         if self._trade_fee_schema is None:
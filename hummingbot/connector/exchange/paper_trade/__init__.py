@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Optional
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
 from hummingbot.client.settings import AllConnectorSettings
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
 
 
 def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> OrderBookTracker:
@@ -22,3 +23,23 @@ def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfi
                               tracker,
                               get_connector_class(exchange_name),
                               exchange_name=exchange_name)
+
+
+def create_replay_paper_trade_market(exchange_name: str,
+                                     client_config_map: ClientConfigAdapter,
+                                     trading_pairs: List[str],
+                                     records_path: str,
+                                     start_timestamp: Optional[float] = None,
+                                     end_timestamp: Optional[float] = None,
+                                     memory_mapped_path: Optional[str] = None):
+    data_source = ReplayOrderBookTrackerDataSource(root_path=records_path,
+                                                   exchange=exchange_name,
+                                                   trading_pairs=trading_pairs,
+                                                   start_timestamp=start_timestamp,
+                                                   end_timestamp=end_timestamp,
+                                                   memory_mapped_path=memory_mapped_path)
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+    return PaperTradeExchange(client_config_map,
+                              tracker,
+                              get_connector_class(exchange_name),
+                              exchange_name=exchange_name)
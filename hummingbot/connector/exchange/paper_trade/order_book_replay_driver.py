@@ -0,0 +1,134 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent
+
+obrd_logger = None
+
+
+class ReplayReport(NamedTuple):
+    messages: int
+    trades: int
+    ticks: int
+    start_timestamp: float
+    end_timestamp: float
+    duration: float
+
+    @property
+    def events_per_second(self) -> float:
+        return self.messages / self.duration if self.duration > 0 else 0.0
+
+
+class OrderBookReplayDriver:
+    """
+    Backtests the clock iterators (the paper trade market and the strategies) over the order book data replayed by
+    the market ReplayOrderBookTrackerDataSource, as fast as the CPU allows.
+
+    The recorded messages are applied to the market order books in timestamp order. Before applying a message, the
+    clock is advanced through all the ticks before the message timestamp, so that each tick sees the order books as
+    they were at that time. The diffs received between two ticks are applied in a single batch, and the trades are
+    applied to the order books, which makes the market match them to its limit orders.
+    """
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global obrd_logger
+        if obrd_logger is None:
+            obrd_logger = logging.getLogger(__name__)
+        return obrd_logger
+
+    def __init__(self, clock: Clock, market: PaperTradeExchange):
+        if clock.clock_mode is not ClockMode.BACKTEST:
+            raise ValueError("The order book replay requires a clock in BACKTEST mode.")
+        data_source = market.order_book_tracker.data_source
+        if not isinstance(data_source, ReplayOrderBookTrackerDataSource):
+            raise ValueError("The order book replay requires a market using a ReplayOrderBookTrackerDataSource.")
+        self._clock: Clock = clock
+        self._market: PaperTradeExchange = market
+        self._data_source: ReplayOrderBookTrackerDataSource = data_source
+        self._pending_diffs: Dict[str, List[OrderBookMessage]] = defaultdict(list)
+
+    def run(self) -> ReplayReport:
+        start_time = time.perf_counter()
+        start_timestamp = self._clock.current_timestamp
+        tick_size = self._clock.tick_size
+        last_message_timestamp = start_timestamp
+        messages = trades = 0
+
+        order_books = self._initialize_order_books()
+        for message in self._data_source.replay_messages():
+            if message.timestamp - tick_size > self._clock.current_timestamp:
+                self._apply_pending_diffs(order_books)
+                self._clock.backtest_til(message.timestamp - tick_size)
+
+            order_book = order_books[message.trading_pair]
+            if message.type is OrderBookMessageType.DIFF:
+                if message.update_id >= order_book.snapshot_uid:
+                    self._pending_diffs[message.trading_pair].append(message)
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._apply_trading_pair_pending_diffs(message.trading_pair, order_book)
+                order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+            else:
+                self._apply_trading_pair_pending_diffs(message.trading_pair, order_book)
+                self._apply_trade(order_book, message)
+                trades += 1
+            messages += 1
+            last_message_timestamp = message.timestamp
+
+        self._apply_pending_diffs(order_books)
+        self._clock.backtest_til(max(self._clock.current_timestamp, last_message_timestamp))
+        duration = time.perf_counter() - start_time
+
+        report = ReplayReport(messages=messages,
+                              trades=trades,
+                              ticks=int(round((self._clock.current_timestamp - start_timestamp) / tick_size)),
+                              start_timestamp=start_timestamp,
+                              end_timestamp=self._clock.current_timestamp,
+                              duration=duration)
+        self.logger().info(f"Replayed {report.messages} order book messages ({report.trades} trades) and "
+                           f"{report.ticks} ticks in {report.duration:.2f} seconds "
+                           f"({report.events_per_second:.0f} events per second).")
+        return report
+
+    def _initialize_order_books(self) -> Dict[str, OrderBook]:
+        order_books = {}
+        for trading_pair in self._data_source.trading_pairs:
+            snapshot: OrderBookMessage = self._data_source.initial_snapshot(trading_pair)
+            order_book: OrderBook = self._data_source.order_book_create_function()
+            order_book.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+            order_books[trading_pair] = order_book
+        self._market.order_book_tracker.initialize_order_books(order_books)
+        # Checking the market readiness registers it as listener of the order books trades
+        self._market.ready
+        return order_books
+
+    def _apply_pending_diffs(self, order_books: Dict[str, OrderBook]):
+        for trading_pair, diffs in self._pending_diffs.items():
+            if len(diffs) > 0:
+                self._apply_trading_pair_pending_diffs(trading_pair, order_books[trading_pair])
+
+    def _apply_trading_pair_pending_diffs(self, trading_pair: str, order_book: OrderBook):
+        diffs: List[OrderBookMessage] = self._pending_diffs[trading_pair]
+        if len(diffs) > 0:
+            order_book.apply_raw_diff_messages(diffs)
+            self._pending_diffs[trading_pair] = []
+
+    @staticmethod
+    def _apply_trade(order_book: OrderBook, trade_message: OrderBookMessage):
+        order_book.apply_trade(OrderBookTradeEvent(
+            trading_pair=trade_message.trading_pair,
+            timestamp=trade_message.timestamp,
+            price=float(trade_message.content["price"]),
+            amount=float(trade_message.content["amount"]),
+            type=TradeType.SELL if
+            trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+        ))
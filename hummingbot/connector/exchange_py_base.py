@@ -16,6 +16,7 @@ from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import RequestPriority, request_priority
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
@@ -475,7 +476,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             return
 
         try:
-            exchange_order_id = await self._place_order_and_process_update(order=order, **kwargs,)
+            with request_priority(RequestPriority.CREATE_ORDER):
+                exchange_order_id = await self._place_order_and_process_update(order=order, **kwargs,)
 
         except asyncio.CancelledError:
             raise
@@ -544,7 +546,8 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._execute_order_cancel_and_process_update(order=order)
+            with request_priority(RequestPriority.CANCEL_ORDER):
+                cancelled = await self._execute_order_cancel_and_process_update(order=order)
             if cancelled:
                 return order.client_order_id
         except asyncio.CancelledError:
@@ -756,7 +759,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_rules())
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -776,7 +780,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.REFERENCE_DATA):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -801,7 +806,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                if self._time_synchronizer.resync_due:
+                    await self._update_time_synchronizer()
 
                 # the following method is implementation-specific
                 await self._status_polling_loop_fetch_updates()
@@ -1,16 +1,20 @@
 import asyncio
+import logging
 import os.path
+import queue
 import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from decimal import Decimal
-from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.trade_fill_exporter import TradeFillExporter
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.event.events import (
@@ -39,18 +43,52 @@ from hummingbot.model.range_position_update import RangePositionUpdate
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
 from hummingbot.model.trade_fill import TradeFill
 
+mr_logger = None
+
+# A database write, executed inside an open transaction
+DBWrite = Callable[[Session], Any]
+
 
 class MarketsRecorder:
+    """
+    Records the orders, trades and market states of the connectors in the trades database.
+
+    In write-behind mode, the records are not written from the event loop. They are put in a bounded queue, drained
+    by a writer thread that saves them in batched transactions, and the connectors tracking states are saved at most
+    once every MARKET_STATES_SAVE_INTERVAL seconds. The event loop never waits for the queue: when it is full, the
+    records are kept in an overflow list that is moved to the queue as the writer catches up. The reads return the
+    records already saved, `wait_for_pending_writes()` waits (without blocking the event loop) for the ones queued
+    before it, and the queue is flushed when the recorder is stopped.
+
+    The trade fills are exported to CSV after their transaction is committed, so a batch retried record by record
+    after a failure does not export them twice.
+    """
+    MAX_PENDING_WRITES = 10000
+    WRITE_BATCH_SIZE = 500
+    MARKET_STATES_SAVE_INTERVAL = 1.0
+    OVERFLOW_DRAIN_INTERVAL = 0.1
+    # Key of the Session.info list with the functions to call once the session transaction is committed
+    AFTER_COMMIT_INFO_KEY = "markets_recorder_after_commit"
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
     }
 
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global mr_logger
+        if mr_logger is None:
+            mr_logger = logging.getLogger(__name__)
+        return mr_logger
+
     def __init__(self,
                  sql: SQLConnectionManager,
                  markets: List[ConnectorBase],
                  config_file_path: str,
-                 strategy_name: str):
+                 strategy_name: str,
+                 write_behind: bool = False,
+                 trade_fill_exporter: Optional[TradeFillExporter] = None):
         if threading.current_thread() != threading.main_thread():
             raise EnvironmentError("MarketsRecorded can only be initialized from the main thread.")
 
@@ -59,6 +97,14 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        self._write_behind: bool = write_behind
+        self._trade_fill_exporter: TradeFillExporter = trade_fill_exporter or TradeFillExporter()
+        self._write_queue: queue.Queue = queue.Queue(maxsize=self.MAX_PENDING_WRITES)
+        self._overflow_writes: Deque[DBWrite] = deque()
+        self._overflow_drain_handle: Optional[asyncio.TimerHandle] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._markets_with_pending_states: Set[ConnectorBase] = set()
+        self._market_states_save_handle: Optional[asyncio.TimerHandle] = None
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -114,19 +160,84 @@ class MarketsRecorder:
     def db_timestamp(self) -> int:
         return int(time.time() * 1e3)
 
+    @property
+    def write_behind(self) -> bool:
+        return self._write_behind
+
+    @property
+    def pending_writes(self) -> int:
+        return self._write_queue.qsize() + len(self._overflow_writes)
+
     def start(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.add_listener(event_pair[0], event_pair[1])
+            market.set_markets_recorder(self)
+        if self._write_behind and (self._writer_thread is None or not self._writer_thread.is_alive()):
+            self._writer_thread = threading.Thread(target=self._writer_loop, name="MarketsRecorderWriter", daemon=True)
+            self._writer_thread.start()
 
     def stop(self):
         for market in self._markets:
             for event_pair in self._event_pairs:
                 market.remove_listener(event_pair[0], event_pair[1])
+            market.set_markets_recorder(None)
+        if self._write_behind:
+            self.flush()
+            if self._writer_thread is not None and self._writer_thread.is_alive():
+                self._write_queue.put(None)
+                self._writer_thread.join()
+            self._writer_thread = None
+        self._trade_fill_exporter.close()
+
+    def flush(self):
+        """
+        Blocks until all the pending records (including the debounced market states) are saved in the database.
+        It is meant for the recorder shutdown. From the event loop use `wait_for_pending_writes()` instead.
+        """
+        if not self._write_behind:
+            return
+        self._enqueue_pending_market_states()
+        if self._overflow_drain_handle is not None:
+            self._overflow_drain_handle.cancel()
+            self._overflow_drain_handle = None
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            while len(self._overflow_writes) > 0:
+                self._write_queue.put(self._overflow_writes.popleft())
+            self._write_queue.join()
+        else:
+            writes: List[DBWrite] = []
+            while not self._write_queue.empty():
+                writes.append(self._write_queue.get_nowait())
+                self._write_queue.task_done()
+            writes.extend(self._overflow_writes)
+            self._overflow_writes.clear()
+            self._execute_writes([write for write in writes if write is not None])
+
+    async def wait_for_pending_writes(self):
+        """
+        Waits, without blocking the event loop, until the records queued so far are saved in the database.
+        The debounced market states are not forced out.
+        """
+        if not self._write_behind or self.pending_writes == 0:
+            return
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self.flush()
+            return
+        saved: Future = Future()
+
+        def mark_saved(session: Session):
+            self._after_commit(session, lambda: saved.set_result(None))
+
+        self._enqueue(mark_saved)
+        await asyncio.wrap_future(saved)
 
     def get_orders_for_config_and_market(self, config_file_path: str, market: ConnectorBase,
                                          with_exchange_order_id_present: Optional[bool] = False,
                                          number_of_rows: Optional[int] = None) -> List[Order]:
+        """
+        Reads the orders saved in the database (in write-behind mode, the ones still queued are not included)
+        """
         with self._sql_manager.get_new_session() as session:
             filters = [Order.config_file_path == config_file_path,
                        Order.market == market.display_name]
@@ -142,6 +253,9 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def get_trades_for_config(self, config_file_path: str, number_of_rows: Optional[int] = None) -> List[TradeFill]:
+        """
+        Reads the trade fills saved in the database (in write-behind mode, the ones still queued are not included)
+        """
         with self._sql_manager.get_new_session() as session:
             query: Query = (session
                             .query(TradeFill)
@@ -152,18 +266,57 @@ class MarketsRecorder:
             else:
                 return query.limit(number_of_rows).all()
 
+    def is_trade_fill_recorded(self, market: ConnectorBase, exchange_trade_id: str, trading_pair: str) -> bool:
+        """
+        Looks up a trade fill of the config in the DB. The pending writes are not flushed: the connectors already know
+        the fills recorded recently.
+        """
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(TradeFill.exchange_trade_id)
+                            .filter(TradeFill.config_file_path == self._config_file_path,
+                                    TradeFill.market == market.display_name,
+                                    TradeFill.exchange_trade_id == exchange_trade_id,
+                                    TradeFill.symbol == trading_pair))
+            return query.first() is not None
+
+    def get_order_id_for_exchange_order_id(self, market: ConnectorBase, exchange_order_id: str) -> Optional[str]:
+        """
+        Looks up the client order id of an order of the config in the DB. The pending writes are not flushed: the
+        connectors already know the orders recorded recently.
+        """
+        with self._sql_manager.get_new_session() as session:
+            query: Query = (session
+                            .query(Order.id)
+                            .filter(Order.config_file_path == self._config_file_path,
+                                    Order.market == market.display_name,
+                                    Order.exchange_order_id == exchange_order_id))
+            row = query.first()
+            return None if row is None else row[0]
+
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        self._save_tracking_states(config_file_path, market.display_name, market.tracking_states, session)
+
+    def _save_tracking_states(self,
+                              config_file_path: str,
+                              market_name: str,
+                              tracking_states: Dict[str, Any],
+                              session: Session):
+        market_states: Optional[MarketState] = (session
+                                                .query(MarketState)
+                                                .filter(MarketState.config_file_path == config_file_path,
+                                                        MarketState.market == market_name)
+                                                .one_or_none())
         timestamp: int = self.db_timestamp
 
         if market_states is not None:
-            market_states.saved_state = market.tracking_states
+            market_states.saved_state = tracking_states
             market_states.timestamp = timestamp
         else:
             market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
+                                        market=market_name,
                                         timestamp=timestamp,
-                                        saved_state=market.tracking_states)
+                                        saved_state=tracking_states)
             session.add(market_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
@@ -196,31 +349,32 @@ class MarketsRecorder:
         timestamp = int(evt.creation_timestamp * 1e3)
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Order = Order(id=evt.order_id,
-                                            config_file_path=self._config_file_path,
-                                            strategy=self._strategy_name,
-                                            market=market.display_name,
-                                            symbol=evt.trading_pair,
-                                            base_asset=base_asset,
-                                            quote_asset=quote_asset,
-                                            creation_timestamp=timestamp,
-                                            order_type=evt.type.name,
-                                            amount=Decimal(evt.amount),
-                                            leverage=evt.leverage if evt.leverage else 1,
-                                            price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
-                                            position=evt.position if evt.position else PositionAction.NIL.value,
-                                            last_status=event_type.name,
-                                            last_update_timestamp=timestamp,
-                                            exchange_order_id=evt.exchange_order_id)
-                order_status: OrderStatus = OrderStatus(order=order_record,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-                session.add(order_record)
-                session.add(order_status)
-                market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
-                self.save_market_states(self._config_file_path, market, session=session)
+        market.add_exchange_order_ids_from_market_recorder({evt.exchange_order_id: evt.order_id})
+
+        def write(session: Session):
+            order_record: Order = Order(id=evt.order_id,
+                                        config_file_path=self._config_file_path,
+                                        strategy=self._strategy_name,
+                                        market=market.display_name,
+                                        symbol=evt.trading_pair,
+                                        base_asset=base_asset,
+                                        quote_asset=quote_asset,
+                                        creation_timestamp=timestamp,
+                                        order_type=evt.type.name,
+                                        amount=Decimal(evt.amount),
+                                        leverage=evt.leverage if evt.leverage else 1,
+                                        price=Decimal(evt.price) if evt.price == evt.price else Decimal(0),
+                                        position=evt.position if evt.position else PositionAction.NIL.value,
+                                        last_status=event_type.name,
+                                        last_update_timestamp=timestamp,
+                                        exchange_order_id=evt.exchange_order_id)
+            order_status: OrderStatus = OrderStatus(order=order_record,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+            session.add(order_record)
+            session.add(order_status)
+
+        self._record(write, market)
 
     def _did_fill_order(self,
                         event_tag: int,
@@ -235,47 +389,51 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the order record, and update it if necessary.
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-
-                # Order status and trade fill record should be added even if the order record is not found, because it's
-                # possible for fill event to come in before the order created event for market orders.
-                order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                        timestamp=timestamp,
-                                                        status=event_type.name)
-
-                trade_fill_record: TradeFill = TradeFill(
-                    config_file_path=self.config_file_path,
-                    strategy=self.strategy_name,
-                    market=market.display_name,
-                    symbol=evt.trading_pair,
-                    base_asset=base_asset,
-                    quote_asset=quote_asset,
-                    timestamp=timestamp,
-                    order_id=order_id,
-                    trade_type=evt.trade_type.name,
-                    order_type=evt.order_type.name,
-                    price=Decimal(
-                        evt.price) if evt.price == evt.price else Decimal(0),
-                    amount=Decimal(evt.amount),
-                    leverage=evt.leverage if evt.leverage else 1,
-                    trade_fee=evt.trade_fee.to_json(),
-                    exchange_trade_id=evt.exchange_trade_id,
-                    position=evt.position if evt.position else PositionAction.NIL.value,
-                )
-                session.add(order_status)
-                session.add(trade_fill_record)
-                self.save_market_states(self._config_file_path, market, session=session)
-
-                market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
-                                                                                   trade_fill_record.exchange_trade_id,
-                                                                                   trade_fill_record.symbol)})
-                self.append_to_csv(trade_fill_record)
+        market_name: str = market.display_name
+        trade_fee: Dict[str, Any] = evt.trade_fee.to_json()
+
+        market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(market_name,
+                                                                           evt.exchange_trade_id,
+                                                                           evt.trading_pair)})
+
+        def write(session: Session):
+            # Try to find the order record, and update it if necessary.
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+
+            # Order status and trade fill record should be added even if the order record is not found, because it's
+            # possible for fill event to come in before the order created event for market orders.
+            order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                    timestamp=timestamp,
+                                                    status=event_type.name)
+
+            trade_fill_record: TradeFill = TradeFill(
+                config_file_path=self.config_file_path,
+                strategy=self.strategy_name,
+                market=market_name,
+                symbol=evt.trading_pair,
+                base_asset=base_asset,
+                quote_asset=quote_asset,
+                timestamp=timestamp,
+                order_id=order_id,
+                trade_type=evt.trade_type.name,
+                order_type=evt.order_type.name,
+                price=Decimal(
+                    evt.price) if evt.price == evt.price else Decimal(0),
+                amount=Decimal(evt.amount),
+                leverage=evt.leverage if evt.leverage else 1,
+                trade_fee=trade_fee,
+                exchange_trade_id=evt.exchange_trade_id,
+                position=evt.position if evt.position else PositionAction.NIL.value,
+            )
+            session.add(order_status)
+            session.add(trade_fill_record)
+            csv_row = self._trade_fill_csv_row(trade_fill_record)
+            self._after_commit(session, lambda: self._trade_fill_exporter.append(*csv_row))
+
+        self._record(write, market)
 
     def _did_complete_funding_payment(self,
                                       event_tag: int,
@@ -287,26 +445,30 @@ class MarketsRecorder:
 
         timestamp: float = evt.timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                # Try to find the funding payment has been recorded already.
-                payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
-                    FundingPayment.timestamp == timestamp).one_or_none()
-                if payment_record is None:
-                    funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
-                                                                            config_file_path=self.config_file_path,
-                                                                            market=market.display_name,
-                                                                            rate=evt.funding_rate,
-                                                                            symbol=evt.trading_pair,
-                                                                            amount=float(evt.amount))
-                    session.add(funding_payment_record)
-
-    @staticmethod
-    def _csv_matches_header(file_path: str, header: tuple) -> bool:
-        df = pd.read_csv(file_path, header=None)
-        return tuple(df.iloc[0].values) == header
+        market_name: str = market.display_name
+
+        def write(session: Session):
+            # Try to find the funding payment has been recorded already.
+            payment_record: Optional[FundingPayment] = session.query(FundingPayment).filter(
+                FundingPayment.timestamp == timestamp).one_or_none()
+            if payment_record is None:
+                funding_payment_record: FundingPayment = FundingPayment(timestamp=timestamp,
+                                                                        config_file_path=self.config_file_path,
+                                                                        market=market_name,
+                                                                        rate=evt.funding_rate,
+                                                                        symbol=evt.trading_pair,
+                                                                        amount=float(evt.amount))
+                session.add(funding_payment_record)
+
+        self._record(write)
 
     def append_to_csv(self, trade: TradeFill):
+        self._trade_fill_exporter.append(*self._trade_fill_csv_row(trade))
+
+    def _trade_fill_csv_row(self, trade: TradeFill) -> Tuple[str, Tuple[str, ...], Tuple[Any, ...]]:
+        """
+        :return: the CSV file path, the field names and the field values of the trade fill
+        """
         csv_filename = "trades_" + trade.config_file_path[:-4] + ".csv"
         csv_path = os.path.join(data_path(), csv_filename)
 
@@ -320,14 +482,7 @@ class MarketsRecorder:
         field_names += ("age",)
         field_data += (age,)
 
-        if (os.path.exists(csv_path) and (not self._csv_matches_header(csv_path, field_names))):
-            move(csv_path, csv_path[:-4] + '_old_' + pd.Timestamp.utcnow().strftime("%Y%m%d-%H%M%S") + ".csv")
-
-        if not os.path.exists(csv_path):
-            df_header = pd.DataFrame([field_names])
-            df_header.to_csv(csv_path, mode='a', header=False, index=False)
-        df = pd.DataFrame([field_data])
-        df.to_csv(csv_path, mode='a', header=False, index=False)
+        return csv_path, field_names, field_data
 
     def _update_order_status(self,
                              event_tag: int,
@@ -345,18 +500,19 @@ class MarketsRecorder:
         event_type: MarketEvent = self.market_event_tag_map[event_tag]
         order_id: str = evt.order_id
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
-
-                if order_record is not None:
-                    order_record.last_status = event_type.name
-                    order_record.last_update_timestamp = timestamp
-                    order_status: OrderStatus = OrderStatus(order_id=order_id,
-                                                            timestamp=timestamp,
-                                                            status=event_type.name)
-                    session.add(order_status)
-                    self.save_market_states(self._config_file_path, market, session=session)
+        def write(session: Session) -> bool:
+            order_record: Optional[Order] = session.query(Order).filter(Order.id == order_id).one_or_none()
+
+            if order_record is not None:
+                order_record.last_status = event_type.name
+                order_record.last_update_timestamp = timestamp
+                order_status: OrderStatus = OrderStatus(order_id=order_id,
+                                                        timestamp=timestamp,
+                                                        status=event_type.name)
+                session.add(order_status)
+            return order_record is not None
+
+        self._record(write, market)
 
     def _did_cancel_order(self,
                           event_tag: int,
@@ -392,15 +548,17 @@ class MarketsRecorder:
 
         timestamp: int = self.db_timestamp
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
-                                                                     timestamp=timestamp,
-                                                                     tx_hash=evt.exchange_order_id,
-                                                                     token_id=evt.token_id,
-                                                                     trade_fee=evt.trade_fee.to_json())
-                session.add(rp_update)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        trade_fee: Dict[str, Any] = evt.trade_fee.to_json()
+
+        def write(session: Session):
+            rp_update: RangePositionUpdate = RangePositionUpdate(hb_id=evt.order_id,
+                                                                 timestamp=timestamp,
+                                                                 tx_hash=evt.exchange_order_id,
+                                                                 token_id=evt.token_id,
+                                                                 trade_fee=trade_fee)
+            session.add(rp_update)
+
+        self._record(write, connector)
 
     def _did_close_position(self,
                             event_tag: int,
@@ -410,14 +568,129 @@ class MarketsRecorder:
             self._ev_loop.call_soon_threadsafe(self._did_close_position, event_tag, connector, evt)
             return
 
-        with self._sql_manager.get_new_session() as session:
-            with session.begin():
-                rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
-                                                                                 strategy=self._strategy_name,
-                                                                                 token_id=evt.token_id,
-                                                                                 token_0=evt.token_0,
-                                                                                 token_1=evt.token_1,
-                                                                                 claimed_fee_0=Decimal(evt.claimed_fee_0),
-                                                                                 claimed_fee_1=Decimal(evt.claimed_fee_1))
-                session.add(rp_fees)
-                self.save_market_states(self._config_file_path, connector, session=session)
+        def write(session: Session):
+            rp_fees: RangePositionCollectedFees = RangePositionCollectedFees(config_file_path=self._config_file_path,
+                                                                             strategy=self._strategy_name,
+                                                                             token_id=evt.token_id,
+                                                                             token_0=evt.token_0,
+                                                                             token_1=evt.token_1,
+                                                                             claimed_fee_0=Decimal(evt.claimed_fee_0),
+                                                                             claimed_fee_1=Decimal(evt.claimed_fee_1))
+            session.add(rp_fees)
+
+        self._record(write, connector)
+
+    def _record(self, write: DBWrite, market: Optional[ConnectorBase] = None):
+        """
+        Executes the database write, followed by the save of the market tracking states if a market is specified.
+        In write-behind mode the write is queued for the writer thread, and the market states save is debounced.
+        """
+        if self._write_behind:
+            self._enqueue(write)
+            if market is not None:
+                self._schedule_market_states_save(market)
+        else:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    # A write returning False did not change anything, so the market states are not saved again
+                    if write(session) is not False and market is not None:
+                        self.save_market_states(self._config_file_path, market, session=session)
+            self._run_after_commit(session)
+
+    def _enqueue(self, write: DBWrite):
+        """
+        Queues a write for the writer thread without blocking. When the queue is full the write is kept in the
+        overflow list (after the previous overflowing writes, to keep their order) until the writer catches up.
+        """
+        if len(self._overflow_writes) == 0:
+            try:
+                self._write_queue.put_nowait(write)
+                return
+            except queue.Full:
+                self.logger().warning(f"The trades database writer is falling behind ({self.MAX_PENDING_WRITES} "
+                                      f"pending records). New records are kept in memory until it catches up.")
+        self._overflow_writes.append(write)
+        if self._overflow_drain_handle is None:
+            self._overflow_drain_handle = self._ev_loop.call_later(self.OVERFLOW_DRAIN_INTERVAL,
+                                                                   self._drain_overflow_writes)
+
+    def _drain_overflow_writes(self):
+        self._overflow_drain_handle = None
+        while len(self._overflow_writes) > 0:
+            try:
+                self._write_queue.put_nowait(self._overflow_writes[0])
+            except queue.Full:
+                self._overflow_drain_handle = self._ev_loop.call_later(self.OVERFLOW_DRAIN_INTERVAL,
+                                                                       self._drain_overflow_writes)
+                return
+            self._overflow_writes.popleft()
+
+    @classmethod
+    def _after_commit(cls, session: Session, callback: Callable[[], Any]):
+        """
+        Registers a function to call once the transaction of the session is committed
+        """
+        session.info.setdefault(cls.AFTER_COMMIT_INFO_KEY, []).append(callback)
+
+    def _run_after_commit(self, session: Session):
+        for callback in session.info.pop(self.AFTER_COMMIT_INFO_KEY, []):
+            try:
+                callback()
+            except Exception:
+                self.logger().error("Unexpected error processing a saved record.", exc_info=True)
+        try:
+            self._trade_fill_exporter.flush()
+        except Exception:
+            self.logger().error("Unexpected error flushing the exported trades.", exc_info=True)
+
+    def _schedule_market_states_save(self, market: ConnectorBase):
+        self._markets_with_pending_states.add(market)
+        if self._market_states_save_handle is None:
+            self._market_states_save_handle = self._ev_loop.call_later(self.MARKET_STATES_SAVE_INTERVAL,
+                                                                       self._enqueue_pending_market_states)
+
+    def _enqueue_pending_market_states(self):
+        if self._market_states_save_handle is not None:
+            self._market_states_save_handle.cancel()
+            self._market_states_save_handle = None
+        markets = self._markets_with_pending_states
+        self._markets_with_pending_states = set()
+        for market in markets:
+            # The tracking states are captured here, in the event loop thread, the writer thread only saves them
+            tracking_states: Dict[str, Any] = market.tracking_states
+            market_name: str = market.display_name
+            self._enqueue(lambda session, name=market_name, states=tracking_states:
+                          self._save_tracking_states(self._config_file_path, name, states, session))
+
+    def _writer_loop(self):
+        stopped = False
+        while not stopped:
+            writes: List[Optional[DBWrite]] = [self._write_queue.get()]
+            while len(writes) < self.WRITE_BATCH_SIZE:
+                try:
+                    writes.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopped = None in writes
+            self._execute_writes([write for write in writes if write is not None])
+            for _ in writes:
+                self._write_queue.task_done()
+
+    def _execute_writes(self, writes: List[DBWrite]):
+        if len(writes) == 0:
+            return
+        try:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    for write in writes:
+                        write(session)
+        except Exception:
+            if len(writes) == 1:
+                self.logger().error("Unexpected error saving a record in the trades database.", exc_info=True)
+            else:
+                # A single failing record must not discard the rest of the batch
+                for write in writes:
+                    self._execute_writes([write])
+            return
+        # Outside of the retried block, so that the records committed are exported once
+        self._run_after_commit(session)
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -15,13 +15,32 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+
+    The offset is computed when a sample is added, and cached, so that `time()` only does arithmetic. When the samples
+    span at least MIN_DRIFT_FIT_SPAN_MS, a drift model is fitted on them (the offset at the last sample plus a skew,
+    in ms of offset per ms of local time) to extrapolate the offset between samples. `resync_due` tells when a new
+    sample is required, based on the measured skew.
     """
 
     NaN = float("nan")
+    # Minimum time between the first and last sample to fit the skew of the local clock
+    MIN_DRIFT_FIT_SPAN_MS = 60_000
+    # Maximum error accepted in the time estimated without a new sample
+    RESYNC_TOLERANCE_MS = 250
+    # Skews above this (1 ms per second) are considered clock steps or outliers, not drift
+    MAX_SKEW = 1e-3
+    MIN_RESYNC_INTERVAL = 60.0
+    MAX_RESYNC_INTERVAL = 30 * 60.0
     _logger = None
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        # Local time (ms) at which each offset sample was taken (NaN when unknown)
+        self._sample_local_ms: Deque[float] = deque(maxlen=5)
+        self._offset_ms: float = 0.0
+        self._skew: float = 0.0
+        self._reference_local_ms: float = 0.0
+        self._last_sample_seconds_counter: Optional[float] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -34,24 +53,69 @@ class TimeSynchronizer:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            offset = self._offset_ms
 
         return offset
 
-    def add_time_offset_ms_sample(self, offset: float):
+    @property
+    def skew(self) -> float:
+        """
+        The drift of the local clock measured from the samples, in ms of offset per ms of local time
+        """
+        return self._skew
+
+    @property
+    def resync_interval(self) -> float:
+        """
+        Seconds after the last sample until the time estimated with the measured skew may be off by more than
+        RESYNC_TOLERANCE_MS
+        """
+        if self._skew == 0:
+            return self.MIN_RESYNC_INTERVAL if len(self._time_offset_ms) < 3 else self.MAX_RESYNC_INTERVAL
+        interval = self.RESYNC_TOLERANCE_MS / abs(self._skew) * 1e-3
+        return min(max(interval, self.MIN_RESYNC_INTERVAL), self.MAX_RESYNC_INTERVAL)
+
+    @property
+    def resync_due(self) -> bool:
+        """
+        True if a new sample is required (there is no sample, or the last one is older than `resync_interval`)
+        """
+        return (self._last_sample_seconds_counter is None
+                or self._current_seconds_counter() - self._last_sample_seconds_counter >= self.resync_interval)
+
+    def add_time_offset_ms_sample(self, offset: float, local_time_ms: Optional[float] = None):
+        """
+        Registers a new offset sample and updates the cached offset and drift model
+
+        :param offset: the server time minus the local time, in ms
+        :param local_time_ms: the local time of the sample (the seconds counter in ms), if known
+        """
         self._time_offset_ms.append(offset)
+        self._sample_local_ms.append(self.NaN if local_time_ms is None else local_time_ms)
+        if local_time_ms is not None:
+            self._last_sample_seconds_counter = local_time_ms * 1e-3
+        self._update_drift_model()
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._sample_local_ms.clear()
+        self._offset_ms = 0.0
+        self._skew = 0.0
+        self._reference_local_ms = 0.0
+        self._last_sample_seconds_counter = None
 
     def time(self) -> float:
         """
         Returns the current time in seconds calculated base on the deviation samples.
         :return: Calculated current time considering the registered deviations
         """
-        return self._current_seconds_counter() + self.time_offset_ms * 1e-3
+        if not self._time_offset_ms:
+            return self._current_seconds_counter() + self.time_offset_ms * 1e-3
+        seconds_counter = self._current_seconds_counter()
+        offset_ms = self._offset_ms
+        if self._skew != 0:
+            offset_ms += self._skew * (seconds_counter * 1e3 - self._reference_local_ms)
+        return seconds_counter + offset_ms * 1e-3
 
     async def update_server_time_offset_with_time_provider(self, time_provider: Awaitable):
         """
@@ -66,7 +130,7 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
-            self.add_time_offset_ms_sample(time_offset_ms)
+            self.add_time_offset_ms_sample(time_offset_ms, local_time_ms=local_server_time_pre_image_ms)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -86,6 +150,23 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _update_drift_model(self):
+        offsets = numpy.array(self._time_offset_ms)
+        local_times = numpy.array(self._sample_local_ms)
+        self._skew = 0.0
+        if (len(offsets) >= 3
+                and not numpy.isnan(local_times).any()
+                and local_times[-1] - local_times[0] >= self.MIN_DRIFT_FIT_SPAN_MS):
+            skew = float(numpy.polyfit(local_times, offsets, 1)[0])
+            if abs(skew) <= self.MAX_SKEW:
+                self._skew = skew
+                self._reference_local_ms = float(local_times[-1])
+                # The offsets are compared at the time of the last sample
+                offsets = offsets + self._skew * (self._reference_local_ms - local_times)
+        median = numpy.median(offsets)
+        weighted_average = numpy.average(offsets, weights=range(1, len(offsets) * 2 + 1, 2))
+        self._offset_ms = float(numpy.mean([median, weighted_average]))
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
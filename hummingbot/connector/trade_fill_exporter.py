@@ -0,0 +1,148 @@
+import csv
+import importlib.util
+import json
+import logging
+import os
+from decimal import Decimal
+from shutil import move
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+tfe_logger = None
+
+
+class _TradesFile:
+    """
+    A trades CSV file kept open in append mode, with the rows not yet written to a Parquet segment
+    """
+
+    def __init__(self, csv_path: str, field_names: Tuple[str, ...], opened_date: str):
+        self.csv_path: str = csv_path
+        self.field_names: Tuple[str, ...] = field_names
+        self.opened_date: str = opened_date
+        self.file: IO = open(csv_path, mode="a", newline="")
+        self.writer = csv.writer(self.file, lineterminator=os.linesep)
+        self.parquet_rows: List[Tuple[Any, ...]] = []
+
+    @property
+    def size(self) -> int:
+        return self.file.tell()
+
+    def close(self):
+        self.file.close()
+
+
+class TradeFillExporter:
+    """
+    Appends the trades to CSV files that are kept open between trades.
+    The header of each file is checked only when the file is opened, and rows are written through the file buffer,
+    which is flushed with `flush()`. Files can be rotated when they reach `max_file_size` bytes and/or when the UTC
+    date changes. Optionally, the rows are also written as Parquet segments of `parquet_segment_size` rows next to the
+    CSV file, for faster analytics (requires pyarrow or fastparquet).
+    """
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global tfe_logger
+        if tfe_logger is None:
+            tfe_logger = logging.getLogger(__name__)
+        return tfe_logger
+
+    def __init__(self,
+                 max_file_size: Optional[int] = None,
+                 rotate_daily: bool = False,
+                 parquet_segment_size: Optional[int] = None):
+        self._max_file_size: Optional[int] = max_file_size
+        self._rotate_daily: bool = rotate_daily
+        self._parquet_segment_size: Optional[int] = parquet_segment_size
+        self._files: Dict[str, _TradesFile] = {}
+
+        if parquet_segment_size is not None and not self.parquet_engine_available():
+            self.logger().warning("Parquet trades export requires pyarrow or fastparquet. "
+                                  "Trades will only be exported to CSV.")
+            self._parquet_segment_size = None
+
+    @staticmethod
+    def parquet_engine_available() -> bool:
+        return any(importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet"))
+
+    def append(self, csv_path: str, field_names: Tuple[str, ...], field_data: Tuple[Any, ...]):
+        trades_file: Optional[_TradesFile] = self._files.get(csv_path)
+        if trades_file is None or trades_file.field_names != field_names:
+            if trades_file is not None:
+                self._close_file(trades_file)
+            trades_file = self._open_file(csv_path, field_names)
+        elif self._rotation_required(trades_file):
+            self._close_file(trades_file)
+            self._rotate(csv_path)
+            trades_file = self._open_file(csv_path, field_names)
+
+        trades_file.writer.writerow(field_data)
+        if self._parquet_segment_size is not None:
+            trades_file.parquet_rows.append(field_data)
+            if len(trades_file.parquet_rows) >= self._parquet_segment_size:
+                self._write_parquet_segment(trades_file)
+
+    def flush(self):
+        for trades_file in self._files.values():
+            trades_file.file.flush()
+
+    def close(self):
+        for trades_file in list(self._files.values()):
+            self._close_file(trades_file)
+
+    def _open_file(self, csv_path: str, field_names: Tuple[str, ...]) -> _TradesFile:
+        if os.path.exists(csv_path) and not self._csv_matches_header(csv_path, field_names):
+            move(csv_path, csv_path[:-4] + '_old_' + self._now().strftime("%Y%m%d-%H%M%S") + ".csv")
+
+        if os.path.exists(csv_path):
+            opened_date = pd.Timestamp(os.path.getmtime(csv_path), unit="s", tz="UTC").strftime("%Y%m%d")
+            trades_file = _TradesFile(csv_path, field_names, opened_date)
+        else:
+            trades_file = _TradesFile(csv_path, field_names, self._now().strftime("%Y%m%d"))
+            trades_file.writer.writerow(field_names)
+        self._files[csv_path] = trades_file
+        return trades_file
+
+    def _close_file(self, trades_file: _TradesFile):
+        if len(trades_file.parquet_rows) > 0:
+            self._write_parquet_segment(trades_file)
+        trades_file.close()
+        del self._files[trades_file.csv_path]
+
+    def _rotation_required(self, trades_file: _TradesFile) -> bool:
+        if self._max_file_size is not None and trades_file.size >= self._max_file_size:
+            return True
+        return self._rotate_daily and trades_file.opened_date != self._now().strftime("%Y%m%d")
+
+    def _rotate(self, csv_path: str):
+        move(csv_path, csv_path[:-4] + "_" + self._now().strftime("%Y%m%d-%H%M%S") + ".csv")
+
+    def _write_parquet_segment(self, trades_file: _TradesFile):
+        segment_path = trades_file.csv_path[:-4] + "_" + self._now().strftime("%Y%m%d-%H%M%S-%f") + ".parquet"
+        df = pd.DataFrame([[self._parquet_value(value) for value in row] for row in trades_file.parquet_rows],
+                          columns=list(trades_file.field_names))
+        trades_file.parquet_rows = []
+        try:
+            df.to_parquet(segment_path, index=False)
+        except Exception:
+            self.logger().error(f"Error writing trades Parquet segment {segment_path}.", exc_info=True)
+
+    @staticmethod
+    def _parquet_value(value: Any) -> Any:
+        if isinstance(value, Decimal):
+            return float(value)
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def _csv_matches_header(file_path: str, header: Tuple[str, ...]) -> bool:
+        with open(file_path, newline="") as csv_file:
+            first_row = next(csv.reader(csv_file), None)
+        return first_row is not None and tuple(first_row) == header
+
+    @staticmethod
+    def _now() -> pd.Timestamp:
+        return pd.Timestamp.utcnow()
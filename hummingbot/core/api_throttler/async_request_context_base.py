@@ -3,9 +3,10 @@ import logging
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import DEFAULT_REQUEST_PRIORITY, PriorityLanes, RequestPriority
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +35,8 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = DEFAULT_REQUEST_PRIORITY,
+                 priority_lanes: Optional[PriorityLanes] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +45,8 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: The priority class of the API Request
+        :param priority_lanes: The shared requests priority lanes of the throttler, if priorities have to be applied
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +54,8 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._priority_lanes: Optional[PriorityLanes] = priority_lanes
 
     def flush(self):
         """
@@ -66,14 +73,38 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def capacity_limit(self, rate_limit: RateLimit, weight: int) -> float:
+        """
+        Returns the part of the rate limit this request is allowed to use, according to its priority class
+        """
+        if self._priority_lanes is None:
+            return rate_limit.limit
+        return self._priority_lanes.capacity_limit(rate_limit.limit, weight, self._priority)
+
+    def limit_ids(self) -> List[str]:
+        """
+        Returns the ids of all the rate limits the request consumes capacity from (its own and the linked ones)
+        """
+        return [self._rate_limit.limit_id] + [limit.limit_id for limit, _ in self._related_limits]
+
+    def has_precedence(self) -> bool:
+        return self._priority_lanes is None or self._priority_lanes.has_precedence(self._priority, self.limit_ids())
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        if self._priority_lanes is not None:
+            self._priority_lanes.enter(self._priority, self.limit_ids())
+        start_time = time.time()
+        try:
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if self.has_precedence() and self.within_capacity():
+                        break
+                await asyncio.sleep(self._retry_interval)
+        finally:
+            if self._priority_lanes is not None:
+                self._priority_lanes.leave(self._priority, time.time() - start_time, self.limit_ids())
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
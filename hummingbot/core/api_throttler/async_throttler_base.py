@@ -8,6 +8,7 @@ from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.request_priority import DEFAULT_REQUEST_PRIORITY, PriorityLanes, RequestPriority
 from hummingbot.logger.logger import HummingbotLogger
 
 
@@ -55,6 +56,19 @@ class AsyncThrottlerBase(ABC):
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
+        # Requests waiting for capacity, by priority class
+        self._priority_lanes = PriorityLanes()
+
+    @property
+    def priority_lanes(self) -> PriorityLanes:
+        return self._priority_lanes
+
+    def priority_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the queue depth and wait time metrics of each request priority class
+        """
+        return self._priority_lanes.metrics()
+
     def set_rate_limits(self, rate_limits: List[RateLimit]):
         # Rate Limit Definitions
         self._rate_limits: List[RateLimit] = copy.deepcopy(rate_limits)
@@ -85,5 +99,5 @@ class AsyncThrottlerBase(ABC):
         return rate_limit, related_limits
 
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: RequestPriority = DEFAULT_REQUEST_PRIORITY) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -0,0 +1,131 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Dict, Iterable
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority classes of the requests sent through a throttler. Lower values have higher priority.
+    """
+    CANCEL_ORDER = 0
+    CREATE_ORDER = 1
+    ORDER_STATUS = 2
+    REFERENCE_DATA = 3  # trading rules, trading fees and any other low urgency request
+
+
+DEFAULT_REQUEST_PRIORITY = RequestPriority.ORDER_STATUS
+
+_current_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "current_request_priority", default=DEFAULT_REQUEST_PRIORITY)
+
+
+def current_request_priority() -> RequestPriority:
+    """
+    Returns the priority class of the requests issued from the current async context
+    """
+    return _current_request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority class of all the requests issued inside the context (including the ones issued by the tasks
+    created inside it), when they do not specify a priority explicitly.
+    """
+    token = _current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_request_priority.reset(token)
+
+
+@dataclass
+class PriorityLaneMetrics:
+    queue_depth: int = 0
+    requests: int = 0
+    total_wait_time: float = 0
+    max_wait_time: float = 0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.requests if self.requests > 0 else 0
+
+
+class PriorityLanes:
+    """
+    Keeps track of the requests waiting for capacity in a throttler, grouped by priority class and by the rate limits
+    (limit_id) they consume.
+    A request only takes capacity when no request of a higher priority class is waiting for any of its rate limits
+    (requests on unrelated limits never hold each other back), and requests of the lowest priority class can only use
+    part of each rate limit, leaving the rest for the more urgent requests.
+    """
+
+    LOWEST_PRIORITY_CAPACITY_SHARE = 0.8
+
+    def __init__(self):
+        self._metrics: Dict[RequestPriority, PriorityLaneMetrics] = {
+            priority: PriorityLaneMetrics() for priority in RequestPriority
+        }
+        # limit_id -> priority -> number of requests waiting for capacity in the limit
+        self._waiting: Dict[str, Dict[RequestPriority, int]] = {}
+
+    def enter(self, priority: RequestPriority, limit_ids: Iterable[str]):
+        """
+        Registers a request waiting for capacity in the rate limits with the specified ids
+        """
+        self._metrics[priority].queue_depth += 1
+        for limit_id in set(limit_ids):
+            waiting = self._waiting.setdefault(limit_id, {})
+            waiting[priority] = waiting.get(priority, 0) + 1
+
+    def leave(self, priority: RequestPriority, wait_time: float, limit_ids: Iterable[str]):
+        """
+        Unregisters a request that was waiting for capacity in the rate limits with the specified ids
+        """
+        for limit_id in set(limit_ids):
+            waiting = self._waiting.get(limit_id)
+            if waiting is None or priority not in waiting:
+                continue
+            waiting[priority] -= 1
+            if waiting[priority] <= 0:
+                del waiting[priority]
+            if not waiting:
+                del self._waiting[limit_id]
+        lane_metrics = self._metrics[priority]
+        lane_metrics.queue_depth -= 1
+        lane_metrics.requests += 1
+        lane_metrics.total_wait_time += wait_time
+        lane_metrics.max_wait_time = max(lane_metrics.max_wait_time, wait_time)
+
+    def has_precedence(self, priority: RequestPriority, limit_ids: Iterable[str]) -> bool:
+        """
+        Returns True if no request with a higher priority than the one specified is waiting for any of the rate limits
+        with the specified ids
+        """
+        for limit_id in limit_ids:
+            waiting = self._waiting.get(limit_id)
+            if waiting is not None and any(other_priority < priority for other_priority in waiting):
+                return False
+        return True
+
+    def capacity_limit(self, limit: float, weight: int, priority: RequestPriority) -> float:
+        """
+        Returns the part of a rate limit a request of the specified priority can use
+        """
+        if priority == max(RequestPriority):
+            # The request must still fit in an otherwise empty limit
+            return max(float(limit) * self.LOWEST_PRIORITY_CAPACITY_SHARE, min(float(limit), weight))
+        return limit
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            priority.name: {
+                "queue_depth": lane_metrics.queue_depth,
+                "requests": lane_metrics.requests,
+                "average_wait_time": lane_metrics.average_wait_time,
+                "max_wait_time": lane_metrics.max_wait_time,
+            }
+            for priority, lane_metrics in self._metrics.items()
+        }
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import MAX_CAPACITY_REACHED_WARNING_INTERVAL
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.request_priority import DEFAULT_REQUEST_PRIORITY, RequestPriority
+from hummingbot.logger.logger import HummingbotLogger
+
+swt_logger = None
+MIN_WAIT_INTERVAL = 0.001
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the capacity used for a single RateLimit.
+    Keeps the (timestamp, weight) of every task logged in the window in insertion order, together with the running
+    total of the weights, so that expiring old tasks and checking the capacity do not need to rescan the window.
+    """
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.limit: float = float(rate_limit.limit)
+        self.window: float = float(rate_limit.time_interval) * (1 + safety_margin_pct)
+        self.used: int = 0
+        self._entries: Deque[Tuple[float, int]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def expire(self, now: float):
+        """
+        Removes the tasks that are older than the window
+        """
+        entries = self._entries
+        threshold = now - self.window
+        while entries and entries[0][0] <= threshold:
+            _, weight = entries.popleft()
+            self.used -= weight
+
+    def add(self, timestamp: float, weight: int):
+        self._entries.append((timestamp, weight))
+        self.used += weight
+
+    def has_capacity(self, weight: int, limit: Optional[float] = None) -> bool:
+        return self.used + weight <= (self.limit if limit is None else limit)
+
+    def capacity_available_at(self, weight: int, limit: Optional[float] = None) -> float:
+        """
+        Returns the time at which enough of the logged tasks will have left the window to fit the requested weight.
+        :param limit: the part of the limit the request can use, if it is not allowed to use all of it
+        """
+        excess = self.used + weight - (self.limit if limit is None else limit)
+        freed = 0
+        for timestamp, entry_weight in self._entries:
+            freed += entry_weight
+            if freed >= excess:
+                return timestamp + self.window
+        # The weight can never fit (it is larger than the limit). Waiting for the full window will at least let it
+        # run on its own, which is what the task log based throttler ends up doing.
+        return (self._entries[-1][0] if self._entries else 0) + self.window
+
+
+class SlidingWindowRequestContext:
+    """
+    An async context class ('async with' syntax) that waits until all the rate limits associated to a request have
+    capacity for it, and then logs the request in their windows.
+    Instead of polling, a waiting request sleeps until the earliest time at which the capacity it needs is freed.
+    """
+
+    _last_max_cap_warning_ts: float = 0.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global swt_logger
+        if swt_logger is None:
+            swt_logger = logging.getLogger(__name__)
+        return swt_logger
+
+    def __init__(self,
+                 throttler: "SlidingWindowAsyncThrottler",
+                 weights: List[Tuple[RateLimitWindow, int]],
+                 priority: RequestPriority = DEFAULT_REQUEST_PRIORITY):
+        """
+        :param throttler: the throttler that created the context
+        :param weights: list of the rate limit windows the request consumes capacity from, with the weight consumed
+        :param priority: the priority class of the request
+        """
+        self._throttler = throttler
+        self._weights = weights
+        self._priority = priority
+
+    def capacity_limit(self, limit_window: RateLimitWindow, weight: int) -> float:
+        """
+        Returns the part of the rate limit this request is allowed to use, according to its priority class
+        """
+        return self._throttler.priority_lanes.capacity_limit(limit_window.limit, weight, self._priority)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if the request fits in all its rate limits. Logs a warning message if a limit is reached.
+        """
+        now: float = self._throttler.time()
+        for limit_window, weight in self._weights:
+            limit_window.expire(now)
+            if not limit_window.has_capacity(weight, self.capacity_limit(limit_window, weight)):
+                self._warn_capacity_reached(limit_window, now)
+                return False
+        return True
+
+    def wait_time(self) -> float:
+        """
+        Returns how long the request has to wait for capacity in all its rate limits (0 if it can run now)
+        """
+        now: float = self._throttler.time()
+        available_at: float = now
+        for limit_window, weight in self._weights:
+            limit_window.expire(now)
+            limit = self.capacity_limit(limit_window, weight)
+            if not limit_window.has_capacity(weight, limit):
+                self._warn_capacity_reached(limit_window, now)
+                # Never return 0 for a request without capacity, even if rounding puts the release time in the past
+                available_at = max(available_at,
+                                   limit_window.capacity_available_at(weight, limit),
+                                   now + MIN_WAIT_INTERVAL)
+        return available_at - now
+
+    def limit_ids(self) -> List[str]:
+        """
+        Returns the ids of all the rate limits the request consumes capacity from
+        """
+        return [limit_window.rate_limit.limit_id for limit_window, _ in self._weights]
+
+    async def acquire(self):
+        priority_lanes = self._throttler.priority_lanes
+        limit_ids = self.limit_ids()
+        priority_lanes.enter(self._priority, limit_ids)
+        start_time: float = self._throttler.time()
+        try:
+            while True:
+                if not priority_lanes.has_precedence(self._priority, limit_ids):
+                    # Requests of a higher priority are waiting for the same limits, they take the capacity first
+                    await self._throttler.sleep(self._throttler.retry_interval)
+                    continue
+                wait_time = self.wait_time()
+                if wait_time <= 0:
+                    break
+                await self._throttler.sleep(wait_time)
+        finally:
+            priority_lanes.leave(self._priority, self._throttler.time() - start_time, limit_ids)
+        # No await between the last capacity check and the logging, so no other request can take the capacity
+        now: float = self._throttler.time()
+        for limit_window, weight in self._weights:
+            limit_window.add(now, weight)
+
+    def _warn_capacity_reached(self, limit_window: RateLimitWindow, now: float):
+        if SlidingWindowRequestContext._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+            rate_limit = limit_window.rate_limit
+            msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                  f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                  f"is {limit_window.used} in the last " \
+                  f"{rate_limit.time_interval} seconds"
+            self.logger().notify(msg)
+            SlidingWindowRequestContext._last_max_cap_warning_ts = now
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class SlidingWindowAsyncThrottler(AsyncThrottlerBase):
+    """
+    Throttler with the same rate limit definitions as AsyncThrottler (RateLimit and LinkedLimitWeightPair), that keeps
+    one sliding window per limit_id instead of a single shared task log.
+    Checking the capacity of a request only touches the windows of the limits it is associated with, and takes
+    constant time per limit (amortized) regardless of how many tasks are logged. Requests waiting for capacity are
+    woken up when the capacity they need is freed, instead of polling every retry_interval.
+    Requests waiting for capacity are served by priority class (see RequestPriority).
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,
+                 limits_share_percentage: Optional[Decimal] = None):
+        # Set before the base class initialization, because it calls set_rate_limits
+        self._limit_windows: Dict[str, RateLimitWindow] = {}
+        self._safety_margin_pct: float = safety_margin_pct
+        super().__init__(
+            rate_limits=rate_limits,
+            retry_interval=retry_interval,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=limits_share_percentage,
+        )
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        # Capacity already used is kept for the limits that are still defined
+        previous_windows = self._limit_windows
+        self._limit_windows = {}
+        for limit in self._rate_limits:
+            limit_window = RateLimitWindow(rate_limit=limit, safety_margin_pct=self._safety_margin_pct)
+            previous_window = previous_windows.get(limit.limit_id)
+            if previous_window is not None:
+                for timestamp, weight in previous_window._entries:
+                    limit_window.add(timestamp, weight)
+            self._limit_windows[limit.limit_id] = limit_window
+
+    @property
+    def retry_interval(self) -> float:
+        return self._retry_interval
+
+    def execute_task(self,
+                     limit_id: str,
+                     priority: RequestPriority = DEFAULT_REQUEST_PRIORITY) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority class of the API request
+        :return: An async context (used with async with syntax)
+        """
+        return SlidingWindowRequestContext(
+            throttler=self, weights=self._weights_for_limit_id(limit_id), priority=priority)
+
+    def time(self) -> float:
+        return time.time()
+
+    async def sleep(self, delay: float):
+        await asyncio.sleep(delay)
+
+    def logged_tasks_count(self, limit_id: str) -> int:
+        limit_window = self._limit_windows.get(limit_id)
+        return 0 if limit_window is None else len(limit_window)
+
+    def _weights_for_limit_id(self, limit_id: str) -> List[Tuple[RateLimitWindow, int]]:
+        rate_limit, related_limits = self.get_related_limits(limit_id=limit_id)
+        weights_by_limit_id: Dict[str, int] = {}
+        if rate_limit is not None:
+            weights_by_limit_id[rate_limit.limit_id] = rate_limit.weight
+            for related_limit, weight in related_limits:
+                weights_by_limit_id[related_limit.limit_id] = weights_by_limit_id.get(related_limit.limit_id, 0) + weight
+        return [(self._limit_windows[related_limit_id], weight)
+                for related_limit_id, weight in weights_by_limit_id.items()]
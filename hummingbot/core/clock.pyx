@@ -8,6 +8,7 @@ from typing import List
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -90,6 +91,8 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start
+            object runtime_metrics = RuntimeMetrics.get_instance()
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -115,6 +118,7 @@ cdef class Clock:
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,6 +126,8 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    runtime_metrics.record_tick_duration(type(child_iterator).__name__,
+                                                         (time.perf_counter() - tick_start) * 1e3)
         finally:
             for ci in self._current_context:
                 child_iterator = ci
@@ -28,6 +28,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self._depth_index_dirty = True
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -71,6 +72,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self._depth_index_dirty = True
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -175,6 +177,39 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef c_rebuild_depth_index(self):
+        """
+        The depth index of a composite order book is built from the composite entries, so that volume queries take
+        into account the recorded filled orders.
+        """
+        cdef:
+            double cumulative_base = 0
+            double cumulative_quote = 0
+
+        self._bid_depth_prices.clear()
+        self._bid_depth_cum_base.clear()
+        self._bid_depth_cum_quote.clear()
+        for row in self.bid_entries():
+            cumulative_base += row.amount
+            cumulative_quote += row.amount * row.price
+            self._bid_depth_prices.push_back(row.price)
+            self._bid_depth_cum_base.push_back(cumulative_base)
+            self._bid_depth_cum_quote.push_back(cumulative_quote)
+
+        cumulative_base = 0
+        cumulative_quote = 0
+        self._ask_depth_prices.clear()
+        self._ask_depth_cum_base.clear()
+        self._ask_depth_cum_quote.clear()
+        for row in self.ask_entries():
+            cumulative_base += row.amount
+            cumulative_quote += row.amount * row.price
+            self._ask_depth_prices.push_back(row.price)
+            self._ask_depth_cum_base.push_back(cumulative_base)
+            self._ask_depth_cum_quote.push_back(cumulative_quote)
+
+        self._depth_index_dirty = False
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
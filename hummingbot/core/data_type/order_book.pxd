@@ -20,10 +20,19 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_dirty
+    cdef vector[double] _bid_depth_prices
+    cdef vector[double] _bid_depth_cum_base
+    cdef vector[double] _bid_depth_cum_quote
+    cdef vector[double] _ask_depth_prices
+    cdef vector[double] _ask_depth_cum_base
+    cdef vector[double] _ask_depth_cum_quote
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_rebuild_depth_index(self)
+    cdef c_ensure_depth_index(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
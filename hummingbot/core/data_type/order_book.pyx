@@ -37,6 +37,56 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef _raw_levels_to_entries(object levels, int64_t update_id, vector[OrderBookEntry] &entries):
+    # Parses the exchange's price levels straight into C++ entries, without creating an OrderBookRow per level.
+    # Levels are either a sequence of [price, amount, ...] (numbers or numeric strings) or a float64 array whose
+    # first two columns are price and amount.
+    cdef:
+        double[:, :] buffer
+        Py_ssize_t i
+    if isinstance(levels, np.ndarray):
+        buffer = levels
+        entries.reserve(entries.size() + buffer.shape[0])
+        for i in range(buffer.shape[0]):
+            entries.push_back(OrderBookEntry(buffer[i, 0], buffer[i, 1], update_id))
+    else:
+        for level in levels:
+            entries.push_back(OrderBookEntry(float(level[0]), float(level[1]), update_id))
+
+
+cdef inline size_t _first_index_at_least(vector[double] &cumulative, double target) nogil:
+    # Binary search over a non-decreasing cumulative volume array. A NaN target never matches, same as a linear scan.
+    cdef:
+        size_t low = 0
+        size_t high = cumulative.size()
+        size_t middle
+    while low < high:
+        middle = (low + high) >> 1
+        if cumulative[middle] >= target:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+cdef inline size_t _levels_within_price(vector[double] &prices, double price, bint is_buy) nogil:
+    # Number of levels, from the top of the book, priced at or better than `price`. Asks are sorted ascending and
+    # bids descending.
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t middle
+        bint outside
+    while low < high:
+        middle = (low + high) >> 1
+        outside = prices[middle] > price if is_buy else prices[middle] < price
+        if outside:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -56,6 +106,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_dirty = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -96,6 +147,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self._depth_index_dirty = True
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -136,6 +188,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self._depth_index_dirty = True
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -188,6 +241,35 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: object, asks: object, update_id: int):
+        """
+        Applies a diff given as the exchange's raw price levels, i.e. [[price, amount], ...] lists or float64 arrays
+        with price and amount columns. The levels are parsed and applied in a single pass.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        _raw_levels_to_entries(bids, update_id, cpp_bids)
+        _raw_levels_to_entries(asks, update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
+    def apply_raw_diff_messages(self, messages: List[OrderBookMessage]):
+        """
+        Coalesces several diff messages, in the order given, into a single diff application. The messages content
+        must hold the raw "bids" and "asks" price levels, as accepted by apply_raw_diffs.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t update_id = 0
+        if len(messages) == 0:
+            return
+        for message in messages:
+            update_id = message.update_id
+            _raw_levels_to_entries(message.content["bids"], update_id, cpp_bids)
+            _raw_levels_to_entries(message.content["asks"], update_id, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -319,142 +401,166 @@ cdef class OrderBook(PubSub):
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
+    cdef c_rebuild_depth_index(self):
+        """
+        Rebuilds the cumulative base and quote volume arrays for both sides of the book, ordered from the best price
+        outwards. Reads the C++ books directly so no Python objects are created.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            double cumulative_base = 0
+            double cumulative_quote = 0
+
+        self._bid_depth_prices.clear()
+        self._bid_depth_cum_base.clear()
+        self._bid_depth_cum_quote.clear()
+        self._bid_depth_prices.reserve(self._bid_book.size())
+        self._bid_depth_cum_base.reserve(self._bid_book.size())
+        self._bid_depth_cum_quote.reserve(self._bid_book.size())
+        while bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            cumulative_base += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            self._bid_depth_prices.push_back(entry.getPrice())
+            self._bid_depth_cum_base.push_back(cumulative_base)
+            self._bid_depth_cum_quote.push_back(cumulative_quote)
+            inc(bid_it)
+
+        cumulative_base = 0
+        cumulative_quote = 0
+        self._ask_depth_prices.clear()
+        self._ask_depth_cum_base.clear()
+        self._ask_depth_cum_quote.clear()
+        self._ask_depth_prices.reserve(self._ask_book.size())
+        self._ask_depth_cum_base.reserve(self._ask_book.size())
+        self._ask_depth_cum_quote.reserve(self._ask_book.size())
+        while ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            cumulative_base += entry.getAmount()
+            cumulative_quote += entry.getAmount() * entry.getPrice()
+            self._ask_depth_prices.push_back(entry.getPrice())
+            self._ask_depth_cum_base.push_back(cumulative_base)
+            self._ask_depth_cum_quote.push_back(cumulative_quote)
+            inc(ask_it)
+
+        self._depth_index_dirty = False
+
+    cdef c_ensure_depth_index(self):
+        if self._depth_index_dirty:
+            self.c_rebuild_depth_index()
+
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            size_t levels = deref(prices).size()
+            size_t index = _first_index_at_least(deref(cum_base), volume)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        if index < levels:
+            cumulative_volume = deref(cum_base)[index]
+            result_price = deref(prices)[index]
+        elif levels > 0:
+            cumulative_volume = deref(cum_base)[levels - 1]
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            size_t levels = deref(prices).size()
+            size_t index = _first_index_at_least(deref(cum_base), volume)
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        if index < levels:
+            if index > 0:
+                total_cost = deref(cum_quote)[index - 1]
+                total_volume = deref(cum_base)[index - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[index]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif levels > 0:
+            total_volume = deref(cum_base)[levels - 1]
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            size_t levels = deref(prices).size()
+            size_t index = _first_index_at_least(deref(cum_quote), quote_volume)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        if index < levels:
+            cumulative_volume = deref(cum_quote)[index]
+            result_price = deref(prices)[index]
+        elif levels > 0:
+            cumulative_volume = deref(cum_quote)[levels - 1]
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            size_t levels = deref(prices).size()
+            size_t index = _first_index_at_least(deref(cum_base), base_amount)
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+
+        if index < levels:
+            if index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+                cumulative_base_amount = deref(cum_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif levels > 0:
+            cumulative_volume = deref(cum_quote)[levels - 1]
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_base = ref(self._ask_depth_cum_base) if is_buy else ref(self._bid_depth_cum_base)
+            size_t levels = _levels_within_price(deref(prices), price, is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        if levels > 0:
+            cumulative_volume = deref(cum_base)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
+        self.c_ensure_depth_index()
         cdef:
+            vector[double] *prices = ref(self._ask_depth_prices) if is_buy else ref(self._bid_depth_prices)
+            vector[double] *cum_quote = ref(self._ask_depth_cum_quote) if is_buy else ref(self._bid_depth_cum_quote)
+            size_t levels = _levels_within_price(deref(prices), price, is_buy)
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        if levels > 0:
+            cumulative_volume = deref(cum_quote)[levels - 1]
+            result_price = deref(prices)[levels - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
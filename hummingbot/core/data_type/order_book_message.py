@@ -64,6 +64,15 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_raw_price_levels(self) -> bool:
+        """
+        True if the content "bids" and "asks" are the exchange's raw [price, amount, ...] levels, i.e. the message
+        class does not parse its price levels on its own
+        """
+        message_class = type(self)
+        return message_class.bids is OrderBookMessage.bids and message_class.asks is OrderBookMessage.asks
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -0,0 +1,472 @@
+import csv
+import logging
+import math
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+
+obr_logger = None
+
+INDEX_FILE_NAME = "index.csv"
+INDEX_FIELD_NAMES = ("chunk", "first_timestamp", "last_timestamp", "message_count")
+# The columns of the chunks, with their types
+CHUNK_COLUMNS = {
+    "timestamp": np.float64,
+    "type": np.int8,
+    "update_id": np.int64,
+    "first_update_id": np.int64,
+    "trade_id": np.str_,
+    "trade_type": np.float64,
+    "price": np.float64,
+    "amount": np.float64,
+    "bids_count": np.int32,
+    "asks_count": np.int32,
+    "level_price": np.float64,
+    "level_amount": np.float64,
+}
+
+
+class OrderBookRecordChunk(NamedTuple):
+    """
+    An entry of a trading pair index: the chunk file path (relative to the trading pair directory) and the range of
+    the message timestamps it holds
+    """
+    chunk: str
+    first_timestamp: float
+    last_timestamp: float
+    message_count: int
+
+
+class _ChunkBuffer:
+    """
+    The columns of the messages of one trading pair that have not been written yet.
+    The price levels of all the messages are kept in two flat columns, the bids of a message followed by its asks, and
+    each message keeps the count of its bids and asks levels.
+    """
+
+    def __init__(self, partition: str):
+        self.partition: str = partition
+        self.created: float = time.monotonic()
+        self.timestamp: List[float] = []
+        self.type: List[int] = []
+        self.update_id: List[int] = []
+        self.first_update_id: List[int] = []
+        self.trade_id: List[str] = []
+        self.trade_type: List[float] = []
+        self.price: List[float] = []
+        self.amount: List[float] = []
+        self.bids_count: List[int] = []
+        self.asks_count: List[int] = []
+        self.level_price: List[float] = []
+        self.level_amount: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, message: OrderBookMessage):
+        """
+        Adds the message to the columns. Raises NotImplementedError for the message classes of the connectors that
+        keep the trades, or the price levels, in their own format.
+        """
+        # The message is parsed before any column is updated, so that an invalid message leaves the columns untouched
+        content = message.content
+        timestamp = float(message.timestamp)
+        if message.type is OrderBookMessageType.TRADE:
+            if not all(key in content for key in ("trade_type", "price", "amount")):
+                raise NotImplementedError(f"{type(message).__name__} trade messages can not be recorded.")
+            row = (int(content.get("update_id", -1)),
+                   -1,
+                   str(content.get("trade_id", "")),
+                   float(content["trade_type"]),
+                   float(content["price"]),
+                   float(content["amount"]))
+            bids, asks = [], []
+        else:
+            row = (int(message.update_id), int(message.first_update_id), "", math.nan, math.nan, math.nan)
+            if message.has_raw_price_levels:
+                bids = [(float(price), float(amount)) for price, amount, *_ in content["bids"]]
+                asks = [(float(price), float(amount)) for price, amount, *_ in content["asks"]]
+            else:
+                bids = [(float(row.price), float(row.amount)) for row in message.bids]
+                asks = [(float(row.price), float(row.amount)) for row in message.asks]
+
+        self.timestamp.append(timestamp)
+        self.type.append(message.type.value)
+        self.update_id.append(row[0])
+        self.first_update_id.append(row[1])
+        self.trade_id.append(row[2])
+        self.trade_type.append(row[3])
+        self.price.append(row[4])
+        self.amount.append(row[5])
+        self.bids_count.append(len(bids))
+        self.asks_count.append(len(asks))
+        for price, amount in bids + asks:
+            self.level_price.append(price)
+            self.level_amount.append(amount)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: np.array(getattr(self, name), dtype=dtype) for name, dtype in CHUNK_COLUMNS.items()}
+
+
+class OrderBookRecorder:
+    """
+    Records the order book snapshot, diff and trade messages of an exchange to disk.
+
+    `record()` only puts the message in a bounded queue, so it adds no latency to the order book tracker (messages
+    are dropped, and counted, if the queue is full). A background thread buffers the messages of each trading pair
+    in columns and writes them as compressed, append-only chunks:
+
+        <root>/<exchange>/<trading pair>/<YYYYMMDD-HH>/<first timestamp ms>-<sequence>.npz
+
+    partitioned by the UTC hour of the messages timestamps. A chunk is written when it has `chunk_size` messages,
+    when it is older than `flush_interval` seconds, or when the hour changes. Every written chunk is appended to the
+    trading pair index.csv, with the range of its timestamps, so that OrderBookRecordReader can seek to any timestamp
+    without reading the previous chunks.
+    """
+    MAX_PENDING_MESSAGES = 100000
+    CHUNK_SIZE = 10000
+    FLUSH_INTERVAL = 60.0
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global obr_logger
+        if obr_logger is None:
+            obr_logger = logging.getLogger(__name__)
+        return obr_logger
+
+    def __init__(self,
+                 root_path: str,
+                 exchange: str,
+                 chunk_size: int = CHUNK_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL,
+                 max_pending_messages: int = MAX_PENDING_MESSAGES):
+        self._root_path: str = root_path
+        self._exchange: str = exchange
+        self._chunk_size: int = chunk_size
+        self._flush_interval: float = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_messages)
+        self._buffers: Dict[str, _ChunkBuffer] = {}
+        self._chunk_sequence: Dict[str, int] = defaultdict(int)
+        self._dropped_messages: int = 0
+        self._unsupported_messages: int = 0
+        self._unsupported_message_kinds: Set[Tuple[type, OrderBookMessageType]] = set()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._stop_requested: threading.Event = threading.Event()
+
+    @property
+    def exchange(self) -> str:
+        return self._exchange
+
+    @property
+    def dropped_messages(self) -> int:
+        return self._dropped_messages
+
+    @property
+    def unsupported_messages(self) -> int:
+        """
+        Number of messages not recorded because their class keeps the trades or price levels in its own format
+        """
+        return self._unsupported_messages
+
+    @property
+    def is_running(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+
+    def trading_pair_path(self, trading_pair: str) -> str:
+        return os.path.join(self._root_path, self._exchange, trading_pair)
+
+    def start(self):
+        if self.is_running:
+            return
+        self._stop_requested.clear()
+        self._writer_thread = threading.Thread(target=self._write_loop, name="OrderBookRecorder", daemon=True)
+        self._writer_thread.start()
+
+    def stop(self):
+        """
+        Stops the writer thread once every queued message has been written
+        """
+        if self._writer_thread is not None:
+            self._stop_requested.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def record(self, message: OrderBookMessage):
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self._dropped_messages += 1
+
+    def flush(self):
+        """
+        Writes the buffered messages of every trading pair. It must only be called when the writer thread is not
+        running.
+        """
+        self._drain_queue()
+        for trading_pair in list(self._buffers):
+            self._write_chunk(trading_pair)
+
+    def _write_loop(self):
+        while not self._stop_requested.is_set():
+            try:
+                message: OrderBookMessage = self._queue.get(timeout=0.5)
+                self._buffer_message(message)
+                self._drain_queue()
+                self._write_expired_chunks()
+            except queue.Empty:
+                self._write_expired_chunks()
+            except Exception:
+                self.logger().error("Unexpected error recording order book messages.", exc_info=True)
+        try:
+            self.flush()
+        except Exception:
+            self.logger().error("Unexpected error writing the recorded order book messages.", exc_info=True)
+
+    def _drain_queue(self):
+        while True:
+            try:
+                message: OrderBookMessage = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._buffer_message(message)
+
+    def _buffer_message(self, message: OrderBookMessage):
+        trading_pair: str = message.trading_pair
+        partition: str = time.strftime("%Y%m%d-%H", time.gmtime(message.timestamp))
+        buffer: Optional[_ChunkBuffer] = self._buffers.get(trading_pair)
+        if buffer is not None and buffer.partition != partition:
+            self._write_chunk(trading_pair)
+            buffer = None
+        if buffer is None:
+            buffer = _ChunkBuffer(partition)
+            self._buffers[trading_pair] = buffer
+        try:
+            buffer.append(message)
+        except NotImplementedError:
+            self._unsupported_messages += 1
+            message_kind = (type(message), message.type)
+            if message_kind not in self._unsupported_message_kinds:
+                self._unsupported_message_kinds.add(message_kind)
+                self.logger().warning(f"{type(message).__name__} {message.type.name.lower()} messages can not be "
+                                      f"recorded and will be skipped.")
+            return
+        except Exception:
+            self.logger().error(f"Invalid order book message for {trading_pair} not recorded: {message}",
+                                exc_info=True)
+            return
+        if len(buffer) >= self._chunk_size:
+            self._write_chunk(trading_pair)
+
+    def _write_expired_chunks(self):
+        now = time.monotonic()
+        for trading_pair, buffer in list(self._buffers.items()):
+            if now - buffer.created >= self._flush_interval:
+                self._write_chunk(trading_pair)
+
+    def _write_chunk(self, trading_pair: str):
+        buffer: Optional[_ChunkBuffer] = self._buffers.pop(trading_pair, None)
+        if buffer is None or len(buffer) == 0:
+            return
+        columns = buffer.columns()
+        trading_pair_path = self.trading_pair_path(trading_pair)
+        os.makedirs(os.path.join(trading_pair_path, buffer.partition), exist_ok=True)
+
+        first_timestamp = float(columns["timestamp"].min())
+        chunk = self._new_chunk_name(trading_pair_path, buffer.partition, first_timestamp)
+        chunk_path = os.path.join(trading_pair_path, chunk)
+        temporary_path = chunk_path[:-4] + ".tmp.npz"
+        np.savez_compressed(temporary_path, **columns)
+        os.replace(temporary_path, chunk_path)
+
+        index_path = os.path.join(trading_pair_path, INDEX_FILE_NAME)
+        write_header = not os.path.exists(index_path)
+        with open(index_path, "a", newline="") as index_file:
+            writer = csv.writer(index_file)
+            if write_header:
+                writer.writerow(INDEX_FIELD_NAMES)
+            writer.writerow((chunk, repr(first_timestamp), repr(float(columns["timestamp"].max())), len(buffer)))
+
+    def _new_chunk_name(self, trading_pair_path: str, partition: str, first_timestamp: float) -> str:
+        while True:
+            self._chunk_sequence[trading_pair_path] += 1
+            chunk = os.path.join(
+                partition, f"{int(first_timestamp * 1e3)}-{self._chunk_sequence[trading_pair_path]:06d}.npz")
+            if not os.path.exists(os.path.join(trading_pair_path, chunk)):
+                return chunk
+
+
+class OrderBookRecordReader:
+    """
+    Reads the order book messages of a trading pair recorded by OrderBookRecorder, in recording order.
+    """
+
+    def __init__(self, root_path: str, exchange: str, trading_pair: str):
+        self._exchange: str = exchange
+        self._trading_pair: str = trading_pair
+        self._trading_pair_path: str = os.path.join(root_path, exchange, trading_pair)
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def chunks(self) -> List[OrderBookRecordChunk]:
+        index_path = os.path.join(self._trading_pair_path, INDEX_FILE_NAME)
+        if not os.path.exists(index_path):
+            return []
+        with open(index_path, newline="") as index_file:
+            return [OrderBookRecordChunk(row["chunk"],
+                                         float(row["first_timestamp"]),
+                                         float(row["last_timestamp"]),
+                                         int(row["message_count"]))
+                    for row in csv.DictReader(index_file)]
+
+    def messages(self,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        """
+        Iterates over the recorded messages with start_timestamp <= timestamp <= end_timestamp. Only the chunks with
+        messages in the range are read.
+        """
+        chunks = self.chunks()
+        first_chunk = 0
+        if start_timestamp is not None and len(chunks) > 0:
+            # Skips the chunks that end before the start, using the running maximum of the chunks last timestamps
+            last_timestamps = np.maximum.accumulate([chunk.last_timestamp for chunk in chunks])
+            first_chunk = int(np.searchsorted(last_timestamps, start_timestamp, side="left"))
+        for chunk in chunks[first_chunk:]:
+            if start_timestamp is not None and chunk.last_timestamp < start_timestamp:
+                continue
+            if end_timestamp is not None and chunk.first_timestamp > end_timestamp:
+                continue
+            yield from self._chunk_messages(chunk, start_timestamp, end_timestamp)
+
+    def export_memory_mapped(self,
+                             path: str,
+                             start_timestamp: Optional[float] = None,
+                             end_timestamp: Optional[float] = None) -> "MemoryMappedOrderBookRecord":
+        """
+        Exports the chunks with messages in the range as uncompressed column files, that can be memory-mapped by
+        MemoryMappedOrderBookRecord
+
+        :param path: the directory to write the column files to
+        :param start_timestamp: the start of the range (all the messages if None)
+        :param end_timestamp: the end of the range (all the messages if None)
+        :return: the exported record
+        """
+        chunks_columns: List[Dict[str, np.ndarray]] = []
+        for chunk in self.chunks():
+            if start_timestamp is not None and chunk.last_timestamp < start_timestamp:
+                continue
+            if end_timestamp is not None and chunk.first_timestamp > end_timestamp:
+                continue
+            chunks_columns.append(self._chunk_columns(chunk))
+
+        os.makedirs(path, exist_ok=True)
+        for name in CHUNK_COLUMNS:
+            column = (np.concatenate([columns[name] for columns in chunks_columns])
+                      if len(chunks_columns) > 0
+                      else np.array([], dtype=CHUNK_COLUMNS[name]))
+            np.save(os.path.join(path, f"{name}.npy"), column.astype(CHUNK_COLUMNS[name], copy=False))
+        bids_count = np.load(os.path.join(path, "bids_count.npy"))
+        asks_count = np.load(os.path.join(path, "asks_count.npy"))
+        np.save(os.path.join(path, "levels_offset.npy"), _levels_offsets(bids_count, asks_count))
+        return MemoryMappedOrderBookRecord(path, self._trading_pair)
+
+    def _chunk_columns(self, chunk: OrderBookRecordChunk) -> Dict[str, np.ndarray]:
+        with np.load(os.path.join(self._trading_pair_path, chunk.chunk)) as data:
+            return {name: data[name] for name in data.files}
+
+    def _chunk_messages(self,
+                        chunk: OrderBookRecordChunk,
+                        start_timestamp: Optional[float],
+                        end_timestamp: Optional[float]) -> Iterator[OrderBookMessage]:
+        columns = self._chunk_columns(chunk)
+        levels_offsets = _levels_offsets(columns["bids_count"], columns["asks_count"])
+        return _messages_from_columns(self._trading_pair, columns, levels_offsets, start_timestamp, end_timestamp)
+
+
+class MemoryMappedOrderBookRecord:
+    """
+    The recorded messages of a trading pair exported by OrderBookRecordReader.export_memory_mapped. The column files
+    are memory-mapped read-only, so the processes reading the same record share the pages of the OS cache instead of
+    loading a copy each.
+    """
+
+    def __init__(self, path: str, trading_pair: str):
+        self._path: str = path
+        self._trading_pair: str = trading_pair
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in CHUNK_COLUMNS
+        }
+        self._levels_offsets: np.ndarray = np.load(os.path.join(path, "levels_offset.npy"), mmap_mode="r")
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    def messages(self,
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None) -> Iterator[OrderBookMessage]:
+        """
+        Iterates over the messages with start_timestamp <= timestamp <= end_timestamp
+        """
+        return _messages_from_columns(
+            self._trading_pair, self._columns, self._levels_offsets, start_timestamp, end_timestamp)
+
+
+def _levels_offsets(bids_count: np.ndarray, asks_count: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0], np.cumsum(bids_count.astype(np.int64) + asks_count))).astype(np.int64)
+
+
+def _messages_from_columns(trading_pair: str,
+                           columns: Dict[str, np.ndarray],
+                           levels_offsets: np.ndarray,
+                           start_timestamp: Optional[float],
+                           end_timestamp: Optional[float]) -> Iterator[OrderBookMessage]:
+    timestamps = columns["timestamp"]
+    selected = np.ones(len(timestamps), dtype=bool)
+    if start_timestamp is not None:
+        selected &= timestamps >= start_timestamp
+    if end_timestamp is not None:
+        selected &= timestamps <= end_timestamp
+    level_price = columns["level_price"]
+    level_amount = columns["level_amount"]
+
+    for i in np.flatnonzero(selected).tolist():
+        message_type = OrderBookMessageType(int(columns["type"][i]))
+        timestamp = float(timestamps[i])
+        if message_type is OrderBookMessageType.TRADE:
+            content = {
+                "trading_pair": trading_pair,
+                "trade_type": float(columns["trade_type"][i]),
+                "trade_id": str(columns["trade_id"][i]),
+                "update_id": int(columns["update_id"][i]),
+                "price": float(columns["price"][i]),
+                "amount": float(columns["amount"][i]),
+            }
+        else:
+            bids_start = int(levels_offsets[i])
+            asks_start = bids_start + int(columns["bids_count"][i])
+            asks_end = int(levels_offsets[i + 1])
+            content = {
+                "trading_pair": trading_pair,
+                "update_id": int(columns["update_id"][i]),
+                "bids": [[price, amount] for price, amount in zip(level_price[bids_start:asks_start].tolist(),
+                                                                  level_amount[bids_start:asks_start].tolist())],
+                "asks": [[price, amount] for price, amount in zip(level_price[asks_start:asks_end].tolist(),
+                                                                  level_amount[asks_start:asks_end].tolist())],
+            }
+            if message_type is OrderBookMessageType.DIFF:
+                content["first_update_id"] = int(columns["first_update_id"][i])
+        yield OrderBookMessage(message_type, content, timestamp)
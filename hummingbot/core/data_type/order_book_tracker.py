@@ -10,9 +10,11 @@ import pandas as pd
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,6 +25,9 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    MAX_COALESCED_DIFFS: int = 64
+    SNAPSHOT_RETRY_INITIAL_DELAY: float = 5.0
+    SNAPSHOT_RETRY_MAX_DELAY: float = 60.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,6 +41,7 @@ class OrderBookTracker:
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_books_ready: Dict[str, bool] = {trading_pair: False for trading_pair in trading_pairs or []}
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +51,7 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._recorder: Optional[OrderBookRecorder] = None
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +75,29 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def order_books_ready(self) -> Dict[str, bool]:
+        """
+        Readiness of each trading pair order book. A trading pair is ready as soon as its own order book has been
+        initialized, even if the books for other trading pairs are still loading.
+        """
+        return dict(self._order_books_ready)
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return self._order_books_ready.get(trading_pair, False)
+
+    @property
+    def recorder(self) -> Optional[OrderBookRecorder]:
+        """
+        The recorder that receives the initial snapshots and every diff, snapshot and trade message received from the
+        data source
+        """
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: Optional[OrderBookRecorder]):
+        self._recorder = recorder
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -104,8 +134,10 @@ class OrderBookTracker:
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        RuntimeMetrics.get_instance().register_gauges(self._metrics_name, self._gauges)
 
     def stop(self):
+        RuntimeMetrics.get_instance().unregister_gauges(self._metrics_name)
         if self._init_order_books_task is not None:
             self._init_order_books_task.cancel()
             self._init_order_books_task = None
@@ -138,10 +170,45 @@ class OrderBookTracker:
                 task.cancel()
             self._tracking_tasks.clear()
         self._order_books_initialized.clear()
+        for trading_pair in self._order_books_ready:
+            self._order_books_ready[trading_pair] = False
+
+    @property
+    def _metrics_name(self) -> str:
+        # The trackers of several connectors can use the same data source class
+        return f"order_book_tracker.{type(self._data_source).__name__}.{id(self):x}"
+
+    def _gauges(self) -> Dict[str, float]:
+        tasks = [self._init_order_books_task,
+                 self._emit_trade_event_task,
+                 self._order_book_diff_listener_task,
+                 self._order_book_trade_listener_task,
+                 self._order_book_snapshot_listener_task,
+                 self._order_book_diff_router_task,
+                 self._order_book_snapshot_router_task,
+                 self._update_last_trade_prices_task,
+                 self._order_book_stream_listener_task] + list(self._tracking_tasks.values())
+        return {
+            "running_tasks": sum(1 for task in tasks if task is not None and not task.done()),
+            "diff_queue_size": self._order_book_diff_stream.qsize(),
+            "snapshot_queue_size": self._order_book_snapshot_stream.qsize(),
+            "trade_queue_size": self._order_book_trade_stream.qsize(),
+            "tracking_queues_size": sum(queue.qsize() for queue in self._tracking_message_queues.values()),
+        }
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def initialize_order_books(self, order_books: Dict[str, OrderBook]):
+        """
+        Sets order books that have been built outside the tracker (e.g. when replaying recorded data) and flags the
+        tracker as ready. No tracking task is started, the caller is responsible for updating the order books.
+        """
+        for trading_pair, order_book in order_books.items():
+            self._order_books[trading_pair] = order_book
+            self._order_books_ready[trading_pair] = True
+        self._order_books_initialized.set()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -174,17 +241,63 @@ class OrderBookTracker:
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books.
+        When the data source requests snapshots through an API throttler, the snapshots for all trading pairs are
+        fetched concurrently and the throttler rate limits bound the requests. Otherwise the snapshots are requested
+        one at a time.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._data_source.snapshot_requests_throttled:
+            await safe_gather(*[self._init_order_book(trading_pair) for trading_pair in self._trading_pairs])
+        else:
+            for trading_pair in self._trading_pairs:
+                await self._init_order_book(trading_pair)
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        """
+        Initialize the order book of a single trading pair, and flags it as ready once it is being tracked.
+        The failed snapshot requests are retried with an exponential backoff, up to SNAPSHOT_RETRY_MAX_DELAY seconds.
+        """
+        retry_delay = self.SNAPSHOT_RETRY_INITIAL_DELAY
+        while True:
+            try:
+                order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=(f"Could not initialize order book for {trading_pair}. "
+                                     f"Retrying after {retry_delay:g} seconds.")
+                )
+                await self._sleep(delay=retry_delay)
+                retry_delay = min(retry_delay * 2, self.SNAPSHOT_RETRY_MAX_DELAY)
+
+        self._order_books[trading_pair] = order_book
+        if self._recorder is not None:
+            self._recorder.record(self._snapshot_message_from_order_book(trading_pair, order_book))
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_books_ready[trading_pair] = True
+        ready_count = sum(1 for ready in self._order_books_ready.values() if ready)
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{ready_count}/{len(self._trading_pairs)} completed.")
+
+    @staticmethod
+    def _snapshot_message_from_order_book(trading_pair: str, order_book: OrderBook) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {
+                "trading_pair": trading_pair,
+                "update_id": order_book.snapshot_uid,
+                "bids": [[row.price, row.amount] for row in order_book.bid_entries()],
+                "asks": [[row.price, row.amount] for row in order_book.ask_entries()],
+            },
+            timestamp=time.time())
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -197,6 +310,8 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
@@ -242,6 +357,8 @@ class OrderBookTracker:
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(ob_message)
                 trading_pair: str = ob_message.trading_pair
                 if trading_pair not in self._tracking_message_queues:
                     continue
@@ -260,21 +377,37 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        pending_message: Optional[OrderBookMessage] = None
 
         while True:
             try:
                 saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
 
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
+                # Process a message held back from the last batch, then saved messages, if there are any
+                if pending_message is not None:
+                    message = pending_message
+                    pending_message = None
+                elif len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    diff_messages_accepted += 1
+                    # When the queue is backed up, coalesce the queued diffs into a single application
+                    diff_messages: List[OrderBookMessage] = [message]
+                    while (len(saved_messages) == 0
+                           and not message_queue.empty()
+                           and len(diff_messages) < self.MAX_COALESCED_DIFFS):
+                        next_message: OrderBookMessage = message_queue.get_nowait()
+                        if next_message.type is OrderBookMessageType.DIFF:
+                            diff_messages.append(next_message)
+                        else:
+                            pending_message = next_message
+                            break
+
+                    self._apply_diff_messages(order_book, diff_messages)
+                    past_diffs_window.extend(diff_messages)
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -295,6 +428,16 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _apply_diff_messages(order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        # Messages that keep the exchange's raw price levels are parsed straight into the order book. Message
+        # classes with their own bids/asks parsing go through their OrderBookRow lists.
+        if all(message.has_raw_price_levels for message in diff_messages):
+            order_book.apply_raw_diff_messages(diff_messages)
+        else:
+            for message in diff_messages:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
@@ -303,6 +446,8 @@ class OrderBookTracker:
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
+                if self._recorder is not None:
+                    self._recorder.record(trade_message)
                 trading_pair: str = trade_message.trading_pair
 
                 if trading_pair not in self._order_books:
@@ -5,8 +5,10 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
@@ -15,6 +17,8 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
 
     _logger: Optional[HummingbotLogger] = None
+    # Set by the data sources that send their requests through web assistants
+    _api_factory: Optional[WebAssistantsFactory] = None
 
     def __init__(self, trading_pairs: List[str]):
         self._trade_messages_queue_key = "trade"
@@ -39,6 +43,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def snapshot_requests_throttled(self) -> bool:
+        """
+        Returns True if the order book snapshots are requested through an API throttler, whose rate limits bound the
+        requests when the snapshots of all the trading pairs are requested at once
+        """
+        return self._api_factory is not None and isinstance(self._api_factory.throttler, AsyncThrottlerBase)
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -0,0 +1,150 @@
+import asyncio
+import heapq
+import os
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import MemoryMappedOrderBookRecord, OrderBookRecordReader
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class ReplayOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source that replays the messages recorded by OrderBookRecorder instead of connecting to the
+    exchange.
+
+    The initial order book of each trading pair is built from its first recorded snapshot at or after
+    `start_timestamp`. The messages recorded after that snapshot are replayed for all trading pairs merged in timestamp
+    order, until `end_timestamp`. They can be consumed through the usual tracker listeners, or synchronously with
+    `replay_messages()` (used by OrderBookReplayDriver to backtest at full speed).
+
+    With `memory_mapped_path`, the messages are read from the records exported there by
+    `export_memory_mapped_records` instead of the recorded chunks, so that several processes can replay the same
+    data without loading a copy each.
+    """
+    REPLAY_BATCH_SIZE = 1000
+
+    def __init__(self,
+                 root_path: str,
+                 exchange: str,
+                 trading_pairs: List[str],
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None,
+                 memory_mapped_path: Optional[str] = None):
+        super().__init__(trading_pairs)
+        self._readers: Dict[str, Union[OrderBookRecordReader, MemoryMappedOrderBookRecord]] = {}
+        for trading_pair in trading_pairs:
+            if memory_mapped_path is not None:
+                self._readers[trading_pair] = MemoryMappedOrderBookRecord(
+                    os.path.join(memory_mapped_path, trading_pair), trading_pair)
+            else:
+                self._readers[trading_pair] = OrderBookRecordReader(root_path, exchange, trading_pair)
+        self._start_timestamp: Optional[float] = start_timestamp
+        self._end_timestamp: Optional[float] = end_timestamp
+        self._initial_snapshots: Dict[str, OrderBookMessage] = {}
+        self._last_traded_prices: Dict[str, float] = {}
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def start_timestamp(self) -> Optional[float]:
+        return self._start_timestamp
+
+    @property
+    def end_timestamp(self) -> Optional[float]:
+        return self._end_timestamp
+
+    @staticmethod
+    def export_memory_mapped_records(root_path: str,
+                                     exchange: str,
+                                     trading_pairs: List[str],
+                                     memory_mapped_path: str,
+                                     start_timestamp: Optional[float] = None,
+                                     end_timestamp: Optional[float] = None):
+        """
+        Exports the recorded messages of the trading pairs in the period, to be replayed from `memory_mapped_path`
+        """
+        for trading_pair in trading_pairs:
+            OrderBookRecordReader(root_path, exchange, trading_pair).export_memory_mapped(
+                os.path.join(memory_mapped_path, trading_pair), start_timestamp, end_timestamp)
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {trading_pair: self._last_traded_prices[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._last_traded_prices}
+
+    def initial_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Returns the first recorded snapshot of the trading pair in the replay period
+
+        :param trading_pair: the trading pair
+        :return: the snapshot message
+        """
+        snapshot: Optional[OrderBookMessage] = self._initial_snapshots.get(trading_pair)
+        if snapshot is None:
+            snapshot = next((message
+                             for message in self._recorded_messages(trading_pair)
+                             if message.type is OrderBookMessageType.SNAPSHOT),
+                            None)
+            if snapshot is None:
+                raise ValueError(f"There is no order book snapshot recorded for {trading_pair} in the replay period.")
+            self._initial_snapshots[trading_pair] = snapshot
+        return snapshot
+
+    def replay_messages(self) -> Iterator[OrderBookMessage]:
+        """
+        Iterates over the messages recorded after the initial snapshots, for all trading pairs, in timestamp order.
+        The messages of each trading pair keep their recording order.
+        """
+        trading_pairs_messages = [self._trading_pair_replay_messages(trading_pair)
+                                  for trading_pair in self._trading_pairs]
+        for message in heapq.merge(*trading_pairs_messages, key=lambda message: message.timestamp):
+            if message.type is OrderBookMessageType.TRADE:
+                self._last_traded_prices[message.trading_pair] = float(message.content["price"])
+            yield message
+
+    async def listen_for_subscriptions(self):
+        """
+        Replays the recorded messages into the messages queues, yielding control to the event loop every
+        REPLAY_BATCH_SIZE messages
+        """
+        queue_keys = {
+            OrderBookMessageType.SNAPSHOT: self._snapshot_messages_queue_key,
+            OrderBookMessageType.DIFF: self._diff_messages_queue_key,
+            OrderBookMessageType.TRADE: self._trade_messages_queue_key,
+        }
+        for message_count, message in enumerate(self.replay_messages(), start=1):
+            self._message_queue[queue_keys[message.type]].put_nowait(message)
+            if message_count % self.REPLAY_BATCH_SIZE == 0:
+                await self._sleep(0)
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        return self.initial_snapshot(trading_pair)
+
+    async def _request_order_book_snapshots(self, output: asyncio.Queue):
+        # Only the recorded snapshots are replayed
+        pass
+
+    async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    async def _parse_order_book_snapshot_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(raw_message)
+
+    def _recorded_messages(self, trading_pair: str) -> Iterator[OrderBookMessage]:
+        return self._readers[trading_pair].messages(start_timestamp=self._start_timestamp,
+                                                    end_timestamp=self._end_timestamp)
+
+    def _trading_pair_replay_messages(self, trading_pair: str) -> Iterator[OrderBookMessage]:
+        initial_snapshot_found = False
+        for message in self._recorded_messages(trading_pair):
+            if initial_snapshot_found:
+                yield message
+            elif message.type is OrderBookMessageType.SNAPSHOT:
+                self._initial_snapshots.setdefault(trading_pair, message)
+                initial_snapshot_found = True
@@ -0,0 +1,102 @@
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, KeysView, Mapping, Tuple, Union
+
+
+class TimeWindowedIndex:
+    """
+    Dictionary of the keys added in the last `window` seconds, with at most `max_size` keys.
+
+    The keys are kept in a queue ordered by age and evicted from its head when they get older than the window (or when
+    there are too many), so adding and looking up a key is O(1) and the memory used does not grow with the runtime.
+    Adding a key already in the index updates its value but not its age.
+    """
+
+    def __init__(self, window: float, max_size: int, time_provider: Callable[[], float] = time.time):
+        """
+        :param window: the time (in seconds) a key is kept in the index
+        :param max_size: the maximum number of keys in the index
+        :param time_provider: the function returning the current time (in seconds)
+        """
+        self._window: float = window
+        self._max_size: int = max_size
+        self._time_provider: Callable[[], float] = time_provider
+        # key -> (value, time added)
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+        # (time added, key), oldest first. Removed keys are skipped when they reach the head, or dropped when the queue
+        # gets longer than twice the maximum size.
+        self._added: Deque[Tuple[float, Hashable]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def keys(self) -> KeysView:
+        return self._entries.keys()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        return default if entry is None else entry[0]
+
+    def add(self, key: Hashable, value: Any = None):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (value, entry[1])
+            return
+        now = self._time_provider()
+        self._entries[key] = (value, now)
+        self._added.append((now, key))
+        self._evict(now)
+
+    def update(self, items: Union[Mapping[Hashable, Any], Iterable[Hashable]]):
+        """
+        Adds the keys and values of a mapping, or the keys of an iterable (with None values)
+        """
+        if isinstance(items, Mapping):
+            for key, value in items.items():
+                self.add(key, value)
+        else:
+            for key in items:
+                self.add(key)
+
+    def remove(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+        self._added.clear()
+
+    def _evict(self, now: float):
+        expiration_time = now - self._window
+        while len(self._added) > 0:
+            added_time, key = self._added[0]
+            entry = self._entries.get(key)
+            if entry is None or entry[1] != added_time:
+                # The key was removed
+                self._added.popleft()
+            elif len(self._entries) > self._max_size or added_time < expiration_time:
+                self._added.popleft()
+                del self._entries[key]
+            else:
+                break
+        if len(self._added) > 2 * self._max_size:
+            self._compact()
+
+    def _compact(self):
+        """
+        Drops the removed keys from the queue, when there are more of them than keys in the index
+        """
+        added: Deque[Tuple[float, Hashable]] = deque()
+        queued_keys = set()
+        for added_time, key in self._added:
+            entry = self._entries.get(key)
+            # A key removed and added again at the same time is queued twice
+            if entry is not None and entry[1] == added_time and key not in queued_keys:
+                added.append((added_time, key))
+                queued_keys.add(key)
+        self._added = added
@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 
 
@@ -33,8 +34,24 @@ class UserStreamTracker:
         self._user_stream_tracking_task = safe_ensure_future(
             self.data_source.listen_for_user_stream(self._user_stream)
         )
-        await safe_gather(self._user_stream_tracking_task)
+        RuntimeMetrics.get_instance().register_gauges(self._metrics_name, self._gauges)
+        try:
+            await safe_gather(self._user_stream_tracking_task)
+        finally:
+            RuntimeMetrics.get_instance().unregister_gauges(self._metrics_name)
 
     @property
     def user_stream(self) -> asyncio.Queue:
         return self._user_stream
+
+    @property
+    def _metrics_name(self) -> str:
+        # The trackers of several connectors can use the same data source class
+        return f"user_stream_tracker.{type(self._data_source).__name__}.{id(self):x}"
+
+    def _gauges(self) -> Dict[str, float]:
+        task = self._user_stream_tracking_task
+        return {
+            "running_tasks": int(task is not None and not task.done()),
+            "user_stream_queue_size": self._user_stream.qsize(),
+        }
@@ -0,0 +1,215 @@
+from bisect import bisect_right, insort
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.event.events import OrderFilledEvent
+
+s_decimal_0 = Decimal("0")
+
+
+class OrderFillAggregate:
+    """
+    Running totals of the fills of one trading pair and side, and optionally of one order type.
+    The percentage fees are accumulated in the quote token and the flat fees in their own tokens.
+    """
+    __slots__ = ("trading_pair",
+                 "trade_type",
+                 "order_type",
+                 "base",
+                 "quote",
+                 "fill_count",
+                 "base_volume",
+                 "quote_volume",
+                 "price_sum",
+                 "fees",
+                 "first_timestamp",
+                 "last_timestamp")
+
+    def __init__(self, trading_pair: str, trade_type: TradeType, order_type: Optional[OrderType] = None):
+        self.trading_pair: str = trading_pair
+        self.trade_type: TradeType = trade_type
+        self.order_type: Optional[OrderType] = order_type
+        trading_pair_tokens = trading_pair.split("-")
+        self.base: str = trading_pair_tokens[0]
+        self.quote: str = trading_pair_tokens[1]
+        self.fill_count: int = 0
+        self.base_volume: Decimal = s_decimal_0
+        self.quote_volume: Decimal = s_decimal_0
+        self.price_sum: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = {}
+        self.first_timestamp: Optional[float] = None
+        self.last_timestamp: Optional[float] = None
+
+    @property
+    def average_price(self) -> Decimal:
+        return self.quote_volume / self.base_volume if self.base_volume != s_decimal_0 else s_decimal_0
+
+    @property
+    def mean_price(self) -> Decimal:
+        """
+        The arithmetic mean of the fill prices, not weighted by the fill amounts
+        """
+        return self.price_sum / self.fill_count if self.fill_count > 0 else s_decimal_0
+
+    def add(self, event: OrderFilledEvent):
+        notional = event.price * event.amount
+        self.fill_count += 1
+        self.base_volume += event.amount
+        self.quote_volume += notional
+        self.price_sum += event.price
+        trade_fee = event.trade_fee
+        if trade_fee.percent is not None and trade_fee.percent != s_decimal_0:
+            self.fees[self.quote] = self.fees.get(self.quote, s_decimal_0) + notional * trade_fee.percent
+        for flat_fee in trade_fee.flat_fees:
+            self.fees[flat_fee.token] = self.fees.get(flat_fee.token, s_decimal_0) + flat_fee.amount
+        if self.first_timestamp is None:
+            self.first_timestamp = event.timestamp
+        self.last_timestamp = event.timestamp
+
+
+class OrderFilledStore:
+    """
+    Keeps the order filled events with a memory footprint that does not grow with the number of fills: one
+    OrderFillAggregate per trading pair and side (and one per trading pair, side and order type), plus a window with
+    the most recent fill events.
+
+    The balance changes since the last starting timestamps queried (usually 0 and the balances snapshot timestamp) are
+    kept in ledgers updated as the fills are added, so that querying them again only copies the per-asset totals.
+    The fills leaving the recent fills window are kept as their balance changes per timestamp, so that the balance
+    changes since any timestamp include all the fills after it.
+    """
+    RECENT_FILLS_LIMIT = 1000
+    MAX_LEDGERS = 4
+
+    def __init__(self, recent_fills_limit: int = RECENT_FILLS_LIMIT):
+        self._recent_fills: Deque[OrderFilledEvent] = deque(maxlen=recent_fills_limit)
+        self._aggregates: Dict[Tuple[str, TradeType], OrderFillAggregate] = {}
+        self._order_type_aggregates: Dict[Tuple[str, TradeType, OrderType], OrderFillAggregate] = {}
+        self._fill_count: int = 0
+        self._first_timestamp: Optional[float] = None
+        # Balance changes of the fills that left the recent fills window, per timestamp in ascending order
+        self._evicted_timestamps: List[float] = []
+        self._evicted_balance_changes: Dict[float, Dict[str, Decimal]] = {}
+        self._trading_pair_assets: Dict[str, Tuple[str, str]] = {}
+        # Starting timestamp -> balance changes of the fills after it, the most recently used last
+        self._ledgers: Dict[float, Dict[str, Decimal]] = {}
+
+    @property
+    def recent_fills(self) -> Deque[OrderFilledEvent]:
+        return self._recent_fills
+
+    @property
+    def aggregates(self) -> Dict[Tuple[str, TradeType], OrderFillAggregate]:
+        return self._aggregates
+
+    @property
+    def order_type_aggregates(self) -> Dict[Tuple[str, TradeType, OrderType], OrderFillAggregate]:
+        return self._order_type_aggregates
+
+    @property
+    def fill_count(self) -> int:
+        return self._fill_count
+
+    def aggregate(self, trading_pair: str, trade_type: TradeType) -> Optional[OrderFillAggregate]:
+        return self._aggregates.get((trading_pair, trade_type))
+
+    def order_type_aggregate(self,
+                             trading_pair: str,
+                             trade_type: TradeType,
+                             order_type: OrderType) -> Optional[OrderFillAggregate]:
+        return self._order_type_aggregates.get((trading_pair, trade_type, order_type))
+
+    def add(self, event: OrderFilledEvent):
+        if len(self._recent_fills) == self._recent_fills.maxlen:
+            self._evict(self._recent_fills[0])
+        self._recent_fills.append(event)
+
+        key = (event.trading_pair, event.trade_type)
+        aggregate = self._aggregates.get(key)
+        if aggregate is None:
+            aggregate = OrderFillAggregate(trading_pair=event.trading_pair, trade_type=event.trade_type)
+            self._aggregates[key] = aggregate
+        aggregate.add(event)
+
+        key = (event.trading_pair, event.trade_type, event.order_type)
+        aggregate = self._order_type_aggregates.get(key)
+        if aggregate is None:
+            aggregate = OrderFillAggregate(trading_pair=event.trading_pair,
+                                           trade_type=event.trade_type,
+                                           order_type=event.order_type)
+            self._order_type_aggregates[key] = aggregate
+        aggregate.add(event)
+
+        self._fill_count += 1
+        if self._first_timestamp is None or event.timestamp < self._first_timestamp:
+            self._first_timestamp = event.timestamp
+
+        for starting_timestamp, ledger in self._ledgers.items():
+            if event.timestamp > starting_timestamp:
+                self._apply_to_ledger(ledger, event)
+
+    def balance_changes(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        Calculates the asset balance changes from the fills after the timestamp (without fees).
+        The changes are computed the first time a starting timestamp is queried, from the aggregates when all the fills
+        are included, or from the recent fills window and the balance changes of the fills that left it otherwise. Then
+        they are kept up to date as the fills are added.
+        """
+        ledger = self._ledgers.pop(starting_timestamp, None)
+        if ledger is None:
+            ledger = self._compute_ledger(starting_timestamp)
+            if len(self._ledgers) >= self.MAX_LEDGERS:
+                del self._ledgers[next(iter(self._ledgers))]
+        self._ledgers[starting_timestamp] = ledger
+        return dict(ledger)
+
+    def clear(self):
+        self._recent_fills.clear()
+        self._aggregates.clear()
+        self._order_type_aggregates.clear()
+        self._fill_count = 0
+        self._first_timestamp = None
+        self._evicted_timestamps.clear()
+        self._evicted_balance_changes.clear()
+        self._ledgers.clear()
+
+    def _assets(self, trading_pair: str) -> Tuple[str, str]:
+        assets = self._trading_pair_assets.get(trading_pair)
+        if assets is None:
+            trading_pair_tokens = trading_pair.split("-")
+            assets = self._trading_pair_assets[trading_pair] = (trading_pair_tokens[0], trading_pair_tokens[1])
+        return assets
+
+    def _compute_ledger(self, starting_timestamp: float) -> Dict[str, Decimal]:
+        ledger: Dict[str, Decimal] = {}
+        if self._first_timestamp is not None and starting_timestamp < self._first_timestamp:
+            for aggregate in self._aggregates.values():
+                sign = Decimal("1") if aggregate.trade_type is TradeType.BUY else Decimal("-1")
+                ledger[aggregate.base] = ledger.get(aggregate.base, s_decimal_0) + sign * aggregate.base_volume
+                ledger[aggregate.quote] = ledger.get(aggregate.quote, s_decimal_0) - sign * aggregate.quote_volume
+        else:
+            for timestamp in self._evicted_timestamps[bisect_right(self._evicted_timestamps, starting_timestamp):]:
+                for asset, balance_change in self._evicted_balance_changes[timestamp].items():
+                    ledger[asset] = ledger.get(asset, s_decimal_0) + balance_change
+            for event in self._recent_fills:
+                if event.timestamp > starting_timestamp:
+                    self._apply_to_ledger(ledger, event)
+        return ledger
+
+    def _evict(self, event: OrderFilledEvent):
+        balance_changes = self._evicted_balance_changes.get(event.timestamp)
+        if balance_changes is None:
+            balance_changes = self._evicted_balance_changes[event.timestamp] = {}
+            if len(self._evicted_timestamps) == 0 or event.timestamp > self._evicted_timestamps[-1]:
+                self._evicted_timestamps.append(event.timestamp)
+            else:
+                insort(self._evicted_timestamps, event.timestamp)
+        self._apply_to_ledger(balance_changes, event)
+
+    def _apply_to_ledger(self, ledger: Dict[str, Decimal], event: OrderFilledEvent):
+        base, quote = self._assets(event.trading_pair)
+        sign = Decimal("1") if event.trade_type is TradeType.BUY else Decimal("-1")
+        ledger[base] = ledger.get(base, s_decimal_0) + sign * event.amount
+        ledger[quote] = ledger.get(quote, s_decimal_0) - sign * event.price * event.amount
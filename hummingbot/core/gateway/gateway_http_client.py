@@ -11,6 +11,8 @@ from hummingbot.client.config.security import Security
 from hummingbot.core.data_type.common import OrderType, PositionSide
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.event.events import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.logger import HummingbotLogger
 
 if TYPE_CHECKING:
@@ -64,6 +66,8 @@ class GatewayHttpClient:
         if GatewayHttpClient.__instance is None:
             self._base_url = f"https://{api_host}:{api_port}"
         self._client_config_map = client_config_map
+        self._quote_cache = GatewayQuoteCache()
+        RuntimeMetrics.get_instance().register_gauges("gateway_quote_cache", self._quote_cache.metrics)
         GatewayHttpClient.__instance = self
 
     @classmethod
@@ -103,6 +107,10 @@ class GatewayHttpClient:
     def base_url(self, url: str):
         self._base_url = url
 
+    @property
+    def quote_cache(self) -> GatewayQuoteCache:
+        return self._quote_cache
+
     def log_error_codes(self, resp: Dict[str, Any]):
         """
         If the API returns an error code, interpret the code, log a useful
@@ -382,16 +390,26 @@ class GatewayHttpClient:
             raise ValueError("Only BUY and SELL prices are supported.")
 
         # XXX(martin_kou): The amount is always output with 18 decimal places.
-        return await self.api_request("post", "amm/price", {
-            "chain": chain,
-            "network": network,
-            "connector": connector,
-            "base": base_asset,
-            "quote": quote_asset,
-            "amount": f"{amount:.18f}",
-            "side": side.name,
-            "allowedSlippage": "0/1",  # hummingbot applies slippage itself
-        }, fail_silently=fail_silently)
+        return await self._quote_cache.get_price(
+            chain=chain,
+            network=network,
+            connector=connector,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            amount=amount,
+            side=side,
+            fail_silently=fail_silently,
+            fetch_price=lambda: self.api_request("post", "amm/price", {
+                "chain": chain,
+                "network": network,
+                "connector": connector,
+                "base": base_asset,
+                "quote": quote_asset,
+                "amount": f"{amount:.18f}",
+                "side": side.name,
+                "allowedSlippage": "0/1",  # hummingbot applies slippage itself
+            }, fail_silently=fail_silently),
+        )
 
     async def get_transaction_status(
             self,
@@ -0,0 +1,198 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from hummingbot.core.data_type.common import TradeType
+
+s_decimal_0 = Decimal("0")
+
+# (chain, network, connector, base, quote, side)
+LadderKey = Tuple[str, str, str, str, str, TradeType]
+
+
+class GatewayQuoteCache:
+    """
+    Cache of the Gateway AMM price quotes, shared by all the connectors and strategies requesting them.
+
+    - Identical concurrent requests are sent once, and all the callers get the same response.
+    - Successful quotes are reused for part of the block time of their chain (BLOCK_TIME_SHARE), counted from the time
+      they were requested. The pools state does not change within a block, but the block boundaries are not known, so
+      a quote kept for a whole block time would often outlive its block.
+    - Optionally, a quote for an amount between the amounts of two cached quotes of the same market and side (its
+      ladder) is interpolated from them, if their amounts are close enough. This is disabled by default.
+    """
+    # Average block time (in seconds) of each chain
+    CHAIN_BLOCK_TIMES: Dict[str, float] = {
+        "ethereum": 12.0,
+        "polygon": 2.0,
+        "avalanche": 2.0,
+        "binance-smart-chain": 3.0,
+        "cronos": 6.0,
+        "harmony": 2.0,
+        "xdc": 2.0,
+        "near": 1.0,
+        "injective": 1.0,
+        "algorand": 3.3,
+    }
+    # Share of the block time a quote is kept
+    BLOCK_TIME_SHARE = 0.5
+    DEFAULT_TTL = 0.5
+    MAX_LADDER_SIZE = 50
+
+    def __init__(self,
+                 chain_ttls: Optional[Dict[str, float]] = None,
+                 interpolation_max_spread: Decimal = s_decimal_0,
+                 time_provider: Callable[[], float] = time.monotonic):
+        """
+        :param chain_ttls: the time (in seconds) quotes are kept for each chain (BLOCK_TIME_SHARE of the chains block
+        times by default)
+        :param interpolation_max_spread: the maximum relative difference between the amounts of two cached quotes to
+        interpolate a quote from them (0 disables the interpolation)
+        :param time_provider: the function returning the current time (in seconds), monotonic by default so that the
+        quotes expiration is not affected by system clock adjustments
+        """
+        if chain_ttls is None:
+            chain_ttls = {chain: block_time * self.BLOCK_TIME_SHARE
+                          for chain, block_time in self.CHAIN_BLOCK_TIMES.items()}
+        self._chain_ttls: Dict[str, float] = dict(chain_ttls)
+        self._interpolation_max_spread: Decimal = interpolation_max_spread
+        self._time_provider: Callable[[], float] = time_provider
+        # ladder key -> amount -> (expiration time, response)
+        self._ladders: Dict[LadderKey, Dict[Decimal, Tuple[float, Dict[str, Any]]]] = {}
+        self._pending_requests: Dict[Tuple[LadderKey, Decimal, bool], asyncio.Task] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._coalesced: int = 0
+        self._interpolated: int = 0
+
+    @property
+    def interpolation_max_spread(self) -> Decimal:
+        return self._interpolation_max_spread
+
+    @interpolation_max_spread.setter
+    def interpolation_max_spread(self, value: Decimal):
+        self._interpolation_max_spread = value
+
+    def ttl(self, chain: str) -> float:
+        return self._chain_ttls.get(chain, self.DEFAULT_TTL)
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "interpolated": self._interpolated,
+            "size": sum(len(ladder) for ladder in self._ladders.values()),
+        }
+
+    def clear(self):
+        self._ladders.clear()
+
+    async def get_price(self,
+                        chain: str,
+                        network: str,
+                        connector: str,
+                        base_asset: str,
+                        quote_asset: str,
+                        amount: Decimal,
+                        side: TradeType,
+                        fail_silently: bool,
+                        fetch_price: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Returns the cached quote for the request, or sends it with fetch_price (unless an identical request is in
+        progress) and caches the response if it has a price.
+        The returned dictionary is a copy, so callers can modify it.
+        """
+        ladder_key = (chain, network, connector, base_asset, quote_asset, side)
+        # The amount is sent with 18 decimals, so amounts equal to that precision get the same quote
+        amount = Decimal(f"{amount:.18f}")
+        now = self._time_provider()
+
+        response = self._cached_response(ladder_key, amount, now)
+        if response is not None:
+            return response
+
+        request_key = (ladder_key, amount, fail_silently)
+        request = self._pending_requests.get(request_key)
+        if request is None:
+            self._misses += 1
+            request = asyncio.ensure_future(self._fetch(ladder_key, amount, fetch_price))
+            self._pending_requests[request_key] = request
+            request.add_done_callback(lambda task: self._on_request_done(request_key, task))
+        else:
+            self._coalesced += 1
+        # A caller being cancelled does not cancel the request for the other callers
+        response = await asyncio.shield(request)
+        return dict(response) if isinstance(response, dict) else response
+
+    def _cached_response(self, ladder_key: LadderKey, amount: Decimal, now: float) -> Optional[Dict[str, Any]]:
+        ladder = self._ladders.get(ladder_key)
+        if ladder is None:
+            return None
+        entry = ladder.get(amount)
+        if entry is not None and entry[0] > now:
+            self._hits += 1
+            return dict(entry[1])
+        if self._interpolation_max_spread > s_decimal_0:
+            response = self._interpolated_response(ladder, amount, now)
+            if response is not None:
+                self._interpolated += 1
+                return response
+        return None
+
+    def _interpolated_response(self,
+                               ladder: Dict[Decimal, Tuple[float, Dict[str, Any]]],
+                               amount: Decimal,
+                               now: float) -> Optional[Dict[str, Any]]:
+        lower_amount = upper_amount = None
+        for ladder_amount, (expiration_time, _) in ladder.items():
+            if expiration_time <= now:
+                continue
+            if ladder_amount < amount and (lower_amount is None or ladder_amount > lower_amount):
+                lower_amount = ladder_amount
+            elif ladder_amount > amount and (upper_amount is None or ladder_amount < upper_amount):
+                upper_amount = ladder_amount
+        if (lower_amount is None
+                or upper_amount is None
+                or upper_amount - lower_amount > upper_amount * self._interpolation_max_spread):
+            return None
+
+        lower_price = Decimal(ladder[lower_amount][1]["price"])
+        upper_price = Decimal(ladder[upper_amount][1]["price"])
+        price = lower_price + (upper_price - lower_price) * (amount - lower_amount) / (upper_amount - lower_amount)
+        # The gas estimation of the larger amount is kept, as it is the most conservative
+        response = dict(ladder[upper_amount][1])
+        response["price"] = str(price)
+        response["amount"] = str(amount)
+        if "expectedAmount" in response:
+            # The quote amount received for a sell, or paid for a buy
+            response["expectedAmount"] = str(price * amount)
+        return response
+
+    async def _fetch(self,
+                     ladder_key: LadderKey,
+                     amount: Decimal,
+                     fetch_price: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        # The quote reflects the pools state when it was requested
+        request_time = self._time_provider()
+        response = await fetch_price()
+        if isinstance(response, dict) and "price" in response:
+            ladder = self._ladders.setdefault(ladder_key, {})
+            ladder.pop(amount, None)
+            ladder[amount] = (request_time + self.ttl(ladder_key[0]), dict(response))
+            self._prune(ladder, self._time_provider())
+        return response
+
+    def _on_request_done(self, request_key: Tuple[LadderKey, Decimal, bool], request: asyncio.Task):
+        self._pending_requests.pop(request_key, None)
+        if not request.cancelled():
+            # Retrieved so it is not reported as unhandled when all the callers were cancelled
+            request.exception()
+
+    def _prune(self, ladder: Dict[Decimal, Tuple[float, Dict[str, Any]]], now: float):
+        for amount in [amount for amount, (expiration_time, _) in ladder.items() if expiration_time <= now]:
+            del ladder[amount]
+        # The ladder keeps the insertion order, so the oldest quotes are the first ones
+        while len(ladder) > self.MAX_LADDER_SIZE:
+            del ladder[next(iter(ladder))]
@@ -0,0 +1,194 @@
+import asyncio
+import bisect
+import gc
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class Histogram:
+    """
+    Distribution of durations (in ms), counted in fixed buckets so that recording a value does not allocate.
+    The percentiles are approximated by the upper bound of their bucket.
+    """
+    BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self._count: int = 0
+        self._total: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count > 0 else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def observe(self, value: float):
+        self._bucket_counts[bisect.bisect_left(self.BUCKET_BOUNDS_MS, value)] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        :param percentile: the percentile, between 0 and 100
+        :return: the upper bound of the bucket of the percentile (the max value for the last bucket)
+        """
+        if self._count == 0:
+            return 0.0
+        rank = self._count * percentile / 100
+        cumulative_count = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self._bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return min(bound, self._max)
+        return self._max
+
+    def reset(self):
+        self._bucket_counts = [0] * len(self._bucket_counts)
+        self._count = 0
+        self._total = 0.0
+        self._max = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self._max,
+        }
+
+
+class RuntimeMetrics:
+    """
+    Collects the metrics used to find out what delays the clock ticks:
+    - the duration of the tick of each clock iterator (recorded by the Clock)
+    - the lag of the event loop (how late a sleep wakes up) and the garbage collection pauses, while sampling is on
+    - the latency of the REST requests, by throttler limit id (recorded by the RESTAssistant)
+    - gauges (task counts, queue sizes) registered by the components, evaluated only when a snapshot is taken
+    """
+    LOOP_LAG_SAMPLING_INTERVAL = 0.5
+
+    _shared_instance: "RuntimeMetrics" = None
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def get_instance(cls) -> "RuntimeMetrics":
+        if cls._shared_instance is None:
+            cls._shared_instance = RuntimeMetrics()
+        return cls._shared_instance
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self):
+        self._tick_durations: Dict[str, Histogram] = {}
+        self._rest_latencies: Dict[str, Histogram] = {}
+        self._loop_lag: Histogram = Histogram()
+        self._gc_pauses: Histogram = Histogram()
+        self._gauges: Dict[str, Callable[[], Dict[str, float]]] = {}
+        self._loop_lag_sampling_task: Optional[asyncio.Task] = None
+        self._gc_start: Optional[float] = None
+
+    @property
+    def is_sampling_loop_lag(self) -> bool:
+        return self._loop_lag_sampling_task is not None
+
+    def record_tick_duration(self, iterator_name: str, duration_ms: float):
+        histogram = self._tick_durations.get(iterator_name)
+        if histogram is None:
+            histogram = self._tick_durations[iterator_name] = Histogram()
+        histogram.observe(duration_ms)
+
+    def record_rest_latency(self, endpoint: str, latency_ms: float):
+        histogram = self._rest_latencies.get(endpoint)
+        if histogram is None:
+            histogram = self._rest_latencies[endpoint] = Histogram()
+        histogram.observe(latency_ms)
+
+    def register_gauges(self, name: str, gauges: Callable[[], Dict[str, float]]):
+        """
+        :param name: the name of the component (replaces the gauges previously registered with the same name)
+        :param gauges: a function returning the current value of each gauge of the component
+        """
+        self._gauges[name] = gauges
+
+    def unregister_gauges(self, name: str):
+        self._gauges.pop(name, None)
+
+    def start_loop_lag_sampling(self):
+        if self._loop_lag_sampling_task is None:
+            self._loop_lag_sampling_task = safe_ensure_future(self._loop_lag_sampling_loop())
+            gc.callbacks.append(self._on_gc_event)
+
+    def stop_loop_lag_sampling(self):
+        if self._loop_lag_sampling_task is not None:
+            self._loop_lag_sampling_task.cancel()
+            self._loop_lag_sampling_task = None
+        if self._on_gc_event in gc.callbacks:
+            gc.callbacks.remove(self._on_gc_event)
+        self._gc_start = None
+
+    def reset(self):
+        """
+        Clears the recorded durations (the registered gauges are kept)
+        """
+        self._tick_durations.clear()
+        self._rest_latencies.clear()
+        self._loop_lag.reset()
+        self._gc_pauses.reset()
+
+    def snapshot(self) -> Dict[str, Any]:
+        gauges = {}
+        for name, component_gauges in list(self._gauges.items()):
+            try:
+                gauges.update({f"{name}.{gauge}": value for gauge, value in component_gauges().items()})
+            except Exception:
+                self.logger().error(f"Unexpected error reading the {name} gauges.", exc_info=True)
+        try:
+            gauges["event_loop.tasks"] = len(asyncio.all_tasks())
+        except RuntimeError:  # no running event loop
+            pass
+        return {
+            "tick_duration_ms": {name: histogram.to_dict() for name, histogram in self._tick_durations.items()},
+            "loop_lag_ms": self._loop_lag.to_dict(),
+            "gc_pause_ms": self._gc_pauses.to_dict(),
+            "rest_latency_ms": {name: histogram.to_dict() for name, histogram in self._rest_latencies.items()},
+            "gauges": gauges,
+        }
+
+    async def _loop_lag_sampling_loop(self):
+        while True:
+            expected_wake_up = time.perf_counter() + self.LOOP_LAG_SAMPLING_INTERVAL
+            await self._sleep(self.LOOP_LAG_SAMPLING_INTERVAL)
+            self._loop_lag.observe(max(0.0, (time.perf_counter() - expected_wake_up) * 1e3))
+
+    def _on_gc_event(self, phase: str, _):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        elif self._gc_start is not None:
+            self._gc_pauses.observe((time.perf_counter() - self._gc_start) * 1e3)
+            self._gc_start = None
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
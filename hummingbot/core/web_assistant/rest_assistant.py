@@ -1,9 +1,12 @@
 import json
+import time
 from asyncio import wait_for
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.request_priority import RequestPriority, current_request_priority
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -17,6 +20,7 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+    The latency of the requests sent with `execute_request` is recorded in the RuntimeMetrics, by throttler limit id.
     """
     def __init__(
         self,
@@ -42,9 +46,15 @@ class RESTAssistant:
             is_auth_required: bool = False,
             return_err: bool = False,
             timeout: Optional[float] = None,
-            headers: Optional[Dict[str, Any]] = None) -> Union[str, Dict[str, Any]]:
+            headers: Optional[Dict[str, Any]] = None,
+            priority: Optional[RequestPriority] = None) -> Union[str, Dict[str, Any]]:
+        """
+        Sends the request once the throttler gives it capacity.
+        If no priority is specified, the priority class set for the current context (see `request_priority`) is used.
+        """
 
         headers = headers or {}
+        priority = current_request_priority() if priority is None else priority
 
         local_headers = {
             "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
@@ -62,8 +72,13 @@ class RESTAssistant:
             throttler_limit_id=throttler_limit_id
         )
 
-        async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+        async with self._throttler.execute_task(limit_id=throttler_limit_id, priority=priority):
+            request_start = time.perf_counter()
+            try:
+                response = await self.call(request=request, timeout=timeout)
+            finally:
+                RuntimeMetrics.get_instance().record_rest_latency(
+                    throttler_limit_id, (time.perf_counter() - request_start) * 1e3)
 
             if 400 <= response.status:
                 if return_err:
@@ -1,11 +1,12 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
 from hummingbot.core.network_iterator import NetworkStatus, safe_ensure_future
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import constants as CONSTANTS
 from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
@@ -21,8 +22,13 @@ class BinancePerpetualCandles(CandlesBase):
             cls._logger = logging.getLogger(__name__)
         return cls._logger
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
-        super().__init__(trading_pair, interval, max_records)
+    def __init__(self,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 candles_store_path: Optional[str] = None,
+                 api_factory: Optional[WebAssistantsFactory] = None):
+        super().__init__(trading_pair, interval, max_records, candles_store_path, api_factory)
 
     @property
     def name(self):
@@ -78,6 +84,7 @@ class BinancePerpetualCandles(CandlesBase):
         return np.array(candles)[:, [0, 1, 2, 3, 4, 5, 7, 8, 9, 10]].astype(np.float)
 
     async def fill_historical_candles(self):
+        await self._fill_historical_candles_from_store()
         max_request_needed = (self._candles.maxlen // 1000) + 1
         requests_executed = 0
         while not self.is_ready:
@@ -88,9 +95,9 @@ class BinancePerpetualCandles(CandlesBase):
                     # we have to add one more since, the last row is not going to be included
                     candles = await self.fetch_candles(end_time=end_timestamp, limit=min(1000, missing_records + 1))
                     # we are computing again the quantity of records again since the websocket process is able to
-                    # modify the deque and if we extend it, the new observations are going to be dropped.
+                    # modify the buffer and if we extend it, the new observations are going to be dropped.
                     missing_records = self._candles.maxlen - len(self._candles)
-                    self._candles.extendleft(candles[-(missing_records + 1):-1][::-1])
+                    self._prepend_candles(candles[-(missing_records + 1):-1])
                     requests_executed += 1
                 else:
                     self.logger().error(f"There is no data available for the quantity of "
@@ -110,14 +117,7 @@ class BinancePerpetualCandles(CandlesBase):
         :param ws: the websocket assistant used to connect to the exchange
         """
         try:
-            candle_params = []
-            candle_params.append(f"{self._ex_trading_pair.lower()}@kline_{self.interval}")
-            payload = {
-                "method": "SUBSCRIBE",
-                "params": candle_params,
-                "id": 1
-            }
-            subscribe_candles_request: WSJSONRequest = WSJSONRequest(payload=payload)
+            subscribe_candles_request: WSJSONRequest = self.ws_subscription_request([self.ws_stream_name])
 
             await ws.send(subscribe_candles_request)
             self.logger().info("Subscribed to public klines...")
@@ -130,32 +130,42 @@ class BinancePerpetualCandles(CandlesBase):
             )
             raise
 
-    async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None and data.get("e") == "kline":  # data will be None when the websocket is disconnected
-                timestamp = data["k"]["t"]
-                open = data["k"]["o"]
-                low = data["k"]["l"]
-                high = data["k"]["h"]
-                close = data["k"]["c"]
-                volume = data["k"]["v"]
-                quote_asset_volume = data["k"]["q"]
-                n_trades = data["k"]["n"]
-                taker_buy_base_volume = data["k"]["V"]
-                taker_buy_quote_volume = data["k"]["Q"]
-                if len(self._candles) == 0:
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                    safe_ensure_future(self.fill_historical_candles())
-                elif timestamp > int(self._candles[-1][0]):
-                    # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
-                elif timestamp == int(self._candles[-1][0]):
-                    self._candles.pop()
-                    self._candles.append(np.array([timestamp, open, high, low, close, volume,
-                                                   quote_asset_volume, n_trades, taker_buy_base_volume,
-                                                   taker_buy_quote_volume]))
+    @property
+    def ws_stream_name(self) -> str:
+        return f"{self._ex_trading_pair.lower()}@kline_{self.interval}"
+
+    def ws_subscription_request(self, stream_names: List[str], subscribe: bool = True) -> WSJSONRequest:
+        payload = {
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": stream_names,
+            "id": 1
+        }
+        return WSJSONRequest(payload=payload)
+
+    def ws_message_stream_name(self, data: Dict[str, Any]) -> Optional[str]:
+        if data.get("e") == "kline":
+            return f"{data['s'].lower()}@kline_{data['k']['i']}"
+        return None
+
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        if data.get("e") == "kline":
+            timestamp = data["k"]["t"]
+            open = data["k"]["o"]
+            low = data["k"]["l"]
+            high = data["k"]["h"]
+            close = data["k"]["c"]
+            volume = data["k"]["v"]
+            quote_asset_volume = data["k"]["q"]
+            n_trades = data["k"]["n"]
+            taker_buy_base_volume = data["k"]["V"]
+            taker_buy_quote_volume = data["k"]["Q"]
+            candle = [timestamp, open, high, low, close, volume, quote_asset_volume, n_trades,
+                      taker_buy_base_volume, taker_buy_quote_volume]
+            if len(self._candles) == 0:
+                self._append_candle(candle)
+                safe_ensure_future(self.fill_historical_candles())
+            elif timestamp > int(self._candles[-1][0]):
+                # TODO: validate also that the diff of timestamp == interval (issue with 1M interval).
+                self._append_candle(candle)
+            elif timestamp == int(self._candles[-1][0]):
+                self._update_live_candle(candle)
@@ -1,32 +1,70 @@
 import asyncio
-from collections import deque
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set
 
+import numpy as np
 import pandas as pd
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+from hummingbot.data_feed.candles_feed.indicators import IncrementalIndicator
+
+if TYPE_CHECKING:
+    from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 
 
 class CandlesBase(NetworkBase):
     """
     This class serves as a base class for fetching and storing candle data from a cryptocurrency exchange.
-    The class uses the Rest and WS Assistants for all the IO operations, and a double-ended queue to store candles.
-    Also implements the Throttler module for API rate limiting, but it's not so necessary since the realtime data should
-    be updated via websockets mainly.
+    The class uses the Rest and WS Assistants for all the IO operations, and a CandlesBuffer (a NumPy ring array) to
+    store candles. Also implements the Throttler module for API rate limiting, but it's not so necessary since the
+    realtime data should be updated via websockets mainly.
+
+    Subclasses change the candles only through `_append_candle`, `_update_live_candle` and `_prepend_candles`, that
+    keep the indicators added with `add_indicator` up to date.
+
+    With a `candles_store_path`, the closed candles are kept in a CandlesStore shared by the bots of the host, and the
+    historical candles are loaded from it, fetching from the exchange only the missing ranges. The closed candles are
+    stored every STORE_BATCH_SIZE candles closed, when the stream is interrupted and when the network is stopped. The
+    store file operations run in a thread shared by all the candles, out of the event loop.
+
+    When the candles are created by a CandlesHub, they don't open their own websocket connection: the hub subscribes
+    to their stream (`ws_stream_name`) on a connection shared with the other candles of the exchange, and forwards the
+    stream messages to `_process_websocket_message`.
     """
     columns = ["timestamp", "open", "high", "low", "close", "volume", "quote_asset_volume",
                "n_trades", "taker_buy_base_volume", "taker_buy_quote_volume"]
 
-    def __init__(self, trading_pair: str, interval: str = "1m", max_records: int = 150):
+    # Maximum candles returned by the exchange per request
+    MAX_CANDLES_PER_REQUEST = 1000
+    # Candles closed before they are written to the candles store, each write adds a segment to the store
+    STORE_BATCH_SIZE = 10
+
+    _store_executor: Optional[ThreadPoolExecutor] = None
+
+    def __init__(self,
+                 trading_pair: str,
+                 interval: str = "1m",
+                 max_records: int = 150,
+                 candles_store_path: Optional[str] = None,
+                 api_factory: Optional[WebAssistantsFactory] = None):
         super().__init__()
-        async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
-        self._api_factory = WebAssistantsFactory(throttler=async_throttler)
-        self._candles = deque(maxlen=max_records)
+        if api_factory is None:
+            async_throttler = AsyncThrottler(rate_limits=self.rate_limits)
+            api_factory = WebAssistantsFactory(throttler=async_throttler)
+        self._api_factory = api_factory
+        self._hub: Optional["CandlesHub"] = None
+        self._candles = CandlesBuffer(columns=self.columns, maxlen=max_records)
+        self._indicators: Dict[str, IncrementalIndicator] = {}
+        self._candles_df_cache: Optional[pd.DataFrame] = None
+        self._candles_df_version: int = -1
         self._listen_candles_task: Optional[asyncio.Task] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
@@ -35,26 +73,46 @@ class CandlesBase(NetworkBase):
         else:
             self.logger().exception(f"Interval {interval} is not supported. Available Intervals: {self.intervals.keys()}")
             raise
+        self._candles_store: Optional[CandlesStore] = None
+        self._closed_candles_not_stored: int = 0
+        self._pending_store_writes: Set[asyncio.Future] = set()
+        if candles_store_path is not None:
+            self._candles_store = CandlesStore(candles_store_path, self.name, self.interval, self.columns)
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network and starts a task for listen_for_subscriptions (or subscribes to the hub).
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self._hub is not None:
+            self._hub.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task (or unsubscribing from the hub).
         """
+        if self._hub is not None:
+            self._hub.unsubscribe(self)
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        self._store_closed_candles()
+        await self._wait_for_pending_store_writes()
+
+    @property
+    def hub(self) -> Optional["CandlesHub"]:
+        return self._hub
+
+    @hub.setter
+    def hub(self, hub: Optional["CandlesHub"]):
+        self._hub = hub
 
     @property
     def is_ready(self):
         """
-        This property returns a boolean indicating whether the _candles deque has reached its maximum length.
+        This property returns a boolean indicating whether the _candles buffer has reached its maximum length.
         """
         return len(self._candles) == self._candles.maxlen
 
@@ -92,9 +150,43 @@ class CandlesBase(NetworkBase):
     @property
     def candles_df(self) -> pd.DataFrame:
         """
-        This property returns the candles stored in the _candles deque as a Pandas DataFrame.
+        This property returns the candles stored in the _candles buffer as a Pandas DataFrame.
+        The DataFrame is built again only when the candles change. A copy of it is returned, since the callers usually
+        add columns to it (copying its single float block is much cheaper than building it).
+        """
+        if self._candles_df_version != self._candles.version:
+            self._candles_df_cache = pd.DataFrame(self._candles.values, columns=self.columns, copy=True)
+            self._candles_df_version = self._candles.version
+        return self._candles_df_cache.copy()
+
+    @property
+    def candles_array(self) -> np.ndarray:
+        """
+        This property returns a zero-copy view of the candles as a NumPy structured array, with a field per column.
+        The view is only valid until the candles change.
+        """
+        return self._candles.array
+
+    @property
+    def indicators(self) -> Dict[str, IncrementalIndicator]:
+        return self._indicators
+
+    def add_indicator(self, name: str, indicator: IncrementalIndicator) -> IncrementalIndicator:
+        """
+        Adds an indicator, computed over the current candles and then updated with each candle change.
+        :param name: the name to get the indicator with
+        :param indicator: the indicator (e.g. EMA(length=14))
+        :return: the indicator
         """
-        return pd.DataFrame(self._candles, columns=self.columns, dtype=float)
+        self._indicators[name] = indicator
+        self._recompute_indicator(indicator)
+        return indicator
+
+    def get_indicator_value(self, name: str):
+        return self._indicators[name].value
+
+    def remove_indicator(self, name: str):
+        self._indicators.pop(name, None)
 
     def get_exchange_trading_pair(self, trading_pair):
         raise NotImplementedError
@@ -114,7 +206,7 @@ class CandlesBase(NetworkBase):
 
     async def fill_historical_candles(self):
         """
-        This is an abstract method that must be implemented by a subclass to fill the _candles deque with historical candles.
+        This is an abstract method that must be implemented by a subclass to fill the _candles buffer with historical candles.
         """
         raise NotImplementedError
 
@@ -154,7 +246,37 @@ class CandlesBase(NetworkBase):
         """
         raise NotImplementedError
 
+    @property
+    def ws_stream_name(self) -> str:
+        """
+        The name of the websocket stream of the candles, unique for the trading pair and interval in the exchange
+        """
+        raise NotImplementedError
+
+    def ws_subscription_request(self, stream_names: List[str], subscribe: bool = True) -> WSJSONRequest:
+        """
+        Returns the request to subscribe to (or unsubscribe from) several streams in a single message
+        :param stream_names: the names of the streams
+        :param subscribe: True to subscribe, False to unsubscribe
+        """
+        raise NotImplementedError
+
+    def ws_message_stream_name(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns the name of the stream of a websocket message, or None if it is not a candles message
+        """
+        raise NotImplementedError
+
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data = ws_response.data
+            if data is not None:  # data will be None when the websocket is disconnected
+                self._process_websocket_message(data)
+
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        """
+        Updates the candles with a message of their websocket stream
+        """
         raise NotImplementedError
 
     async def _sleep(self, delay):
@@ -163,6 +285,111 @@ class CandlesBase(NetworkBase):
         """
         await asyncio.sleep(delay)
 
+    async def _fill_historical_candles_from_store(self):
+        """
+        Completes the candles before the first one with the stored candles, fetching from the exchange only the ranges
+        missing in the store (and storing them). Does nothing without a candles store.
+        """
+        if self._candles_store is None or len(self._candles) == 0 or self.is_ready:
+            return
+        try:
+            interval_ms = self.intervals[self.interval] * 1000
+            end_time = int(self._candles[0][0])
+            start_time = end_time - (self._candles.maxlen - len(self._candles)) * interval_ms
+            missing_ranges = await self._run_in_store_executor(
+                self._candles_store.missing_ranges, start_time, end_time, interval_ms)
+            for range_start, range_end in missing_ranges:
+                candles = await self._fetch_candles_range(range_start, range_end, interval_ms)
+                await self._run_in_store_executor(self._candles_store.write, candles)
+            self._prepend_candles(await self._run_in_store_executor(self._candles_store.read, start_time, end_time - 1))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().exception(f"Unexpected error loading the stored candles of {self.name}.")
+
+    async def _fetch_candles_range(self, start_time: int, end_time: int, interval_ms: int) -> np.ndarray:
+        """
+        Fetches the candles between start_time (included) and end_time (excluded) from the exchange
+        """
+        fetched = []
+        while start_time < end_time:
+            candles = await self.fetch_candles(start_time=start_time,
+                                               end_time=end_time - 1,
+                                               limit=self.MAX_CANDLES_PER_REQUEST)
+            candles = candles[(candles[:, 0] >= start_time) & (candles[:, 0] < end_time)] if len(candles) else candles
+            if len(candles) == 0:
+                break
+            fetched.append(candles)
+            start_time = int(candles[-1, 0]) + interval_ms
+        return np.concatenate(fetched) if fetched else np.empty((0, len(self.columns)))
+
+    def _store_closed_candles(self):
+        """
+        Stores the candles, except the last one that may not be closed yet, in the store thread
+        """
+        if self._candles_store is not None and len(self._candles) > 1:
+            write = self._run_in_store_executor(self._write_to_store, self._candles.values[:-1].copy())
+            self._pending_store_writes.add(write)
+            write.add_done_callback(self._pending_store_writes.discard)
+        self._closed_candles_not_stored = 0
+
+    def _write_to_store(self, candles: np.ndarray):
+        try:
+            self._candles_store.write(candles)
+        except Exception:
+            self.logger().exception(f"Unexpected error storing the candles of {self.name}.")
+
+    async def _wait_for_pending_store_writes(self):
+        if len(self._pending_store_writes) > 0:
+            await asyncio.gather(*self._pending_store_writes)
+
+    def _run_in_store_executor(self, function, *args) -> asyncio.Future:
+        if CandlesBase._store_executor is None:
+            # A single thread, so that the writes of a store are not run concurrently
+            CandlesBase._store_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CandlesStore")
+        return asyncio.get_event_loop().run_in_executor(CandlesBase._store_executor, function, *args)
+
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
+        self._store_closed_candles()
         self._candles.clear()
+        for indicator in self._indicators.values():
+            indicator.reset()
+
+    def _append_candle(self, candle: Sequence):
+        """
+        Adds a new candle after the last one, which is then closed
+        """
+        if len(self._candles) > 0:
+            self._closed_candles_not_stored += 1
+        self._candles.append(candle)
+        last_candle = self._candles.array[-1]
+        for indicator in self._indicators.values():
+            indicator.update(last_candle, new_candle=True)
+        # Before the oldest candles not stored yet leave the buffer
+        store_batch_size = min(self.STORE_BATCH_SIZE, self._candles.maxlen - 1)
+        if self._candles_store is not None and self._closed_candles_not_stored >= store_batch_size:
+            self._store_closed_candles()
+
+    def _update_live_candle(self, candle: Sequence):
+        """
+        Replaces the last candle with its latest values
+        """
+        self._candles.replace_last(candle)
+        last_candle = self._candles.array[-1]
+        for indicator in self._indicators.values():
+            indicator.update(last_candle, new_candle=False)
+
+    def _prepend_candles(self, candles: Sequence[Sequence]):
+        """
+        Adds historical candles, in chronological order, before the first one.
+        The indicators are computed again from the first candle.
+        """
+        self._candles.prepend(candles)
+        for indicator in self._indicators.values():
+            self._recompute_indicator(indicator)
+
+    def _recompute_indicator(self, indicator: IncrementalIndicator):
+        indicator.reset()
+        for candle in self._candles.array:
+            indicator.update(candle, new_candle=True)
@@ -0,0 +1,107 @@
+from typing import Iterable, List, Sequence, Union
+
+import numpy as np
+
+
+class CandlesBuffer:
+    """
+    Fixed capacity buffer of candles, stored in a preallocated NumPy structured array with a float64 field per column.
+
+    The array has twice the capacity of the buffer, so that the candles always sit in a contiguous slice of it: appending
+    writes after the last candle and drops the oldest one when the buffer is full, and the candles are moved back to the
+    start of the array only when its end is reached (once every `maxlen` appends). Reading the candles is then a
+    zero-copy view of that slice.
+
+    The views returned by `array` and `values` are only valid until the next change of the buffer. `version` is
+    incremented on every change, to detect when the data derived from the candles has to be computed again.
+    """
+
+    def __init__(self, columns: List[str], maxlen: int):
+        if maxlen <= 0:
+            raise ValueError(f"The candles buffer length must be positive ({maxlen}).")
+        self._columns: List[str] = columns
+        self._maxlen: int = maxlen
+        self._dtype = np.dtype([(column, np.float64) for column in columns])
+        self._data: np.ndarray = np.zeros(2 * maxlen, dtype=self._dtype)
+        self._start: int = 0
+        self._end: int = 0
+        self._version: int = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        """
+        Returns the candles at the index (a row of `values`), e.g. `buffer[-1][0]` is the timestamp of the last candle
+        """
+        return self.values[index]
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        A view of the candles as a structured array, with a field per column
+        """
+        return self._data[self._start:self._end]
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        A view of the candles as a 2D float array, with a column per field
+        """
+        return self.array.view(np.float64).reshape(-1, len(self._columns))
+
+    def append(self, candle: Sequence):
+        """
+        Adds a candle after the last one, dropping the first candle if the buffer is full
+        """
+        if len(self) == self._maxlen:
+            self._start += 1
+        if self._end == len(self._data):
+            length = len(self)
+            self._data[:length] = self._data[self._start:self._end]
+            self._start, self._end = 0, length
+        self._data[self._end] = tuple(candle)
+        self._end += 1
+        self._version += 1
+
+    def replace_last(self, candle: Sequence):
+        """
+        Replaces the last candle, i.e. updates the live candle that has not closed yet
+        """
+        if len(self) == 0:
+            raise IndexError("There is no candle to replace in the candles buffer.")
+        self._data[self._end - 1] = tuple(candle)
+        self._version += 1
+
+    def prepend(self, candles: Iterable[Sequence]):
+        """
+        Adds older candles, in chronological order, before the first one. The candles exceeding the buffer capacity are
+        not added (the oldest ones).
+        """
+        rows = np.array([tuple(candle) for candle in candles], dtype=self._dtype)
+        rows = rows[max(0, len(rows) - (self._maxlen - len(self))):]
+        if len(rows) == 0:
+            return
+        if self._start < len(rows):
+            length = len(self)
+            self._data[len(rows):len(rows) + length] = self._data[self._start:self._end]
+            self._start, self._end = len(rows), len(rows) + length
+        self._data[self._start - len(rows):self._start] = rows
+        self._start -= len(rows)
+        self._version += 1
+
+    def clear(self):
+        self._start = self._end = 0
+        self._version += 1
@@ -1,5 +1,8 @@
+from typing import Dict, Optional
+
 from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
 from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 
 
 class CandlesFactory:
@@ -7,13 +10,39 @@ class CandlesFactory:
     The CandlesFactory class creates and returns a Candle object based on the specified connector and trading pair.
     It has a class method, get_candle which takes in a connector, trading pair, interval, and max_records as parameters.
     Based on the connector provided, the method returns either a BinancePerpetualsCandles or a BinanceSpotCandles object.
+    With a candles_store_path, the candles are cached on disk there and shared by all the candles feeds using it.
+    With use_hub, the candles share the websocket connections and the throttler of the connector CandlesHub.
     If an unsupported connector is provided, it raises an exception.
     """
+    _hubs: Dict[str, CandlesHub] = {}
+
     @classmethod
-    def get_candle(cls, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 500):
+    def get_candle(cls,
+                   connector: str,
+                   trading_pair: str,
+                   interval: str = "1m",
+                   max_records: int = 500,
+                   candles_store_path: Optional[str] = None,
+                   use_hub: bool = False):
+        if use_hub:
+            return cls.get_candles_hub(connector, candles_store_path).get_candle(trading_pair, interval, max_records)
         if connector == "binance_perpetual":
-            return BinancePerpetualCandles(trading_pair, interval, max_records)
+            return BinancePerpetualCandles(trading_pair, interval, max_records, candles_store_path)
         elif connector == "binance":
-            return BinanceSpotCandles(trading_pair, interval, max_records)
+            return BinanceSpotCandles(trading_pair, interval, max_records, candles_store_path)
         else:
             raise Exception(f"The connector {connector} is not available. Please select another one.")
+
+    @classmethod
+    def get_candles_hub(cls, connector: str, candles_store_path: Optional[str] = None) -> CandlesHub:
+        """
+        Returns the CandlesHub of the connector, created on the first call (with the candles store path of that call)
+        """
+        if connector not in cls._hubs:
+            if connector == "binance_perpetual":
+                cls._hubs[connector] = CandlesHub(BinancePerpetualCandles, candles_store_path=candles_store_path)
+            elif connector == "binance":
+                cls._hubs[connector] = CandlesHub(BinanceSpotCandles, candles_store_path=candles_store_path)
+            else:
+                raise Exception(f"The connector {connector} is not available. Please select another one.")
+        return cls._hubs[connector]
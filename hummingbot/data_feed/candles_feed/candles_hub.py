@@ -0,0 +1,207 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set, Type
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+from hummingbot.logger import HummingbotLogger
+
+
+class _CandlesHubConnection:
+    """
+    A websocket connection of the hub, with the streams subscribed through it
+    """
+
+    def __init__(self):
+        self.stream_names: Set[str] = set()
+        self.pending_stream_names: Set[str] = set()
+        self.ws: Optional[WSAssistant] = None
+        # Whether the initial subscription was sent through the current websocket
+        self.subscribed: bool = False
+        self.listen_task: Optional[asyncio.Task] = None
+        self.subscription_task: Optional[asyncio.Task] = None
+
+
+class CandlesHub:
+    """
+    Shares the websocket connections and the rate limits of all the candles of an exchange.
+
+    The candles created with `get_candle` are views of the trading pair and interval streams: instead of opening their
+    own websocket connection when started, they subscribe their stream to the hub, which multiplexes the streams over a
+    few connections (up to `max_streams_per_connection` each, subscribed with a single message per connection) and
+    forwards each message to the candles of its stream. All the candles use the same throttler for their REST requests.
+
+    The subscriptions are sent in batches, to stay under the exchange limit of messages per connection when many
+    candles are started at once: a new connection subscribes SUBSCRIPTION_BATCH_DELAY after it is opened to all the
+    streams added until then, and the streams added to an open connection are subscribed together
+    SUBSCRIPTION_BATCH_DELAY after the first of them.
+    """
+    SUBSCRIPTION_BATCH_DELAY = 0.5
+
+    _logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    def __init__(self,
+                 candles_class: Type[CandlesBase],
+                 max_streams_per_connection: int = 200,
+                 candles_store_path: Optional[str] = None):
+        """
+        :param candles_class: the candles class of the exchange (e.g. BinanceSpotCandles)
+        :param max_streams_per_connection: the maximum number of streams subscribed through a websocket connection
+        :param candles_store_path: the candles store path of the candles created by the hub
+        """
+        self._candles_class: Type[CandlesBase] = candles_class
+        self._max_streams_per_connection: int = max_streams_per_connection
+        self._candles_store_path: Optional[str] = candles_store_path
+        self._api_factory: Optional[WebAssistantsFactory] = None
+        # The exchange specific requests and messages parsing of the first candles are used for all the streams
+        self._reference_candles: Optional[CandlesBase] = None
+        self._subscribers: Dict[str, List[CandlesBase]] = {}
+        self._connections: List[_CandlesHubConnection] = []
+
+    @property
+    def subscribed_stream_names(self) -> List[str]:
+        return list(self._subscribers)
+
+    @property
+    def connections_count(self) -> int:
+        return len(self._connections)
+
+    def get_candle(self, trading_pair: str, interval: str = "1m", max_records: int = 500) -> CandlesBase:
+        """
+        Creates candles of the trading pair and interval using the hub connections and throttler
+        """
+        candles = self._candles_class(trading_pair, interval, max_records, self._candles_store_path, self._api_factory)
+        if self._reference_candles is None:
+            # The throttler of the first candles is shared with all the others
+            self._api_factory = candles._api_factory
+            self._reference_candles = candles
+        candles.hub = self
+        return candles
+
+    def subscribe(self, candles: CandlesBase):
+        stream_name = candles.ws_stream_name
+        subscribers = self._subscribers.setdefault(stream_name, [])
+        if candles in subscribers:
+            return
+        subscribers.append(candles)
+        if len(subscribers) == 1:
+            connection = next((connection
+                               for connection in self._connections
+                               if len(connection.stream_names) < self._max_streams_per_connection),
+                              None)
+            if connection is None:
+                connection = _CandlesHubConnection()
+                self._connections.append(connection)
+            connection.stream_names.add(stream_name)
+            if connection.listen_task is None:
+                connection.listen_task = safe_ensure_future(self._listen_for_subscriptions(connection))
+            elif connection.subscribed:
+                connection.pending_stream_names.add(stream_name)
+                if connection.subscription_task is None:
+                    connection.subscription_task = safe_ensure_future(self._subscribe_pending_streams(connection))
+
+    def unsubscribe(self, candles: CandlesBase):
+        stream_name = candles.ws_stream_name
+        subscribers = self._subscribers.get(stream_name, [])
+        if candles not in subscribers:
+            return
+        subscribers.remove(candles)
+        if len(subscribers) > 0:
+            return
+        del self._subscribers[stream_name]
+        for connection in list(self._connections):
+            if stream_name not in connection.stream_names:
+                continue
+            connection.stream_names.discard(stream_name)
+            connection.pending_stream_names.discard(stream_name)
+            if len(connection.stream_names) == 0:
+                self._close_connection(connection)
+            elif connection.subscribed:
+                safe_ensure_future(self._send_subscription(connection, [stream_name], subscribe=False))
+
+    async def _listen_for_subscriptions(self, connection: _CandlesHubConnection):
+        """
+        Connects to the candles websocket endpoint, subscribes to the streams of the connection and forwards the
+        messages to the candles of each stream
+        """
+        while True:
+            try:
+                ws: WSAssistant = await self._api_factory.get_ws_assistant()
+                await ws.connect(ws_url=self._reference_candles.wss_url, ping_timeout=30)
+                connection.ws = ws
+                # The streams added in the meantime are subscribed with the first message
+                await self._sleep(self.SUBSCRIPTION_BATCH_DELAY)
+                connection.subscribed = True
+                connection.pending_stream_names.clear()
+                await self._send_subscription(connection, sorted(connection.stream_names), subscribe=True)
+                self.logger().info(f"Subscribed to {len(connection.stream_names)} public klines streams...")
+                async for ws_response in ws.iter_messages():
+                    data = ws_response.data
+                    if data is not None:  # data will be None when the websocket is disconnected
+                        self._forward_message(data)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                await self._on_connection_interruption(connection)
+
+    def _forward_message(self, data):
+        stream_name = self._reference_candles.ws_message_stream_name(data)
+        for candles in self._subscribers.get(stream_name, []):
+            candles._process_websocket_message(data)
+
+    async def _subscribe_pending_streams(self, connection: _CandlesHubConnection):
+        try:
+            await self._sleep(self.SUBSCRIPTION_BATCH_DELAY)
+            stream_names = sorted(connection.pending_stream_names)
+            connection.pending_stream_names.clear()
+            if connection.subscribed and len(stream_names) > 0:
+                await self._send_subscription(connection, stream_names, subscribe=True)
+        finally:
+            connection.subscription_task = None
+
+    async def _send_subscription(self, connection: _CandlesHubConnection, stream_names: List[str], subscribe: bool):
+        try:
+            await connection.ws.send(self._reference_candles.ws_subscription_request(stream_names, subscribe))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Unexpected error occurred subscribing to public klines...", exc_info=True)
+            raise
+
+    async def _on_connection_interruption(self, connection: _CandlesHubConnection):
+        ws, connection.ws = connection.ws, None
+        connection.subscribed = False
+        ws and await ws.disconnect()
+        interrupted_candles = [candles
+                               for stream_name in connection.stream_names
+                               for candles in self._subscribers.get(stream_name, [])]
+        for candles in interrupted_candles:
+            await candles._on_order_stream_interruption()
+
+    def _close_connection(self, connection: _CandlesHubConnection):
+        self._connections.remove(connection)
+        for task in (connection.listen_task, connection.subscription_task):
+            if task is not None:
+                task.cancel()
+        connection.listen_task = connection.subscription_task = None
+
+    async def _sleep(self, delay: float):
+        """
+        Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
+        """
+        await asyncio.sleep(delay)
@@ -0,0 +1,145 @@
+import os
+import shutil
+import uuid
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class CandlesStore:
+    """
+    Local store of the closed candles of an exchange, trading pair and interval, shared by all the bots of the host.
+
+    The candles are stored under `<root_path>/<name>/<interval>/` in immutable segments: a directory
+    per write, named after its first and last timestamps, with an uncompressed `<column>.npy` file per column. The
+    segments are written to a hidden temporary directory and then renamed, so that the readers of other processes only
+    see complete segments, and they are read with memory mapping, loading only the rows of the requested range.
+
+    The segments may overlap (e.g. written concurrently by two bots), the candles are de-duplicated by timestamp when
+    read. When there are more than MAX_SEGMENTS segments they are merged into a single one, keeping only the
+    `max_candles` most recent candles, so the store does not grow with the runtime.
+
+    The reads and writes are blocking file operations, the candles feeds run them out of the event loop.
+    """
+    MAX_SEGMENTS = 32
+    MAX_CANDLES = 100000
+    READ_ATTEMPTS = 3
+
+    def __init__(self, root_path: str, name: str, interval: str, columns: List[str], max_candles: int = MAX_CANDLES):
+        """
+        :param root_path: the root path of the candles stores
+        :param name: the candles feed name, identifying the exchange and the trading pair (e.g. binance_spot_BTC-USDT)
+        :param interval: the candles interval
+        :param columns: the candles columns, the first one being the timestamp
+        :param max_candles: the number of most recent candles kept when the segments are merged
+        """
+        self._path: str = os.path.join(root_path, name, interval)
+        self._columns: List[str] = columns
+        self._max_candles: int = max_candles
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def read(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> np.ndarray:
+        """
+        Returns the stored candles with a timestamp between start_time and end_time (both included), sorted by
+        timestamp and without duplicates, as a 2D float array with a column per field
+        """
+        for attempt in range(self.READ_ATTEMPTS):
+            try:
+                return self._read(self._segments(), start_time, end_time)
+            except FileNotFoundError:
+                # A segment was merged by another process while being read, the segments are listed again
+                if attempt == self.READ_ATTEMPTS - 1:
+                    raise
+
+    def write(self, candles: np.ndarray):
+        """
+        Stores the candles (a 2D float array with a column per field) that are not stored yet
+        """
+        candles = np.asarray(candles, dtype=np.float64).reshape(-1, len(self._columns))
+        if len(candles) == 0:
+            return
+        candles = self._sorted_unique(candles)
+        stored_timestamps = self.read(candles[0, 0], candles[-1, 0])[:, 0]
+        candles = candles[~np.isin(candles[:, 0], stored_timestamps)]
+        if len(candles) == 0:
+            return
+        self._write_segment(candles)
+        segments = self._segments()
+        if len(segments) > self.MAX_SEGMENTS:
+            self._merge(segments)
+
+    def missing_ranges(self, start_time: int, end_time: int, interval_ms: int) -> List[Tuple[int, int]]:
+        """
+        Returns the ranges of timestamps, between start_time (included) and end_time (excluded), where candles are
+        missing in the store. The ranges are (start, end) tuples, with the end excluded.
+        """
+        timestamps = self.read(start_time, end_time - 1)[:, 0]
+        ranges = []
+        previous_end = start_time
+        for timestamp in timestamps:
+            # Half an interval of tolerance, the monthly candles do not have a fixed interval
+            if timestamp - previous_end >= interval_ms / 2:
+                ranges.append((int(previous_end), int(timestamp)))
+            previous_end = timestamp + interval_ms
+        if end_time - previous_end >= interval_ms / 2:
+            ranges.append((int(previous_end), int(end_time)))
+        return ranges
+
+    def _segments(self) -> List[Tuple[float, float, str]]:
+        if not os.path.isdir(self._path):
+            return []
+        segments = []
+        for name in os.listdir(self._path):
+            if name.startswith("."):
+                continue
+            first_timestamp, last_timestamp, _ = name.split("-")
+            segments.append((float(first_timestamp), float(last_timestamp), os.path.join(self._path, name)))
+        return sorted(segments)
+
+    def _read(self, segments: List[Tuple[float, float, str]], start_time: Optional[int], end_time: Optional[int]):
+        parts = []
+        for first_timestamp, last_timestamp, segment_path in segments:
+            if ((start_time is not None and last_timestamp < start_time)
+                    or (end_time is not None and first_timestamp > end_time)):
+                continue
+            timestamps = np.load(os.path.join(segment_path, f"{self._columns[0]}.npy"), mmap_mode="r")
+            first = 0 if start_time is None else int(np.searchsorted(timestamps, start_time, side="left"))
+            last = len(timestamps) if end_time is None else int(np.searchsorted(timestamps, end_time, side="right"))
+            if first < last:
+                parts.append(np.column_stack([
+                    np.load(os.path.join(segment_path, f"{column}.npy"), mmap_mode="r")[first:last]
+                    for column in self._columns]))
+        if not parts:
+            return np.empty((0, len(self._columns)), dtype=np.float64)
+        return self._sorted_unique(np.concatenate(parts))
+
+    def _write_segment(self, candles: np.ndarray):
+        os.makedirs(self._path, exist_ok=True)
+        segment_id = uuid.uuid4().hex
+        temporary_path = os.path.join(self._path, f".{segment_id}")
+        os.makedirs(temporary_path)
+        for index, column in enumerate(self._columns):
+            np.save(os.path.join(temporary_path, f"{column}.npy"), np.ascontiguousarray(candles[:, index]))
+        os.rename(temporary_path,
+                  os.path.join(self._path, f"{int(candles[0, 0])}-{int(candles[-1, 0])}-{segment_id}"))
+
+    def _merge(self, segments: List[Tuple[float, float, str]]):
+        try:
+            self._write_segment(self._read(segments, None, None)[-self._max_candles:])
+        except FileNotFoundError:
+            # The segments were already merged by another process
+            return
+        for _, _, segment_path in segments:
+            shutil.rmtree(segment_path, ignore_errors=True)
+
+    @staticmethod
+    def _sorted_unique(candles: np.ndarray) -> np.ndarray:
+        # Keeps the last candle of each timestamp
+        if len(candles) == 0:
+            return candles
+        candles = candles[np.argsort(candles[:, 0], kind="stable")]
+        last_of_timestamp = np.append(candles[1:, 0] != candles[:-1, 0], True)
+        return candles[last_of_timestamp]
@@ -0,0 +1,271 @@
+import math
+from collections import deque
+from typing import Any, Deque, NamedTuple, Optional
+
+import numpy as np
+
+
+class BollingerBandsValue(NamedTuple):
+    lower: float
+    middle: float
+    upper: float
+
+
+class MACDValue(NamedTuple):
+    macd: float
+    signal: float
+    histogram: float
+
+
+class IncrementalIndicator:
+    """
+    Base class of the technical indicators updated in O(1) with each candle, instead of being computed again over the
+    whole candles history.
+
+    An indicator keeps the state computed with the closed candles, and computes its value for the last (live) candle
+    from that state. When the live candle changes the value is computed again from the same state, and when a new
+    candle starts the live candle is closed and added to the state.
+
+    Subclasses implement `_close(candle)` to add a closed candle to the state and `_compute(candle)` to compute the
+    value with the live candle. The candles are rows of a CandlesBuffer structured array (the fields are accessed by
+    column name).
+    """
+
+    def __init__(self):
+        self._live_candle: Optional[np.void] = None
+        self._value: Any = self._nan_value()
+
+    @property
+    def value(self) -> Any:
+        """
+        The indicator value at the last candle (NaN while there are not enough candles)
+        """
+        return self._value
+
+    def update(self, candle: np.void, new_candle: bool):
+        """
+        Updates the indicator with the last candle
+
+        :param candle: the last candle
+        :param new_candle: True if the candle starts after the previous one (which is then closed), False if it is the
+        previous one updated
+        """
+        if new_candle and self._live_candle is not None:
+            self._close(self._live_candle)
+        self._live_candle = candle.copy()
+        self._value = self._compute(self._live_candle)
+
+    def reset(self):
+        """
+        Clears the state, to compute the indicator again from the first candle
+        """
+        self._live_candle = None
+        self._value = self._nan_value()
+        self._reset()
+
+    def _nan_value(self) -> Any:
+        return math.nan
+
+    def _reset(self):
+        raise NotImplementedError
+
+    def _close(self, candle: np.void):
+        raise NotImplementedError
+
+    def _compute(self, candle: np.void) -> Any:
+        raise NotImplementedError
+
+
+class _ExponentialAverage:
+    """
+    Exponential moving average of a series, seeded with the simple average of its first `length` values.
+    `smoothing` is the weight of the new value (2 / (length + 1) for an EMA, 1 / length for Wilder's smoothing).
+    """
+
+    def __init__(self, length: int, smoothing: float):
+        self._length: int = length
+        self._smoothing: float = smoothing
+        self.reset()
+
+    def reset(self):
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._average: float = math.nan
+
+    def close(self, value: float):
+        self._average = self.compute(value)
+        if self._count < self._length:
+            self._count += 1
+            self._sum += value
+
+    def compute(self, value: float) -> float:
+        if self._count + 1 < self._length:
+            return math.nan
+        if self._count + 1 == self._length:
+            return (self._sum + value) / self._length
+        return self._smoothing * value + (1 - self._smoothing) * self._average
+
+
+class EMA(IncrementalIndicator):
+    """
+    Exponential moving average of a candles column (the close price by default)
+    """
+
+    def __init__(self, length: int = 14, column: str = "close"):
+        self._column: str = column
+        self._average = _ExponentialAverage(length, 2 / (length + 1))
+        super().__init__()
+
+    def _reset(self):
+        self._average.reset()
+
+    def _close(self, candle: np.void):
+        self._average.close(float(candle[self._column]))
+
+    def _compute(self, candle: np.void) -> float:
+        return self._average.compute(float(candle[self._column]))
+
+
+class RSI(IncrementalIndicator):
+    """
+    Relative strength index of the close price, with Wilder's smoothing of the gains and losses
+    """
+
+    def __init__(self, length: int = 14):
+        self._gains = _ExponentialAverage(length, 1 / length)
+        self._losses = _ExponentialAverage(length, 1 / length)
+        self._previous_close: Optional[float] = None
+        super().__init__()
+
+    def _reset(self):
+        self._gains.reset()
+        self._losses.reset()
+        self._previous_close = None
+
+    def _close(self, candle: np.void):
+        close = float(candle["close"])
+        if self._previous_close is not None:
+            change = close - self._previous_close
+            self._gains.close(max(change, 0.0))
+            self._losses.close(max(-change, 0.0))
+        self._previous_close = close
+
+    def _compute(self, candle: np.void) -> float:
+        if self._previous_close is None:
+            return math.nan
+        change = float(candle["close"]) - self._previous_close
+        gain = self._gains.compute(max(change, 0.0))
+        loss = self._losses.compute(max(-change, 0.0))
+        if math.isnan(gain) or math.isnan(loss):
+            return math.nan
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - 100 / (1 + gain / loss)
+
+
+class ATR(IncrementalIndicator):
+    """
+    Average true range, with Wilder's smoothing of the true ranges
+    """
+
+    def __init__(self, length: int = 14):
+        self._true_ranges = _ExponentialAverage(length, 1 / length)
+        self._previous_close: Optional[float] = None
+        super().__init__()
+
+    def _reset(self):
+        self._true_ranges.reset()
+        self._previous_close = None
+
+    def _close(self, candle: np.void):
+        self._true_ranges.close(self._true_range(candle))
+        self._previous_close = float(candle["close"])
+
+    def _compute(self, candle: np.void) -> float:
+        return self._true_ranges.compute(self._true_range(candle))
+
+    def _true_range(self, candle: np.void) -> float:
+        high = float(candle["high"])
+        low = float(candle["low"])
+        if self._previous_close is None:
+            return high - low
+        return max(high - low, abs(high - self._previous_close), abs(low - self._previous_close))
+
+
+class BollingerBands(IncrementalIndicator):
+    """
+    Simple moving average of the close price, with bands at `std` standard deviations (of the same closes) from it
+    """
+
+    def __init__(self, length: int = 20, std: float = 2.0):
+        self._length: int = length
+        self._std: float = std
+        self._closes: Deque[float] = deque()
+        self._sum: float = 0.0
+        self._squares_sum: float = 0.0
+        super().__init__()
+
+    def _nan_value(self) -> BollingerBandsValue:
+        return BollingerBandsValue(math.nan, math.nan, math.nan)
+
+    def _reset(self):
+        self._closes.clear()
+        self._sum = 0.0
+        self._squares_sum = 0.0
+
+    def _close(self, candle: np.void):
+        # Only the last length - 1 closed candles are kept, the live one completes the window
+        close = float(candle["close"])
+        self._closes.append(close)
+        self._sum += close
+        self._squares_sum += close * close
+        if len(self._closes) >= self._length:
+            removed = self._closes.popleft()
+            self._sum -= removed
+            self._squares_sum -= removed * removed
+
+    def _compute(self, candle: np.void) -> BollingerBandsValue:
+        if len(self._closes) + 1 < self._length:
+            return self._nan_value()
+        close = float(candle["close"])
+        mean = (self._sum + close) / self._length
+        variance = max((self._squares_sum + close * close) / self._length - mean * mean, 0.0)
+        width = self._std * math.sqrt(variance)
+        return BollingerBandsValue(mean - width, mean, mean + width)
+
+
+class MACD(IncrementalIndicator):
+    """
+    Moving average convergence divergence of the close price: the difference between its fast and slow EMAs, the
+    signal EMA of that difference, and the histogram (difference minus signal)
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = _ExponentialAverage(fast, 2 / (fast + 1))
+        self._slow = _ExponentialAverage(slow, 2 / (slow + 1))
+        self._signal = _ExponentialAverage(signal, 2 / (signal + 1))
+        super().__init__()
+
+    def _nan_value(self) -> MACDValue:
+        return MACDValue(math.nan, math.nan, math.nan)
+
+    def _reset(self):
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+
+    def _close(self, candle: np.void):
+        close = float(candle["close"])
+        macd = self._fast.compute(close) - self._slow.compute(close)
+        self._fast.close(close)
+        self._slow.close(close)
+        if not math.isnan(macd):
+            self._signal.close(macd)
+
+    def _compute(self, candle: np.void) -> MACDValue:
+        close = float(candle["close"])
+        macd = self._fast.compute(close) - self._slow.compute(close)
+        if math.isnan(macd):
+            return self._nan_value()
+        signal = self._signal.compute(macd)
+        return MACDValue(macd, signal, macd - signal)
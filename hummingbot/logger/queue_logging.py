@@ -0,0 +1,203 @@
+import atexit
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueListener
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class _LogQueueListener(QueueListener):
+    """
+    Writes the records of the log queue with the handlers queued along with each record
+    """
+
+    def enqueue_sentinel(self):
+        # Waits for room in the queue, instead of failing when it is full
+        self.queue.put(self._sentinel)
+
+    def handle(self, item: Tuple[logging.LogRecord, Sequence[logging.Handler]]):
+        record, handlers = item
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class LogQueue:
+    """
+    Moves the log writing out of the logging thread (the event loop).
+
+    The records are put in a bounded queue and written by a background thread with the handlers of the logger that
+    emitted them. Formatting the message is the only work left to the logging thread (the arguments of the message
+    may change after the call), tracebacks are formatted by the background thread.
+
+    When the queue is full the new records are dropped. Besides, only `rate_limit_burst` records with the same logger,
+    level and message template are queued every `rate_limit_interval` seconds; the next one queued reports how many
+    were sampled out in between. The dropped and sampled out records are counted.
+    """
+    # Above this number of messages tracked by the rate limiter, the ones without recent records are forgotten
+    MAX_RATE_LIMIT_KEYS = 1000
+
+    def __init__(self, max_size: int = 10000, rate_limit_interval: float = 10.0, rate_limit_burst: int = 5):
+        """
+        :param max_size: the maximum number of records waiting to be written
+        :param rate_limit_interval: the rate limiting window, in seconds (0 disables the rate limiting)
+        :param rate_limit_burst: the maximum number of identical messages of a logger written in a window
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._rate_limit_interval: float = rate_limit_interval
+        self._rate_limit_burst: int = rate_limit_burst
+        # (logger name, level, message template) -> [window start, records in the window, records sampled out]
+        self._rate_limits: Dict[Tuple, List] = {}
+        self._dropped_records_count: int = 0
+        self._sampled_records_count: int = 0
+        self._listener: _LogQueueListener = _LogQueueListener(self._queue)
+        self._started: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def dropped_records_count(self) -> int:
+        return self._dropped_records_count
+
+    @property
+    def sampled_records_count(self) -> int:
+        return self._sampled_records_count
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    def start(self):
+        if not self._started:
+            self._listener.start()
+            self._started = True
+
+    def stop(self):
+        """
+        Writes the records already queued and stops the background thread
+        """
+        if self._started:
+            self._listener.stop()
+            self._started = False
+
+    def put(self, record: logging.LogRecord, handlers: Sequence[logging.Handler]):
+        with self._lock:
+            sampled_out_count = self._rate_limit(record)
+            if sampled_out_count is None:
+                self._sampled_records_count += 1
+                return
+        try:
+            self._queue.put_nowait((self._prepare(record, sampled_out_count), handlers))
+        except queue.Full:
+            with self._lock:
+                self._dropped_records_count += 1
+
+    def _rate_limit(self, record: logging.LogRecord) -> Optional[int]:
+        """
+        Returns None if the record has to be sampled out, otherwise the number of identical records sampled out since
+        the last one queued
+        """
+        if self._rate_limit_interval <= 0:
+            return 0
+        key = (record.name, record.levelno, str(record.msg))
+        rate_limit = self._rate_limits.get(key)
+        if rate_limit is None or record.created - rate_limit[0] >= self._rate_limit_interval:
+            if rate_limit is None and len(self._rate_limits) >= self.MAX_RATE_LIMIT_KEYS:
+                self._forget_stale_rate_limits(record.created)
+            sampled_out_count = 0 if rate_limit is None else rate_limit[2]
+            self._rate_limits[key] = [record.created, 1, 0]
+            return sampled_out_count
+        if rate_limit[1] < self._rate_limit_burst:
+            rate_limit[1] += 1
+            return 0
+        rate_limit[2] += 1
+        return None
+
+    def _forget_stale_rate_limits(self, now: float):
+        self._rate_limits = {key: rate_limit
+                             for key, rate_limit in self._rate_limits.items()
+                             if now - rate_limit[0] < self._rate_limit_interval}
+
+    @staticmethod
+    def _prepare(record: logging.LogRecord, sampled_out_count: int) -> logging.LogRecord:
+        record = copy.copy(record)
+        message = record.getMessage()
+        if sampled_out_count > 0:
+            message = f"{message} ({sampled_out_count} similar messages suppressed)"
+        record.msg = message
+        record.args = None
+        return record
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Replaces the handlers of a logger, queueing its records to be written with them by the LogQueue thread
+    """
+
+    def __init__(self, log_queue: LogQueue, handlers: Sequence[logging.Handler]):
+        super().__init__()
+        self._log_queue: LogQueue = log_queue
+        self._handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._handlers
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._log_queue.put(record, self._handlers)
+        except Exception:
+            self.handleError(record)
+
+
+_log_queue: Optional[LogQueue] = None
+
+
+def _configured_loggers() -> List[logging.Logger]:
+    return [logging.getLogger()] + [logger
+                                    for logger in logging.Logger.manager.loggerDict.values()
+                                    if isinstance(logger, logging.Logger)]
+
+
+def get_log_queue() -> Optional[LogQueue]:
+    """
+    Returns the LogQueue of the non-blocking logging, if it is enabled
+    """
+    return _log_queue
+
+
+def start_non_blocking_logging(max_size: int = 10000,
+                               rate_limit_interval: float = 10.0,
+                               rate_limit_burst: int = 5) -> LogQueue:
+    """
+    Puts the handlers of the root logger and of all the configured loggers behind a LogQueue
+    """
+    global _log_queue
+    stop_non_blocking_logging()
+    _log_queue = LogQueue(max_size, rate_limit_interval, rate_limit_burst)
+    for logger in _configured_loggers():
+        if len(logger.handlers) > 0:
+            logger.handlers = [QueueLogHandler(_log_queue, logger.handlers)]
+    _log_queue.start()
+    return _log_queue
+
+
+def stop_non_blocking_logging():
+    """
+    Writes the queued records and puts back the original handlers of the loggers
+    """
+    global _log_queue
+    if _log_queue is None:
+        return
+    for logger in _configured_loggers():
+        logger.handlers = [original_handler
+                           for handler in logger.handlers
+                           for original_handler in (handler.handlers
+                                                    if isinstance(handler, QueueLogHandler)
+                                                    else [handler])]
+    _log_queue.stop()
+    _log_queue = None
+
+
+# Registered after the logging module one, so that the queued records are written before the handlers are closed
+atexit.register(stop_non_blocking_logging)
@@ -28,6 +28,11 @@ class LogMessage(PubSubMessage):
     logger_name: str = ''
 
 
+class MetricsMessage(PubSubMessage):
+    timestamp: float = 0.0
+    data: Optional[Dict[str, Any]] = {}
+
+
 class ExternalEventMessage(PubSubMessage):
     timestamp: Optional[int] = -1
     sequence: Optional[int] = 0
@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -41,6 +42,7 @@ from hummingbot.remote_iface.messages import (
     ImportCommandMessage,
     InternalEventMessage,
     LogMessage,
+    MetricsMessage,
     NotifyMessage,
     StartCommandMessage,
     StatusCommandMessage,
@@ -69,6 +71,7 @@ class TopicSpecs:
     INTERNAL_EVENTS: str = '/events'
     NOTIFICATIONS: str = '/notify'
     HEARTBEATS: str = '/hb'
+    METRICS: str = '/metrics'
     EXTERNAL_EVENTS: str = '/external/event/*'
 
 
@@ -524,6 +527,49 @@ class MQTTNotifier(NotifierBase):
         return None
 
 
+class MQTTMetricsPublisher:
+    PUBLISH_INTERVAL: float = 10.0
+
+    def __init__(self,
+                 hb_app: "HummingbotApplication",
+                 node: Node) -> None:
+        self._node = node
+        self._hb_app = hb_app
+        self._ev_loop: asyncio.AbstractEventLoop = self._hb_app.ev_loop
+        self._publish_task: Optional[asyncio.Task] = None
+
+        topic_prefix = TopicSpecs.PREFIX.format(
+            namespace=self._node.namespace,
+            instance_id=self._hb_app.instance_id
+        )
+        self._topic = f'{topic_prefix}{TopicSpecs.METRICS}'
+        self.metrics_pub = self._node.create_publisher(
+            topic=self._topic,
+            msg_type=MetricsMessage
+        )
+
+    def publish_metrics(self):
+        self.metrics_pub.publish(MetricsMessage(timestamp=time.time(),
+                                                data=RuntimeMetrics.get_instance().snapshot()))
+
+    async def _publish_metrics_loop(self):
+        while True:
+            await asyncio.sleep(self.PUBLISH_INTERVAL)
+            self.publish_metrics()
+
+    def start(self) -> None:
+        if threading.current_thread() != threading.main_thread():  # pragma: no cover
+            self._ev_loop.call_soon_threadsafe(self.start)
+            return
+        if self._publish_task is None:
+            self._publish_task = safe_ensure_future(self._publish_metrics_loop(), loop=self._ev_loop)
+
+    def stop(self) -> None:
+        if self._publish_task is not None:
+            self._publish_task.cancel()
+            self._publish_task = None
+
+
 class MQTTGateway(Node):
     NODE_NAME: str = 'hbot.$instance_id'
     _instance: Optional["MQTTGateway"] = None
@@ -550,6 +596,7 @@ class MQTTGateway(Node):
         self._commands: MQTTCommands = None
         self._logh: MQTTLogHandler = None
         self._external_events: MQTTExternalEvents = None
+        self._metrics: MQTTMetricsPublisher = None
         self._hb_app: "HummingbotApplication" = hb_app
         self._ev_loop = self._hb_app.ev_loop
         self._params = self._create_mqtt_params_from_conf()
@@ -649,6 +696,16 @@ class MQTTGateway(Node):
         if self._market_events is not None:
             self._market_events._stop_event_listeners()
 
+    def _init_metrics(self):
+        if self._hb_app.client_config_map.mqtt_bridge.mqtt_metrics:
+            self._metrics = MQTTMetricsPublisher(self._hb_app, self)
+            self._metrics.start()
+
+    def _remove_metrics(self):
+        if self._metrics is not None:
+            self._metrics.stop()
+            self._metrics = None
+
     def _init_external_events(self):
         if self._hb_app.client_config_map.mqtt_bridge.mqtt_external_events:
             self._external_events = MQTTExternalEvents(self._hb_app, self)
@@ -724,6 +781,7 @@ class MQTTGateway(Node):
         self._init_notifier()
         self._init_commands()
         self._init_external_events()
+        self._init_metrics()
         self._start_health_monitoring_loop()
         self.run()
 
@@ -732,6 +790,7 @@ class MQTTGateway(Node):
         self._remove_notifier()
         self._remove_log_handlers()
         self._remove_market_event_listeners()
+        self._remove_metrics()
         self._stop_health_monitorint_loop()
 
     def __del__(self):
@@ -1,11 +1,21 @@
 import numpy as np
 import logging
+from libc.math cimport NAN, isfinite, sqrt
 cimport numpy as np
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added.
+    The mean, variance (Welford's algorithm) and the sum of the squared differences between consecutive values are
+    updated on every value added, so reading them takes constant time. To avoid accumulating rounding errors, they are
+    recalculated from the buffer values every time the buffer wraps around.
+    NaN or infinite values can not be removed from the running sums, so while the buffer holds any of them the
+    incremental updates are skipped, and the values are recalculated once the last one leaves the buffer.
+    """
+
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -18,18 +28,84 @@ cdef class RingBuffer:
         self._buffer = np.zeros(length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._sum_of_squared_diffs = 0
+        self._non_finite_count = 0
 
     def __dealloc__(self):
         self._buffer = None
 
-    cdef void c_add_value(self, float val):
+    cdef void c_add_value(self, double val):
+        cdef:
+            double previous_value = 0
+            double removed_value
+            double previous_mean = self._mean
+            int64_t size = self.c_size()
+            bint non_finite_removed = self._is_full and not isfinite(self._buffer[self._delimiter])
+
+        if non_finite_removed:
+            self._non_finite_count -= 1
+        if not isfinite(val):
+            self._non_finite_count += 1
+        if self._non_finite_count > 0 or non_finite_removed:
+            self._buffer[self._delimiter] = val
+            self.c_increment_delimiter()
+            # Recalculated when a non-finite value enters the buffer and when the last one leaves it (the buffer
+            # wrapping around already recalculates them)
+            if self._delimiter != 0 and (self._non_finite_count == 0 or not isfinite(val)):
+                self.c_renormalize()
+            return
+        if size > 0:
+            previous_value = self._buffer[(self._delimiter - 1 + self._length) % self._length]
+        if self._is_full:
+            removed_value = self._buffer[self._delimiter]
+            if self._length > 1:
+                # The oldest value leaves the window, together with its difference to the next one
+                self._sum_of_squared_diffs += ((val - previous_value) ** 2 -
+                                               (self._buffer[(self._delimiter + 1) % self._length] - removed_value) ** 2)
+            self._mean += (val - removed_value) / self._length
+            self._m2 += (val - removed_value) * (val - self._mean + removed_value - previous_mean)
+        else:
+            if size > 0:
+                self._sum_of_squared_diffs += (val - previous_value) ** 2
+            self._mean += (val - previous_mean) / (size + 1)
+            self._m2 += (val - previous_mean) * (val - self._mean)
         self._buffer[self._delimiter] = val
         self.c_increment_delimiter()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
-        if not self._is_full and self._delimiter == 0:
+        if self._delimiter == 0:
             self._is_full = True
+            self.c_renormalize()
+
+    cdef void c_renormalize(self):
+        cdef:
+            int64_t size = self.c_size()
+            int64_t start = self._delimiter if self._is_full else 0
+            int64_t i
+            double total = 0
+            double m2 = 0
+            double sum_of_squared_diffs = 0
+            double value
+            double previous_value = 0
+            double mean = 0
+
+        for i in range(size):
+            value = self._buffer[(start + i) % self._length]
+            total += value
+            if i > 0:
+                sum_of_squared_diffs += (value - previous_value) ** 2
+            previous_value = value
+        if size > 0:
+            mean = total / size
+        # The values are always stored from the beginning of the buffer, so the order does not matter here
+        for i in range(size):
+            m2 += (self._buffer[i] - mean) ** 2
+        self._mean = mean
+        self._m2 = m2
+        self._sum_of_squared_diffs = sum_of_squared_diffs
 
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
@@ -42,39 +118,53 @@ cdef class RingBuffer:
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_size(self):
+        return self._length if self._is_full else self._delimiter
+
     cdef double c_mean_value(self):
-        result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
-        return result
+            return self.c_window_mean()
+        return NAN
 
     cdef double c_variance(self):
-        result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
-        return result
+            return self.c_window_variance()
+        return NAN
 
     cdef double c_std_dev(self):
-        result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+            return sqrt(self.c_window_variance())
+        return NAN
+
+    cdef double c_window_mean(self):
+        if self.c_is_empty():
+            return NAN
+        return self._mean
+
+    cdef double c_window_variance(self):
+        if self.c_is_empty():
+            return NAN
+        return max(self._m2, 0) / self.c_size()
+
+    cdef double c_sum_of_squared_diffs(self):
+        return max(self._sum_of_squared_diffs, 0)
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
 
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
-        else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[:self._delimiter].copy()
+        return np.concatenate((buffer[self._delimiter:], buffer[:self._delimiter]))
 
     def __init__(self, length):
         self._length = length
         self._buffer = np.zeros(length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._sum_of_squared_diffs = 0
+        self._non_finite_count = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -89,6 +179,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def size(self) -> int:
+        return self.c_size()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -101,6 +195,27 @@ cdef class RingBuffer:
     def variance(self):
         return self.c_variance()
 
+    @property
+    def window_mean(self) -> float:
+        """
+        Mean of the values in the buffer, even if it is not full yet (NaN if it is empty)
+        """
+        return self.c_window_mean()
+
+    @property
+    def window_variance(self) -> float:
+        """
+        Population variance of the values in the buffer, even if it is not full yet (NaN if it is empty)
+        """
+        return self.c_window_variance()
+
+    @property
+    def sum_of_squared_diffs(self) -> float:
+        """
+        Sum of the squared differences between consecutive values in the buffer
+        """
+        return self.c_sum_of_squared_diffs()
+
     @property
     def length(self) -> int:
         return self._length
@@ -113,6 +228,10 @@ cdef class RingBuffer:
         self._buffer = np.zeros(value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
+        self._sum_of_squared_diffs = 0
+        self._non_finite_count = 0
 
         for val in data[-value:]:
             self.add_value(val)
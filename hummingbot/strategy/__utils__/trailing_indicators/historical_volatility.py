@@ -1,18 +1,39 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from ..ring_buffer import RingBuffer
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # Log returns between the consecutive prices of the sampling buffer, their variance is updated incrementally
+        self._log_returns = RingBuffer(self._log_returns_length(sampling_length))
+
+    def add_sample(self, value: float):
+        last_price = self._sampling_buffer.get_last_value()
+        if not np.isnan(last_price):
+            self._log_returns.add_value(np.log(value / last_price))
+        super().add_sample(value)
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        if self._sampling_buffer.size > 1:
+            return self._log_returns.window_variance
+        # No returns yet, counted as no volatility
+        return 0.0
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.size > 0:
+            return np.sqrt(self._processing_buffer.window_mean)
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_buffer.length
+
+    @sampling_length.setter
+    def sampling_length(self, value):
+        self._sampling_buffer.length = value
+        self._log_returns.length = self._log_returns_length(value)
+
+    @staticmethod
+    def _log_returns_length(sampling_length: int) -> int:
+        return max(sampling_length - 1, 1)
@@ -13,16 +13,25 @@ cdef class TradingIntensityIndicator:
         double _alpha
         double _kappa
         dict _trade_samples
+        object _trade_sample_timestamps
+        dict _price_level_amounts
+        dict _price_level_counts
+        double _histogram_amount
+        double _histogram_changed_amount
         list _current_trade_sample
         object _trades_forwarder
         OrderBook _order_book
         object _price_delegate
-        list _last_quotes
+        object _quote_timestamps
+        object _quote_prices
         int _sampling_length
         int _samples_length
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
+    cdef c_add_trade_to_sample(self, double sample_timestamp, double price_level, double amount)
+    cdef c_remove_oldest_trade_sample(self)
+    cdef bint c_histogram_changed(self)
     cdef c_estimate_intensity(self)
 
 cdef class TradesForwarder(EventListener):
@@ -2,6 +2,8 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 import warnings
+from bisect import bisect_left, insort
+from collections import deque
 from decimal import Decimal
 from typing import Tuple
 
@@ -17,6 +19,10 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+# Share of the traded amount in the window that has to enter or leave it before the intensity is estimated again.
+# Smaller changes barely move the fitted curve, so refitting for them would only spend the tick budget
+REFIT_CHANGE_THRESHOLD = 0.02
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -26,11 +32,23 @@ cdef class TradesForwarder(EventListener):
 
 
 cdef class TradingIntensityIndicator:
+    """
+    Estimates the trading intensity (lambda = alpha * exp(-kappa * price_level)) from the trades of the last
+    `sampling_length` samples, where the price level of a trade is its distance to the last mid price quoted before it.
+    The traded amount per price level is kept as a histogram that is updated as trades enter and leave the window,
+    and the curve is only fitted again when the histogram has changed enough since the last fit.
+    """
 
     def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
         self._alpha = 0
         self._kappa = 0
+        # Trades (price level, amount) of each sample, and the sample timestamps in ascending order
         self._trade_samples = {}
+        self._trade_sample_timestamps = deque()
+        self._price_level_amounts = {}
+        self._price_level_counts = {}
+        self._histogram_amount = 0
+        self._histogram_changed_amount = 0
         self._current_trade_sample = []
         self._trades_forwarder = TradesForwarder(self)
         self._order_book = order_book
@@ -38,7 +56,9 @@ cdef class TradingIntensityIndicator:
         self._price_delegate = price_delegate
         self._sampling_length = sampling_length
         self._samples_length = 0
-        self._last_quotes = []
+        # Ascending order of price-timestamp quotes
+        self._quote_timestamps = deque()
+        self._quote_prices = deque()
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -48,12 +68,12 @@ cdef class TradingIntensityIndicator:
 
     @property
     def is_sampling_buffer_full(self) -> bool:
-        return len(self._trade_samples.keys()) == self._sampling_length
+        return len(self._trade_samples) == self._sampling_length
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        is_changed = self._samples_length != len(self._trade_samples.keys())
-        self._samples_length = len(self._trade_samples.keys())
+        is_changed = self._samples_length != len(self._trade_samples)
+        self._samples_length = len(self._trade_samples)
         return is_changed
 
     @property
@@ -66,54 +86,61 @@ cdef class TradingIntensityIndicator:
 
     @property
     def last_quotes(self) -> list:
-        """A helper method to be used in unit tests"""
-        return self._last_quotes
+        """A helper method to be used in unit tests. Quotes are returned in descending timestamp order"""
+        return [{"timestamp": timestamp, "price": price}
+                for timestamp, price in zip(reversed(self._quote_timestamps), reversed(self._quote_prices))]
 
     @last_quotes.setter
     def last_quotes(self, value):
+        """A helper method to be used in unit tests. Quotes are expected in descending timestamp order"""
+        self._quote_timestamps = deque(quote["timestamp"] for quote in reversed(value))
+        self._quote_prices = deque(float(quote["price"]) for quote in reversed(value))
+
+    @property
+    def trade_samples(self) -> dict:
+        """A helper method to be used in unit tests"""
+        return self._trade_samples
+
+    @property
+    def price_level_amounts(self) -> dict:
         """A helper method to be used in unit tests"""
-        self._last_quotes = value
+        return self._price_level_amounts
 
     def calculate(self, timestamp):
         """A helper method to be used in unit tests"""
         self.c_calculate(timestamp)
 
     cdef c_calculate(self, timestamp):
+        cdef:
+            object quote_timestamps = self._quote_timestamps
+            object quote_prices = self._quote_prices
+            int latest_processed_quote_idx = -1
+            int quote_idx
+
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
-        # Descending order of price-timestamp quotes
-        self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
+        quote_timestamps.append(timestamp)
+        quote_prices.append(float(price))
 
-        latest_processed_quote_idx = None
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
-
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
-
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+            # Last quote before the trade
+            quote_idx = bisect_left(quote_timestamps, trade.timestamp) - 1
+            if quote_idx >= 0:
+                latest_processed_quote_idx = max(latest_processed_quote_idx, quote_idx)
+                self.c_add_trade_to_sample(quote_timestamps[quote_idx] + 1,
+                                           abs(trade.price - quote_prices[quote_idx]),
+                                           trade.amount)
 
         # THere are no trades left to process
         self._current_trade_sample = []
         # Store quotes that happened after the latest trade + one before
-        if latest_processed_quote_idx is not None:
-            self._last_quotes = self._last_quotes[0:latest_processed_quote_idx + 1]
-
-        if len(self._trade_samples.keys()) > self._sampling_length:
-            timestamps = list(self._trade_samples.keys())
-            timestamps.sort()
-            timestamps = timestamps[-self._sampling_length:]
+        for _ in range(latest_processed_quote_idx):
+            quote_timestamps.popleft()
+            quote_prices.popleft()
 
-            trade_samples = {}
-            for timestamp in timestamps:
-                trade_samples[timestamp] = self._trade_samples[timestamp]
-            self._trade_samples = trade_samples
+        while len(self._trade_samples) > self._sampling_length:
+            self.c_remove_oldest_trade_sample()
 
-        if self.is_sampling_buffer_full:
+        if self.is_sampling_buffer_full and self.c_histogram_changed():
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -123,30 +150,52 @@ cdef class TradingIntensityIndicator:
     cdef c_register_trade(self, object trade):
         self._current_trade_sample.append(trade)
 
+    cdef c_add_trade_to_sample(self, double sample_timestamp, double price_level, double amount):
+        if sample_timestamp not in self._trade_samples:
+            self._trade_samples[sample_timestamp] = []
+            if len(self._trade_sample_timestamps) == 0 or sample_timestamp > self._trade_sample_timestamps[-1]:
+                self._trade_sample_timestamps.append(sample_timestamp)
+            else:
+                insort(self._trade_sample_timestamps, sample_timestamp)
+        self._trade_samples[sample_timestamp].append((price_level, amount))
+
+        self._price_level_amounts[price_level] = self._price_level_amounts.get(price_level, 0) + amount
+        self._price_level_counts[price_level] = self._price_level_counts.get(price_level, 0) + 1
+        self._histogram_amount += amount
+        self._histogram_changed_amount += abs(amount)
+
+    cdef c_remove_oldest_trade_sample(self):
+        cdef:
+            double price_level
+            double amount
+
+        sample_timestamp = self._trade_sample_timestamps.popleft()
+        for price_level, amount in self._trade_samples.pop(sample_timestamp):
+            self._price_level_counts[price_level] -= 1
+            if self._price_level_counts[price_level] == 0:
+                del self._price_level_counts[price_level]
+                del self._price_level_amounts[price_level]
+            else:
+                self._price_level_amounts[price_level] -= amount
+            self._histogram_amount -= amount
+            self._histogram_changed_amount += abs(amount)
+
+    cdef bint c_histogram_changed(self):
+        if self._alpha == 0 and self._kappa == 0:
+            # There is no estimation yet
+            return len(self._price_level_amounts) > 0
+        return self._histogram_changed_amount > REFIT_CHANGE_THRESHOLD * abs(self._histogram_amount)
+
     cdef c_estimate_intensity(self):
         cdef:
-            dict trades_consolidated
             list lambdas
             list price_levels
 
-        # Calculate lambdas / trading intensities
-        lambdas = []
+        self._histogram_changed_amount = 0
 
-        trades_consolidated = {}
-        price_levels = []
-        for timestamp in self._trade_samples.keys():
-            tick = self._trade_samples[timestamp]
-            for trade in tick:
-                if trade['price_level'] not in trades_consolidated.keys():
-                    trades_consolidated[trade['price_level']] = 0
-                    price_levels += [trade['price_level']]
-
-                trades_consolidated[trade['price_level']] += trade['amount']
-
-        price_levels = sorted(price_levels, reverse=True)
-
-        for price_level in price_levels:
-            lambdas += [trades_consolidated[price_level]]
+        # Calculate lambdas / trading intensities
+        price_levels = sorted(self._price_level_amounts.keys(), reverse=True)
+        lambdas = [self._price_level_amounts[price_level] for price_level in price_levels]
 
         # Adjust to be able to calculate log
         lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
@@ -0,0 +1,205 @@
+import asyncio
+import itertools
+import logging
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Type
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.strategy_config_data_types import BaseTradingStrategyConfigMap
+from hummingbot.client.performance import PerformanceMetricsAccumulator
+from hummingbot.connector.exchange.paper_trade import create_replay_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.order_book_replay_driver import OrderBookReplayDriver
+from hummingbot.core.clock import Clock
+from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.strategy.avellaneda_market_making import AvellanedaMarketMakingStrategy
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+ps_logger = None
+
+# Creates the strategy to backtest from its config map and market. It must be picklable (a module level function)
+StrategyFactory = Callable[[ClientConfigAdapter, MarketTradingPairTuple], StrategyBase]
+
+# The PerformanceMetrics attributes included in the results table
+RESULT_METRICS = ("num_trades", "tot_vol_quote", "trade_pnl", "fee_in_quote", "total_pnl", "return_pct")
+
+
+class _SweepTask(NamedTuple):
+    parameters: Dict[str, Any]
+    config_class: Type[BaseTradingStrategyConfigMap]
+    config_json: str
+    strategy_factory: StrategyFactory
+    records_path: str
+    memory_mapped_path: str
+    initial_balances: Dict[str, Decimal]
+    start_timestamp: Optional[float]
+    end_timestamp: Optional[float]
+    tick_size: float
+
+
+def avellaneda_market_making_factory(config_map: ClientConfigAdapter,
+                                     market_info: MarketTradingPairTuple) -> StrategyBase:
+    strategy = AvellanedaMarketMakingStrategy()
+    strategy.init_params(config_map=config_map,
+                         market_info=market_info,
+                         hb_app_notification=False,
+                         is_debug=False)
+    return strategy
+
+
+class ParameterSweep:
+    """
+    Backtests a strategy for every combination of a parameter grid, over order book data recorded by
+    OrderBookRecorder, and aggregates the performance metrics of all the runs in a single table.
+
+    Each combination is applied to a copy of the config template and run in a worker of a ProcessPoolExecutor, with a
+    paper trade market replaying the recorded data and a Clock in BACKTEST mode driven by OrderBookReplayDriver. The
+    recorded data of the period is exported once as memory-mapped column files, that all the workers read without
+    loading a copy each.
+    """
+
+    @classmethod
+    def logger(cls) -> logging.Logger:
+        global ps_logger
+        if ps_logger is None:
+            ps_logger = logging.getLogger(__name__)
+        return ps_logger
+
+    def __init__(self,
+                 config_template: ClientConfigAdapter,
+                 parameter_grid: Dict[str, List[Any]],
+                 strategy_factory: StrategyFactory,
+                 records_path: str,
+                 initial_balances: Dict[str, Decimal],
+                 start_timestamp: Optional[float] = None,
+                 end_timestamp: Optional[float] = None,
+                 tick_size: float = 1.0,
+                 max_workers: Optional[int] = None):
+        """
+        :param config_template: the strategy config map (a BaseTradingStrategyConfigMap) used for all the runs
+        :param parameter_grid: the values to backtest for each config map parameter
+        :param strategy_factory: the function creating the strategy from the config map and its market
+        :param records_path: the root path of the order book records
+        :param initial_balances: the paper trade balances at the start of each run
+        :param start_timestamp: the start of the backtest period (the start of the records if None)
+        :param end_timestamp: the end of the backtest period (the end of the records if None)
+        :param tick_size: the clock tick size in seconds
+        :param max_workers: the number of worker processes (the number of CPUs if None)
+        """
+        self._config_template: ClientConfigAdapter = config_template
+        self._parameter_grid: Dict[str, List[Any]] = parameter_grid
+        self._strategy_factory: StrategyFactory = strategy_factory
+        self._records_path: str = records_path
+        self._initial_balances: Dict[str, Decimal] = initial_balances
+        self._start_timestamp: Optional[float] = start_timestamp
+        self._end_timestamp: Optional[float] = end_timestamp
+        self._tick_size: float = tick_size
+        self._max_workers: Optional[int] = max_workers
+
+    def configurations(self) -> List[Dict[str, Any]]:
+        names = list(self._parameter_grid)
+        return [dict(zip(names, values)) for values in itertools.product(*self._parameter_grid.values())]
+
+    def run(self) -> pd.DataFrame:
+        """
+        Runs the backtests and returns a table with a row per parameters combination, with the parameter values, the
+        performance metrics, and the replay statistics (or the error of the run if it failed)
+        """
+        with tempfile.TemporaryDirectory() as memory_mapped_path:
+            ReplayOrderBookTrackerDataSource.export_memory_mapped_records(
+                root_path=self._records_path,
+                exchange=self._config_template.exchange.value,
+                trading_pairs=[self._config_template.market],
+                memory_mapped_path=memory_mapped_path,
+                start_timestamp=self._start_timestamp,
+                end_timestamp=self._end_timestamp)
+            tasks = [self._task(parameters, memory_mapped_path) for parameters in self.configurations()]
+            with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+                results = list(executor.map(run_sweep_task, tasks))
+        return pd.DataFrame(results)
+
+    def _task(self, parameters: Dict[str, Any], memory_mapped_path: str) -> _SweepTask:
+        # The config is validated here, so that an invalid combination fails before starting the workers
+        config_map = ClientConfigAdapter(self._config_template.hb_config.copy(deep=True))
+        for name, value in parameters.items():
+            setattr(config_map, name, value)
+        return _SweepTask(parameters=parameters,
+                          config_class=type(config_map.hb_config),
+                          config_json=config_map.hb_config.json(),
+                          strategy_factory=self._strategy_factory,
+                          records_path=self._records_path,
+                          memory_mapped_path=memory_mapped_path,
+                          initial_balances=self._initial_balances,
+                          start_timestamp=self._start_timestamp,
+                          end_timestamp=self._end_timestamp,
+                          tick_size=self._tick_size)
+
+
+def run_sweep_task(task: _SweepTask) -> Dict[str, Any]:
+    """
+    Runs the backtest of one parameters combination, in a worker process
+    """
+    result: Dict[str, Any] = dict(task.parameters)
+    # The workers (processes, or threads) have no event loop, and the market and the strategy use the current one
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    try:
+        config_map = ClientConfigAdapter(task.config_class.parse_raw(task.config_json))
+        exchange: str = config_map.exchange.value
+        trading_pair: str = config_map.market
+        market = create_replay_paper_trade_market(exchange_name=exchange,
+                                                  client_config_map=ClientConfigAdapter(ClientConfigMap()),
+                                                  trading_pairs=[trading_pair],
+                                                  records_path=task.records_path,
+                                                  start_timestamp=task.start_timestamp,
+                                                  end_timestamp=task.end_timestamp,
+                                                  memory_mapped_path=task.memory_mapped_path)
+        for asset, balance in task.initial_balances.items():
+            market.set_balance(asset, balance)
+        base, quote = market.split_trading_pair(trading_pair)
+        market_info = MarketTradingPairTuple(market, trading_pair, base, quote)
+
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+
+        def add_trade(event_tag: int, market: Any, event: OrderFilledEvent):
+            accumulator.add_trade(order_id=event.order_id,
+                                  trade_type=event.trade_type.name,
+                                  price=event.price,
+                                  amount=event.amount,
+                                  trade_fee=event.trade_fee.to_json(),
+                                  position=event.position or PositionAction.NIL.value)
+
+        fill_forwarder = SourceInfoEventForwarder(add_trade)
+        market.add_listener(MarketEvent.OrderFilled, fill_forwarder)
+
+        strategy = task.strategy_factory(config_map, market_info)
+        start_timestamp = (task.start_timestamp
+                           if task.start_timestamp is not None
+                           else market.order_book_tracker.data_source.initial_snapshot(trading_pair).timestamp)
+        clock = Clock(ClockMode.BACKTEST, task.tick_size, start_timestamp, task.end_timestamp or start_timestamp)
+        clock.add_iterator(market)
+        clock.add_iterator(strategy)
+        report = OrderBookReplayDriver(clock, market).run()
+
+        current_balances = {asset: market.get_balance(asset) for asset in (base, quote)}
+        performance = ev_loop.run_until_complete(accumulator.performance_metrics(current_balances))
+        result.update({metric: getattr(performance, metric) for metric in RESULT_METRICS})
+        result.update({"messages": report.messages,
+                       "duration": report.duration,
+                       "events_per_second": report.events_per_second})
+    except Exception as exception:
+        ParameterSweep.logger().error(f"Error backtesting {task.parameters}.", exc_info=True)
+        result["error"] = str(exception)
+    finally:
+        asyncio.set_event_loop(None)
+        ev_loop.close()
+    return result
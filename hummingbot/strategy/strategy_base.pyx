@@ -189,8 +189,9 @@ cdef class StrategyBase(TimeIterator):
     @property
     def trades(self) -> List[Trade]:
         """
-        Returns a list of all completed trades from the market.
-        The trades are taken from the market event logs.
+        Returns a list of the most recent completed trades from the market.
+        The trades are taken from the market order filled events, which only keep the most recent fills. Totals over
+        all the fills (volumes, average prices, fees) are in the markets order_filled_store aggregates.
         """
         def event_to_trade(order_filled_event: OrderFilledEvent, market_name: str):
             return Trade(order_filled_event.trading_pair,
@@ -203,9 +204,7 @@ cdef class StrategyBase(TimeIterator):
                          order_filled_event.trade_fee)
         past_trades = []
         for market in self.active_markets:
-            event_logs = market.event_logs
-            order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), event_logs))
-            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), order_filled_events))
+            past_trades += list(map(lambda ofe: event_to_trade(ofe, market.display_name), market.order_filled_events))
 
         return sorted(past_trades, key=lambda x: x.timestamp)
 
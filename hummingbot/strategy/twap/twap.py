@@ -1,7 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
 import logging
-import statistics
 from typing import (
     List,
     Tuple,
@@ -134,8 +133,9 @@ class TwapTradeStrategy(StrategyPyBase):
 
     def filled_trades(self):
         """
-        Returns a list of all filled trades generated from limit orders with the same trade type the strategy
-        has in its configuration
+        Returns a list of the most recent filled trades generated from limit orders with the same trade type the
+        strategy has in its configuration. Use `average_filled_price` or the markets order filled store aggregates for
+        values over all the filled trades.
         """
         trade_type = TradeType.BUY if self._is_buy else TradeType.SELL
         return [trade
@@ -143,6 +143,22 @@ class TwapTradeStrategy(StrategyPyBase):
                 in self.trades
                 if trade.trade_type == trade_type.name and trade.order_type == OrderType.LIMIT]
 
+    def average_filled_price(self) -> Decimal:
+        """
+        Returns the mean price of all the trades filled from limit orders with the same trade type the strategy has in
+        its configuration. It is computed from the order type aggregates of the markets, since the filled trades only
+        include the most recent ones.
+        """
+        trade_type = TradeType.BUY if self._is_buy else TradeType.SELL
+        aggregates = [aggregate
+                      for market in self.active_markets
+                      for aggregate in market.order_filled_store.order_type_aggregates.values()
+                      if aggregate.trade_type == trade_type and aggregate.order_type == OrderType.LIMIT]
+        fill_count = sum(aggregate.fill_count for aggregate in aggregates)
+        return (sum(aggregate.price_sum for aggregate in aggregates) / fill_count
+                if fill_count > 0
+                else Decimal(0))
+
     def format_status(self) -> str:
         lines: list = []
         warning_lines: list = []
@@ -181,10 +197,7 @@ class TwapTradeStrategy(StrategyPyBase):
             else:
                 lines.extend(["", "  No active maker orders."])
 
-            filled_trades = self.filled_trades()
-            average_price = (statistics.mean([trade.price for trade in filled_trades])
-                             if filled_trades
-                             else Decimal(0))
+            average_price = self.average_filled_price()
             lines.extend(["",
                           f"  Average filled orders price: "
                           f"{PerformanceMetrics.smart_round(average_price)} "
@@ -9,6 +9,7 @@ class DownloadCandles(ScriptStrategyBase):
     This script provides an example of how to use the Candles Feed to download and store historical data.
     It downloads 3-minute candles for 3 Binance trading pairs ["APE-USDT", "BTC-USDT", "BNB-USDT"] and stores them in
     CSV files in the /data directory. The script stops after it has downloaded 50,000 max_records records for each pair.
+    The candles are also kept in the local candles store, so that running it again only downloads the new candles.
     Is important to notice that the component will fail if all the candles are not available since the idea of it is to
     use it in production based on candles needed to compute technical indicators.
     """
@@ -19,7 +20,7 @@ class DownloadCandles(ScriptStrategyBase):
     candles = {trading_pair: {} for trading_pair in trading_pairs}
     for trading_pair in trading_pairs:
         candle = CandlesFactory.get_candle(connector="binance", trading_pair=trading_pair, interval=interval,
-                                           max_records=50000)
+                                           max_records=50000, candles_store_path=data_path() + "/candles_store")
         candle.start()
         # we are storing the candles object and the csv path to save the candles
         candles[trading_pair]["candles"] = candle
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+"""
+Microbenchmark of the acquire latency of AsyncThrottler and SlidingWindowAsyncThrottler when the throttlers already
+hold a large number of logged tasks within their rate limit windows.
+
+Usage:
+    python test/debug/debug_async_throttler_benchmark.py [logged_tasks] [acquire_count]
+"""
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowAsyncThrottler
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS = "ORDERS"
+ENDPOINTS = [f"/endpoint_{i}" for i in range(10)]
+
+
+def rate_limits() -> List[RateLimit]:
+    # Large limits, so that the benchmark measures the capacity check and never waits for capacity
+    limits = [
+        RateLimit(limit_id=REQUEST_WEIGHT, limit=10_000_000, time_interval=60),
+        RateLimit(limit_id=ORDERS, limit=10_000_000, time_interval=10),
+    ]
+    for endpoint in ENDPOINTS:
+        limits.append(RateLimit(limit_id=endpoint, limit=10_000_000, time_interval=60, linked_limits=[
+            LinkedLimitWeightPair(REQUEST_WEIGHT, 1),
+            LinkedLimitWeightPair(ORDERS, 1),
+        ]))
+    return limits
+
+
+def fill_task_logs(throttler: AsyncThrottlerBase, logged_tasks: int):
+    now = time.time()
+    if isinstance(throttler, SlidingWindowAsyncThrottler):
+        for i in range(logged_tasks):
+            endpoint = ENDPOINTS[i % len(ENDPOINTS)]
+            for limit_window, weight in throttler._weights_for_limit_id(endpoint):
+                limit_window.add(now, weight)
+    else:
+        for i in range(logged_tasks):
+            rate_limit, related_limits = throttler.get_related_limits(ENDPOINTS[i % len(ENDPOINTS)])
+            throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=rate_limit.weight))
+            for limit, weight in related_limits:
+                throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+
+
+async def measure_acquire_latency(throttler: AsyncThrottlerBase, acquire_count: int) -> float:
+    start = time.perf_counter()
+    for i in range(acquire_count):
+        async with throttler.execute_task(limit_id=ENDPOINTS[i % len(ENDPOINTS)]):
+            pass
+    return (time.perf_counter() - start) / acquire_count
+
+
+def main():
+    logged_tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    acquire_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    ev_loop = asyncio.get_event_loop()
+
+    for throttler_class in [AsyncThrottler, SlidingWindowAsyncThrottler]:
+        throttler = throttler_class(rate_limits=rate_limits(), limits_share_percentage=Decimal("100"))
+        fill_task_logs(throttler, logged_tasks)
+        latency = ev_loop.run_until_complete(measure_acquire_latency(throttler, acquire_count))
+        print(f"{throttler_class.__name__}: {latency * 1e6:,.1f} us per acquire "
+              f"with {logged_tasks:,} logged tasks ({acquire_count} acquires)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+"""
+Measures the time it takes a new Python process to create the connector settings (as the client does at startup),
+without the connector settings manifest (all the connector utils modules are imported, as before the manifest
+existed) and with a valid manifest.
+
+Usage:
+    PYTHONPATH=. python test/debug/debug_connector_settings_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import List, Tuple
+
+PROCESS_CODE = """
+import sys
+import time
+
+start = time.perf_counter()
+from hummingbot.client.settings import AllConnectorSettings
+imported = time.perf_counter()
+
+AllConnectorSettings.connector_settings_manifest_path = classmethod(lambda cls: {manifest_path!r})
+AllConnectorSettings.get_connector_settings()
+created = time.perf_counter()
+
+utils_modules = [name for name in sys.modules if name.startswith("hummingbot.connector.") and name.endswith("_utils")]
+print(imported - start, created - imported, len(utils_modules))
+"""
+
+
+def run_process(manifest_path: str) -> Tuple[float, float, float, int]:
+    code = PROCESS_CODE.format(manifest_path=manifest_path)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.getcwd(), os.environ.get("PYTHONPATH", "")]))
+    output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    import_time, settings_time, utils_modules = output.split()
+    return float(import_time), float(settings_time), float(import_time) + float(settings_time), int(utils_modules)
+
+
+def report(label: str, results: List[Tuple[float, float, float, int]]):
+    print(f"{label}:")
+    print(f"  import hummingbot.client.settings: {statistics.median(r[0] for r in results) * 1e3:8.1f} ms (median)")
+    print(f"  create connector settings:         {statistics.median(r[1] for r in results) * 1e3:8.1f} ms (median)")
+    print(f"  total:                             {statistics.median(r[2] for r in results) * 1e3:8.1f} ms (median)")
+    print(f"  connector utils modules imported:  {results[-1][3]}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manifest_path = os.path.join(temp_dir, "connector_settings_manifest.json")
+
+        without_manifest = []
+        for _ in range(runs):
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            without_manifest.append(run_process(manifest_path))
+
+        # The last run created the manifest
+        with_manifest = [run_process(manifest_path) for _ in range(runs)]
+
+    report("Without manifest (imports every connector utils module)", without_manifest)
+    report("With manifest", with_manifest)
+
+
+if __name__ == "__main__":
+    main()
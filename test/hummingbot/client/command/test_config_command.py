@@ -80,6 +80,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ mqtt_commands          | True                 |\n"
                            "    | ∟ mqtt_events            | True                 |\n"
                            "    | ∟ mqtt_external_events   | True                 |\n"
+                           "    | ∟ mqtt_metrics           | False                |\n"
                            "    | ∟ mqtt_autostart         | False                |\n"
                            "    | send_error_logs          | True                 |\n"
                            "    | pmm_script_mode          | pmm_script_disabled  |\n"
@@ -1,8 +1,13 @@
 import asyncio
+import binascii
+import json
 import unittest
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Awaitable
+from unittest.mock import patch
+
+from eth_keyfile import create_keyfile_json
 
 from hummingbot.client.config import config_crypt, config_helpers, security
 from hummingbot.client.config.config_crypt import ETHKeyFileSecretManger, store_password_verification, validate_password
@@ -123,3 +128,74 @@ class SecurityTest(unittest.TestCase):
         binance_loaded_config = Security.decrypted_value(binance_config.connector)
 
         self.assertEqual(binance_config, binance_loaded_config)
+
+    def test_connector_configs_are_decrypted_on_first_use(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        store_password_verification(secrets_manager)
+        Security.secrets_manager = secrets_manager
+        config_map = self.store_binance_config()
+
+        Security.login(secrets_manager)
+        self.async_run_with_timeout(Security.wait_til_decryption_done(), timeout=2)
+
+        self.assertNotIn(self.connector, Security._secure_configs)
+        self.assertTrue(Security.any_secure_configs())
+
+        api_keys = Security.api_keys(self.connector)
+
+        self.assertEqual(api_keys_from_connector_config_map(config_map), api_keys)
+        self.assertIn(self.connector, Security._secure_configs)
+        self.assertEqual([self.connector], list(Security.all_decrypted_values().keys()))
+
+        Security.remove_secure_config(self.connector)
+
+        self.assertFalse(Security.any_secure_configs())
+        self.assertEqual({}, Security.api_keys(self.connector))
+
+    def test_prepare_decryption_derives_the_keys_upfront(self):
+        encrypted_values = [ETHKeyFileSecretManger("som-password").encrypt_secret_value("attr", f"secret{i}")
+                            for i in range(2)]
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+
+        secrets_manager.prepare_decryption(encrypted_values + ["not-encrypted"])
+
+        self.assertEqual(2, len(secrets_manager._derived_keys))
+        with patch.object(config_crypt, "_derive_key", wraps=config_crypt._derive_key) as derive_key_mock:
+            decrypted_values = [secrets_manager.decrypt_secret_value("attr", value) for value in encrypted_values]
+            derive_key_mock.assert_not_called()
+            # The keys are dropped once their values are decrypted
+            self.assertEqual({}, secrets_manager._derived_keys)
+            self.assertEqual("secret0", secrets_manager.decrypt_secret_value("attr", encrypted_values[0]))
+            derive_key_mock.assert_called_once()
+        self.assertEqual(["secret0", "secret1"], decrypted_values)
+
+    def test_prepare_decryption_discards_the_keys_of_other_values(self):
+        encrypted_values = [ETHKeyFileSecretManger("som-password").encrypt_secret_value("attr", f"secret{i}")
+                            for i in range(2)]
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        secrets_manager.prepare_decryption(encrypted_values[:1])
+
+        secrets_manager.prepare_decryption(encrypted_values[1:])
+
+        self.assertEqual(1, len(secrets_manager._derived_keys))
+        with patch.object(config_crypt, "_derive_key", wraps=config_crypt._derive_key) as derive_key_mock:
+            self.assertEqual("secret1", secrets_manager.decrypt_secret_value("attr", encrypted_values[1]))
+        derive_key_mock.assert_not_called()
+
+    def test_values_encrypted_by_eth_account_are_decrypted(self):
+        for kdf in ("pbkdf2", "scrypt"):
+            keyfile_json = create_keyfile_json(b"secret".rjust(32, b"\0"), b"som-password", kdf=kdf, iterations=2)
+            encrypted_value = binascii.hexlify(json.dumps(keyfile_json).encode()).decode()
+
+            decrypted_value = ETHKeyFileSecretManger("som-password").decrypt_secret_value("attr", encrypted_value)
+
+            self.assertEqual("secret", decrypted_value.lstrip("\0"))
+
+    def test_values_encrypted_with_their_own_salt_are_decrypted(self):
+        secrets_manager = ETHKeyFileSecretManger("som-password")
+        encrypted_value = binascii.hexlify(json.dumps(
+            config_crypt._create_v3_keyfile_json(b"secret", b"som-password")).encode()).decode()
+
+        self.assertEqual("secret", secrets_manager.decrypt_secret_value("attr", encrypted_value))
+        with self.assertRaisesRegex(ValueError, "MAC mismatch"):
+            ETHKeyFileSecretManger("another-password").decrypt_secret_value("attr", encrypted_value)
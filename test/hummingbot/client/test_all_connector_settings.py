@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from hummingbot.client import settings
+from hummingbot.client.settings import AllConnectorSettings, ConnectorType, LazyConnectorSetting
+from hummingbot.connector.exchange.binance import binance_utils
+
+
+class AllConnectorSettingsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, "connector_settings_manifest.json")
+        self.original_settings = AllConnectorSettings.all_connector_settings
+        manifest_path_patch = patch.object(AllConnectorSettings,
+                                           "connector_settings_manifest_path",
+                                           return_value=self.manifest_path)
+        manifest_path_patch.start()
+        self.addCleanup(manifest_path_patch.stop)
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.all_connector_settings = self.original_settings
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_settings_are_created_from_utils_modules(self):
+        all_settings = AllConnectorSettings.create_connector_settings()
+
+        binance = all_settings["binance"]
+        self.assertIsInstance(binance, LazyConnectorSetting)
+        self.assertEqual(ConnectorType.Exchange, binance.type)
+        self.assertEqual(binance_utils.EXAMPLE_PAIR, binance.example_pair)
+        self.assertEqual(binance_utils.DEFAULT_FEES, binance.trade_fee_schema)
+        self.assertIs(binance_utils.KEYS, binance.config_keys)
+
+        binance_us = all_settings["binance_us"]
+        self.assertTrue(binance_us.is_sub_domain)
+        self.assertEqual("binance", binance_us.parent_name)
+        self.assertEqual(binance_utils.OTHER_DOMAINS_PARAMETER["binance_us"], binance_us.domain_parameter)
+        self.assertEqual(binance_utils.OTHER_DOMAINS_DEFAULT_FEES["binance_us"], binance_us.trade_fee_schema)
+        self.assertIs(binance_utils.OTHER_DOMAINS_KEYS["binance_us"], binance_us.config_keys)
+
+    def test_manifest_is_used_without_importing_utils_modules(self):
+        created_settings = AllConnectorSettings.create_connector_settings()
+        self.assertTrue(os.path.exists(self.manifest_path))
+
+        with open(self.manifest_path) as manifest_file:
+            unavailable_modules = [entry["module"] for entry in json.load(manifest_file)["connectors"]
+                                   if not entry["available"]]
+
+        with patch.object(settings.importlib, "import_module", side_effect=ModuleNotFoundError) as import_module_mock:
+            manifest_settings = AllConnectorSettings.create_connector_settings()
+            binance_fees = manifest_settings["binance"].trade_fee_schema
+
+        # Only the connectors that could not be imported are checked again
+        self.assertEqual(unavailable_modules, [call.args[0] for call in import_module_mock.call_args_list])
+        self.assertEqual(list(created_settings.keys()), list(manifest_settings.keys()))
+        self.assertEqual(created_settings["binance"].trade_fee_schema, binance_fees)
+
+    def test_manifest_is_recreated_when_utils_modules_change(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(self.manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        binance_entry = next(entry for entry in manifest["connectors"] if entry["name"] == "binance")
+        binance_entry["example_pair"] = "OLD-PAIR"
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        self.assertEqual("OLD-PAIR", AllConnectorSettings.create_connector_settings()["binance"].example_pair)
+
+        with patch.object(AllConnectorSettings, "_connector_utils_fingerprint", return_value="changed"):
+            all_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(binance_utils.EXAMPLE_PAIR, all_settings["binance"].example_pair)
+        with open(self.manifest_path) as manifest_file:
+            self.assertEqual("changed", json.load(manifest_file)["fingerprint"])
+
+    def test_manifest_fingerprint_changes_with_any_connector_source_file(self):
+        with tempfile.TemporaryDirectory() as connector_dir:
+            utils_path = os.path.join(connector_dir, "test_utils.py")
+            constants_path = os.path.join(connector_dir, "test_constants.py")
+            for path in (utils_path, constants_path):
+                with open(path, "w") as source_file:
+                    source_file.write("VALUE = 1\n")
+            utils_modules = [("exchange", "test", "hummingbot.connector.exchange.test.test_utils", utils_path)]
+            fingerprint = AllConnectorSettings._connector_utils_fingerprint(utils_modules)
+
+            with open(constants_path, "w") as source_file:
+                source_file.write("VALUE = 10\n")
+
+            self.assertNotEqual(fingerprint, AllConnectorSettings._connector_utils_fingerprint(utils_modules))
+
+    def test_unavailable_connectors_are_checked_again(self):
+        AllConnectorSettings.create_connector_settings()
+        with open(self.manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        binance_entry = next(entry for entry in manifest["connectors"] if entry["name"] == "binance")
+        binance_entry.clear()
+        binance_entry.update(name="binance", type="exchange", module=binance_utils.__name__, available=False)
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+
+        all_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertEqual(binance_utils.EXAMPLE_PAIR, all_settings["binance"].example_pair)
+        with open(self.manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+        self.assertTrue(next(entry for entry in manifest["connectors"] if entry["name"] == "binance")["available"])
+
+    def test_invalid_manifest_is_ignored(self):
+        with open(self.manifest_path, "w") as manifest_file:
+            manifest_file.write("{invalid")
+
+        all_settings = AllConnectorSettings.create_connector_settings()
+
+        self.assertIn("binance", all_settings)
+
+    def test_paper_trade_settings_share_lazy_config_keys(self):
+        AllConnectorSettings.create_connector_settings()
+        AllConnectorSettings.initialize_paper_trade_settings(["binance"])
+
+        paper_trade = AllConnectorSettings.all_connector_settings["binance_paper_trade"]
+        self.assertIsInstance(paper_trade, LazyConnectorSetting)
+        self.assertEqual("binance", paper_trade.parent_name)
+        self.assertIs(binance_utils.KEYS, paper_trade.config_keys)
+
+    def test_trade_fee_schema_json_round_trip(self):
+        schema = AllConnectorSettings._validate_trade_fee_schema("test", [0.1, 0.2])
+
+        restored = AllConnectorSettings._trade_fee_schema_from_json(
+            AllConnectorSettings._trade_fee_schema_to_json(schema))
+
+        self.assertEqual(schema, restored)
+        self.assertEqual(Decimal("0.002"), restored.taker_percent_fee_decimal)
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -326,3 +326,102 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         expected_fee_amount += flat_fees[0].amount * Decimal("0.9") * Decimal("2")
         expected_fee_amount += flat_fees[1].amount * Decimal("2")
         self.assertEqual(expected_fee_amount, performance_metric.fee_in_quote)
+
+    def test_accumulator_metrics_match_performance_metrics(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices["USDT-HBOT"] = Decimal("5")
+        rate_oracle._prices[trading_pair] = Decimal("110")
+        RateOracle._shared_instance = rate_oracle
+
+        trade_fee = AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("USDT", Decimal("2"))])
+        trades_data = [("someId0", "BUY", 100, 10), ("someId1", "SELL", 120, 15), ("someId2", "BUY", 90, 3)]
+        trades = [
+            TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=int(time.time()),
+                order_id=order_id,
+                trade_type=trade_type,
+                order_type="LIMIT",
+                price=price,
+                amount=amount,
+                trade_fee=trade_fee.to_json(),
+                exchange_trade_id=f"{order_id}-fill",
+                position=PositionAction.NIL.value,
+            )
+            for order_id, trade_type, price, amount in trades_data
+        ]
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(order_id=trade.order_id,
+                                  trade_type=trade.trade_type,
+                                  price=trade.price,
+                                  amount=trade.amount,
+                                  trade_fee=trade.trade_fee,
+                                  position=trade.position)
+
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics = self.async_run_with_timeout(accumulator.performance_metrics(cur_bals))
+
+        self.assertFalse(accumulator.are_derivatives)
+        self.assertEqual(expected.__dict__, metrics.__dict__)
+        self.assertEqual(expected.fees, metrics.fees)
+        self.assertEqual(Decimal("110"), metrics.cur_price)
+        self.assertEqual(Decimal("100"), metrics.start_price)
+
+    def test_accumulator_derivatives_trade_pnl_matches_performance_metrics(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("15")
+        RateOracle._shared_instance = rate_oracle
+
+        fee = AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("1"))])
+        trades_data = [
+            ("order1", "BUY", "OPEN", "10", "100"),
+            ("order2", "SELL", "OPEN", "20", "50"),
+            ("order1", "BUY", "OPEN", "12", "100"),
+            ("order3", "SELL", "CLOSE", "15", "150"),
+            ("order4", "BUY", "CLOSE", "18", "50"),
+            ("order3", "SELL", "CLOSE", "17", "50"),
+            ("order5", "BUY", "OPEN", "11", "10"),
+        ]
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        for i in range(len(trades_data)):
+            order_id, trade_type, position, price, amount = trades_data[i]
+            accumulator.add_trade(order_id=order_id,
+                                  trade_type=trade_type,
+                                  price=Decimal(price),
+                                  amount=Decimal(amount),
+                                  trade_fee=fee.to_json(),
+                                  position=position)
+
+            with patch("hummingbot.client.performance.PerformanceMetrics._is_trade_fill", return_value=True):
+                trades = [self.mock_trade(id=order_id, amount=Decimal(amount), price=Decimal(price),
+                                          position=position, type=trade_type, fee=fee)
+                          for order_id, trade_type, position, price, amount in trades_data[:i + 1]]
+                expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, {}))
+            metrics = self.async_run_with_timeout(accumulator.performance_metrics({}))
+
+            self.assertEqual(expected.trade_pnl, metrics.trade_pnl)
+            self.assertEqual(expected.total_pnl, metrics.total_pnl)
+        self.assertTrue(accumulator.are_derivatives)
+        # Long: (16 - 11) * 200, short: (20 - 18) * 50
+        self.assertEqual(Decimal("1100"), metrics.trade_pnl)
+
+    def test_accumulator_json_round_trip(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("USDT", Decimal("2"))])
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        accumulator.add_trade("order1", "BUY", Decimal("10"), Decimal("100"), fee.to_json(), "OPEN")
+        accumulator.add_trade("order2", "SELL", Decimal("15"), Decimal("60"), fee.to_json(), "CLOSE")
+
+        restored = PerformanceMetricsAccumulator.from_json(accumulator.to_json())
+        self.assertEqual(accumulator.to_json(), restored.to_json())
+
+        accumulator.add_trade("order2", "SELL", Decimal("17"), Decimal("40"), fee.to_json(), "CLOSE")
+        restored.add_trade("order2", "SELL", Decimal("17"), Decimal("40"), fee.to_json(), "CLOSE")
+        self.assertEqual(Decimal("600"), restored.derivative_pnl)
+        self.assertEqual(accumulator.to_json(), restored.to_json())
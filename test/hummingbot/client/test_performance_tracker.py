@@ -0,0 +1,236 @@
+import asyncio
+import os
+import tempfile
+from decimal import Decimal
+from typing import Awaitable
+from unittest import TestCase
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_tracker import PerformanceTracker
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+from hummingbot.model.trade_fill import TradeFill
+
+
+class PerformanceTrackerTests(TestCase):
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def setUp(self, engine_mock) -> None:
+        super().setUp()
+        self.display_name = "test_market"
+        self.config_file_path = "test_config.yml"
+        self.base = "COINALPHA"
+        self.quote = "HBOT"
+        self.trading_pair = f"{self.base}-{self.quote}"
+        self.start_time = 1640000000.0
+
+        engine_mock.return_value = create_engine("sqlite:///:memory:")
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.temp_dir.name, "performance_test_config.json")
+        self.listeners = []
+
+        rate_oracle = RateOracle()
+        rate_oracle._prices[self.trading_pair] = Decimal("105")
+        RateOracle._shared_instance = rate_oracle
+
+    def tearDown(self) -> None:
+        RateOracle._shared_instance = None
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def add_listener(self, event_tag, listener):
+        self.listeners.append((event_tag, listener))
+
+    def remove_listener(self, event_tag, listener):
+        self.listeners.remove((event_tag, listener))
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def create_tracker(self, start_time=None) -> PerformanceTracker:
+        return PerformanceTracker(sql=self.manager,
+                                  markets=[self],
+                                  config_file_path=self.config_file_path,
+                                  start_time=start_time or self.start_time,
+                                  checkpoint_path=self.checkpoint_path)
+
+    def fill_event(self, index: int, trade_type: TradeType = TradeType.BUY) -> OrderFilledEvent:
+        return OrderFilledEvent(
+            timestamp=self.start_time + index,
+            order_id=f"OID{index}",
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(100 + index),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id=f"EOID{index}",
+        )
+
+    def save_trade_fill(self, event: OrderFilledEvent):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.add(TradeFill(config_file_path=self.config_file_path,
+                                      strategy="test_strategy",
+                                      market=self.display_name,
+                                      symbol=event.trading_pair,
+                                      base_asset=self.base,
+                                      quote_asset=self.quote,
+                                      timestamp=int(event.timestamp * 1e3),
+                                      order_id=event.order_id,
+                                      trade_type=event.trade_type.name,
+                                      order_type=event.order_type.name,
+                                      price=event.price,
+                                      amount=event.amount,
+                                      leverage=1,
+                                      trade_fee=event.trade_fee.to_json(),
+                                      exchange_trade_id=event.exchange_trade_id,
+                                      position="NIL"))
+
+    def record_fill(self, tracker: PerformanceTracker, event: OrderFilledEvent):
+        self.save_trade_fill(event)
+        tracker._did_fill_order(MarketEvent.OrderFilled.value, self, event)
+
+    def test_fills_are_accumulated_per_market_trading_pair(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.assertEqual([(MarketEvent.OrderFilled, tracker._fill_order_forwarder)], self.listeners)
+
+        events = [self.fill_event(1), self.fill_event(2, TradeType.SELL), self.fill_event(3)]
+        for event in events:
+            self.record_fill(tracker, event)
+
+        self.assertEqual(3, tracker.num_trades)
+        self.assertEqual([(self.display_name, self.trading_pair)], list(tracker.accumulators.keys()))
+
+        balances = {self.base: Decimal("10"), self.quote: Decimal("1000")}
+        metrics = self.async_run_with_timeout(tracker.performance_metrics(self.display_name, self.trading_pair,
+                                                                          balances))
+        with self.manager.get_new_session() as session:
+            trades = session.query(TradeFill).order_by(TradeFill.timestamp).all()
+            expected = self.async_run_with_timeout(PerformanceMetrics.create(self.trading_pair, trades, balances))
+        self.assertEqual(expected.__dict__, metrics.__dict__)
+        self.assertIsNone(self.async_run_with_timeout(tracker.performance_metrics("other", self.trading_pair, {})))
+
+        tracker.stop()
+        self.assertEqual([], self.listeners)
+        self.assertTrue(os.path.exists(self.checkpoint_path))
+
+    def test_start_reads_trades_since_start_time_from_database(self):
+        self.save_trade_fill(self.fill_event(-1))
+        self.save_trade_fill(self.fill_event(1))
+        self.save_trade_fill(self.fill_event(2, TradeType.SELL))
+
+        tracker = self.create_tracker()
+        tracker.start()
+
+        accumulator = tracker.accumulators[(self.display_name, self.trading_pair)]
+        self.assertEqual(1, accumulator.num_buys)
+        self.assertEqual(1, accumulator.num_sells)
+        self.assertEqual(Decimal("101"), accumulator.start_price)
+
+    def test_restart_resumes_from_checkpoint(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(1))
+        self.record_fill(tracker, self.fill_event(2))
+        tracker.stop()
+        # Recorded while the tracker was stopped
+        self.save_trade_fill(self.fill_event(3))
+        expected_state = tracker.accumulators[(self.display_name, self.trading_pair)].to_json()
+
+        resumed_tracker = self.create_tracker()
+        with patch.object(PerformanceTracker, "_add_trade", autospec=True,
+                          side_effect=PerformanceTracker._add_trade) as add_trade_mock:
+            resumed_tracker.start()
+
+        # The trades in the checkpoint are not read again from the database
+        self.assertEqual(1, add_trade_mock.call_count)
+        self.assertEqual(3, resumed_tracker.num_trades)
+        key = (self.display_name, self.trading_pair)
+        self.assertEqual(int((self.start_time + 3) * 1e3), resumed_tracker._last_fill_timestamps[key])
+        resumed_state = resumed_tracker.accumulators[key].to_json()
+        self.assertEqual(expected_state["start_price"], resumed_state["start_price"])
+        self.assertEqual(Decimal(expected_state["b_vol_base"]) + 1, Decimal(resumed_state["b_vol_base"]))
+
+    def test_checkpoint_resumed_with_other_start_time_covering_the_same_trades(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(5))
+        tracker.stop()
+
+        resumed_tracker = self.create_tracker(start_time=self.start_time + 2)
+        with patch.object(PerformanceTracker, "_add_trade", autospec=True,
+                          side_effect=PerformanceTracker._add_trade) as add_trade_mock:
+            resumed_tracker.start()
+
+        add_trade_mock.assert_not_called()
+        self.assertEqual(1, resumed_tracker.num_trades)
+
+    def test_checkpoint_with_trades_before_start_time_is_ignored(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(1))
+        self.record_fill(tracker, self.fill_event(12))
+        tracker.stop()
+
+        new_session_tracker = self.create_tracker(start_time=self.start_time + 10)
+        new_session_tracker.start()
+
+        self.assertEqual(1, new_session_tracker.num_trades)
+        accumulator = new_session_tracker.accumulators[(self.display_name, self.trading_pair)]
+        self.assertEqual(Decimal("112"), accumulator.start_price)
+
+    def test_checkpoint_not_matching_trades_database_is_ignored(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(1))
+        self.record_fill(tracker, self.fill_event(2))
+        tracker.stop()
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                session.query(TradeFill).filter(TradeFill.order_id == "OID2").delete()
+
+        resumed_tracker = self.create_tracker()
+        resumed_tracker.start()
+
+        self.assertEqual(1, resumed_tracker.num_trades)
+        self.assertEqual(int((self.start_time + 1) * 1e3),
+                         resumed_tracker._last_fill_timestamps[(self.display_name, self.trading_pair)])
+
+    def test_checkpoint_only_skips_trades_already_accumulated(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(1))
+        tracker.stop()
+        # Another fill with the same timestamp as the last one in the checkpoint
+        same_timestamp_event = self.fill_event(1)._replace(order_id="OID1b", exchange_trade_id="EOID1b")
+        self.save_trade_fill(same_timestamp_event)
+
+        resumed_tracker = self.create_tracker()
+        resumed_tracker.start()
+
+        self.assertEqual(2, resumed_tracker.num_trades)
+
+    def test_checkpoint_saved_periodically_on_fills(self):
+        tracker = self.create_tracker()
+        tracker.start()
+        self.record_fill(tracker, self.fill_event(1))
+        self.assertFalse(os.path.exists(self.checkpoint_path))
+
+        tracker._last_checkpoint_time -= PerformanceTracker.CHECKPOINT_INTERVAL
+        self.record_fill(tracker, self.fill_event(2))
+        self.assertTrue(os.path.exists(self.checkpoint_path))
@@ -0,0 +1,121 @@
+import tempfile
+from decimal import Decimal
+from typing import List, Tuple
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade import create_replay_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.order_book_replay_driver import OrderBookReplayDriver
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+
+class ReplayTestStrategy(StrategyPyBase):
+
+    def __init__(self, market, trading_pair: str):
+        super().__init__()
+        self._market = market
+        self._trading_pair = trading_pair
+        self.order_placed = False
+        self.best_bids: List[Tuple[float, float]] = []
+        self.add_markets([market])
+
+    def tick(self, timestamp: float):
+        if not self._market.ready:
+            return
+        self.best_bids.append((timestamp, float(self._market.get_price(self._trading_pair, False))))
+        if not self.order_placed:
+            self._market.buy(self._trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"))
+            self.order_placed = True
+
+
+class OrderBookReplayDriverTests(TestCase):
+    start_timestamp = 1640000000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        recorder = OrderBookRecorder(self.temp_dir.name, self.exchange)
+        for message in [
+            self.snapshot_message(1, 0),
+            self.diff_message(2, 2.5, bids=[["99.5", "1"]]),
+            self.diff_message(3, 2.7, bids=[["99.8", "1"]]),
+            self.trade_message(4.5, price=99.0),
+            self.diff_message(4, 6, bids=[["99.8", "0"]]),
+        ]:
+            recorder.record(message)
+        recorder.flush()
+
+        self.market = create_replay_paper_trade_market(
+            exchange_name=self.exchange,
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=[self.trading_pair],
+            records_path=self.temp_dir.name)
+        self.market.set_balance("COINALPHA", Decimal("100"))
+        self.market.set_balance("HBOT", Decimal("100000"))
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 10)
+        self.strategy = ReplayTestStrategy(self.market, self.trading_pair)
+        self.clock.add_iterator(self.market)
+        self.clock.add_iterator(self.strategy)
+        self.order_filled_logger = EventLogger()
+        self.market.add_listener(MarketEvent.OrderFilled, self.order_filled_logger)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def snapshot_message(self, update_id: int, delay: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": [["99", "1"]], "asks": [["101", "1"]]},
+            timestamp=self.start_timestamp + delay)
+
+    def diff_message(self, update_id: int, delay: float, bids) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": []},
+            timestamp=self.start_timestamp + delay)
+
+    def trade_message(self, delay: float, price: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair, "trade_type": 2.0, "trade_id": "T1", "price": price, "amount": 1},
+            timestamp=self.start_timestamp + delay)
+
+    def test_driver_requires_backtest_clock(self):
+        with self.assertRaises(ValueError):
+            OrderBookReplayDriver(Clock(ClockMode.REALTIME), self.market)
+
+    def test_replay_ticks_see_order_books_at_tick_time(self):
+        report = OrderBookReplayDriver(self.clock, self.market).run()
+
+        self.assertEqual(4, report.messages)
+        self.assertEqual(1, report.trades)
+        self.assertEqual(6, report.ticks)
+        self.assertEqual(self.start_timestamp + 6, report.end_timestamp)
+        self.assertGreater(report.events_per_second, 0)
+        self.assertEqual(
+            [(self.start_timestamp + 1, 99.0),
+             (self.start_timestamp + 2, 99.0),
+             (self.start_timestamp + 3, 99.8),
+             (self.start_timestamp + 4, 99.8),
+             (self.start_timestamp + 5, 99.8),
+             (self.start_timestamp + 6, 99.5)],
+            self.strategy.best_bids)
+
+    def test_replayed_trades_fill_limit_orders(self):
+        OrderBookReplayDriver(self.clock, self.market).run()
+
+        self.assertTrue(self.strategy.order_placed)
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        fill_event = self.order_filled_logger.event_log[0]
+        self.assertEqual(Decimal("100"), fill_event.price)
+        self.assertEqual(Decimal("1"), fill_event.amount)
@@ -2,15 +2,17 @@ import copy
 import unittest
 import unittest.mock
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.connector_base import ConnectorBase, OrderFilledEvent
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
+from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent
 
 
 class InFightOrderTest(InFlightOrderBase):
@@ -32,16 +34,11 @@ class MockTestConnector(ConnectorBase):
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
         self._in_flight_orders = {}
-        self._event_logs = []
 
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrder]:
         return self._in_flight_orders
 
-    @property
-    def event_logs(self) -> List:
-        return self._event_logs
-
 
 class ConnectorBaseUnitTest(unittest.TestCase):
     @classmethod
@@ -67,6 +64,20 @@ class ConnectorBaseUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("300"), bals["USDT"])
         self.assertEqual(Decimal("1.5"), bals["HBOT"])
 
+    def test_in_flight_asset_balances_of_the_snapshot_are_reused_until_a_new_snapshot_is_taken(self):
+        connector = ConnectorBase(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        order = InFightOrderTest("1", "A", "HBOT-USDT", OrderType.LIMIT, TradeType.BUY, 100, 1, 1640001112.0, "live")
+        connector.in_flight_orders_snapshot = snapshot = {"1": order}
+
+        self.assertEqual({"USDT": Decimal("100")}, connector.in_flight_asset_balances(snapshot))
+
+        order.amount = Decimal(2)
+        self.assertEqual({"USDT": Decimal("100")}, connector.in_flight_asset_balances(snapshot))
+        self.assertEqual({"USDT": Decimal("200")}, connector.in_flight_asset_balances({"1": order}))
+
+        connector.in_flight_orders_snapshot = snapshot = {"1": order}
+        self.assertEqual({"USDT": Decimal("200")}, connector.in_flight_asset_balances(snapshot))
+
     def test_estimated_available_balance_with_no_order_during_snapshot_is_the_registered_available_balance(self):
         connector = MockTestConnector(client_config_map=ClientConfigAdapter(ClientConfigMap()))
         connector.real_time_balance_update = True
@@ -244,7 +255,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(2),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -279,7 +290,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(2),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -338,7 +349,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         initial_buy_order.executed_amount_base = buy_fill_event.amount
         initial_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -352,7 +363,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         initial_sell_order.executed_amount_base = sell_fill_event.amount
         initial_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -417,7 +428,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         initial_buy_order.executed_amount_base = buy_fill_event.amount
         initial_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -431,7 +442,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         initial_sell_order.executed_amount_base = sell_fill_event.amount
         initial_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -520,7 +531,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.5"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(buy_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, buy_fill_event)
         current_buy_order.executed_amount_base = buy_fill_event.amount
         current_buy_order.executed_amount_quote = buy_fill_event.amount * buy_fill_event.price
 
@@ -534,7 +545,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal("0.1"),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(sell_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, sell_fill_event)
         current_sell_order.executed_amount_base = sell_fill_event.amount
         current_sell_order.executed_amount_quote = sell_fill_event.amount * sell_fill_event.price
 
@@ -548,7 +559,7 @@ class ConnectorBaseUnitTest(unittest.TestCase):
             amount=Decimal(3),
             trade_fee=AddedToCostTradeFee(),
         )
-        connector._event_logs.append(extra_fill_event)
+        connector.trigger_event(MarketEvent.OrderFilled, extra_fill_event)
 
         estimated_coinalpha_balance = connector.apply_balance_update_since_snapshot(
             currency="COINALPHA",
@@ -570,3 +581,36 @@ class ConnectorBaseUnitTest(unittest.TestCase):
                                 + (current_sell_order.executed_amount_quote)
                                 - (extra_fill_event.amount * extra_fill_event.price))
         self.assertEqual(expected_hbot_amount, estimated_hbot_balance)
+
+    def test_confirmed_new_order_filled_event_uses_recent_ids_indexes(self):
+        connector = ConnectorBase(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        connector.add_exchange_order_ids_from_market_recorder({"EOID1": "OID1"})
+        connector.add_trade_fills_from_market_recorder(
+            {TradeFillOrderDetails(connector.display_name, "TID1", "HBOT-USDT")})
+
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID1", "EOID1", "HBOT-USDT"))
+        self.assertTrue(connector.is_confirmed_new_order_filled_event("TID2", "EOID1", "HBOT-USDT"))
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID3", "EOID2", "HBOT-USDT"))
+
+    def test_confirmed_new_order_filled_event_looks_up_the_markets_recorder_on_miss(self):
+        connector = ConnectorBase(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        markets_recorder = unittest.mock.MagicMock()
+        markets_recorder.get_order_id_for_exchange_order_id.side_effect = (
+            lambda market, exchange_order_id: "OID1" if exchange_order_id == "EOID1" else None)
+        markets_recorder.is_trade_fill_recorded.side_effect = (
+            lambda market, exchange_trade_id, trading_pair: exchange_trade_id == "TID1")
+        connector.set_markets_recorder(markets_recorder)
+
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID1", "EOID1", "HBOT-USDT"))
+        self.assertTrue(connector.is_confirmed_new_order_filled_event("TID2", "EOID1", "HBOT-USDT"))
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID3", "EOID2", "HBOT-USDT"))
+        self.assertFalse(connector.is_confirmed_new_order_filled_event("TID4", "EOID2", "HBOT-USDT"))
+
+        # The results are indexed, the unknown exchange order id is looked up only once
+        self.assertEqual(2, markets_recorder.get_order_id_for_exchange_order_id.call_count)
+        self.assertEqual("OID1", connector._exchange_order_ids.get("EOID1"))
+        self.assertIn(TradeFillOrderDetails(connector.display_name, "TID1", "HBOT-USDT"),
+                      connector._current_trade_fills)
+
+        connector.add_exchange_order_ids_from_market_recorder({"EOID2": "OID2"})
+        self.assertTrue(connector.is_confirmed_new_order_filled_event("TID4", "EOID2", "HBOT-USDT"))
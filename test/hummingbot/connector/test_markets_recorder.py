@@ -1,9 +1,11 @@
+import asyncio
 import time
 from decimal import Decimal
 from unittest import TestCase
-from unittest.mock import patch
+from unittest.mock import PropertyMock, patch
 
 from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -17,7 +19,9 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
+from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 
@@ -49,6 +53,44 @@ class MarketsRecorderTests(TestCase):
     def add_exchange_order_ids_from_market_recorder(self, current_exchange_order_ids):
         pass
 
+    def set_markets_recorder(self, markets_recorder):
+        pass
+
+    def add_listener(self, event_tag, listener):
+        pass
+
+    def remove_listener(self, event_tag, listener):
+        pass
+
+    @patch("hummingbot.model.sql_connection_manager.create_engine")
+    def create_write_behind_recorder(self, engine_mock) -> MarketsRecorder:
+        # The writer thread and the test share the same in memory database connection
+        engine_mock.return_value = create_engine("sqlite:///:memory:",
+                                                 connect_args={"check_same_thread": False},
+                                                 poolclass=StaticPool)
+        self.manager = SQLConnectionManager(
+            ClientConfigAdapter(ClientConfigMap()), SQLConnectionType.TRADE_FILLS, db_name="test_DB"
+        )
+        return MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            write_behind=True,
+        )
+
+    def buy_order_created_event(self, order_id: str) -> BuyOrderCreatedEvent:
+        return BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id=order_id,
+            creation_timestamp=1640001112.223,
+            exchange_order_id=f"E{order_id}",
+        )
+
     def test_properties(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -220,6 +262,42 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_recorded_trade_fills_and_orders_lookup(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        create_event = BuyOrderCreatedEvent(
+            timestamp=1642010000,
+            type=OrderType.LIMIT,
+            trading_pair=self.trading_pair,
+            amount=Decimal(1),
+            price=Decimal(1000),
+            order_id="OID1-1642010000000000",
+            creation_timestamp=1640001112.223,
+            exchange_order_id="EOID1",
+        )
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+
+        self.assertTrue(recorder.is_trade_fill_recorded(self, "TradeId1", self.trading_pair))
+        self.assertFalse(recorder.is_trade_fill_recorded(self, "TradeId2", self.trading_pair))
+        self.assertEqual(create_event.order_id, recorder.get_order_id_for_exchange_order_id(self, "EOID1"))
+        self.assertIsNone(recorder.get_order_id_for_exchange_order_id(self, "EOID2"))
+
     def test_create_order_and_completed(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -266,3 +344,198 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def test_write_behind_records_are_saved_on_flush(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.start()
+
+        create_event = self.buy_order_created_event("OID1")
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, create_event)
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id=create_event.order_id,
+            trading_pair=create_event.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=create_event.type,
+            price=Decimal(1010),
+            amount=create_event.amount,
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        with patch.object(recorder._trade_fill_exporter, "append") as append_mock:
+            recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+            # The reads from the event loop wait for the pending records without blocking it
+            asyncio.get_event_loop().run_until_complete(recorder.wait_for_pending_writes())
+            trades = recorder.get_trades_for_config(self.config_file_path)
+
+        append_mock.assert_called_once()
+        self.assertEqual(1, len(trades))
+        self.assertEqual("TradeId1", trades[0].exchange_trade_id)
+        self.assertEqual(0, recorder.pending_writes)
+        with self.manager.get_new_session() as session:
+            order = session.query(Order).one()
+            self.assertEqual(MarketEvent.OrderFilled.name, order.last_status)
+            self.assertEqual(2, len(order.status))
+
+        recorder.stop()
+
+    def test_write_behind_market_states_are_debounced(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.start()
+
+        with patch.object(type(self), "tracking_states", new_callable=PropertyMock, create=True) as tracking_states_mock:
+            tracking_states_mock.return_value = {"OID1": "state"}
+            for i in range(5):
+                recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self,
+                                           self.buy_order_created_event(f"OID{i}"))
+            recorder.flush()
+
+            # Serialized once for all the order creations
+            tracking_states_mock.assert_called_once()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(5, session.query(Order).count())
+            market_state = session.query(MarketState).one()
+            self.assertEqual({"OID1": "state"}, market_state.saved_state)
+
+        recorder.stop()
+
+    def test_write_behind_market_states_saved_after_interval(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.MARKET_STATES_SAVE_INTERVAL = 0.01
+        recorder.start()
+        self.tracking_states = {"OID1": "state"}
+
+        recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self, self.buy_order_created_event("OID1"))
+        asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.05))
+        recorder._write_queue.join()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual({"OID1": "state"}, session.query(MarketState).one().saved_state)
+
+        recorder.stop()
+
+    def test_write_behind_stop_flushes_pending_records(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.start()
+
+        for i in range(3):
+            recorder._did_create_order(MarketEvent.BuyOrderCreated.value, self,
+                                       self.buy_order_created_event(f"OID{i}"))
+        recorder.stop()
+
+        self.assertIsNone(recorder._writer_thread)
+        with self.manager.get_new_session() as session:
+            self.assertEqual(3, session.query(Order).count())
+            self.assertEqual(1, session.query(MarketState).count())
+
+    def test_write_behind_failed_write_does_not_discard_batch(self):
+        recorder = self.create_write_behind_recorder()
+
+        def failing_write(session):
+            raise ValueError("Test error")
+
+        # Queued before the writer starts, so that they are saved in the same batch
+        recorder._record(lambda session: session.add(OrderStatus(order_id="OID1", timestamp=1, status="Test")))
+        recorder._record(failing_write)
+        recorder._record(lambda session: session.add(OrderStatus(order_id="OID2", timestamp=2, status="Test")))
+
+        with patch.object(recorder.logger(), "error") as error_mock:
+            recorder.start()
+            recorder.flush()
+            error_mock.assert_called_once()
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(["OID1", "OID2"],
+                             [status.order_id for status in session.query(OrderStatus).order_by(OrderStatus.timestamp)])
+
+        recorder.stop()
+
+    def test_write_behind_trade_fills_are_exported_once_when_a_batch_is_retried(self):
+        recorder = self.create_write_behind_recorder()
+
+        def failing_write(session):
+            raise ValueError("Test error")
+
+        fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="TradeId1"
+        )
+        # Queued before the writer starts, so that they are saved in the same batch
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, fill_event)
+        recorder._record(failing_write)
+
+        with patch.object(recorder._trade_fill_exporter, "append") as append_mock:
+            with patch.object(recorder.logger(), "error"):
+                recorder.start()
+                recorder.flush()
+
+        append_mock.assert_called_once()
+        self.assertEqual(1, len(recorder.get_trades_for_config(self.config_file_path)))
+
+        recorder.stop()
+
+    def test_write_behind_export_error_does_not_stop_the_writer(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.start()
+
+        with patch.object(recorder._trade_fill_exporter, "flush", side_effect=OSError("No space left on device")):
+            with patch.object(recorder.logger(), "error") as error_mock:
+                recorder._record(lambda session: session.add(OrderStatus(order_id="OID1", timestamp=1, status="Test")))
+                recorder.flush()
+                error_mock.assert_called_once()
+
+        # The writer thread keeps saving the records
+        recorder._record(lambda session: session.add(OrderStatus(order_id="OID2", timestamp=2, status="Test")))
+        recorder.flush()
+        with self.manager.get_new_session() as session:
+            self.assertEqual(2, session.query(OrderStatus).count())
+
+        recorder.stop()
+
+    @patch.object(MarketsRecorder, "MAX_PENDING_WRITES", 2)
+    def test_write_behind_records_overflowing_the_queue_are_kept_in_order(self):
+        recorder = self.create_write_behind_recorder()
+
+        with patch.object(recorder.logger(), "warning") as warning_mock:
+            for i in range(5):
+                recorder._record(lambda session, i=i: session.add(OrderStatus(order_id=f"OID{i}",
+                                                                              timestamp=i,
+                                                                              status="Test")))
+            warning_mock.assert_called_once()
+
+        self.assertEqual(5, recorder.pending_writes)
+
+        recorder.start()
+        recorder.flush()
+
+        self.assertEqual(0, recorder.pending_writes)
+        with self.manager.get_new_session() as session:
+            self.assertEqual([f"OID{i}" for i in range(5)],
+                             [status.order_id for status in session.query(OrderStatus).order_by(OrderStatus.id)])
+
+        recorder.stop()
+
+    @patch.object(MarketsRecorder, "MAX_PENDING_WRITES", 2)
+    def test_write_behind_wait_for_pending_writes_includes_overflowing_records(self):
+        recorder = self.create_write_behind_recorder()
+        recorder.OVERFLOW_DRAIN_INTERVAL = 0.01
+        recorder.start()
+
+        for i in range(5):
+            recorder._record(lambda session, i=i: session.add(OrderStatus(order_id=f"OID{i}",
+                                                                          timestamp=i,
+                                                                          status="Test")))
+        asyncio.get_event_loop().run_until_complete(asyncio.wait_for(recorder.wait_for_pending_writes(), 1))
+
+        with self.manager.get_new_session() as session:
+            self.assertEqual(5, session.query(OrderStatus).count())
+
+        recorder.stop()
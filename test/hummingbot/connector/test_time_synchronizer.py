@@ -75,3 +75,51 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_time_extrapolates_offset_with_measured_skew(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        # the offset grows 0.1 ms per second of local time
+        for local_seconds in [0, 60, 120]:
+            time_provider.add_time_offset_ms_sample(1000 + local_seconds * 0.1, local_time_ms=local_seconds * 1e3)
+
+        self.assertAlmostEqual(1e-4, time_provider.skew)
+        self.assertAlmostEqual(1012, time_provider.time_offset_ms)
+
+        seconds_counter_mock.return_value = 220
+        self.assertAlmostEqual(220 + 1.022, time_provider.time())
+
+    def test_skew_not_fitted_on_short_span_or_outliers(self):
+        time_provider = TimeSynchronizer()
+        for local_seconds in [0, 10, 20]:
+            time_provider.add_time_offset_ms_sample(local_seconds * 0.1, local_time_ms=local_seconds * 1e3)
+        self.assertEqual(0, time_provider.skew)
+
+        time_provider.clear_time_offset_ms_samples()
+        for local_seconds, offset in [(0, 0), (60, 0), (120, 5000)]:
+            time_provider.add_time_offset_ms_sample(offset, local_time_ms=local_seconds * 1e3)
+        self.assertEqual(0, time_provider.skew)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_resync_due_after_interval_driven_by_skew(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        self.assertTrue(time_provider.resync_due)
+
+        time_provider.add_time_offset_ms_sample(0, local_time_ms=0)
+        self.assertEqual(TimeSynchronizer.MIN_RESYNC_INTERVAL, time_provider.resync_interval)
+        seconds_counter_mock.return_value = 30
+        self.assertFalse(time_provider.resync_due)
+        seconds_counter_mock.return_value = 60
+        self.assertTrue(time_provider.resync_due)
+
+        # 0.5 ms of drift per second reaches the 250 ms tolerance after 500 seconds
+        for local_seconds in [60, 120]:
+            time_provider.add_time_offset_ms_sample(local_seconds * 0.5, local_time_ms=local_seconds * 1e3)
+        self.assertAlmostEqual(500, time_provider.resync_interval)
+        seconds_counter_mock.return_value = 120 + 499
+        self.assertFalse(time_provider.resync_due)
+        seconds_counter_mock.return_value = 120 + 500
+        self.assertTrue(time_provider.resync_due)
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertTrue(time_provider.resync_due)
@@ -0,0 +1,163 @@
+import csv
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.trade_fill_exporter import TradeFillExporter
+
+
+class TradeFillExporterTests(unittest.TestCase):
+    field_names = ("exchange_trade_id", "price", "amount", "trade_fee")
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, "trades_test.csv")
+        self.now = pd.Timestamp("2022-01-01 10:00:00", tz="UTC")
+        self.exporters: List[TradeFillExporter] = []
+
+    def tearDown(self) -> None:
+        for exporter in self.exporters:
+            exporter.close()
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def create_exporter(self, **kwargs) -> TradeFillExporter:
+        exporter = TradeFillExporter(**kwargs)
+        exporter._now = lambda: self.now
+        self.exporters.append(exporter)
+        return exporter
+
+    def read_rows(self, path: str) -> List[List[str]]:
+        with open(path, newline="") as csv_file:
+            return list(csv.reader(csv_file))
+
+    def test_append_writes_header_once(self):
+        exporter = self.create_exporter()
+
+        exporter.append(self.csv_path, self.field_names, ("T1", Decimal("10.5"), Decimal("1"), {"percent": "0"}))
+        exporter.append(self.csv_path, self.field_names, ("T2", Decimal("11"), Decimal("2"), None))
+        exporter.flush()
+
+        self.assertEqual([list(self.field_names),
+                          ["T1", "10.5", "1", "{'percent': '0'}"],
+                          ["T2", "11", "2", ""]],
+                         self.read_rows(self.csv_path))
+
+    def test_header_checked_only_when_file_is_opened(self):
+        exporter = self.create_exporter()
+
+        with patch.object(TradeFillExporter, "_csv_matches_header", return_value=True) as header_check_mock:
+            exporter.append(self.csv_path, self.field_names, ("T1", 1, 1, None))
+            exporter.append(self.csv_path, self.field_names, ("T2", 1, 1, None))
+
+        # The file did not exist, there was no header to check
+        header_check_mock.assert_not_called()
+
+        exporter.close()
+        exporter.append(self.csv_path, self.field_names, ("T3", 1, 1, None))
+        exporter.append(self.csv_path, self.field_names, ("T4", 1, 1, None))
+        exporter.flush()
+
+        self.assertEqual(5, len(self.read_rows(self.csv_path)))
+
+    def test_existing_file_with_different_header_is_moved(self):
+        with open(self.csv_path, "w") as csv_file:
+            csv_file.write("old_field\nold_value\n")
+        exporter = self.create_exporter()
+
+        exporter.append(self.csv_path, self.field_names, ("T1", 1, 1, None))
+        exporter.flush()
+
+        old_path = os.path.join(self.temp_dir.name, "trades_test_old_20220101-100000.csv")
+        self.assertEqual([["old_field"], ["old_value"]], self.read_rows(old_path))
+        self.assertEqual([list(self.field_names), ["T1", "1", "1", ""]], self.read_rows(self.csv_path))
+
+    def test_existing_file_with_same_header_is_appended(self):
+        exporter = self.create_exporter()
+        exporter.append(self.csv_path, self.field_names, ("T1", 1, 1, None))
+        exporter.close()
+
+        exporter = self.create_exporter()
+        exporter.append(self.csv_path, self.field_names, ("T2", 1, 1, None))
+        exporter.flush()
+
+        self.assertEqual([list(self.field_names), ["T1", "1", "1", ""], ["T2", "1", "1", ""]],
+                         self.read_rows(self.csv_path))
+
+    def test_rotation_by_size(self):
+        exporter = self.create_exporter(max_file_size=60)
+
+        for i in range(4):
+            exporter.append(self.csv_path, self.field_names, (f"T{i}", 1000, 1000, None))
+        exporter.flush()
+
+        rotated_path = os.path.join(self.temp_dir.name, "trades_test_20220101-100000.csv")
+        rotated_rows = self.read_rows(rotated_path)
+        current_rows = self.read_rows(self.csv_path)
+        self.assertEqual(list(self.field_names), current_rows[0])
+        self.assertEqual(["T0", "T1", "T2", "T3"], [row[0] for row in rotated_rows[1:] + current_rows[1:]])
+
+    def test_rotation_by_date(self):
+        exporter = self.create_exporter(rotate_daily=True)
+
+        exporter.append(self.csv_path, self.field_names, ("T1", 1, 1, None))
+        self.now = pd.Timestamp("2022-01-02 00:00:01", tz="UTC")
+        exporter.append(self.csv_path, self.field_names, ("T2", 1, 1, None))
+        exporter.flush()
+
+        rotated_path = os.path.join(self.temp_dir.name, "trades_test_20220102-000001.csv")
+        self.assertEqual([list(self.field_names), ["T1", "1", "1", ""]], self.read_rows(rotated_path))
+        self.assertEqual([list(self.field_names), ["T2", "1", "1", ""]], self.read_rows(self.csv_path))
+
+    def test_parquet_export_disabled_without_engine(self):
+        with patch.object(TradeFillExporter, "parquet_engine_available", return_value=False):
+            with patch.object(TradeFillExporter.logger(), "warning") as warning_mock:
+                exporter = self.create_exporter(parquet_segment_size=10)
+
+        warning_mock.assert_called_once()
+        self.assertIsNone(exporter._parquet_segment_size)
+
+    @patch("pandas.DataFrame.to_parquet", autospec=True)
+    def test_parquet_segments(self, to_parquet_mock):
+        with patch.object(TradeFillExporter, "parquet_engine_available", return_value=True):
+            exporter = self.create_exporter(parquet_segment_size=2)
+
+        for i in range(3):
+            exporter.append(self.csv_path, self.field_names, (f"T{i}", Decimal("1.5"), 1, {"percent": "0"}))
+
+        self.assertEqual(1, to_parquet_mock.call_count)
+        df, segment_path = to_parquet_mock.call_args[0]
+        self.assertEqual(os.path.join(self.temp_dir.name, "trades_test_20220101-100000-000000.parquet"),
+                         segment_path)
+        self.assertEqual(["T0", "T1"], list(df["exchange_trade_id"]))
+        self.assertEqual([1.5, 1.5], list(df["price"]))
+        self.assertEqual(['{"percent": "0"}'] * 2, list(df["trade_fee"]))
+
+        # Remaining rows are written when the file is closed
+        exporter.close()
+        self.assertEqual(2, to_parquet_mock.call_count)
+        self.assertEqual(["T2"], list(to_parquet_mock.call_args[0][0]["exchange_trade_id"]))
+
+    def test_exporter_built_from_client_config(self):
+        config_map = ClientConfigAdapter(ClientConfigMap())
+        exporter = config_map.trades_export.build_trade_fill_exporter()
+        self.assertIsNone(exporter._max_file_size)
+        self.assertFalse(exporter._rotate_daily)
+        self.assertIsNone(exporter._parquet_segment_size)
+
+        config_map.trades_export.max_file_size_mb = Decimal("1.5")
+        config_map.trades_export.rotate_daily = True
+        config_map.trades_export.parquet_segment_size = 100
+        with patch.object(TradeFillExporter, "parquet_engine_available", return_value=True):
+            exporter = config_map.trades_export.build_trade_fill_exporter()
+        self.assertEqual(1572864, exporter._max_file_size)
+        self.assertTrue(exporter._rotate_daily)
+        self.assertEqual(100, exporter._parquet_segment_size)
@@ -0,0 +1,235 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Awaitable, List
+from unittest.mock import MagicMock
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.request_priority import (
+    DEFAULT_REQUEST_PRIORITY,
+    PriorityLanes,
+    RequestPriority,
+    current_request_priority,
+    request_priority,
+)
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowAsyncThrottler
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+TEST_LIMIT_ID = "TEST"
+TEST_OTHER_LIMIT_ID = "TEST_OTHER"
+TEST_POOL_ID = "TEST_POOL"
+
+
+class RequestPriorityTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def test_request_priority_context(self):
+        self.assertEqual(DEFAULT_REQUEST_PRIORITY, current_request_priority())
+
+        with request_priority(RequestPriority.CANCEL_ORDER):
+            self.assertEqual(RequestPriority.CANCEL_ORDER, current_request_priority())
+            with request_priority(RequestPriority.REFERENCE_DATA):
+                self.assertEqual(RequestPriority.REFERENCE_DATA, current_request_priority())
+            self.assertEqual(RequestPriority.CANCEL_ORDER, current_request_priority())
+
+        self.assertEqual(DEFAULT_REQUEST_PRIORITY, current_request_priority())
+
+    def test_request_priority_is_inherited_by_created_tasks(self):
+        async def task_priority() -> RequestPriority:
+            return current_request_priority()
+
+        async def run() -> RequestPriority:
+            with request_priority(RequestPriority.CREATE_ORDER):
+                return await asyncio.ensure_future(task_priority())
+
+        self.assertEqual(RequestPriority.CREATE_ORDER, self.async_run_with_timeout(run()))
+
+    def test_priority_lanes_precedence_and_metrics(self):
+        lanes = PriorityLanes()
+        lanes.enter(RequestPriority.CREATE_ORDER, [TEST_LIMIT_ID])
+
+        self.assertTrue(lanes.has_precedence(RequestPriority.CANCEL_ORDER, [TEST_LIMIT_ID]))
+        self.assertTrue(lanes.has_precedence(RequestPriority.CREATE_ORDER, [TEST_LIMIT_ID]))
+        self.assertFalse(lanes.has_precedence(RequestPriority.ORDER_STATUS, [TEST_LIMIT_ID]))
+        self.assertEqual(1, lanes.metrics()["CREATE_ORDER"]["queue_depth"])
+
+        lanes.leave(RequestPriority.CREATE_ORDER, 2, [TEST_LIMIT_ID])
+        lanes.enter(RequestPriority.CREATE_ORDER, [TEST_LIMIT_ID])
+        lanes.leave(RequestPriority.CREATE_ORDER, 1, [TEST_LIMIT_ID])
+
+        self.assertTrue(lanes.has_precedence(RequestPriority.REFERENCE_DATA, [TEST_LIMIT_ID]))
+        metrics = lanes.metrics()["CREATE_ORDER"]
+        self.assertEqual(0, metrics["queue_depth"])
+        self.assertEqual(2, metrics["requests"])
+        self.assertEqual(1.5, metrics["average_wait_time"])
+        self.assertEqual(2, metrics["max_wait_time"])
+
+    def test_priority_lanes_precedence_only_applies_to_the_same_limits(self):
+        lanes = PriorityLanes()
+        lanes.enter(RequestPriority.CANCEL_ORDER, [TEST_LIMIT_ID, TEST_POOL_ID])
+
+        self.assertTrue(lanes.has_precedence(RequestPriority.REFERENCE_DATA, [TEST_OTHER_LIMIT_ID]))
+        self.assertFalse(lanes.has_precedence(RequestPriority.REFERENCE_DATA, [TEST_LIMIT_ID]))
+        # A request only sharing a linked limit with the waiting one still yields
+        self.assertFalse(lanes.has_precedence(RequestPriority.REFERENCE_DATA, [TEST_OTHER_LIMIT_ID, TEST_POOL_ID]))
+
+        lanes.leave(RequestPriority.CANCEL_ORDER, 0, [TEST_LIMIT_ID, TEST_POOL_ID])
+
+        self.assertTrue(lanes.has_precedence(RequestPriority.REFERENCE_DATA, [TEST_OTHER_LIMIT_ID, TEST_POOL_ID]))
+
+    def test_priority_lanes_capacity_limit(self):
+        lanes = PriorityLanes()
+
+        self.assertEqual(10, lanes.capacity_limit(10, 1, RequestPriority.CANCEL_ORDER))
+        self.assertEqual(10, lanes.capacity_limit(10, 1, RequestPriority.ORDER_STATUS))
+        self.assertEqual(8, lanes.capacity_limit(10, 1, RequestPriority.REFERENCE_DATA))
+        # A request heavier than the reduced limit can still run on an otherwise empty limit
+        self.assertEqual(10, lanes.capacity_limit(10, 10, RequestPriority.REFERENCE_DATA))
+
+    def test_async_throttler_serves_higher_priority_requests_first(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_LIMIT_ID, limit=1, time_interval=0.1)],
+                                   retry_interval=0.01,
+                                   safety_margin_pct=0)
+        executed: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_LIMIT_ID, priority=priority):
+                executed.append(priority)
+
+        async def run():
+            # The first request takes all the capacity, the rest have to wait for it
+            await request(RequestPriority.ORDER_STATUS)
+            await asyncio.gather(request(RequestPriority.REFERENCE_DATA),
+                                 request(RequestPriority.CREATE_ORDER),
+                                 request(RequestPriority.CANCEL_ORDER))
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual([RequestPriority.ORDER_STATUS,
+                          RequestPriority.CANCEL_ORDER,
+                          RequestPriority.CREATE_ORDER,
+                          RequestPriority.REFERENCE_DATA],
+                         executed)
+        metrics = throttler.priority_metrics()
+        self.assertEqual(0, metrics["CANCEL_ORDER"]["queue_depth"])
+        self.assertEqual(1, metrics["REFERENCE_DATA"]["requests"])
+        self.assertGreater(metrics["REFERENCE_DATA"]["max_wait_time"], metrics["CANCEL_ORDER"]["max_wait_time"])
+
+    def test_async_throttler_keeps_capacity_reserve_for_urgent_requests(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_LIMIT_ID, limit=5, time_interval=5)],
+                                   limits_share_percentage=Decimal("100"))
+
+        async def run(no_request: int, priority: RequestPriority):
+            for _ in range(no_request):
+                async with throttler.execute_task(limit_id=TEST_LIMIT_ID, priority=priority):
+                    pass
+
+        self.async_run_with_timeout(run(4, RequestPriority.REFERENCE_DATA))
+
+        self.assertFalse(throttler.execute_task(TEST_LIMIT_ID, RequestPriority.REFERENCE_DATA).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_LIMIT_ID, RequestPriority.CANCEL_ORDER).within_capacity())
+
+    def test_sliding_window_throttler_serves_higher_priority_requests_first(self):
+        throttler = SlidingWindowAsyncThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_LIMIT_ID, limit=1, time_interval=0.1)],
+            retry_interval=0.01,
+            safety_margin_pct=0)
+        executed: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(limit_id=TEST_LIMIT_ID, priority=priority):
+                executed.append(priority)
+
+        async def run():
+            await request(RequestPriority.ORDER_STATUS)
+            await asyncio.gather(request(RequestPriority.REFERENCE_DATA),
+                                 request(RequestPriority.ORDER_STATUS),
+                                 request(RequestPriority.CANCEL_ORDER))
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual([RequestPriority.ORDER_STATUS,
+                          RequestPriority.CANCEL_ORDER,
+                          RequestPriority.ORDER_STATUS,
+                          RequestPriority.REFERENCE_DATA],
+                         executed)
+        self.assertEqual(2, throttler.priority_metrics()["ORDER_STATUS"]["requests"])
+
+    def test_async_throttler_waiting_urgent_requests_do_not_block_unrelated_limits(self):
+        throttler = AsyncThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_LIMIT_ID, limit=1, time_interval=0.5),
+                         RateLimit(limit_id=TEST_OTHER_LIMIT_ID, limit=10, time_interval=0.5)],
+            retry_interval=0.01,
+            safety_margin_pct=0)
+        executed: List[RequestPriority] = []
+
+        async def request(limit_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                executed.append(priority)
+
+        async def run():
+            await request(TEST_LIMIT_ID, RequestPriority.ORDER_STATUS)
+            # The cancel waits for TEST_LIMIT_ID, the reference data request is free to use TEST_OTHER_LIMIT_ID
+            cancel = asyncio.ensure_future(request(TEST_LIMIT_ID, RequestPriority.CANCEL_ORDER))
+            await asyncio.sleep(0.05)
+            await request(TEST_OTHER_LIMIT_ID, RequestPriority.REFERENCE_DATA)
+            self.assertFalse(cancel.done())
+            await cancel
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual([RequestPriority.ORDER_STATUS,
+                          RequestPriority.REFERENCE_DATA,
+                          RequestPriority.CANCEL_ORDER],
+                         executed)
+
+    def test_sliding_window_throttler_urgent_requests_take_precedence_on_linked_limits(self):
+        throttler = SlidingWindowAsyncThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=0.2),
+                         RateLimit(limit_id=TEST_LIMIT_ID, limit=10, time_interval=0.2,
+                                   linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+                         RateLimit(limit_id=TEST_OTHER_LIMIT_ID, limit=10, time_interval=0.2,
+                                   linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)])],
+            retry_interval=0.01,
+            safety_margin_pct=0)
+        executed: List[str] = []
+
+        async def request(limit_id: str, priority: RequestPriority):
+            async with throttler.execute_task(limit_id=limit_id, priority=priority):
+                executed.append(limit_id)
+
+        async def run():
+            await request(TEST_POOL_ID, RequestPriority.ORDER_STATUS)
+            await asyncio.gather(request(TEST_OTHER_LIMIT_ID, RequestPriority.REFERENCE_DATA),
+                                 request(TEST_LIMIT_ID, RequestPriority.CANCEL_ORDER))
+
+        self.async_run_with_timeout(run())
+
+        self.assertEqual([TEST_POOL_ID, TEST_LIMIT_ID, TEST_OTHER_LIMIT_ID], executed)
+
+    def test_rest_assistant_uses_context_priority(self):
+        throttler = MagicMock()
+        rest_assistant = RESTAssistant(connection=MagicMock(), throttler=throttler)
+        throttler.execute_task.side_effect = asyncio.CancelledError
+
+        async def run(priority=None):
+            try:
+                await rest_assistant.execute_request(url="https://test.url", throttler_limit_id=TEST_LIMIT_ID,
+                                                     priority=priority)
+            except asyncio.CancelledError:
+                pass
+
+        with request_priority(RequestPriority.CANCEL_ORDER):
+            self.async_run_with_timeout(run())
+        throttler.execute_task.assert_called_with(limit_id=TEST_LIMIT_ID, priority=RequestPriority.CANCEL_ORDER)
+
+        with request_priority(RequestPriority.CANCEL_ORDER):
+            self.async_run_with_timeout(run(RequestPriority.REFERENCE_DATA))
+        throttler.execute_task.assert_called_with(limit_id=TEST_LIMIT_ID, priority=RequestPriority.REFERENCE_DATA)
@@ -0,0 +1,150 @@
+import asyncio
+import sys
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import (
+    SlidingWindowAsyncThrottler,
+    SlidingWindowRequestContext,
+)
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+
+
+class SlidingWindowAsyncThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1640000000.0
+        self.sleeps: List[float] = []
+        SlidingWindowRequestContext._last_max_cap_warning_ts = 0.0
+        self.throttler = self.create_throttler(self.rate_limits)
+
+    def create_throttler(self, rate_limits: List[RateLimit], safety_margin_pct: float = 0.05):
+        throttler = SlidingWindowAsyncThrottler(
+            rate_limits=rate_limits,
+            safety_margin_pct=safety_margin_pct,
+            limits_share_percentage=Decimal("100"))
+        throttler.time = lambda: self.now
+
+        async def sleep(delay: float):
+            # Simulated clock, sleeping just moves the time forward
+            self.sleeps.append(delay)
+            self.now += delay
+
+        throttler.sleep = sleep
+        return throttler
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 1):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def execute_requests(self, no_request: int, limit_id: str):
+        for _ in range(no_request):
+            async with self.throttler.execute_task(limit_id=limit_id):
+                pass
+
+    def test_within_capacity_singular_non_weighted_task(self):
+        self.assertTrue(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+        self.async_run_with_timeout(self.execute_requests(1, TEST_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+        self.assertEqual(1, self.throttler.logged_tasks_count(TEST_POOL_ID))
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        self.async_run_with_timeout(self.execute_requests(1, TEST_POOL_ID))
+        # The path limit has capacity, but the linked pool limit does not
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.async_run_with_timeout(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID))
+        self.async_run_with_timeout(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID))
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_within_capacity_for_unknown_limit_id(self):
+        throttler = self.create_throttler([])
+        context = throttler.execute_task(limit_id="test_limit_id")
+        self.assertTrue(context.within_capacity())
+        self.async_run_with_timeout(context.acquire())
+
+    def test_acquire_waits_until_capacity_is_freed(self):
+        self.async_run_with_timeout(self.execute_requests(3, TEST_POOL_ID))
+
+        # Each request after the first one waits exactly until the previous one leaves the window
+        self.assertEqual(2, len(self.sleeps))
+        for delay in self.sleeps:
+            self.assertAlmostEqual(5.0 * 1.05, delay)
+        self.assertEqual(1, self.throttler.logged_tasks_count(TEST_POOL_ID))
+
+    def test_acquire_waits_for_the_most_restrictive_limit(self):
+        self.async_run_with_timeout(self.execute_requests(2, TEST_WEIGHTED_TASK_1_ID))
+        self.now += 1
+        self.async_run_with_timeout(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID))
+
+        # Pool capacity is 11/10, the first task 1 has to leave the window
+        self.assertEqual([5.0 * 1.05 - 1], self.sleeps)
+
+    def test_within_capacity_for_limits_with_milliseconds_interval(self):
+        per_second_limit = RateLimit(limit_id="generic_per_second", limit=3, time_interval=1)
+        per_millisecond_limit = RateLimit(limit_id="generic_per_millisecond", limit=2, time_interval=0.2)
+        specific_limit = RateLimit(limit_id="specific_limit", limit=sys.maxsize, time_interval=1, linked_limits=[
+            LinkedLimitWeightPair(per_second_limit.limit_id),
+            LinkedLimitWeightPair(per_millisecond_limit.limit_id),
+        ])
+        self.throttler = self.create_throttler([per_second_limit, per_millisecond_limit, specific_limit],
+                                               safety_margin_pct=0)
+
+        self.async_run_with_timeout(self.execute_requests(1, specific_limit.limit_id))
+        self.now += 0.01
+        self.assertTrue(self.throttler.execute_task(specific_limit.limit_id).within_capacity())
+
+        self.now += 0.09
+        self.async_run_with_timeout(self.execute_requests(1, specific_limit.limit_id))
+        self.assertFalse(self.throttler.execute_task(specific_limit.limit_id).within_capacity())
+
+        self.now += 0.09
+        self.assertFalse(self.throttler.execute_task(specific_limit.limit_id).within_capacity())
+
+        self.now += 0.02
+        self.assertTrue(self.throttler.execute_task(specific_limit.limit_id).within_capacity())
+
+    def test_set_rate_limits_keeps_used_capacity(self):
+        self.async_run_with_timeout(self.execute_requests(1, TEST_POOL_ID))
+        self.throttler.set_rate_limits(self.rate_limits)
+
+        self.assertEqual(1, self.throttler.logged_tasks_count(TEST_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    @patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext.logger")
+    def test_warning_logged_when_capacity_reached(self, logger_mock):
+        self.async_run_with_timeout(self.execute_requests(1, TEST_POOL_ID))
+        self.throttler.execute_task(TEST_POOL_ID).within_capacity()
+        logger_mock.return_value.notify.assert_called()
@@ -3,6 +3,7 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +51,95 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((11 + 12) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((10 + 2 * 9 + 8) / 4, result.result_price)
+
+        result = order_book.get_price_for_quote_volume(True, 30)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(30, result.result_volume)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(23, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(False, 100)
+        self.assertEqual(10 + 18 + 24, result.result_volume)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 10.5)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 9)
+        self.assertEqual(9, result.result_price)
+        self.assertEqual(10 + 18, result.result_volume)
+
+    def test_depth_queries_follow_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 12).result_volume)
+
+        order_book.apply_numpy_diffs(np.array([[9, 0, 2]], dtype=np.float64),
+                                     np.array([[11, 0, 2], [11.5, 4, 2]], dtype=np.float64))
+        self.assertEqual(6, order_book.get_volume_for_price(True, 12).result_volume)
+        self.assertEqual(11.5, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(1, order_book.get_volume_for_price(False, 1).result_volume)
+
+    def test_apply_raw_diffs(self):
+        order_book = OrderBook()
+        order_book.apply_raw_diffs([["10", "1"], ["9", "2"]], [["11", "1"], ["12", "2", "extra"]], 1)
+        bids, asks = order_book.snapshot
+        self.assertEqual([[10., 1., 1.], [9., 2., 1.]], bids.values.tolist())
+        self.assertEqual([[11., 1., 1.], [12., 2., 1.]], asks.values.tolist())
+        self.assertEqual(1, order_book.last_diff_uid)
+
+        order_book.apply_raw_diffs(np.array([[10, 0], [9.5, 3]], dtype=np.float64),
+                                   np.array([[11, 0.5]], dtype=np.float64),
+                                   2)
+        bids, asks = order_book.snapshot
+        self.assertEqual([[9.5, 3., 2.], [9., 2., 1.]], bids.values.tolist())
+        self.assertEqual([[11., 0.5, 2.], [12., 2., 1.]], asks.values.tolist())
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_apply_raw_diff_messages_matches_sequential_diffs(self):
+        messages = [
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 1, "bids": [["10", "1"]], "asks": [["11", "1"]]}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 2, "bids": [["10", "0"], ["9", "2"]], "asks": []}),
+            OrderBookMessage(OrderBookMessageType.DIFF,
+                             {"trading_pair": "A-B", "update_id": 3, "bids": [], "asks": [["11", "4"]]}),
+        ]
+        coalesced_book = OrderBook()
+        coalesced_book.apply_raw_diff_messages(messages)
+        sequential_book = OrderBook()
+        for message in messages:
+            sequential_book.apply_diffs(message.bids, message.asks, message.update_id)
+
+        coalesced_bids, coalesced_asks = coalesced_book.snapshot
+        sequential_bids, sequential_asks = sequential_book.snapshot
+        self.assertEqual(sequential_bids.values.tolist(), coalesced_bids.values.tolist())
+        self.assertEqual(sequential_asks.values.tolist(), coalesced_asks.values.tolist())
+        self.assertEqual(3, coalesced_book.last_diff_uid)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
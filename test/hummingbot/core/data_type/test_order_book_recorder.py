@@ -0,0 +1,214 @@
+import os
+import tempfile
+import unittest
+
+from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book_message import CoinbaseProOrderBookMessage
+from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookEntry, NdaxOrderBookMessage
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder, OrderBookRecordReader
+
+
+class OrderBookRecorderTests(unittest.TestCase):
+    # 2021-12-20 11:33:20 UTC
+    start_timestamp = 1640000000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root_path = self.temp_dir.name
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def diff_message(self, update_id: int, timestamp: float, trading_pair: str = None) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": trading_pair or self.trading_pair,
+             "update_id": update_id,
+             "first_update_id": update_id - 1,
+             "bids": [["10", "1"], ["9.5", "2"]],
+             "asks": [["11", "0"]]},
+            timestamp=timestamp)
+
+    def snapshot_message(self, update_id: int, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair,
+             "update_id": update_id,
+             "bids": [[10.0, 1.0]],
+             "asks": [[11.0, 3.0], [12.0, 4.0]]},
+            timestamp=timestamp)
+
+    def trade_message(self, trade_id: str, timestamp: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self.trading_pair,
+             "trade_type": 2.0,
+             "trade_id": trade_id,
+             "update_id": 7,
+             "price": "10.5",
+             "amount": "0.25"},
+            timestamp=timestamp)
+
+    def test_recorded_messages_are_read_back(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange)
+        messages = [self.snapshot_message(1, self.start_timestamp),
+                    self.diff_message(2, self.start_timestamp + 1),
+                    self.trade_message("T1", self.start_timestamp + 2)]
+        for message in messages:
+            recorder.record(message)
+        recorder.flush()
+
+        read_messages = list(OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair).messages())
+
+        self.assertEqual([message.type for message in messages], [message.type for message in read_messages])
+        self.assertEqual([message.timestamp for message in messages], [message.timestamp for message in read_messages])
+        snapshot, diff, trade = read_messages
+        self.assertEqual(1, snapshot.update_id)
+        self.assertEqual([[10.0, 1.0]], snapshot.content["bids"])
+        self.assertEqual([[11.0, 3.0], [12.0, 4.0]], snapshot.content["asks"])
+        self.assertEqual(2, diff.update_id)
+        self.assertEqual(1, diff.first_update_id)
+        self.assertEqual([[10.0, 1.0], [9.5, 2.0]], diff.content["bids"])
+        self.assertEqual([[11.0, 0.0]], diff.content["asks"])
+        self.assertEqual("T1", trade.trade_id)
+        self.assertEqual(2.0, trade.content["trade_type"])
+        self.assertEqual(10.5, trade.content["price"])
+        self.assertEqual(0.25, trade.content["amount"])
+
+    def test_chunks_are_partitioned_by_trading_pair_and_hour(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange, chunk_size=2)
+        for i in range(5):
+            recorder.record(self.diff_message(i + 1, self.start_timestamp + i))
+        recorder.record(self.diff_message(6, self.start_timestamp + 3600))
+        recorder.record(self.diff_message(1, self.start_timestamp, trading_pair="WETH-USDT"))
+        recorder.flush()
+
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+        chunks = reader.chunks()
+        self.assertEqual([2, 2, 1, 1], [chunk.message_count for chunk in chunks])
+        self.assertEqual(["20211220-11"] * 3 + ["20211220-12"], [os.path.dirname(chunk.chunk) for chunk in chunks])
+        self.assertEqual(self.start_timestamp + 2, chunks[1].first_timestamp)
+        self.assertEqual(self.start_timestamp + 3, chunks[1].last_timestamp)
+        self.assertEqual(list(range(1, 7)), [message.update_id for message in reader.messages()])
+        self.assertEqual(
+            1, len(list(OrderBookRecordReader(self.root_path, self.exchange, "WETH-USDT").messages())))
+
+    def test_messages_seek_to_timestamp(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange, chunk_size=3)
+        for i in range(10):
+            recorder.record(self.diff_message(i + 1, self.start_timestamp + i))
+        recorder.flush()
+
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+
+        self.assertEqual([5, 6, 7, 8, 9, 10],
+                         [message.update_id for message in reader.messages(start_timestamp=self.start_timestamp + 4)])
+        self.assertEqual([4, 5], [message.update_id for message in reader.messages(
+            start_timestamp=self.start_timestamp + 3, end_timestamp=self.start_timestamp + 4)])
+        self.assertEqual([], list(reader.messages(start_timestamp=self.start_timestamp + 100)))
+
+    def test_writer_thread_writes_queued_messages_on_stop(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange)
+        recorder.start()
+        self.assertTrue(recorder.is_running)
+        for i in range(100):
+            recorder.record(self.diff_message(i + 1, self.start_timestamp + i))
+        recorder.stop()
+
+        self.assertFalse(recorder.is_running)
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+        self.assertEqual(100, len(list(reader.messages())))
+
+    def test_messages_are_dropped_when_queue_is_full(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange, max_pending_messages=2)
+        for i in range(5):
+            recorder.record(self.diff_message(i + 1, self.start_timestamp + i))
+
+        self.assertEqual(3, recorder.dropped_messages)
+
+    def test_invalid_message_is_not_recorded(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange)
+        invalid_message = OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": 1, "bids": [["invalid", "1"]], "asks": []},
+            timestamp=self.start_timestamp)
+        recorder.record(invalid_message)
+        recorder.record(self.diff_message(2, self.start_timestamp + 1))
+
+        with self.assertLogs(level="ERROR"):
+            recorder.flush()
+
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+        self.assertEqual([2], [message.update_id for message in reader.messages()])
+
+    def test_connector_price_levels_are_recorded_through_the_message_accessors(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange)
+        entries = [NdaxOrderBookEntry(mdUpdateId=5, accountId=1, actionDateTime=1627935956059, actionType=0,
+                                      lastTradePrice=42211.51, orderId=1, price=41508.19, productPairCode=5,
+                                      quantity=1.5, side=0),
+                   NdaxOrderBookEntry(mdUpdateId=5, accountId=1, actionDateTime=1627935956059, actionType=2,
+                                      lastTradePrice=42211.51, orderId=2, price=42000.5, productPairCode=5,
+                                      quantity=2, side=1)]
+        recorder.record(NdaxOrderBookMessage(OrderBookMessageType.DIFF,
+                                             {"trading_pair": self.trading_pair, "data": entries},
+                                             timestamp=self.start_timestamp))
+        recorder.flush()
+
+        diff, = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair).messages()
+        self.assertEqual(5, diff.update_id)
+        self.assertEqual([[41508.19, 1.5]], diff.content["bids"])
+        self.assertEqual([[42000.5, 0.0]], diff.content["asks"])
+        self.assertEqual(0, recorder.unsupported_messages)
+
+    def test_messages_without_standard_price_levels_are_skipped(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange)
+        for i in range(2):
+            recorder.record(CoinbaseProOrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair, "sequence": i + 1, "type": "open", "price": "10", "side": "buy"},
+                timestamp=self.start_timestamp + i))
+        recorder.record(OrderBookMessage(OrderBookMessageType.TRADE,
+                                         {"trading_pair": self.trading_pair, "data": []},
+                                         timestamp=self.start_timestamp + 2))
+        recorder.record(self.diff_message(3, self.start_timestamp + 3))
+
+        with self.assertLogs(level="WARNING") as logs:
+            recorder.flush()
+
+        self.assertEqual(2, len(logs.records))
+        self.assertEqual(3, recorder.unsupported_messages)
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+        self.assertEqual([3], [message.update_id for message in reader.messages()])
+
+    def test_reader_without_records(self):
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+
+        self.assertEqual([], reader.chunks())
+        self.assertEqual([], list(reader.messages(start_timestamp=self.start_timestamp)))
+
+    def test_export_memory_mapped_record(self):
+        recorder = OrderBookRecorder(self.root_path, self.exchange, chunk_size=3)
+        recorder.record(self.snapshot_message(1, self.start_timestamp))
+        for i in range(2, 8):
+            recorder.record(self.diff_message(i, self.start_timestamp + i))
+        recorder.record(self.trade_message("T1", self.start_timestamp + 8))
+        recorder.flush()
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+
+        record = reader.export_memory_mapped(os.path.join(self.root_path, "memory_mapped"))
+
+        self.assertEqual([(message.type, message.content, message.timestamp) for message in reader.messages()],
+                         [(message.type, message.content, message.timestamp) for message in record.messages()])
+        self.assertEqual([6, 7], [message.update_id for message in record.messages(
+            start_timestamp=self.start_timestamp + 6, end_timestamp=self.start_timestamp + 7)])
+
+    def test_export_memory_mapped_record_without_messages(self):
+        reader = OrderBookRecordReader(self.root_path, self.exchange, self.trading_pair)
+
+        record = reader.export_memory_mapped(os.path.join(self.root_path, "memory_mapped"))
+
+        self.assertEqual([], list(record.messages()))
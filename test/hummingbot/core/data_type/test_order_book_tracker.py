@@ -0,0 +1,164 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.connector.test_support.mock_order_tracker import MockOrderBookTrackerDataSource
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker = OrderBookTracker(data_source=MagicMock(), trading_pairs=[self.trading_pair])
+        self.order_book = OrderBook()
+        self.tracker._order_books[self.trading_pair] = self.order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+        self.tracking_task = None
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def diff_message(self, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": self.trading_pair, "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=update_id)
+
+    def test_metrics_name_is_unique_per_tracker(self):
+        data_source = MagicMock()
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        other_tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+
+        self.assertTrue(tracker._metrics_name.startswith("order_book_tracker.MagicMock."))
+        self.assertNotEqual(tracker._metrics_name, other_tracker._metrics_name)
+
+    def test_track_single_book_coalesces_queued_diffs(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(self.diff_message(2, [["10", "0"], ["9", "2"]], []))
+        message_queue.put_nowait(self.diff_message(3, [], [["12", "3"]]))
+
+        self.tracker._apply_diff_messages = MagicMock(side_effect=self.tracker._apply_diff_messages)
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.tracker._apply_diff_messages.assert_called_once()
+        self.assertEqual(3, len(self.tracker._apply_diff_messages.call_args[0][1]))
+        self.assertEqual(3, self.order_book.last_diff_uid)
+        self.assertEqual(9, self.order_book.get_price(False))
+        self.assertEqual(11, self.order_book.get_price(True))
+        self.assertEqual(3, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_track_single_book_applies_snapshot_after_coalesced_diffs(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self.diff_message(1, [["10", "1"]], [["11", "1"]]))
+        message_queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair, "update_id": 5, "bids": [["8", "1"]], "asks": [["13", "1"]]},
+            timestamp=5))
+
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(1, self.order_book.last_diff_uid)
+        self.assertEqual(5, self.order_book.snapshot_uid)
+        self.assertEqual(1, len(self.tracker._past_diffs_windows[self.trading_pair]))
+
+    def test_init_order_books_concurrently_when_data_source_is_throttled(self):
+        trading_pairs = ["A-B", "C-D", "E-F"]
+        data_source = MagicMock()
+        data_source.snapshot_requests_throttled = True
+        release_snapshots = asyncio.Event()
+        requested_pairs = []
+
+        async def get_new_order_book(trading_pair: str) -> OrderBook:
+            requested_pairs.append(trading_pair)
+            if trading_pair != "C-D":
+                await release_snapshots.wait()
+            return OrderBook()
+
+        data_source.get_new_order_book = get_new_order_book
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=trading_pairs)
+        self.assertEqual({"A-B": False, "C-D": False, "E-F": False}, tracker.order_books_ready)
+
+        init_task = self.ev_loop.create_task(tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        self.assertEqual(trading_pairs, requested_pairs)
+        self.assertTrue(tracker.is_order_book_ready("C-D"))
+        self.assertFalse(tracker.is_order_book_ready("A-B"))
+        self.assertFalse(tracker.ready)
+
+        release_snapshots.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual({"A-B": True, "C-D": True, "E-F": True}, tracker.order_books_ready)
+        tracker.stop()
+        self.assertEqual({"A-B": False, "C-D": False, "E-F": False}, tracker.order_books_ready)
+
+    @patch("hummingbot.core.data_type.order_book_tracker.OrderBookTracker._sleep", new_callable=AsyncMock)
+    def test_init_order_books_retries_failed_snapshot(self, sleep_mock):
+        data_source = MagicMock()
+        data_source.snapshot_requests_throttled = True
+        data_source.get_new_order_book = AsyncMock(side_effect=[IOError("Test error")] * 6 + [OrderBook()])
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+
+        self.async_run_with_timeout(tracker._init_order_books())
+
+        self.assertTrue(tracker.ready)
+        self.assertTrue(tracker.is_order_book_ready(self.trading_pair))
+        self.assertEqual(7, data_source.get_new_order_book.call_count)
+        # Exponential backoff, capped at the maximum delay
+        self.assertEqual([5.0, 10.0, 20.0, 40.0, 60.0, 60.0],
+                         [call.kwargs["delay"] for call in sleep_mock.call_args_list])
+        tracker.stop()
+
+    def test_data_source_snapshot_requests_throttled(self):
+        data_source = MockOrderBookTrackerDataSource(trading_pairs=[self.trading_pair])
+        self.assertFalse(data_source.snapshot_requests_throttled)
+
+        data_source._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
+        self.assertTrue(data_source.snapshot_requests_throttled)
+
+    def test_recorder_receives_initial_snapshot_and_stream_messages(self):
+        data_source = MagicMock()
+        data_source.snapshot_requests_throttled = True
+        initial_order_book = OrderBook()
+        initial_order_book.apply_snapshot([OrderBookRow(10, 1, 3)], [OrderBookRow(11, 2, 3)], 3)
+        data_source.get_new_order_book = AsyncMock(return_value=initial_order_book)
+        tracker = OrderBookTracker(data_source=data_source, trading_pairs=[self.trading_pair])
+        tracker.recorder = MagicMock()
+
+        self.async_run_with_timeout(tracker._init_order_books())
+        diff_message = self.diff_message(4, [["10", "0"]], [])
+        tracker._order_book_diff_stream.put_nowait(diff_message)
+        self.tracking_task = self.ev_loop.create_task(tracker._order_book_diff_router())
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+
+        recorded_messages = [call[0][0] for call in tracker.recorder.record.call_args_list]
+        self.assertEqual(2, len(recorded_messages))
+        snapshot_message = recorded_messages[0]
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot_message.type)
+        self.assertEqual(3, snapshot_message.update_id)
+        self.assertEqual([[10, 1]], snapshot_message.content["bids"])
+        self.assertEqual([[11, 2]], snapshot_message.content["asks"])
+        self.assertIs(diff_message, recorded_messages[1])
+        tracker.stop()
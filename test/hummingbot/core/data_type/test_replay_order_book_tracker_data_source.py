@@ -0,0 +1,129 @@
+import asyncio
+import tempfile
+import unittest
+from typing import Awaitable
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+
+
+class ReplayOrderBookTrackerDataSourceTests(unittest.TestCase):
+    start_timestamp = 1640000000
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.exchange = "binance"
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.other_trading_pair = "WETH-USDT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        recorder = OrderBookRecorder(self.temp_dir.name, self.exchange)
+        for message in [
+            self.diff_message(self.trading_pair, 1, 0),
+            self.snapshot_message(self.trading_pair, 2, 1),
+            self.snapshot_message(self.other_trading_pair, 1, 1.5),
+            self.diff_message(self.trading_pair, 3, 2),
+            self.trade_message(self.trading_pair, "T1", 10.5, 3),
+            self.diff_message(self.other_trading_pair, 2, 2.5),
+            self.snapshot_message(self.trading_pair, 4, 4),
+        ]:
+            recorder.record(message)
+        recorder.flush()
+        self.data_source = ReplayOrderBookTrackerDataSource(
+            root_path=self.temp_dir.name,
+            exchange=self.exchange,
+            trading_pairs=[self.trading_pair, self.other_trading_pair])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def snapshot_message(self, trading_pair: str, update_id: int, delay: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": trading_pair, "update_id": update_id, "bids": [["10", "1"]], "asks": [["11", "1"]]},
+            timestamp=self.start_timestamp + delay)
+
+    def diff_message(self, trading_pair: str, update_id: int, delay: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": trading_pair, "update_id": update_id, "bids": [["9", "2"]], "asks": []},
+            timestamp=self.start_timestamp + delay)
+
+    def trade_message(self, trading_pair: str, trade_id: str, price: float, delay: float) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": trading_pair, "trade_type": 1.0, "trade_id": trade_id, "price": price, "amount": 1},
+            timestamp=self.start_timestamp + delay)
+
+    def test_initial_snapshot_is_first_recorded_snapshot(self):
+        snapshot = self.data_source.initial_snapshot(self.trading_pair)
+
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot.type)
+        self.assertEqual(2, snapshot.update_id)
+
+        order_book = self.async_run_with_timeout(self.data_source.get_new_order_book(self.trading_pair))
+
+        self.assertEqual(2, order_book.snapshot_uid)
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
+    def test_initial_snapshot_after_start_timestamp(self):
+        data_source = ReplayOrderBookTrackerDataSource(
+            root_path=self.temp_dir.name,
+            exchange=self.exchange,
+            trading_pairs=[self.trading_pair],
+            start_timestamp=self.start_timestamp + 2)
+
+        self.assertEqual(4, data_source.initial_snapshot(self.trading_pair).update_id)
+
+    def test_initial_snapshot_missing_raises_error(self):
+        data_source = ReplayOrderBookTrackerDataSource(
+            root_path=self.temp_dir.name,
+            exchange=self.exchange,
+            trading_pairs=["NOT-RECORDED"])
+
+        with self.assertRaises(ValueError):
+            data_source.initial_snapshot("NOT-RECORDED")
+
+    def test_replay_messages_are_merged_in_timestamp_order(self):
+        messages = list(self.data_source.replay_messages())
+
+        self.assertEqual(
+            [(self.trading_pair, OrderBookMessageType.DIFF),
+             (self.other_trading_pair, OrderBookMessageType.DIFF),
+             (self.trading_pair, OrderBookMessageType.TRADE),
+             (self.trading_pair, OrderBookMessageType.SNAPSHOT)],
+            [(message.trading_pair, message.type) for message in messages])
+        self.assertEqual(
+            {self.trading_pair: 10.5},
+            self.async_run_with_timeout(self.data_source.get_last_traded_prices([self.trading_pair])))
+
+    def test_listen_for_subscriptions_feeds_the_tracker_listeners(self):
+        diffs_queue = asyncio.Queue()
+        trades_queue = asyncio.Queue()
+        snapshots_queue = asyncio.Queue()
+
+        self.async_run_with_timeout(self.data_source.listen_for_subscriptions())
+        tasks = [
+            self.ev_loop.create_task(self.data_source.listen_for_order_book_diffs(self.ev_loop, diffs_queue)),
+            self.ev_loop.create_task(self.data_source.listen_for_trades(self.ev_loop, trades_queue)),
+            self.ev_loop.create_task(self.data_source.listen_for_order_book_snapshots(self.ev_loop, snapshots_queue)),
+        ]
+        self.async_run_with_timeout(asyncio.sleep(0.1))
+        for task in tasks:
+            task.cancel()
+
+        self.assertEqual(2, diffs_queue.qsize())
+        self.assertEqual(1, trades_queue.qsize())
+        self.assertEqual(1, snapshots_queue.qsize())
+        self.assertEqual(4, snapshots_queue.get_nowait().update_id)
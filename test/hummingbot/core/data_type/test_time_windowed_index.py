@@ -0,0 +1,82 @@
+import unittest
+
+from hummingbot.core.data_type.time_windowed_index import TimeWindowedIndex
+
+
+class TimeWindowedIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1000.0
+        self.index = TimeWindowedIndex(window=60, max_size=3, time_provider=lambda: self.now)
+
+    def test_add_and_lookup(self):
+        self.index.add("key1", "value1")
+        self.index.update({"key2": "value2"})
+        self.index.update(["key3"])
+
+        self.assertEqual(3, len(self.index))
+        self.assertIn("key1", self.index)
+        self.assertNotIn("key4", self.index)
+        self.assertEqual("value2", self.index.get("key2"))
+        self.assertIsNone(self.index.get("key3"))
+        self.assertEqual("default", self.index.get("key4", "default"))
+        self.assertEqual(["key1", "key2", "key3"], list(self.index.keys()))
+
+    def test_oldest_keys_are_evicted_when_full(self):
+        for i in range(5):
+            self.index.add(f"key{i}")
+
+        self.assertEqual(["key2", "key3", "key4"], list(self.index))
+
+    def test_keys_older_than_the_window_are_evicted(self):
+        self.index.add("key1")
+        self.now += 30
+        self.index.add("key2")
+        self.now += 31
+        self.index.add("key3")
+
+        self.assertEqual(["key2", "key3"], list(self.index))
+
+    def test_adding_a_key_again_updates_its_value_but_not_its_age(self):
+        self.index.add("key1", "value1")
+        self.now += 30
+        self.index.add("key1", "value2")
+        self.now += 31
+        self.index.add("key2")
+
+        self.assertNotIn("key1", self.index)
+
+        self.index.add("key2", "value3")
+        self.assertEqual("value3", self.index.get("key2"))
+
+    def test_removed_keys_are_skipped_by_the_eviction(self):
+        self.index.add("key1")
+        self.index.remove("key1")
+        self.now += 1
+        self.index.add("key1")
+        self.index.add("key2")
+        self.index.add("key3")
+
+        self.assertEqual(["key1", "key2", "key3"], list(self.index))
+
+        self.index.clear()
+        self.assertEqual(0, len(self.index))
+
+    def test_removed_keys_do_not_count_in_the_size(self):
+        self.index.add("key1")
+        self.index.add("key2")
+        self.index.remove("key2")
+        self.index.add("key3")
+        self.index.add("key4")
+
+        self.assertEqual(["key1", "key3", "key4"], list(self.index))
+
+        for _ in range(10):
+            self.index.remove("key4")
+            self.index.add("key4")
+
+        self.assertEqual(["key1", "key3", "key4"], list(self.index))
+        self.assertLessEqual(len(self.index._added), 6)
+
+        self.index.add("key5")
+        self.assertEqual(["key3", "key4", "key5"], list(self.index))
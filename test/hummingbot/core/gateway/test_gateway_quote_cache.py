@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Any, Awaitable, Dict, List
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.gateway.gateway_quote_cache import GatewayQuoteCache
+
+
+class GatewayQuoteCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.now = 1640000000.0
+        self.cache = GatewayQuoteCache(time_provider=lambda: self.now)
+        self.requested_amounts: List[Decimal] = []
+        self.prices: Dict[Decimal, str] = {}
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def fetch_price(self, amount: Decimal) -> Dict[str, Any]:
+        self.requested_amounts.append(amount)
+        await asyncio.sleep(0)
+        price = self.prices.get(amount)
+        if price is None:
+            return {}
+        return {"price": price, "amount": str(amount), "expectedAmount": "0", "gasCost": "0.001"}
+
+    def get_price(self, amount: Decimal, chain: str = "ethereum", side: TradeType = TradeType.BUY):
+        return self.cache.get_price(chain=chain,
+                                    network="mainnet",
+                                    connector="uniswap",
+                                    base_asset="WETH",
+                                    quote_asset="DAI",
+                                    amount=amount,
+                                    side=side,
+                                    fail_silently=False,
+                                    fetch_price=lambda: self.fetch_price(amount))
+
+    def test_identical_concurrent_requests_are_sent_once(self):
+        self.prices[Decimal(1)] = "1000"
+
+        responses = self.async_run_with_timeout(asyncio.gather(self.get_price(Decimal(1)),
+                                                               self.get_price(Decimal(1)),
+                                                               self.get_price(Decimal(1), side=TradeType.SELL)))
+
+        self.assertEqual([Decimal(1), Decimal(1)], self.requested_amounts)
+        self.assertEqual(["1000", "1000", "1000"], [response["price"] for response in responses])
+        self.assertIsNot(responses[0], responses[1])
+        self.assertEqual({"hits": 0, "misses": 2, "coalesced": 1, "interpolated": 0, "size": 2}, self.cache.metrics())
+
+    def test_quotes_are_kept_for_part_of_the_block_time_of_the_chain(self):
+        self.prices[Decimal(1)] = "1000"
+        self.assertEqual(6.0, self.cache.ttl("ethereum"))
+        self.assertEqual(1.0, self.cache.ttl("polygon"))
+
+        self.async_run_with_timeout(self.get_price(Decimal(1)))
+        self.async_run_with_timeout(self.get_price(Decimal(1), chain="polygon"))
+        self.now += 5
+        self.async_run_with_timeout(self.get_price(Decimal(1)))
+        self.async_run_with_timeout(self.get_price(Decimal(1), chain="polygon"))
+
+        self.assertEqual(3, len(self.requested_amounts))
+        self.assertEqual(1, self.cache.metrics()["hits"])
+
+        self.now += 1
+        self.async_run_with_timeout(self.get_price(Decimal(1)))
+        self.assertEqual(4, len(self.requested_amounts))
+
+    def test_quotes_expire_from_the_time_they_were_requested(self):
+        self.prices[Decimal(1)] = "1000"
+
+        async def slow_fetch_price():
+            self.now += 5
+            return await self.fetch_price(Decimal(1))
+
+        self.async_run_with_timeout(self.cache.get_price(chain="ethereum",
+                                                         network="mainnet",
+                                                         connector="uniswap",
+                                                         base_asset="WETH",
+                                                         quote_asset="DAI",
+                                                         amount=Decimal(1),
+                                                         side=TradeType.BUY,
+                                                         fail_silently=False,
+                                                         fetch_price=slow_fetch_price))
+        self.now += 1
+        self.async_run_with_timeout(self.get_price(Decimal(1)))
+
+        self.assertEqual(2, len(self.requested_amounts))
+
+    def test_responses_without_price_are_not_cached(self):
+        response = self.async_run_with_timeout(self.get_price(Decimal(1)))
+        self.prices[Decimal(1)] = "1000"
+        self.async_run_with_timeout(self.get_price(Decimal(1)))
+
+        self.assertEqual({}, response)
+        self.assertEqual(2, len(self.requested_amounts))
+
+    def test_quotes_are_interpolated_between_close_amounts_when_enabled(self):
+        self.prices[Decimal(100)] = "1000"
+        self.prices[Decimal(101)] = "1002"
+        self.prices[Decimal(120)] = "1010"
+        for amount in (Decimal(100), Decimal(101), Decimal(120)):
+            self.async_run_with_timeout(self.get_price(amount))
+
+        self.async_run_with_timeout(self.get_price(Decimal("100.5")))
+        self.assertEqual(4, len(self.requested_amounts))
+
+        self.cache.interpolation_max_spread = Decimal("0.01")
+        response = self.async_run_with_timeout(self.get_price(Decimal("100.25")))
+
+        self.assertEqual(4, len(self.requested_amounts))
+        self.assertEqual(Decimal("1000.5"), Decimal(response["price"]))
+        self.assertEqual(Decimal("100.25"), Decimal(response["amount"]))
+        self.assertEqual(Decimal("1000.5") * Decimal("100.25"), Decimal(response["expectedAmount"]))
+        self.assertEqual(1, self.cache.metrics()["interpolated"])
+
+        # The quotes at 101 and 120 are too far apart
+        self.async_run_with_timeout(self.get_price(Decimal(110)))
+        self.assertEqual(5, len(self.requested_amounts))
@@ -0,0 +1,146 @@
+from decimal import Decimal
+from unittest import TestCase
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderFilledEvent, SellOrderCreatedEvent
+from hummingbot.core.event.order_filled_store import OrderFilledStore
+
+
+class OrderFilledStoreTests(TestCase):
+
+    def fill_event(self, index: int, trade_type: TradeType = TradeType.BUY, trading_pair: str = "COINALPHA-HBOT"):
+        return OrderFilledEvent(
+            timestamp=1640000000 + index,
+            order_id=f"OID{index}",
+            trading_pair=trading_pair,
+            trade_type=trade_type,
+            order_type=OrderType.LIMIT,
+            price=Decimal(100 + index),
+            amount=Decimal(2),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01"), flat_fees=[TokenAmount("BNB", Decimal("0.1"))]),
+        )
+
+    @staticmethod
+    def expected_balance_changes(events, starting_timestamp=0):
+        balances = {}
+        for event in events:
+            if event.timestamp > starting_timestamp:
+                base, quote = event.trading_pair.split("-")
+                sign = 1 if event.trade_type is TradeType.BUY else -1
+                balances[base] = balances.get(base, Decimal(0)) + sign * event.amount
+                balances[quote] = balances.get(quote, Decimal(0)) - sign * event.price * event.amount
+        return balances
+
+    def test_fills_are_aggregated_by_trading_pair_and_side(self):
+        store = OrderFilledStore()
+        store.add(self.fill_event(1))
+        store.add(self.fill_event(2, TradeType.SELL))
+        store.add(self.fill_event(3))
+        store.add(self.fill_event(4, trading_pair="WETH-USDT"))
+
+        self.assertEqual(4, store.fill_count)
+        buys = store.aggregate("COINALPHA-HBOT", TradeType.BUY)
+        self.assertEqual(2, buys.fill_count)
+        self.assertEqual(Decimal(4), buys.base_volume)
+        self.assertEqual(Decimal(2 * 101 + 2 * 103), buys.quote_volume)
+        self.assertEqual(Decimal(102), buys.average_price)
+        self.assertEqual({"HBOT": Decimal("4.08"), "BNB": Decimal("0.2")}, buys.fees)
+        self.assertEqual(1640000001, buys.first_timestamp)
+        self.assertEqual(1640000003, buys.last_timestamp)
+        self.assertEqual(1, store.aggregate("COINALPHA-HBOT", TradeType.SELL).fill_count)
+        self.assertEqual(1, store.aggregate("WETH-USDT", TradeType.BUY).fill_count)
+        self.assertIsNone(store.aggregate("WETH-USDT", TradeType.SELL))
+        limit_buys = store.order_type_aggregate("COINALPHA-HBOT", TradeType.BUY, OrderType.LIMIT)
+        self.assertEqual(2, limit_buys.fill_count)
+        self.assertEqual(Decimal(102), limit_buys.mean_price)
+        self.assertIsNone(store.order_type_aggregate("COINALPHA-HBOT", TradeType.BUY, OrderType.MARKET))
+
+    def test_recent_fills_window_is_bounded(self):
+        store = OrderFilledStore(recent_fills_limit=3)
+        events = [self.fill_event(i, TradeType.BUY if i % 2 == 0 else TradeType.SELL) for i in range(10)]
+        for event in events:
+            store.add(event)
+
+        self.assertEqual(events[-3:], list(store.recent_fills))
+        self.assertEqual(10, store.fill_count)
+        self.assertEqual(Decimal(10), store.aggregate("COINALPHA-HBOT", TradeType.BUY).base_volume)
+
+    def test_balance_changes_match_all_the_fills(self):
+        store = OrderFilledStore(recent_fills_limit=3)
+        events = [self.fill_event(i, TradeType.BUY if i % 3 == 0 else TradeType.SELL) for i in range(10)]
+        for event in events:
+            store.add(event)
+
+        # All the fills are included from the aggregates, even the ones out of the recent fills window
+        self.assertEqual(self.expected_balance_changes(events), store.balance_changes())
+        # Fills after a recent timestamp are taken from the recent fills window
+        self.assertEqual(self.expected_balance_changes(events, 1640000007), store.balance_changes(1640000007))
+        self.assertEqual({}, store.balance_changes(1640000009))
+
+    def test_balance_changes_are_kept_up_to_date_with_new_fills(self):
+        store = OrderFilledStore(recent_fills_limit=3)
+        events = [self.fill_event(i, TradeType.BUY if i % 2 == 0 else TradeType.SELL) for i in range(10)]
+        for event in events[:5]:
+            store.add(event)
+        self.assertEqual(self.expected_balance_changes(events[:5], 1640000002), store.balance_changes(1640000002))
+
+        # New fills are applied to the balance changes, which keep including the fills out of the recent fills window
+        for i in range(5, 10):
+            store.add(events[i])
+            self.assertEqual(self.expected_balance_changes(events[:i + 1], 1640000002),
+                             store.balance_changes(1640000002))
+            self.assertEqual(self.expected_balance_changes(events[:i + 1]), store.balance_changes())
+        self.assertEqual(self.expected_balance_changes(events, 1640000008), store.balance_changes(1640000008))
+
+    def test_balance_changes_since_a_timestamp_before_the_recent_fills_window_include_the_evicted_fills(self):
+        store = OrderFilledStore()
+        events = [self.fill_event(i, TradeType.BUY if i % 3 == 0 else TradeType.SELL) for i in range(2500)]
+        # Fills out of timestamp order and with the same timestamp leave the window too
+        events[10], events[11] = events[11], events[10]
+        events[20] = events[20]._replace(timestamp=events[19].timestamp)
+        for event in events:
+            store.add(event)
+
+        self.assertEqual(store.RECENT_FILLS_LIMIT, len(store.recent_fills))
+        for starting_timestamp in (1640000005, 1640000010, 1640000019, 1640000700, 1640001499, 1640001500, 1640002000):
+            self.assertEqual(self.expected_balance_changes(events, starting_timestamp),
+                             store.balance_changes(starting_timestamp))
+
+    def test_clear(self):
+        store = OrderFilledStore()
+        store.add(self.fill_event(1))
+
+        store.clear()
+
+        self.assertEqual(0, store.fill_count)
+        self.assertEqual(0, len(store.recent_fills))
+        self.assertEqual({}, store.aggregates)
+        self.assertEqual({}, store.balance_changes())
+
+
+class EventLoggerTests(TestCase):
+
+    def test_order_filled_events_are_kept_in_the_order_filled_store(self):
+        logger = EventLogger()
+        fill_event = OrderFilledStoreTests().fill_event(1)
+        other_event = SellOrderCreatedEvent(timestamp=1640000000,
+                                            type=OrderType.LIMIT,
+                                            trading_pair="COINALPHA-HBOT",
+                                            amount=Decimal(1),
+                                            price=Decimal(100),
+                                            order_id="OID2",
+                                            creation_timestamp=1640000000)
+
+        logger(fill_event)
+        logger(other_event)
+
+        self.assertEqual([other_event, fill_event], logger.event_log)
+        self.assertEqual([fill_event], list(logger.order_filled_events))
+        self.assertEqual(1, logger.order_filled_store.fill_count)
+
+        logger.clear()
+
+        self.assertEqual([], logger.event_log)
+        self.assertEqual(0, logger.order_filled_store.fill_count)
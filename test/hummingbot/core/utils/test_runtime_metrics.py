@@ -0,0 +1,117 @@
+import asyncio
+import gc
+import unittest
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.core.utils.runtime_metrics import Histogram, RuntimeMetrics
+
+
+class HistogramTest(unittest.TestCase):
+    def test_histogram_statistics(self):
+        histogram = Histogram()
+        for value in [0.05] * 50 + [3.0] * 40 + [40.0] * 9 + [12000.0]:
+            histogram.observe(value)
+
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual((0.05 * 50 + 3.0 * 40 + 40.0 * 9 + 12000.0) / 100, histogram.mean)
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(5, histogram.percentile(90))
+        self.assertEqual(50, histogram.percentile(99))
+        self.assertEqual(12000.0, histogram.percentile(100))
+        self.assertEqual(12000.0, histogram.max)
+
+    def test_percentile_is_bounded_by_max(self):
+        histogram = Histogram()
+        histogram.observe(3.0)
+
+        self.assertEqual(3.0, histogram.percentile(50))
+
+    def test_reset(self):
+        histogram = Histogram()
+        histogram.observe(3.0)
+        histogram.reset()
+
+        self.assertEqual({"count": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0, "max": 0.0},
+                         histogram.to_dict())
+
+
+class RuntimeMetricsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.runtime_metrics = RuntimeMetrics()
+
+    def tearDown(self) -> None:
+        self.runtime_metrics.stop_loop_lag_sampling()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_snapshot_includes_tick_durations_and_rest_latencies(self):
+        self.runtime_metrics.record_tick_duration("BinanceExchange", 2.0)
+        self.runtime_metrics.record_tick_duration("BinanceExchange", 4.0)
+        self.runtime_metrics.record_tick_duration("PureMarketMakingStrategy", 30.0)
+        self.runtime_metrics.record_rest_latency("/api/v3/order", 120.0)
+
+        snapshot = self.runtime_metrics.snapshot()
+
+        self.assertEqual(2, snapshot["tick_duration_ms"]["BinanceExchange"]["count"])
+        self.assertEqual(3.0, snapshot["tick_duration_ms"]["BinanceExchange"]["mean"])
+        self.assertEqual(30.0, snapshot["tick_duration_ms"]["PureMarketMakingStrategy"]["max"])
+        self.assertEqual(1, snapshot["rest_latency_ms"]["/api/v3/order"]["count"])
+
+        self.runtime_metrics.reset()
+        snapshot = self.runtime_metrics.snapshot()
+
+        self.assertEqual({}, snapshot["tick_duration_ms"])
+        self.assertEqual({}, snapshot["rest_latency_ms"])
+
+    def test_gauges_are_evaluated_on_snapshot(self):
+        queue_size = 3
+        self.runtime_metrics.register_gauges("tracker", lambda: {"queue_size": queue_size})
+
+        self.assertEqual(3, self.runtime_metrics.snapshot()["gauges"]["tracker.queue_size"])
+
+        queue_size = 5
+        self.assertEqual(5, self.runtime_metrics.snapshot()["gauges"]["tracker.queue_size"])
+
+        self.runtime_metrics.unregister_gauges("tracker")
+        self.assertNotIn("tracker.queue_size", self.runtime_metrics.snapshot()["gauges"])
+
+    def test_failing_gauges_are_skipped(self):
+        def failing_gauges():
+            raise ValueError("Test error")
+
+        self.runtime_metrics.register_gauges("failing", failing_gauges)
+        self.runtime_metrics.register_gauges("tracker", lambda: {"queue_size": 1})
+
+        with patch.object(RuntimeMetrics, "logger"):
+            gauges = self.runtime_metrics.snapshot()["gauges"]
+
+        self.assertEqual({"tracker.queue_size": 1}, gauges)
+
+    def test_loop_lag_and_gc_pauses_are_sampled(self):
+        self.runtime_metrics.LOOP_LAG_SAMPLING_INTERVAL = 0.01
+
+        async def sample():
+            self.runtime_metrics.start_loop_lag_sampling()
+            self.assertTrue(self.runtime_metrics.is_sampling_loop_lag)
+            gc.collect()
+            await asyncio.sleep(0.05)
+            self.assertIn("event_loop.tasks", self.runtime_metrics.snapshot()["gauges"])
+            self.runtime_metrics.stop_loop_lag_sampling()
+
+        self.async_run_with_timeout(sample())
+
+        snapshot = self.runtime_metrics.snapshot()
+        self.assertFalse(self.runtime_metrics.is_sampling_loop_lag)
+        self.assertGreater(snapshot["loop_lag_ms"]["count"], 0)
+        self.assertGreater(snapshot["gc_pause_ms"]["count"], 0)
+        self.assertNotIn(self.runtime_metrics._on_gc_event, gc.callbacks)
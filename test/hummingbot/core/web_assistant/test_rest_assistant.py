@@ -8,6 +8,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.runtime_metrics import RuntimeMetrics
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
@@ -100,3 +101,17 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+
+    @aioresponses()
+    def test_rest_assistant_records_request_latency(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        runtime_metrics = RuntimeMetrics()
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]))
+
+        with patch.object(RuntimeMetrics, "get_instance", return_value=runtime_metrics):
+            self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="test_limit"))
+
+        self.assertEqual(["test_limit"], list(runtime_metrics.snapshot()["rest_latency_ms"]))
+        self.assertEqual(1, runtime_metrics.snapshot()["rest_latency_ms"]["test_limit"]["count"])
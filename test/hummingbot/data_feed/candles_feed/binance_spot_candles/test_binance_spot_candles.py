@@ -1,10 +1,12 @@
 import asyncio
 import json
 import re
+import tempfile
 import unittest
 from typing import Awaitable
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 from aioresponses import aioresponses
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
@@ -312,6 +314,60 @@ class TestBinanceSpotCandles(unittest.TestCase):
         self.assertEqual(self.data_feed.candles_df.shape[0], 2)
         self.assertEqual(self.data_feed.candles_df.shape[1], 10)
 
+    def test_fill_historical_candles_fetches_only_candles_missing_in_store(self):
+        interval_ms = CONSTANTS.INTERVALS[self.interval] * 1000
+        live_timestamp = 1672981200000
+
+        def candles(*timestamps):
+            return np.array([[timestamp, 1, 2, 0.5, 1.5, 10, 15, 3, 5, 7.5] for timestamp in timestamps], dtype=float)
+
+        with tempfile.TemporaryDirectory() as candles_store_path:
+            data_feed = BinanceSpotCandles(trading_pair=self.trading_pair,
+                                           interval=self.interval,
+                                           max_records=5,
+                                           candles_store_path=candles_store_path)
+            data_feed._candles_store.write(candles(live_timestamp - 4 * interval_ms, live_timestamp - 3 * interval_ms))
+            data_feed._append_candle(candles(live_timestamp)[0])
+            data_feed.fetch_candles = AsyncMock(
+                return_value=candles(live_timestamp - 2 * interval_ms, live_timestamp - interval_ms))
+
+            self.async_run_with_timeout(data_feed.fill_historical_candles())
+
+            data_feed.fetch_candles.assert_awaited_once_with(start_time=live_timestamp - 2 * interval_ms,
+                                                             end_time=live_timestamp - 1,
+                                                             limit=data_feed.MAX_CANDLES_PER_REQUEST)
+            self.assertTrue(data_feed.is_ready)
+            self.assertEqual([live_timestamp - i * interval_ms for i in range(4, -1, -1)],
+                             list(data_feed.candles_df["timestamp"]))
+            self.assertEqual(4, len(data_feed._candles_store.read()))
+
+    def test_closed_candles_stored_in_batches_and_when_network_stopped(self):
+        interval_ms = CONSTANTS.INTERVALS[self.interval] * 1000
+        first_timestamp = 1672981200000
+
+        def candle(index):
+            return [first_timestamp + index * interval_ms, 1, 2, 0.5, 1.5, 10, 15, 3, 5, 7.5]
+
+        with tempfile.TemporaryDirectory() as candles_store_path:
+            data_feed = BinanceSpotCandles(trading_pair=self.trading_pair,
+                                           interval=self.interval,
+                                           candles_store_path=candles_store_path)
+            for index in range(data_feed.STORE_BATCH_SIZE):
+                data_feed._append_candle(candle(index))
+            self.assertEqual(0, len(data_feed._pending_store_writes))
+            self.assertEqual(0, len(data_feed._candles_store.read()))
+
+            data_feed._append_candle(candle(data_feed.STORE_BATCH_SIZE))
+            # The candles are written out of the event loop
+            self.assertEqual(1, len(data_feed._pending_store_writes))
+            self.async_run_with_timeout(data_feed._wait_for_pending_store_writes())
+            self.assertEqual(data_feed.STORE_BATCH_SIZE, len(data_feed._candles_store.read()))
+
+            data_feed._append_candle(candle(data_feed.STORE_BATCH_SIZE + 1))
+            self.async_run_with_timeout(data_feed.stop_network())
+            # The live candle is not stored
+            self.assertEqual(data_feed.STORE_BATCH_SIZE + 1, len(data_feed._candles_store.read()))
+
     def _create_exception_and_unlock_test_with_event(self, exception):
         self.resume_test_event.set()
         raise exception
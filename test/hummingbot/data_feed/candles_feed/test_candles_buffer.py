@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+
+
+class CandlesBufferTests(unittest.TestCase):
+    columns = ["timestamp", "open", "close"]
+
+    def candle(self, timestamp: int):
+        return [timestamp, timestamp + 0.5, str(timestamp + 1)]
+
+    def test_append_drops_oldest_candles_when_full(self):
+        buffer = CandlesBuffer(self.columns, maxlen=3)
+        for timestamp in range(10):
+            buffer.append(self.candle(timestamp))
+
+        self.assertEqual(3, len(buffer))
+        self.assertEqual([7, 8, 9], list(buffer.array["timestamp"]))
+        self.assertEqual([8.0, 9.0, 10.0], list(buffer.values[:, 2]))
+        self.assertEqual(9, buffer[-1][0])
+        self.assertEqual(7, buffer[0][0])
+
+    def test_views_are_not_copies(self):
+        buffer = CandlesBuffer(self.columns, maxlen=3)
+        buffer.append(self.candle(1))
+        buffer.append(self.candle(2))
+
+        self.assertTrue(np.shares_memory(buffer.array, buffer.values))
+        self.assertEqual((2, 3), buffer.values.shape)
+
+    def test_replace_last(self):
+        buffer = CandlesBuffer(self.columns, maxlen=3)
+        buffer.append(self.candle(1))
+        version = buffer.version
+
+        buffer.replace_last([1, 2, 3])
+
+        self.assertEqual(1, len(buffer))
+        self.assertEqual([1.0, 2.0, 3.0], list(buffer[-1]))
+        self.assertGreater(buffer.version, version)
+        with self.assertRaises(IndexError):
+            CandlesBuffer(self.columns, maxlen=3).replace_last([1, 2, 3])
+
+    def test_prepend_keeps_chronological_order_up_to_capacity(self):
+        buffer = CandlesBuffer(self.columns, maxlen=5)
+        buffer.append(self.candle(10))
+        buffer.append(self.candle(11))
+
+        buffer.prepend([self.candle(timestamp) for timestamp in range(5, 10)])
+
+        self.assertEqual([7, 8, 9, 10, 11], list(buffer.array["timestamp"]))
+
+        buffer.append(self.candle(12))
+        self.assertEqual([8, 9, 10, 11, 12], list(buffer.array["timestamp"]))
+
+    def test_clear(self):
+        buffer = CandlesBuffer(self.columns, maxlen=2)
+        buffer.append(self.candle(1))
+
+        buffer.clear()
+
+        self.assertEqual(0, len(buffer))
+        self.assertEqual((0, 3), buffer.values.shape)
+
+    def test_invalid_length(self):
+        with self.assertRaises(ValueError):
+            CandlesBuffer(self.columns, maxlen=0)
@@ -0,0 +1,129 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
+
+class CandlesHubTests(unittest.TestCase):
+    # the level is required to receive logs from the data source logger
+    level = 0
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.hub = CandlesHub(BinanceSpotCandles)
+        self.btc_candles = self.hub.get_candle("BTC-USDT", "1m", max_records=10)
+        self.eth_candles = self.hub.get_candle("ETH-USDT", "1m", max_records=10)
+        self.btc_hourly_candles = self.hub.get_candle("BTC-USDT", "1h", max_records=10)
+
+    def tearDown(self) -> None:
+        for candles in (self.btc_candles, self.eth_candles, self.btc_hourly_candles):
+            self.hub.unsubscribe(candles)
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def kline_message(self, symbol: str, interval: str, timestamp: int):
+        return {
+            "e": "kline",
+            "E": timestamp,
+            "s": symbol,
+            "k": {"t": timestamp, "T": timestamp + 59999, "s": symbol, "i": interval, "f": 100, "L": 200,
+                  "o": "0.0010", "c": "0.0020", "h": "0.0025", "l": "0.0015", "v": "1000", "n": 100, "x": False,
+                  "q": "1.0000", "V": "500", "Q": "0.500", "B": "123456"}
+        }
+
+    def test_candles_share_the_hub_throttler(self):
+        self.assertIs(self.hub, self.btc_candles.hub)
+        self.assertIs(self.btc_candles._api_factory, self.eth_candles._api_factory)
+        self.assertIs(self.btc_candles._api_factory, self.btc_hourly_candles._api_factory)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_are_multiplexed_over_one_connection(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub.SUBSCRIPTION_BATCH_DELAY = 0.1
+        for message in (self.kline_message("BTCUSDT", "1m", 60000),
+                        self.kline_message("ETHUSDT", "1m", 60000),
+                        self.kline_message("ETHUSDT", "1m", 120000),
+                        self.kline_message("BTCUSDT", "1h", 3600000)):
+            self.mocking_assistant.add_websocket_aiohttp_message(
+                websocket_mock=ws_connect_mock.return_value,
+                message=json.dumps(message))
+
+        for candles in (self.btc_candles, self.eth_candles, self.btc_hourly_candles):
+            self.async_run_with_timeout(candles.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, ws_connect_mock.call_count)
+        self.assertEqual(1, self.hub.connections_count)
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1h", "btcusdt@kline_1m", "ethusdt@kline_1m"], "id": 1}],
+            sent_messages)
+        self.assertEqual([60000], list(self.btc_candles.candles_df["timestamp"]))
+        self.assertEqual([60000, 120000], list(self.eth_candles.candles_df["timestamp"]))
+        self.assertEqual([3600000], list(self.btc_hourly_candles.candles_df["timestamp"]))
+
+    def test_connections_are_limited_in_streams(self):
+        self.hub = CandlesHub(BinanceSpotCandles, max_streams_per_connection=2)
+        candles = [self.hub.get_candle(trading_pair, "1m") for trading_pair in ("BTC-USDT", "ETH-USDT", "BNB-USDT")]
+
+        with patch.object(CandlesHub, "_listen_for_subscriptions", new_callable=AsyncMock):
+            for candle in candles:
+                self.hub.subscribe(candle)
+            self.hub.subscribe(candles[0])
+
+            self.assertEqual(2, self.hub.connections_count)
+            self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m", "bnbusdt@kline_1m"],
+                             self.hub.subscribed_stream_names)
+
+            self.hub.unsubscribe(candles[2])
+            self.assertEqual(1, self.hub.connections_count)
+            self.hub.unsubscribe(candles[0])
+            self.hub.unsubscribe(candles[1])
+            self.assertEqual(0, self.hub.connections_count)
+            self.assertEqual([], self.hub.subscribed_stream_names)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_streams_added_to_open_connection_are_subscribed_together(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.hub.SUBSCRIPTION_BATCH_DELAY = 0.1
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+
+        self.async_run_with_timeout(self.btc_candles.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+        self.async_run_with_timeout(self.eth_candles.start_network())
+        self.async_run_with_timeout(self.btc_hourly_candles.start_network())
+        # Both streams are subscribed by the same batch
+        self.async_run_with_timeout(self.hub._connections[0].subscription_task)
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.kline_message("ETHUSDT", "1m", 60000)))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        sent_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual(
+            [{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m"], "id": 1},
+             {"method": "SUBSCRIBE", "params": ["btcusdt@kline_1h", "ethusdt@kline_1m"], "id": 1}],
+            sent_messages)
+        self.assertEqual(1, len(self.eth_candles.candles_df))
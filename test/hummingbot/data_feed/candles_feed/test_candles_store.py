@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.data_feed.candles_feed.candles_store import CandlesStore
+
+
+class CandlesStoreTests(unittest.TestCase):
+    columns = ["timestamp", "open", "close"]
+    interval_ms = 60000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = CandlesStore(self.temp_dir.name, "binance_spot_BTC-USDT", "1m", self.columns)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def candles(self, first: int, last: int, price: float = 1.0) -> np.ndarray:
+        timestamps = np.arange(first, last + 1) * self.interval_ms
+        return np.column_stack([timestamps, np.full(len(timestamps), price), np.full(len(timestamps), price + 1)])
+
+    def test_read_empty_store(self):
+        self.assertEqual((0, 3), self.store.read().shape)
+        self.assertEqual([(0, 10 * self.interval_ms)],
+                         self.store.missing_ranges(0, 10 * self.interval_ms, self.interval_ms))
+
+    def test_written_candles_are_read_in_range(self):
+        self.store.write(self.candles(5, 9))
+        self.store.write(self.candles(0, 2))
+
+        self.assertEqual(os.path.join(self.temp_dir.name, "binance_spot_BTC-USDT", "1m"), self.store.path)
+        self.assertEqual(list(np.r_[0:3, 5:10] * self.interval_ms), list(self.store.read()[:, 0]))
+        self.assertEqual([2 * self.interval_ms, 5 * self.interval_ms, 6 * self.interval_ms],
+                         list(self.store.read(2 * self.interval_ms, 6 * self.interval_ms)[:, 0]))
+        np.testing.assert_array_equal(self.candles(5, 6), self.store.read(5 * self.interval_ms, 6 * self.interval_ms))
+
+    def test_only_new_candles_are_written(self):
+        self.store.write(self.candles(0, 4))
+        self.store.write(self.candles(3, 6, price=2.0))
+
+        candles = self.store.read()
+        self.assertEqual(list(range(7)), list(candles[:, 0] / self.interval_ms))
+        # the stored candles are not overwritten
+        self.assertEqual([1.0] * 5 + [2.0] * 2, list(candles[:, 1]))
+        self.assertEqual(2, len(os.listdir(self.store.path)))
+
+        self.store.write(self.candles(1, 5))
+        self.assertEqual(2, len(os.listdir(self.store.path)))
+
+    def test_missing_ranges(self):
+        self.store.write(self.candles(2, 4))
+        self.store.write(self.candles(7, 8))
+
+        self.assertEqual(
+            [(0, 2 * self.interval_ms), (5 * self.interval_ms, 7 * self.interval_ms),
+             (9 * self.interval_ms, 12 * self.interval_ms)],
+            self.store.missing_ranges(0, 12 * self.interval_ms, self.interval_ms))
+        self.assertEqual([], self.store.missing_ranges(2 * self.interval_ms, 5 * self.interval_ms, self.interval_ms))
+
+    def test_segments_are_merged(self):
+        self.store.MAX_SEGMENTS = 3
+        for first in range(0, 40, 10):
+            self.store.write(self.candles(first, first + 4))
+
+        self.assertEqual(1, len(os.listdir(self.store.path)))
+        self.assertEqual(20, len(self.store.read()))
+
+    def test_merged_segments_keep_the_most_recent_candles(self):
+        self.store = CandlesStore(self.temp_dir.name, "binance_spot_BTC-USDT", "1m", self.columns, max_candles=12)
+        self.store.MAX_SEGMENTS = 3
+        for first in range(0, 40, 10):
+            self.store.write(self.candles(first, first + 4))
+
+        self.assertEqual(1, len(os.listdir(self.store.path)))
+        self.assertEqual(list(np.r_[13:15, 20:25, 30:35] * self.interval_ms), list(self.store.read()[:, 0]))
+
+    def test_stores_share_the_candles(self):
+        self.store.write(self.candles(0, 4))
+        other_store = CandlesStore(self.temp_dir.name, "binance_spot_BTC-USDT", "1m", self.columns)
+
+        np.testing.assert_array_equal(self.candles(0, 4), other_store.read())
+        self.assertEqual(0, len(CandlesStore(self.temp_dir.name, "binance_spot_BTC-USDT", "1h", self.columns).read()))
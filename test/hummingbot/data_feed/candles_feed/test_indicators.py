@@ -0,0 +1,150 @@
+import math
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles
+from hummingbot.data_feed.candles_feed.candles_buffer import CandlesBuffer
+from hummingbot.data_feed.candles_feed.indicators import ATR, EMA, MACD, RSI, BollingerBands
+
+
+def seeded_ewm(series: pd.Series, length: int, alpha: float) -> pd.Series:
+    # Exponential average seeded with the simple average of the first length values
+    seeded = series.copy()
+    seeded.iloc[:length - 1] = np.nan
+    seeded.iloc[length - 1] = series.iloc[:length].mean()
+    return seeded.ewm(alpha=alpha, adjust=False, ignore_na=True).mean().where(seeded.index >= length - 1)
+
+
+class IncrementalIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        rng = np.random.default_rng(7)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 80))
+        opens = np.concatenate([[100.0], closes[:-1]])
+        self.df = pd.DataFrame({
+            "timestamp": np.arange(80) * 60000.0,
+            "open": opens,
+            "high": np.maximum(opens, closes) + rng.uniform(0, 1, 80),
+            "low": np.minimum(opens, closes) - rng.uniform(0, 1, 80),
+            "close": closes,
+            "volume": rng.uniform(1, 10, 80),
+        })
+        self.buffer = CandlesBuffer(list(self.df.columns), maxlen=len(self.df))
+
+    def replay(self, indicator):
+        values = []
+        for candle in self.df.itertuples(index=False):
+            # the live candle is first seen at its open price, and then updated with its close
+            self.buffer.append([candle.timestamp, candle.open, candle.open, candle.open, candle.open, 0])
+            indicator.update(self.buffer.array[-1], new_candle=True)
+            self.buffer.replace_last(candle)
+            indicator.update(self.buffer.array[-1], new_candle=False)
+            values.append(indicator.value)
+        return values
+
+    def assert_series_equal(self, expected: pd.Series, values):
+        self.assertEqual(len(expected), len(values))
+        for expected_value, value in zip(expected, values):
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(value))
+            else:
+                self.assertAlmostEqual(expected_value, value, places=8)
+
+    def test_ema(self):
+        values = self.replay(EMA(length=10))
+
+        self.assert_series_equal(seeded_ewm(self.df["close"], 10, 2 / 11), values)
+
+    def test_rsi(self):
+        values = self.replay(RSI(length=14))
+
+        change = self.df["close"].diff().iloc[1:].reset_index(drop=True)
+        gains = seeded_ewm(change.clip(lower=0), 14, 1 / 14)
+        losses = seeded_ewm(-change.clip(upper=0), 14, 1 / 14)
+        expected = pd.concat([pd.Series([np.nan]), 100 - 100 / (1 + gains / losses)], ignore_index=True)
+        self.assert_series_equal(expected, values)
+
+    def test_atr(self):
+        values = self.replay(ATR(length=14))
+
+        previous_close = self.df["close"].shift(1)
+        true_range = pd.concat([self.df["high"] - self.df["low"],
+                                (self.df["high"] - previous_close).abs(),
+                                (self.df["low"] - previous_close).abs()], axis=1).max(axis=1)
+        self.assert_series_equal(seeded_ewm(true_range, 14, 1 / 14), values)
+
+    def test_bollinger_bands(self):
+        values = self.replay(BollingerBands(length=20, std=2))
+
+        middle = self.df["close"].rolling(20).mean()
+        std = self.df["close"].rolling(20).std(ddof=0)
+        self.assert_series_equal(middle, [value.middle for value in values])
+        self.assert_series_equal(middle + 2 * std, [value.upper for value in values])
+        self.assert_series_equal(middle - 2 * std, [value.lower for value in values])
+
+    def test_macd(self):
+        values = self.replay(MACD(fast=12, slow=26, signal=9))
+
+        macd = seeded_ewm(self.df["close"], 12, 2 / 13) - seeded_ewm(self.df["close"], 26, 2 / 27)
+        signal = seeded_ewm(macd.iloc[25:].reset_index(drop=True), 9, 2 / 10)
+        signal = pd.concat([pd.Series([np.nan] * 25), signal], ignore_index=True)
+        self.assert_series_equal(macd, [value.macd for value in values])
+        self.assert_series_equal(signal, [value.signal for value in values])
+        self.assert_series_equal(macd - signal, [value.histogram for value in values])
+
+    def test_reset(self):
+        indicator = EMA(length=2)
+        self.replay(indicator)
+
+        indicator.reset()
+
+        self.assertTrue(math.isnan(indicator.value))
+
+
+class CandlesIndicatorsTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles = BinanceSpotCandles(trading_pair="BTC-USDT", interval="1m", max_records=5)
+
+    def candle(self, timestamp: int, close: float):
+        return [timestamp, close, close, close, close, 1, 1, 1, 1, 1]
+
+    def test_indicators_follow_candles_changes(self):
+        self.candles._append_candle(self.candle(3, 10))
+        ema = self.candles.add_indicator("ema", EMA(length=2))
+        self.assertTrue(math.isnan(self.candles.get_indicator_value("ema")))
+
+        self.candles._append_candle(self.candle(4, "12"))
+        self.assertEqual(11, self.candles.get_indicator_value("ema"))
+
+        self.candles._update_live_candle(self.candle(4, 16))
+        self.assertEqual(13, ema.value)
+
+        self.candles._prepend_candles([self.candle(1, 4), self.candle(2, 6)])
+        # EMA seeded with (4 + 6) / 2, then updated with 10 and 16
+        self.assertAlmostEqual(((5 / 3 + 20 / 3) / 3 + 32 / 3), ema.value, places=8)
+        self.assertEqual(4, len(self.candles.candles_df))
+
+        self.candles.remove_indicator("ema")
+        self.assertEqual({}, self.candles.indicators)
+
+    def test_candles_df_is_cached_until_candles_change(self):
+        self.candles._append_candle(self.candle(1, 10))
+        candles_df = self.candles.candles_df
+        candles_df["timestamp"] = pd.to_datetime(candles_df["timestamp"], unit="ms")
+
+        self.assertEqual(1.0, self.candles.candles_df["timestamp"].iloc[0])
+        cache = self.candles._candles_df_cache
+        self.candles.candles_df
+        self.assertIs(cache, self.candles._candles_df_cache)
+
+        self.candles._update_live_candle(self.candle(1, 11))
+
+        self.assertEqual(11.0, self.candles.candles_df["close"].iloc[-1])
+        self.assertIsNot(cache, self.candles._candles_df_cache)
+        self.assertEqual(list(self.candles.columns), list(self.candles.candles_df.columns))
+        self.assertEqual(11.0, self.candles.candles_array["close"][-1])
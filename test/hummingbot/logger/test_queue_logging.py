@@ -0,0 +1,115 @@
+import logging
+import threading
+import unittest
+from typing import List
+
+from hummingbot.logger.queue_logging import (
+    LogQueue,
+    QueueLogHandler,
+    get_log_queue,
+    start_non_blocking_logging,
+    stop_non_blocking_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records: List[logging.LogRecord] = []
+        self.messages: List[str] = []
+        self.threads: List[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.messages.append(record.getMessage())
+        self.threads.append(threading.current_thread().name)
+
+
+class QueueLoggingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.handler = RecordingHandler()
+        self.warning_handler = RecordingHandler(logging.WARNING)
+        self.logger = logging.getLogger("test.queue_logging")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.handlers = [self.handler, self.warning_handler]
+
+    def tearDown(self) -> None:
+        stop_non_blocking_logging()
+        self.logger.handlers = []
+        super().tearDown()
+
+    def make_record(self, msg: str, created: float, level: int = logging.ERROR, args=None) -> logging.LogRecord:
+        record = self.logger.makeRecord(self.logger.name, level, __file__, 0, msg, args, None)
+        record.created = created
+        return record
+
+    def test_records_are_written_by_the_background_thread(self):
+        start_non_blocking_logging()
+        self.assertIsInstance(self.logger.handlers[0], QueueLogHandler)
+
+        self.logger.info("Info %s", "message")
+        self.logger.warning("Warning message")
+        stop_non_blocking_logging()
+
+        self.assertEqual(["Info message", "Warning message"], self.handler.messages)
+        self.assertEqual(["Warning message"], self.warning_handler.messages)
+        self.assertNotIn(threading.current_thread().name, self.handler.threads)
+        self.assertEqual([self.handler, self.warning_handler], self.logger.handlers)
+        self.assertIsNone(get_log_queue())
+
+    def test_message_is_formatted_when_logged(self):
+        args = ["first"]
+        start_non_blocking_logging()
+
+        self.logger.info("Values: %s", args)
+        args.append("second")
+        stop_non_blocking_logging()
+
+        self.assertEqual(["Values: ['first']"], self.handler.messages)
+
+    def test_exception_info_is_kept_for_the_handlers(self):
+        start_non_blocking_logging()
+
+        try:
+            raise ValueError("Test error")
+        except ValueError:
+            self.logger.exception("Unexpected error")
+        stop_non_blocking_logging()
+
+        self.assertIn("ValueError: Test error", logging.Formatter().format(self.handler.records[0]))
+
+    def test_records_are_dropped_when_the_queue_is_full(self):
+        log_queue = LogQueue(max_size=2, rate_limit_interval=0)
+
+        for i in range(5):
+            log_queue.put(self.make_record(f"Message {i}", created=1000), [self.handler])
+        log_queue.start()
+        log_queue.stop()
+
+        self.assertEqual(["Message 0", "Message 1"], self.handler.messages)
+        self.assertEqual(3, log_queue.dropped_records_count)
+        self.assertEqual(0, log_queue.sampled_records_count)
+
+    def test_identical_messages_are_rate_limited(self):
+        log_queue = LogQueue(rate_limit_interval=10, rate_limit_burst=2)
+
+        for created in (1000, 1001, 1002, 1003, 1004):
+            log_queue.put(self.make_record("Error polling %s", created=created, args=("orders",)), [self.handler])
+        log_queue.put(self.make_record("Error polling %s", created=1004, level=logging.WARNING, args=("orders",)),
+                      [self.handler])
+        log_queue.put(self.make_record("Other error", created=1004), [self.handler])
+        log_queue.put(self.make_record("Error polling %s", created=1010, args=("balances",)), [self.handler])
+        log_queue.start()
+        log_queue.stop()
+
+        self.assertEqual(
+            ["Error polling orders",
+             "Error polling orders",
+             "Error polling orders",
+             "Other error",
+             "Error polling balances (3 similar messages suppressed)"],
+            self.handler.messages)
+        self.assertEqual(3, log_queue.sampled_records_count)
+        self.assertEqual(0, log_queue.dropped_records_count)
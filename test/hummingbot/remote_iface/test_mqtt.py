@@ -1241,3 +1241,16 @@ class RemoteIfaceMQTTTests(TestCase):
         gw = MQTTGateway(self.hbapp)
         self.assertTrue(gw.namespace == 'test')
         self.gateway._hb_app.client_config_map.mqtt_bridge.mqtt_namespace = prev_ns
+
+    @patch("commlib.transports.mqtt.MQTTTransport")
+    def test_mqtt_metrics_publisher(self, mock_mqtt):
+        prev_mqtt_metrics = self.client_config_map.mqtt_bridge.mqtt_metrics
+        self.client_config_map.mqtt_bridge.mqtt_metrics = True
+        self.addCleanup(setattr, self.client_config_map.mqtt_bridge, "mqtt_metrics", prev_mqtt_metrics)
+        self.start_mqtt(mock_mqtt=mock_mqtt)
+
+        self.assertIsNotNone(self.gateway._metrics)
+        self.gateway._metrics.publish_metrics()
+        metrics_topic = f"hbot/{self.instance_id}/metrics"
+        self.ev_loop.run_until_complete(self.wait_for_rcv(metrics_topic))
+        self.assertTrue(self.is_msg_received(metrics_topic))
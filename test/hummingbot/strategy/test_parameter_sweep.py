@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_recorder import OrderBookRecorder
+from hummingbot.core.data_type.replay_order_book_tracker_data_source import ReplayOrderBookTrackerDataSource
+from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
+    AvellanedaMarketMakingConfigMap,
+)
+from hummingbot.strategy.parameter_sweep import ParameterSweep, avellaneda_market_making_factory, run_sweep_task
+
+
+class ParameterSweepTests(unittest.TestCase):
+    start_timestamp = 1640000000
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = "binance"
+        self.trading_pair = "COINALPHA-HBOT"
+        self.temp_dir = tempfile.TemporaryDirectory()
+        recorder = OrderBookRecorder(self.temp_dir.name, self.exchange)
+        recorder.record(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": self.trading_pair,
+             "update_id": 1,
+             "bids": [[str(100 - i), "10"] for i in range(1, 20)],
+             "asks": [[str(100 + i), "10"] for i in range(1, 20)]},
+            timestamp=self.start_timestamp))
+        for i in range(1, 120):
+            # The best bid moves every second, and the trades are further from the mid price the smaller they are
+            recorder.record(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": self.trading_pair,
+                 "update_id": 1 + i,
+                 "bids": [["99.5", "10" if i % 2 == 0 else "0"]],
+                 "asks": []},
+                timestamp=self.start_timestamp + i))
+            recorder.record(OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": self.trading_pair,
+                 "trade_type": 2.0 if i % 2 == 0 else 1.0,
+                 "trade_id": str(i),
+                 "price": 100 - (1 + i % 3) if i % 2 == 0 else 100 + (1 + i % 3),
+                 "amount": 2 ** (2 - i % 3)},
+                timestamp=self.start_timestamp + i))
+        recorder.flush()
+
+        self.config_template = ClientConfigAdapter(AvellanedaMarketMakingConfigMap(
+            exchange=self.exchange,
+            market=self.trading_pair,
+            execution_timeframe_mode="infinite",
+            order_amount=Decimal("1"),
+            order_optimization_enabled=False,
+            min_spread=Decimal("0"),
+            risk_factor=Decimal("1"),
+            order_refresh_time=10,
+            inventory_target_base_pct=Decimal("50"),
+            # Small buffers, to have the strategy ready to trade after a few seconds of replay
+            volatility_buffer_size=10,
+            trading_intensity_buffer_size=10,
+        ))
+        self.sweep = ParameterSweep(
+            config_template=self.config_template,
+            parameter_grid={"risk_factor": [Decimal("0.5"), Decimal("1")], "order_refresh_time": [10, 30]},
+            strategy_factory=avellaneda_market_making_factory,
+            records_path=self.temp_dir.name,
+            initial_balances={"COINALPHA": Decimal("10"), "HBOT": Decimal("1000")},
+            max_workers=1)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def test_configurations_cover_the_parameter_grid(self):
+        self.assertEqual(
+            [{"risk_factor": Decimal("0.5"), "order_refresh_time": 10},
+             {"risk_factor": Decimal("0.5"), "order_refresh_time": 30},
+             {"risk_factor": Decimal("1"), "order_refresh_time": 10},
+             {"risk_factor": Decimal("1"), "order_refresh_time": 30}],
+            self.sweep.configurations())
+
+    def test_task_applies_the_parameters_to_a_copy_of_the_template(self):
+        task = self.sweep._task({"risk_factor": Decimal("0.5"), "order_refresh_time": 30}, "memory_mapped_path")
+
+        config_map = task.config_class.parse_raw(task.config_json)
+        self.assertEqual(Decimal("0.5"), config_map.risk_factor)
+        self.assertEqual(30, config_map.order_refresh_time)
+        self.assertEqual(Decimal("1"), self.config_template.risk_factor)
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.stored_or_live_rate", new_callable=AsyncMock)
+    def test_run_sweep_task_returns_performance_metrics(self, stored_or_live_rate_mock):
+        # No rate is fetched, the current price is the last trade price
+        stored_or_live_rate_mock.return_value = None
+        memory_mapped_path = os.path.join(self.temp_dir.name, "memory_mapped")
+        ReplayOrderBookTrackerDataSource.export_memory_mapped_records(
+            self.temp_dir.name, self.exchange, [self.trading_pair], memory_mapped_path)
+
+        result = run_sweep_task(self.sweep._task({"risk_factor": Decimal("0.5")}, memory_mapped_path))
+
+        self.assertNotIn("error", result)
+        self.assertEqual(Decimal("0.5"), result["risk_factor"])
+        self.assertEqual(238, result["messages"])
+        self.assertEqual(4, result["num_trades"])
+        self.assertEqual(Decimal("5.19437"), result["tot_vol_quote"])
+        self.assertEqual(Decimal("5.19437"), result["trade_pnl"])
+        self.assertEqual(Decimal("0.40050003"), result["fee_in_quote"])
+        self.assertEqual(Decimal("4.79386997"), result["total_pnl"])
+        self.assertAlmostEqual(Decimal("0.002377"), result["return_pct"], places=6)
+
+    @patch("hummingbot.core.rate_oracle.rate_oracle.RateOracle.stored_or_live_rate", new_callable=AsyncMock)
+    @patch("hummingbot.strategy.parameter_sweep.ProcessPoolExecutor", ThreadPoolExecutor)
+    def test_run_aggregates_the_results_in_a_table(self, stored_or_live_rate_mock):
+        stored_or_live_rate_mock.return_value = None
+        results = self.sweep.run()
+
+        self.assertEqual(4, len(results))
+        self.assertEqual([Decimal("0.5"), Decimal("0.5"), Decimal("1"), Decimal("1")], list(results["risk_factor"]))
+        self.assertEqual([10, 30, 10, 30], list(results["order_refresh_time"]))
+        self.assertNotIn("error", results.columns)
+        self.assertIn("total_pnl", results.columns)
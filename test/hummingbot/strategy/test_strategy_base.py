@@ -16,7 +16,9 @@ from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExcha
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.event.order_filled_store import OrderFilledStore
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_tracker import OrderTracker
 from hummingbot.strategy.strategy_base import StrategyBase
@@ -125,6 +127,23 @@ class StrategyBaseUnitTests(unittest.TestCase):
 
         self.assertEqual(1, len(self.strategy.trades))
 
+    def test_trades_are_the_most_recent_fills(self):
+        fills_count = OrderFilledStore.RECENT_FILLS_LIMIT + 10
+        for i in range(fills_count):
+            self.market.trigger_event(
+                MarketEvent.OrderFilled,
+                OrderFilledEvent(1640001112 + i, f"OID{i}", self.trading_pair, TradeType.BUY, OrderType.LIMIT,
+                                 Decimal("100"), Decimal("1"), AddedToCostTradeFee()))
+
+        trades = self.strategy.trades
+        self.assertEqual(OrderFilledStore.RECENT_FILLS_LIMIT, len(trades))
+        self.assertEqual(1640001112 + 10, trades[0].timestamp)
+        self.assertEqual(1640001112 + fills_count - 1, trades[-1].timestamp)
+        # The totals over all the fills are in the order filled store aggregates
+        aggregate = self.market.order_filled_store.aggregate(self.trading_pair, TradeType.BUY)
+        self.assertEqual(fills_count, aggregate.fill_count)
+        self.assertEqual(Decimal(fills_count), aggregate.base_volume)
+
     def test_add_markets(self):
 
         self.assertEqual(1, len(self.strategy.active_markets))
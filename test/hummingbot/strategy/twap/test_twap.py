@@ -430,6 +430,26 @@ class TWAPUnitTest(unittest.TestCase):
         self.assertTrue(sell_started_status.startswith(expected_sell_start))
         self.assertTrue(sell_started_status.endswith(expected_sell_end))
 
+    def test_average_filled_price_is_the_mean_price_of_the_limit_fills_with_the_strategy_trade_type(self):
+        fills = [(TradeType.SELL, OrderType.LIMIT, Decimal("100"), Decimal("1")),
+                 (TradeType.SELL, OrderType.LIMIT, Decimal("104"), Decimal("3")),
+                 (TradeType.SELL, OrderType.MARKET, Decimal("200"), Decimal("1")),
+                 (TradeType.BUY, OrderType.LIMIT, Decimal("50"), Decimal("1"))]
+        for i, (trade_type, order_type, price, amount) in enumerate(fills):
+            self.market.order_filled_store.add(OrderFilledEvent(
+                self.start_timestamp + i,
+                f"order_{i}",
+                self.maker_trading_pairs[0],
+                trade_type,
+                order_type,
+                price,
+                amount,
+                AddedToCostTradeFee(Decimal("0"))
+            ))
+
+        self.assertEqual(Decimal("102"), self.limit_sell_strategy.average_filled_price())
+        self.assertEqual(Decimal("50"), self.limit_buy_strategy.average_filled_price())
+
     def test_strategy_time_span_execution(self):
         span_start_time = self.start_timestamp + (self.clock_tick_size * 5)
         span_end_time = self.start_timestamp + (self.clock_tick_size * 7)
@@ -107,3 +107,82 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_running_statistics_match_numpy(self):
+        buffer = RingBuffer(50)
+        np.random.seed(42)
+
+        for value in np.random.normal(1000, 10, 537):
+            buffer.add_value(value)
+            values = buffer.get_as_numpy_array()
+            self.assertEqual(values.size, buffer.size)
+            self.assertAlmostEqual(np.mean(values), buffer.window_mean, 8)
+            self.assertAlmostEqual(np.var(values), buffer.window_variance, 6)
+            self.assertAlmostEqual(np.sum(np.square(np.diff(values))), buffer.sum_of_squared_diffs, 6)
+            if buffer.is_full:
+                self.assertAlmostEqual(np.std(values), buffer.std_dev, 8)
+
+    def test_window_statistics_when_not_full(self):
+        self.assertEqual(0, self.buffer.size)
+        self.assertTrue(np.isnan(self.buffer.window_mean))
+        self.assertTrue(np.isnan(self.buffer.window_variance))
+        self.assertEqual(0, self.buffer.sum_of_squared_diffs)
+
+        for value in [1, 3, 8]:
+            self.buffer.add_value(value)
+
+        self.assertEqual(3, self.buffer.size)
+        self.assertEqual(4, self.buffer.window_mean)
+        self.assertAlmostEqual(np.var([1, 3, 8]), self.buffer.window_variance)
+        self.assertEqual(29, self.buffer.sum_of_squared_diffs)
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+
+    def test_long_buffer_keeps_values_order_and_precision(self):
+        length = 100_000
+        buffer = RingBuffer(length)
+        values = np.arange(length + 10, dtype=np.float64) + 0.123456789
+
+        for value in values:
+            buffer.add_value(value)
+
+        self.assertTrue(np.array_equal(values[-length:], buffer.get_as_numpy_array()))
+        self.assertEqual(values[-1], buffer.get_last_value())
+        self.assertAlmostEqual(np.mean(values[-length:]), buffer.mean_value, 6)
+        self.assertAlmostEqual(length - 1, buffer.sum_of_squared_diffs, 4)
+
+    def test_statistics_after_length_change(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 10
+
+        self.assertTrue(self.buffer.is_full)
+        self.assertEqual(np.mean(np.arange(20, 30)), self.buffer.mean_value)
+        self.assertAlmostEqual(np.var(np.arange(20, 30)), self.buffer.variance)
+        self.assertEqual(9, self.buffer.sum_of_squared_diffs)
+
+    def test_statistics_recover_once_non_finite_values_leave_the_buffer(self):
+        buffer = RingBuffer(5)
+        values = [1, 2, np.nan, 4, 5, 6, 7]
+
+        for value in values:
+            buffer.add_value(value)
+            window = buffer.get_as_numpy_array()
+            if np.isnan(window).any():
+                self.assertTrue(np.isnan(buffer.window_mean))
+                self.assertTrue(np.isnan(buffer.sum_of_squared_diffs))
+
+        for value in [8, 9]:
+            buffer.add_value(value)
+
+        self.assertEqual(7, buffer.mean_value)
+        self.assertAlmostEqual(np.std([5, 6, 7, 8, 9]), buffer.std_dev)
+        self.assertEqual(4, buffer.sum_of_squared_diffs)
+
+        buffer.add_value(np.inf)
+        self.assertTrue(np.isinf(buffer.mean_value))
+        for value in [10, 11, 12, 13, 14]:
+            buffer.add_value(value)
+
+        self.assertEqual(12, buffer.mean_value)
+        self.assertAlmostEqual(np.var([10, 11, 12, 13, 14]), buffer.variance)
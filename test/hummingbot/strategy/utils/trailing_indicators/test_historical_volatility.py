@@ -66,3 +66,28 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_volatility_matches_full_recalculation(self):
+        sampling_length = 50
+        prices = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 300)))
+        self.indicator = HistoricalVolatilityIndicator(sampling_length, 5)
+        variances = []
+
+        for i, price in enumerate(prices):
+            self.indicator.add_sample(price)
+            window = prices[max(0, i + 1 - sampling_length):i + 1]
+            variances.append(np.var(np.diff(np.log(window))) if window.size > 1 else 0)
+            self.assertAlmostEqual(np.sqrt(np.mean(variances[-5:])), self.indicator.current_value, 10)
+
+    def test_sampling_length_change(self):
+        prices = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 100)))
+        self.indicator = HistoricalVolatilityIndicator(50, 1)
+        for price in prices:
+            self.indicator.add_sample(price)
+
+        self.indicator.sampling_length = 20
+        self.indicator.add_sample(prices[-1])
+
+        expected_variance = np.var(np.diff(np.log(np.append(prices, prices[-1])[-20:])))
+        self.assertEqual(20, self.indicator.sampling_length)
+        self.assertAlmostEqual(np.sqrt(expected_variance), self.indicator.current_value, 10)
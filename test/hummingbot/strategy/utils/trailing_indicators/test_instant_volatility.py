@@ -20,3 +20,14 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_volatility_matches_full_recalculation(self):
+        sampling_length = 40
+        samples = np.random.normal(100, 10, 200)
+        self.indicator = InstantVolatilityIndicator(sampling_length, 1)
+
+        for i, sample in enumerate(samples):
+            self.indicator.add_sample(sample)
+            window = samples[max(0, i + 1 - sampling_length):i + 1]
+            expected_vol = np.sqrt(np.sum(np.square(np.diff(window))) / window.size)
+            self.assertAlmostEqual(expected_vol, self.indicator.current_value, 8)
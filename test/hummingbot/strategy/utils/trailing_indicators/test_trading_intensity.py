@@ -1,6 +1,7 @@
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -259,3 +260,89 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def test_trades_matched_with_last_quote_before_them(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 10)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp + 1, "price": 10},
+                                                   {"timestamp": timestamp, "price": 20}]
+
+        for trade_timestamp, price in [(timestamp + 0.5, 21), (timestamp + 1.5, 13)]:
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT", timestamp=trade_timestamp, price=price, amount=1, type=TradeType.BUY))
+        trading_intensity_indicator.calculate(timestamp + 2)
+
+        # Quotes older than the last one matched with a trade are discarded
+        self.assertEqual([timestamp + 2, timestamp + 1],
+                         [quote["timestamp"] for quote in trading_intensity_indicator.last_quotes])
+        self.assertEqual({timestamp + 1: [(1, 1)], timestamp + 2: [(3, 1)]},
+                         trading_intensity_indicator.trade_samples)
+
+    def test_price_level_histogram_follows_samples_window(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        for amount, price in [(4, 2), (2, 3), (1, 2)]:
+            timestamp += 1
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=amount, type=TradeType.SELL))
+            trading_intensity_indicator.calculate(timestamp)
+            trading_intensity_indicator.last_quotes = ([{"timestamp": timestamp, "price": 1}]
+                                                       + trading_intensity_indicator.last_quotes)
+
+        # The first sample left the window
+        self.assertEqual({2: 2, 1: 1}, trading_intensity_indicator.price_level_amounts)
+        self.assertEqual(2, len(trading_intensity_indicator.trade_samples))
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+
+    def test_intensity_only_estimated_again_when_histogram_changes(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        timestamp += 1
+        for price in [2, 3, 4, 5]:
+            trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT", timestamp=timestamp, price=price, amount=2 * np.exp(-0.1 * (price - 1)),
+                type=TradeType.SELL))
+        trading_intensity_indicator.calculate(timestamp)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        # No new trades, the window did not change
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit") as curve_fit_mock:
+            trading_intensity_indicator.calculate(timestamp + 1)
+            curve_fit_mock.assert_not_called()
+
+        self.assertEqual((alpha, kappa), trading_intensity_indicator.current_value)
+
+    def test_intensity_not_estimated_again_for_small_histogram_changes(self):
+        trading_intensity_indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 2)
+        timestamp = self.start_timestamp
+        trading_intensity_indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+
+        def register_trades(trade_timestamp: float, amount_multiplier: float):
+            for price in [2, 3, 4, 5]:
+                trading_intensity_indicator.register_trade(OrderBookTradeEvent(
+                    trading_pair="COINALPHAHBOT", timestamp=trade_timestamp, price=price,
+                    amount=amount_multiplier * 2 * np.exp(-0.1 * (price - 1)), type=TradeType.SELL))
+
+        register_trades(timestamp + 0.5, 1)
+        trading_intensity_indicator.calculate(timestamp + 1)
+        register_trades(timestamp + 1.5, 1)
+        trading_intensity_indicator.calculate(timestamp + 2)
+        self.assertTrue(trading_intensity_indicator.is_sampling_buffer_full)
+        alpha, kappa = trading_intensity_indicator.current_value
+
+        # Late trades added to the last sample: 1% of the traded amount is not enough to fit the curve again
+        with patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.curve_fit",
+                   side_effect=RuntimeError) as curve_fit_mock:
+            register_trades(timestamp + 1.5, 0.02)
+            trading_intensity_indicator.calculate(timestamp + 3)
+            curve_fit_mock.assert_not_called()
+
+            # The changes add up until they are large enough
+            register_trades(timestamp + 1.5, 0.04)
+            trading_intensity_indicator.calculate(timestamp + 4)
+            curve_fit_mock.assert_called_once()
+
+        self.assertEqual((alpha, kappa), trading_intensity_indicator.current_value)